@@ -1,5 +1,9 @@
 """Base settings class contains only important fields."""
 
+import os
+import tempfile
+from typing import Literal
+
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -84,6 +88,39 @@ class AudioSettings(BaseSettings):
         description="Bytes per audio sample (2 for 16-bit PCM).",
     )
 
+    SPOOL_DIR: str | None = Field(
+        None,
+        description="Directory holding the temporary audio files of the preprocessing "
+        "pipeline (raw recording, normalized WAV). Defaults to the system temp dir; "
+        "point it at a volume sized for the longest meeting so worker memory does not "
+        "have to be.",
+    )
+
+    FFMPEG_SEGMENT_SECONDS: float = Field(
+        300.0,
+        description="Target length of the segments the FFmpeg filter chains (noise "
+        "filtering, loudness normalization) run on in parallel. Cuts are placed in "
+        "silences near multiples of this length; shorter audio runs in one process.",
+    )
+
+    FFMPEG_SEGMENT_WORKERS: int | None = Field(
+        None,
+        description="FFmpeg processes run at once on the segments. Defaults to the "
+        "CPUs available to the worker.",
+    )
+
+    SILENCE_TRIM_MIN_SECONDS: float = Field(
+        5.0,
+        description="With the audio_silence_trimming flag on, silences longer than "
+        "this are cut out of the audio sent to diarization and transcription.",
+    )
+
+    SILENCE_TRIM_PADDING_SECONDS: float = Field(
+        1.0,
+        description="Silence kept on each side of a trimmed silence, so that words "
+        "are not clipped and speaker turns stay apart.",
+    )
+
     NO_SPEECH_PROB_THRESHOLD: float = Field(
         0.6,
         description="""non speech probability threshold. we exclude segment
@@ -123,6 +160,13 @@ class NoiseDetectionSettings(BaseSettings):
         "signal is used for the mono downmix instead of the cancelling average. Affected "
         "recordings show ~35 dB; normally-correlated stereo is near 0 dB.",
     )
+    PHASE_DETECTION_WINDOW_SECONDS: float = Field(
+        default=120.0,
+        gt=0,
+        description="Only the first seconds of a stereo recording are decoded to detect "
+        "phase inversion, so the check costs a bounded partial decode instead of full "
+        "passes over the file.",
+    )
 
     # === CONSTANTS ===
 
@@ -134,6 +178,12 @@ class NoiseDetectionSettings(BaseSettings):
         default=512,
         description="Hop size in samples between consecutive FFT frames.",
     )
+    FLATNESS_BATCH_FRAMES: int = Field(
+        default=512,
+        description="Number of FFT frames transformed together when computing spectral flatness. "
+        "Bounds the memory of the batched STFT (about 25 kB per frame) independently of the "
+        "total silence duration.",
+    )
     INT16_MAX: float = Field(
         default=32768.0,
         description="Maximum absolute value of a 16-bit signed integer, used to normalize audio samples to [-1.0, 1.0].",
@@ -183,6 +233,10 @@ class WhisperTranscriptionSettings(BaseSettings):
         default=0.2,
         description="Fraction of max_chunk_duration at the end of a chunk where the algorithm searches for the best silence to split on.",
     )
+    MIN_CHUNK_DURATION: float = Field(
+        default=30.0,
+        description="Shortest average chunk duration in seconds the makespan planner may cut a meeting into; shorter chunks give the model too little context.",
+    )
 
 
 class Speech2TextSettings(BaseSettings):
@@ -269,6 +323,17 @@ class S3Settings(BaseSettings):
         default="artifacts",
         description="The folder in the S3 bucket where intermediate transcription pipeline artifacts are stored.",
     )
+    S3_AUDIO_DOWNLOAD_CONCURRENCY: int = Field(
+        default=8,
+        ge=1,
+        description="Number of audio chunks of a meeting downloaded in parallel.",
+    )
+    S3_AUDIO_PREFETCH_CHUNKS: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum number of audio chunks downloaded ahead of the one being "
+        "consumed. Bounds the memory held by out-of-order downloads.",
+    )
 
 
 class ApiSettings(BaseSettings):
@@ -295,6 +360,7 @@ class CelerySettings(BaseSettings):
     REDIS_VHOST_RESULT_DB: int = 1
     REDIS_TOKEN_STORE_DB: int = 2
     REDIS_TOKEN_TTL_SECONDS: int = 2_592_000  # 30 days
+    REDIS_LLM_RESPONSE_CACHE_DB: int = 3
     REDIS_VISIBILITY_TIMEOUT: int = Field(
         default=21600,
         description="""
@@ -413,6 +479,39 @@ class LLMSettings(BaseSettings):
     LLM_API_TIMEOUT: float = Field(
         default=120.0, description="Maximum wait time in seconds for API timeout"
     )
+    LLM_MAX_CONCURRENT_CORRECTIONS: int = Field(
+        default=8,
+        ge=1,
+        description="Transcript chunks sent at once to the LLM by each text "
+        "correction pass (acronyms, spelling) of a meeting.",
+    )
+    LLM_MAX_CONCURRENT_PARTICIPANT_EXTRACTIONS: int = Field(
+        default=8,
+        ge=1,
+        description="Transcript chunks sent at once to the LLM to extract their "
+        "participants, with the participant_map_merge flag.",
+    )
+    LLM_RESPONSE_CACHE_BACKEND: Literal["none", "disk", "redis"] = Field(
+        default="none",
+        description="Where LLM responses are cached by request content, so that a "
+        "retried task, a requeued meeting or an evaluation rerun makes no repeat "
+        "call: 'disk' (LLM_RESPONSE_CACHE_DIR, one machine), 'redis' (shared by "
+        "the workers) or 'none'.",
+    )
+    LLM_RESPONSE_CACHE_DIR: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "mcr_llm_responses"),
+        description="Absolute directory of the 'disk' LLM response cache.",
+    )
+    LLM_RESPONSE_CACHE_TTL_SECONDS: int = Field(
+        default=604_800,  # 7 days
+        ge=1,
+        description="How long a cached LLM response is reused.",
+    )
+    LLM_RESPONSE_CACHE_VERSION: str = Field(
+        default="1",
+        description="Part of every LLM response cache key: change it to stop "
+        "reusing the responses cached so far.",
+    )
     RETRY_WAIT_MULTIPLIER: int = Field(
         default=5, description="Exponential backoff multiplier for retry wait times"
     )
@@ -423,6 +522,13 @@ class LLMSettings(BaseSettings):
         default=100, description="Maximum wait time in seconds between retries"
     )
 
+    @field_validator("LLM_RESPONSE_CACHE_DIR")
+    def validate_response_cache_dir(cls, v: str) -> str:
+        # A relative directory would follow each process's working directory.
+        if not os.path.isabs(v):
+            raise ValueError(f"LLM_RESPONSE_CACHE_DIR must be absolute: {v}")
+        return v
+
 
 class ChunkingConfig(BaseSettings):
     CHUNK_SIZE: int = Field(
@@ -440,6 +546,12 @@ class TranscriptionApiSettings(BaseSettings):
     TRANSCRIPTION_API_BASE_URL: str = Field(
         description="Base URL for OpenAI-compatible transcription API"
     )
+    TRANSCRIPTION_API_REPLICA_BASE_URLS: list[str] = Field(
+        default=[],
+        description="Base URLs of further replicas of the transcription API, "
+        "as a JSON list. Chunk calls go to the endpoint with the fewest requests "
+        "in flight, skipping the ones whose circuit breaker is open.",
+    )
     TRANSCRIPTION_API_KEY: str = Field(description="API key for transcription service")
     TRANSCRIPTION_API_MODEL: str = Field(
         default="faster-whisper-large-v3-turbo",
@@ -473,9 +585,107 @@ class TranscriptionApiSettings(BaseSettings):
         """,
     )
     MAX_CONCURRENT_CHUNKS: int = Field(
-        default=4,
+        default=16,
         description="Maximum number of chunk transcription API calls "
-        "executed concurrently (API mode only)",
+        "executed concurrently (API mode only). Upper bound of the adaptive "
+        "window, which starts at INITIAL_CONCURRENT_CHUNKS.",
+    )
+    INITIAL_CONCURRENT_CHUNKS: int = Field(
+        default=4,
+        description="Starting window of concurrent chunk transcription calls. It "
+        "grows by one per window of healthy calls and is cut on overload.",
+    )
+    MIN_CONCURRENT_CHUNKS: int = Field(
+        default=1,
+        description="Floor of the adaptive window of chunk transcription calls.",
+    )
+    CONCURRENCY_DECREASE_FACTOR: float = Field(
+        default=0.5,
+        gt=0,
+        lt=1,
+        description="Factor applied to the window when the transcription API "
+        "throttles, fails with a 5xx or times out.",
+    )
+    CHUNK_HEALTHY_LATENCY_BASE_SECONDS: float = Field(
+        default=10.0,
+        description="Fixed part of the latency a healthy chunk call may take; "
+        "slower calls keep the window from growing.",
+    )
+    CHUNK_HEALTHY_REAL_TIME_FACTOR: float = Field(
+        default=0.1,
+        description="Part of the latency budget proportional to the chunk "
+        "duration (seconds of latency per second of audio).",
+    )
+    CHUNK_REQUEST_OVERHEAD_SECONDS: float = Field(
+        default=3.0,
+        gt=0,
+        description="Initial estimate of the fixed cost of one chunk transcription "
+        "request (upload, queueing, model start), refined from the observed "
+        "latencies. Used to size chunks with TRANSCRIPTION_MAKESPAN_CHUNKING.",
+    )
+    CHUNK_REAL_TIME_FACTOR: float = Field(
+        default=0.05,
+        ge=0,
+        description="Initial estimate of the seconds of processing per second of "
+        "audio of a chunk transcription request, refined from the observed "
+        "latencies.",
+    )
+    CHUNK_LATENCY_PRIOR_WEIGHT: float = Field(
+        default=4.0,
+        gt=0,
+        description="Number of observed chunk calls the initial latency estimates "
+        "weigh as; the estimate follows the endpoint as calls accumulate.",
+    )
+    HEDGE_LATENCY_PERCENTILE: float = Field(
+        default=95.0,
+        gt=0,
+        lt=100,
+        description="Percentile of the recent chunk call latencies after which "
+        "a still running call is sent again (TRANSCRIPTION_HEDGED_REQUESTS).",
+    )
+    HEDGE_MIN_SAMPLES: int = Field(
+        default=20,
+        ge=1,
+        description="Chunk calls to observe before any call is hedged.",
+    )
+    HEDGE_LATENCY_WINDOW: int = Field(
+        default=200,
+        ge=1,
+        description="Number of recent chunk call latencies the percentile is "
+        "taken over.",
+    )
+    HEDGE_BUDGET_RATIO: float = Field(
+        default=0.05,
+        ge=0,
+        le=1,
+        description="Hedged requests allowed per chunk call, shared by the whole "
+        "worker process: caps the extra load hedging puts on the endpoint.",
+    )
+    HEDGE_BUDGET_BURST: float = Field(
+        default=2.0,
+        ge=0,
+        description="Hedged requests the budget may accumulate for a burst of "
+        "stragglers.",
+    )
+    ENDPOINT_BREAKER_FAILURE_THRESHOLD: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive failed chunk calls (5xx, throttling after "
+        "retries, connection errors, timeouts) that open a transcription "
+        "endpoint's circuit breaker.",
+    )
+    ENDPOINT_BREAKER_COOLDOWN_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds an open breaker keeps its endpoint out of rotation "
+        "before one probe call is let through.",
+    )
+    REPLICA_MAX_RETRIES: int = Field(
+        default=1,
+        ge=0,
+        description="Retries of a chunk call on the same endpoint when replicas "
+        "are configured (instead of MAX_RETRIES): a failing call moves on to "
+        "another replica rather than waiting out the backoff.",
     )
 
     DIARIZATION_POLL_FAST_INTERVAL_SECONDS: float = Field(
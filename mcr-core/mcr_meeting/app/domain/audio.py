@@ -1,14 +1,12 @@
 import json
-import os
-import re
-import tempfile
-from io import BytesIO
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass
 from typing import Any
 
 import ffmpeg
 import numpy as np
 import numpy.typing as npt
-import soundfile as sf
 from loguru import logger
 
 from mcr_meeting.app.configs.base import (
@@ -17,6 +15,12 @@ from mcr_meeting.app.configs.base import (
     NormalizedAudioVolumeSettings,
     Speech2TextSettings,
 )
+from mcr_meeting.app.domain.audio_levels import (
+    detect_silences,
+    mean_volume_db,
+)
+from mcr_meeting.app.domain.audio_segments import filter_segments, plan_segments
+from mcr_meeting.app.domain.audio_spool import AudioSpool, wav_header
 from mcr_meeting.app.exceptions.exceptions import (
     InvalidAudioFileError,
     SilentAudioError,
@@ -30,7 +34,7 @@ def log_ffmpeg_command(stream: Any) -> None:  # type: ignore[explicit-any]
         logger.debug("FFmpeg command: %s", " ".join(cmd))
     except Exception:
         logger.warning("Failed to compile FFmpeg command.")
-        pass  # Don't fail if compile fails
+        # Don't fail if compile fails
 
 
 s2t_settings = Speech2TextSettings()
@@ -40,19 +44,12 @@ normalized_audio_volume_settings = NormalizedAudioVolumeSettings()
 sample_rate = audio_settings.SAMPLE_RATE
 nb_channels = audio_settings.NB_AUDIO_CHANNELS
 
-
-def _get_audio_duration_seconds(wav_bytes: BytesIO) -> float:
-    """Compute duration of normalized WAV audio from byte size.
-
-    Works because we control the WAV output format (header size, bytes per sample,
-    sample rate, and channel count are all defined in AudioSettings).
-    """
-    byte_count = len(wav_bytes.getvalue()) - audio_settings.WAV_HEADER_SIZE
-    return byte_count / (sample_rate * nb_channels * audio_settings.BYTES_PER_SAMPLE)
+# Pipe read size of the phase-inversion decode (~8 s of 16 kHz stereo).
+_PHASE_DETECTION_READ_BYTES = 1 << 19
 
 
 def _detect_silences_absolute(
-    wav_bytes: BytesIO,
+    pcm: npt.NDArray[np.int16],
 ) -> list[tuple[float, float]]:
     """Detect silence segments using a fixed absolute dB threshold.
 
@@ -60,49 +57,16 @@ def _detect_silences_absolute(
     noise floor so it reliably detects silence even on fully silent audio where the
     mean volume is already at the floor.
     """
-    threshold_db = noise_detection_settings.SILENT_AUDIO_NOISE_FLOOR_DB
-
-    af = f"silencedetect=noise={threshold_db}dB:d={noise_detection_settings.MIN_SILENCE_DURATION}"
-    _, stderr = (
-        ffmpeg.input("pipe:0", format="wav")
-        .output("pipe:", format="null", af=af)
-        .run(input=wav_bytes.getvalue(), capture_stdout=True, capture_stderr=True)
+    return detect_silences(
+        pcm,
+        noise_db=noise_detection_settings.SILENT_AUDIO_NOISE_FLOOR_DB,
+        min_duration=noise_detection_settings.MIN_SILENCE_DURATION,
+        sample_rate=sample_rate,
     )
-    return _parse_silence_intervals(stderr.decode("utf-8", errors="replace"))
-
-
-def compute_silence_ratio(wav_bytes: BytesIO) -> float:
-    """Compute the ratio of silence duration to total audio duration.
-
-    Uses ffmpeg silencedetect with a fixed absolute threshold to identify silent
-    intervals, then returns the proportion of the audio that is silent.
-
-    Args:
-        wav_bytes: Normalized WAV audio bytes.
-
-    Returns:
-        Float between 0.0 (no silence) and 1.0 (fully silent).
-    """
-    total_duration = _get_audio_duration_seconds(wav_bytes)
-    if total_duration <= 0:
-        return 1.0
-
-    silences = _detect_silences_absolute(wav_bytes)
-    silence_duration = sum(end - start for start, end in silences)
-    wav_bytes.seek(0)
-    return min(silence_duration / total_duration, 1.0)
 
 
-def check_audio_is_not_silent(wav_bytes: BytesIO) -> None:
-    """Check that the audio is not silent, raise SilentAudioError otherwise.
-
-    Args:
-        wav_bytes: Normalized WAV audio bytes.
-
-    Raises:
-        SilentAudioError: If the silence ratio exceeds the configured threshold.
-    """
-    silence_ratio = compute_silence_ratio(wav_bytes)
+def check_silence_ratio(silence_ratio: float) -> None:
+    """Raise SilentAudioError when a precomputed silence ratio reaches the threshold."""
     if silence_ratio >= noise_detection_settings.SILENT_AUDIO_THRESHOLD:
         raise SilentAudioError(
             f"Silent audio detected: "
@@ -111,24 +75,48 @@ def check_audio_is_not_silent(wav_bytes: BytesIO) -> None:
         )
 
 
-def _mean_volume_with_pan(input_path: str, pan_expr: str) -> float:
-    """Return the mean volume in dBFS of a mono mixdown defined by a pan expression.
+def _stereo_mid_side_db(input_path: str) -> tuple[float, float]:
+    """Levels in dB of the mid (L+R)/2 and side (L-R)/2 signals of the first two channels.
 
-    Returns -inf when the mixdown is fully cancelled (volumedetect reports no measurable
-    level), so a silent mid signal against a loud side signal still reads as inverted.
+    Both come from a single decode of at most PHASE_DETECTION_WINDOW_SECONDS,
+    streamed as 16-bit PCM and reduced block by block. A level is -inf when its
+    signal cancels entirely, so a silent mid against a loud side still reads as
+    inverted.
     """
-
-    _, stderr = (
-        ffmpeg.input(input_path)
-        .output("pipe:", format="null", af=f"pan=mono|c0={pan_expr},volumedetect")
-        .run(capture_stdout=True, capture_stderr=True)
+    process = (
+        ffmpeg.input(
+            input_path, t=noise_detection_settings.PHASE_DETECTION_WINDOW_SECONDS
+        )
+        .audio.filter("aeval", "val(0)|val(1)", c="stereo")
+        .output("pipe:", format="s16le", ar=sample_rate)
+        .global_args("-loglevel", "error")
+        .run_async(pipe_stdout=True, pipe_stderr=True)
     )
 
-    try:
-        return _parse_mean_volume(stderr.decode("utf-8", errors="replace"))
+    mid_energy = 0
+    side_energy = 0
+    frame_bytes = 2 * audio_settings.BYTES_PER_SAMPLE
+    pending = b""
+    while block := process.stdout.read(_PHASE_DETECTION_READ_BYTES):
+        pending += block
+        usable = len(pending) - len(pending) % frame_bytes
+        frames = np.frombuffer(pending[:usable], dtype="<i2").reshape(-1, 2)
+        pending = pending[usable:]
+        left = frames[:, 0].astype(np.int64)
+        right = frames[:, 1].astype(np.int64)
+        mid = left + right
+        side = left - right
+        mid_energy += int(np.dot(mid, mid))
+        side_energy += int(np.dot(side, side))
 
-    except RuntimeError:
-        return float("-inf")
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        raise ffmpeg.Error("ffmpeg", None, stderr)
+
+    def to_db(energy: int) -> float:
+        return 10 * math.log10(energy) if energy > 0 else float("-inf")
+
+    return to_db(mid_energy), to_db(side_energy)
 
 
 def _is_phase_inverted_stereo(input_path: str) -> bool:
@@ -149,133 +137,204 @@ def _is_phase_inverted_stereo(input_path: str) -> bool:
         if int(audio_stream.get("channels", 1)) < 2:
             return False
 
-        mid_db = _mean_volume_with_pan(input_path, "0.5*c0+0.5*c1")
-        side_db = _mean_volume_with_pan(input_path, "0.5*c0-0.5*c1")
+        mid_db, side_db = _stereo_mid_side_db(input_path)
 
-    except (ffmpeg.Error, StopIteration, RuntimeError, KeyError, ValueError):
-        # On any probe/parse failure, fall back to the default averaging downmix.
+    except (ffmpeg.Error, StopIteration, KeyError, ValueError):
+        # On any probe/decode failure, fall back to the default averaging downmix.
         return False
 
+    if side_db == float("-inf"):
+        return False
     return side_db - mid_db > noise_detection_settings.PHASE_INVERSION_THRESHOLD_DB
 
 
-def audio_bytes_to_wav_bytes(
-    input_bytes: BytesIO, phase_aware_downmix: bool = False
-) -> BytesIO:
+@dataclass(frozen=True)
+class AudioAnalysis:
+    """Everything preprocessing needs to know about a recording, from one decode.
+
+    Attributes:
+        audio: Normalized WAV (16 kHz mono, 16-bit PCM), spooled to disk.
+        duration_seconds: Duration of the normalized audio.
+        mean_volume_db: volumedetect mean volume in dBFS, -inf when unmeasurable.
+        silences: Silence intervals below the absolute noise floor.
+        loudnorm_stats: EBU R128 measurement (loudnorm pass 1), when requested.
     """
-    Bytes→normalized WAV bytes, using FFmpeg via stdin/stdout pipes.
+
+    audio: AudioSpool
+    duration_seconds: float
+    mean_volume_db: float
+    silences: list[tuple[float, float]]
+    loudnorm_stats: dict[str, str] | None = None
+
+    @property
+    def silence_ratio(self) -> float:
+        """Ratio of silence duration to total duration, 1.0 for empty audio."""
+        if self.duration_seconds <= 0:
+            return 1.0
+        silence_duration = sum(end - start for start, end in self.silences)
+        return min(silence_duration / self.duration_seconds, 1.0)
+
+
+def _loudnorm_targets() -> dict[str, float]:
+    return {
+        "I": normalized_audio_volume_settings.TARGET_LUFS,
+        "TP": normalized_audio_volume_settings.TRUE_PEAK,
+        "LRA": normalized_audio_volume_settings.LOUDNESS_RANGE,
+    }
+
+
+def _log_ffmpeg_warnings(stderr_text: str, step: str) -> None:
+    """Surface only warning/error lines from a `repeat+level+info` ffmpeg log."""
+    warnings = [
+        line
+        for line in stderr_text.splitlines()
+        if "[warning]" in line or "[error]" in line
+    ]
+    if warnings:
+        logger.warning("FFmpeg stderr ({}): {}", step, "\n".join(warnings))
+
+
+def analyze_audio(
+    source_audio: AudioSpool,
+    phase_aware_downmix: bool = False,
+    measure_loudness: bool = False,
+) -> AudioAnalysis:
+    """
+    Decode a recording once and derive the normalized WAV and its analysis.
+
+    The source is decoded and converted to 16 kHz mono 16-bit PCM by a single
+    FFmpeg process; when requested, the PCM is also split (asplit) into the
+    loudnorm measurement pass so it reads exactly the samples written to the WAV.
+    Mean volume and absolute-floor silences are then computed in-process from
+    the memory-mapped PCM (see audio_levels).
+
+    FFmpeg reads the source file and writes the WAV file itself, so neither the
+    recording nor the WAV passes through this process's memory.
 
     Args:
-        input_bytes (BytesIO): Raw audio bytes to be normalized.
+        source_audio (AudioSpool): Raw recording, in any container FFmpeg can read.
         phase_aware_downmix (bool): When True, stereo input whose channels are phase-inverted
-            is downmixed using the side signal (L-R)/2 instead of the cancelling average,
-            recovering speech that a plain mono downmix would silence.
+            is downmixed using the side signal (L-R)/2 instead of the cancelling average.
+        measure_loudness (bool): When True, also run the loudnorm measurement so the
+            noise detection can skip its own first pass.
     Returns:
-        BytesIO: Normalized WAV bytes.
+        AudioAnalysis: The normalized WAV and its measurements.
     """
 
     logger.info(
-        "Normalizing audio (bytes→bytes) | sr={} ch={}",
+        "Analyzing audio (single decode) | sr={} ch={} loudness={}",
         sample_rate,
         nb_channels,
+        measure_loudness,
     )
 
-    # Use a temporary file for input because FFmpeg cannot seek on stdin
-    # This is critical for formats like m4a/mp4 where metadata might be at the end
-    with tempfile.NamedTemporaryFile(delete=False) as tmp_input:
-        tmp_input.write(input_bytes.getvalue())
-        tmp_input_path = tmp_input.name
-
+    # FFmpeg reads the spooled file rather than stdin because it cannot seek on
+    # stdin. This is critical for formats like m4a/mp4 where metadata might be at the end
+    wav_audio = AudioSpool(suffix=".wav")
     try:
-        if phase_aware_downmix and _is_phase_inverted_stereo(tmp_input_path):
+        source = ffmpeg.input(source_audio.path, err_detect="ignore_err").audio
+        if phase_aware_downmix and _is_phase_inverted_stereo(source_audio.path):
             logger.warning(
                 "Phase-inverted stereo detected; using side signal (L-R)/2 for mono downmix"
             )
-            output_kwargs = dict(
-                format="wav", ar=sample_rate, af="pan=mono|c0=0.5*c0-0.5*c1"
-            )
+            # aeval rather than pan: ffmpeg-python escapes the '=' of a pan
+            # channel spec, which the filtergraph parser then rejects.
+            source = source.filter("aeval", "0.5*val(0)-0.5*val(1)", c="mono")
+
+        pcm = source.filter(
+            "aformat",
+            sample_fmts="s16",
+            sample_rates=sample_rate,
+            channel_layouts="mono",
+        )
+        if measure_loudness:
+            branches = pcm.filter_multi_output("asplit", 2)
+            outputs = [
+                ffmpeg.output(branches[0], wav_audio.path, format="wav"),
+                ffmpeg.output(
+                    branches[1].filter(
+                        "loudnorm", **_loudnorm_targets(), print_format="json"
+                    ),
+                    "-",
+                    format="null",
+                ),
+            ]
         else:
-            output_kwargs = dict(format="wav", ar=sample_rate, ac=nb_channels)
+            outputs = [ffmpeg.output(pcm, wav_audio.path, format="wav")]
 
-        # pipe:1 = write to stdout
-        stream = ffmpeg.input(tmp_input_path, err_detect="ignore_err")
         stream = (
-            stream.output("pipe:1", **output_kwargs)
+            ffmpeg.merge_outputs(*outputs)
             .overwrite_output()
-            .global_args("-loglevel", "warning")
+            .global_args("-hide_banner", "-nostats", "-loglevel", "repeat+level+info")
         )
 
         log_ffmpeg_command(stream)
 
-        output, stderr_output = stream.run(
-            capture_stdout=True,
-            capture_stderr=True,
+        _, stderr_output = stream.run(capture_stderr=True)
+        stderr_text = stderr_output.decode("utf-8", errors="replace")
+        _log_ffmpeg_warnings(stderr_text, "analysis")
+
+        pcm_samples = wav_audio.pcm()
+        return AudioAnalysis(
+            audio=wav_audio,
+            duration_seconds=pcm_samples.size / sample_rate,
+            mean_volume_db=mean_volume_db(pcm_samples),
+            silences=_detect_silences_absolute(pcm_samples),
+            loudnorm_stats=(
+                _parse_loudnorm_stats(stderr_text) if measure_loudness else None
+            ),
         )
-        if stderr_output:
-            logger.warning(
-                "FFmpeg stderr (bytes→bytes): {}", stderr_output.decode(errors="ignore")
-            )
-        return BytesIO(output)
-
     except ffmpeg.Error as e:
+        wav_audio.close()
         stderr_text = e.stderr.decode(errors="ignore") if e.stderr else str(e)
         raise InvalidAudioFileError(
             f"FFmpeg normalization failed: {stderr_text}"
         ) from e
     except Exception as e:
+        wav_audio.close()
         raise InvalidAudioFileError(
             f"Unexpected error during normalization: {e}"
         ) from e
-    finally:
-        # Clean up the temporary file
-        if os.path.exists(tmp_input_path):
-            os.remove(tmp_input_path)
 
 
-def filter_noise_from_audio_bytes(input_bytes: BytesIO) -> BytesIO:
+def filter_noise_from_audio(wav_audio: AudioSpool) -> AudioSpool:
     """
-    Apply noise reduction and audio enhancement filters to audio bytes.
-
-    Applies FFmpeg audio filters based on the provided filter string.
+    Apply noise reduction and audio enhancement filters to normalized WAV audio.
+
+    Applies the FFmpeg audio filters of Speech2TextSettings.NOISE_FILTERS, on
+    segments of the audio filtered in parallel (see audio_segments); the cuts
+    fall in silences, where the stateful filters (denoiser, gate, compressor)
+    have little to carry over. A trailing loudnorm always runs in two passes,
+    whatever the length of the audio, even on a single segment: the rest of
+    the chain is applied to the segments, the loudness of the whole filtered
+    meeting is measured once, and every segment is then normalized linearly
+    with those statistics. The same recording is thus levelled the same way
+    however many segments it spans.
 
     Args:
-        input_bytes (BytesIO): Raw audio bytes to be filtered.
-        filters (str): FFmpeg audio filter string to apply.
+        wav_audio (AudioSpool): Normalized WAV audio to be filtered.
     Returns:
-        BytesIO: Filtered audio bytes.
+        AudioSpool: Filtered WAV audio, as long as the input to the sample.
     """
     s2t_settings = Speech2TextSettings()
     filters = s2t_settings.NOISE_FILTERS
+    segments = _plan_filter_segments(wav_audio)
 
-    logger.info("Applying noise reduction filters: {}", filters)
-
-    # Input is already normalized WAV, specify format explicitly
-    stream = ffmpeg.input("pipe:0", format="wav", err_detect="ignore_err")
+    logger.info(
+        "Applying noise reduction filters on {} segment(s): {}", len(segments), filters
+    )
 
     try:
-        # Apply audio filters - maintain WAV format with correct sample rate and channels
-        stream = stream.output(
-            "pipe:1",
-            format="wav",
-            ar=sample_rate,  # Maintain audio sample rate
-            ac=nb_channels,  # Maintain audio channels
-            af=filters,  # Audio filter string
-        )
-
-        stream = stream.overwrite_output().global_args("-loglevel", "warning")
-        log_ffmpeg_command(stream)
-
-        output, stderr_output = stream.run(
-            input=input_bytes.getvalue(),
-            capture_stdout=True,
-            capture_stderr=True,
-        )
-        if stderr_output:
-            logger.warning(
-                "FFmpeg stderr (noise filtering): {}",
-                stderr_output.decode(errors="ignore"),
-            )
-        return BytesIO(output)
+        leading_filters, loudnorm_options = _split_trailing_loudnorm(filters)
+        if loudnorm_options is None:
+            return filter_segments(wav_audio, segments, filters, sample_rate)
+        if not leading_filters:
+            return _two_pass_loudnorm(wav_audio, segments, loudnorm_options)
+
+        with filter_segments(
+            wav_audio, segments, leading_filters, sample_rate
+        ) as filtered_audio:
+            return _two_pass_loudnorm(filtered_audio, segments, loudnorm_options)
     except ffmpeg.Error as e:
         stderr_text = e.stderr.decode(errors="ignore") if e.stderr else str(e)
         raise InvalidAudioFileError(
@@ -287,29 +346,44 @@ def filter_noise_from_audio_bytes(input_bytes: BytesIO) -> BytesIO:
         ) from e
 
 
-def _parse_mean_volume(ffmpeg_stderr: str) -> float:
-    """Parse mean_volume in dBFS from ffmpeg volumedetect stderr output."""
-    match = re.search(r"mean_volume:\s*(-?\d+(?:\.\d+)?)\s*dB", ffmpeg_stderr)
-    if not match:
-        raise RuntimeError(
-            f"Could not parse mean_volume from ffmpeg output.\n\n{ffmpeg_stderr}"
-        )
-    return float(match.group(1))
+def _plan_filter_segments(wav_audio: AudioSpool) -> list[tuple[int, int]]:
+    """Segments of FFMPEG_SEGMENT_SECONDS cut in silences, for filter_segments."""
+    pcm = wav_audio.pcm()
+    segment_samples = round(audio_settings.FFMPEG_SEGMENT_SECONDS * sample_rate)
+    if pcm.size <= segment_samples:
+        return [(0, pcm.size)]
+    return plan_segments(pcm.size, _detect_silences(pcm), segment_samples, sample_rate)
 
 
-def _parse_silence_intervals(
-    ffmpeg_stderr: str,
-) -> list[tuple[float, float]]:
-    """Parse silence intervals from ffmpeg silencedetect stderr output."""
-    starts = [
-        float(x)
-        for x in re.findall(r"silence_start:\s*([0-9]+(?:\.[0-9]+)?)", ffmpeg_stderr)
-    ]
-    ends = [
-        float(x)
-        for x in re.findall(r"silence_end:\s*([0-9]+(?:\.[0-9]+)?)", ffmpeg_stderr)
-    ]
-    return list(zip(starts, ends))
+def _split_trailing_loudnorm(filters: str) -> tuple[str, dict[str, str] | None]:
+    """Split `chain,loudnorm=I=..:TP=..` into the chain and the loudnorm options.
+
+    The chain is empty when loudnorm is the only filter, and the options None
+    when the chain does not end with loudnorm.
+    """
+    leading_filters, _, last_filter = filters.rpartition(",")
+    name, _, options = last_filter.partition("=")
+    if name.strip() != "loudnorm":
+        return filters, None
+    return leading_filters, dict(
+        option.split("=", 1) for option in options.split(":") if "=" in option
+    )
+
+
+def _loudnorm_filter(
+    targets: Mapping[str, object], loudnorm_stats: Mapping[str, str]
+) -> str:
+    """Loudnorm pass 2 as a filter string, applying statistics measured beforehand."""
+    options = {
+        **targets,
+        "measured_I": loudnorm_stats["input_i"],
+        "measured_TP": loudnorm_stats["input_tp"],
+        "measured_LRA": loudnorm_stats["input_lra"],
+        "measured_thresh": loudnorm_stats["input_thresh"],
+        "offset": loudnorm_stats["target_offset"],
+        "linear": "true",
+    }
+    return "loudnorm=" + ":".join(f"{key}={value}" for key, value in options.items())
 
 
 def _parse_loudnorm_stats(ffmpeg_stderr: str) -> dict[str, str]:
@@ -324,159 +398,251 @@ def _parse_loudnorm_stats(ffmpeg_stderr: str) -> dict[str, str]:
     return result
 
 
-def _get_mean_volume_db(wav_bytes: BytesIO) -> float:
-    """Return the mean_volume in dBFS via ffmpeg volumedetect."""
-    _, stderr = (
-        ffmpeg.input("pipe:0", format="wav")
-        .output("pipe:", format="null", af="volumedetect")
-        .run(input=wav_bytes.getvalue(), capture_stdout=True, capture_stderr=True)
-    )
-    return _parse_mean_volume(stderr.decode("utf-8", errors="replace"))
-
-
 def _detect_silences(
-    wav_bytes: BytesIO,
+    pcm: npt.NDArray[np.int16],
+    min_duration: float | None = None,
 ) -> list[tuple[float, float]]:
-    """Detect silence segments using a relative threshold (mean_volume - offset dB)."""
-    mean_volume_db = _get_mean_volume_db(wav_bytes)
-    threshold_db = mean_volume_db - noise_detection_settings.SILENCE_THRESHOLD_OFFSET_DB
+    """Detect silence segments using a relative threshold (mean_volume - offset dB).
 
-    af = f"silencedetect=noise={threshold_db}dB:d={noise_detection_settings.MIN_SILENCE_DURATION}"
-    _, stderr = (
-        ffmpeg.input("pipe:0", format="wav")
-        .output("pipe:", format="null", af=af)
-        .run(input=wav_bytes.getvalue(), capture_stdout=True, capture_stderr=True)
+    Silences shorter than `min_duration` seconds, MIN_SILENCE_DURATION by
+    default, are ignored.
+    """
+    threshold_db = (
+        mean_volume_db(pcm) - noise_detection_settings.SILENCE_THRESHOLD_OFFSET_DB
+    )
+    return detect_silences(
+        pcm,
+        noise_db=threshold_db,
+        min_duration=(
+            noise_detection_settings.MIN_SILENCE_DURATION
+            if min_duration is None
+            else min_duration
+        ),
+        sample_rate=sample_rate,
     )
-    return _parse_silence_intervals(stderr.decode("utf-8", errors="replace"))
-
 
-def two_pass_volume_normalization(wav_bytes: BytesIO) -> BytesIO:
-    """Normalize volume using two-pass EBU R128 loudnorm."""
-    loudnorm_base = f"loudnorm=I={normalized_audio_volume_settings.TARGET_LUFS}:TP={normalized_audio_volume_settings.TRUE_PEAK}:LRA={normalized_audio_volume_settings.LOUDNESS_RANGE}"
 
-    # Pass 1: measure loudness statistics
+def _measure_loudnorm_stats(
+    wav_audio: AudioSpool, targets: Mapping[str, object] | None = None
+) -> dict[str, str]:
+    """Loudnorm pass 1: measure the EBU R128 loudness statistics."""
     _, stderr = (
-        ffmpeg.input("pipe:0", format="wav")
-        .output("pipe:", format="null", af=f"{loudnorm_base}:print_format=json")
-        .run(input=wav_bytes.getvalue(), capture_stdout=True, capture_stderr=True)
+        ffmpeg.input(wav_audio.path, format="wav")
+        .filter("loudnorm", **(targets or _loudnorm_targets()), print_format="json")
+        .output("-", format="null")
+        .run(capture_stderr=True)
     )
-    stats = _parse_loudnorm_stats(stderr.decode("utf-8", errors="replace"))
-
-    # Pass 2: apply normalization with measured values
-    out, _ = (
-        ffmpeg.input("pipe:0", format="wav")
-        .output(
-            "pipe:",
-            format="wav",
-            ar=audio_settings.SAMPLE_RATE,
-            af=(
-                f"{loudnorm_base}:"
-                f"measured_I={stats['input_i']}:"
-                f"measured_TP={stats['input_tp']}:"
-                f"measured_LRA={stats['input_lra']}:"
-                f"measured_thresh={stats['input_thresh']}:"
-                f"offset={stats['target_offset']}:"
-                f"linear=true"
-            ),
-        )
-        .run(input=wav_bytes.getvalue(), capture_stdout=True, capture_stderr=True)
+    return _parse_loudnorm_stats(stderr.decode("utf-8", errors="replace"))
+
+
+def two_pass_volume_normalization(
+    wav_audio: AudioSpool, loudnorm_stats: dict[str, str] | None = None
+) -> AudioSpool:
+    """Normalize volume using two-pass EBU R128 loudnorm.
+
+    Pass 1 measures the whole audio once, and is skipped when the loudnorm
+    statistics were already measured (see analyze_audio). Pass 2 applies them
+    to segments of the audio in parallel (see audio_segments).
+    """
+    return _two_pass_loudnorm(
+        wav_audio, _plan_filter_segments(wav_audio), _loudnorm_targets(), loudnorm_stats
     )
-    return BytesIO(out)
-
-
-def _read_audio_samples(
-    wav_bytes: BytesIO,
-) -> npt.NDArray[np.float32]:
-    """Read WAV bytes into float32 mono samples via ffmpeg."""
-    out, _ = (
-        ffmpeg.input("pipe:0", format="wav")
-        .output(
-            "pipe:",
-            format="s16le",
-            acodec="pcm_s16le",
-            ac=1,
-            ar=audio_settings.SAMPLE_RATE,
-        )
-        .run(input=wav_bytes.getvalue(), capture_stdout=True, capture_stderr=True)
+
+
+def _two_pass_loudnorm(
+    wav_audio: AudioSpool,
+    segments: list[tuple[int, int]],
+    targets: Mapping[str, object],
+    loudnorm_stats: dict[str, str] | None = None,
+) -> AudioSpool:
+    """Loudnorm measured on the whole audio, then applied linearly per segment."""
+    stats = loudnorm_stats or _measure_loudnorm_stats(wav_audio, targets)
+    return filter_segments(
+        wav_audio, segments, _loudnorm_filter(targets, stats), sample_rate
     )
-    return (
-        np.frombuffer(out, dtype=np.int16).astype(np.float32)
-        / noise_detection_settings.INT16_MAX
+
+
+def remove_long_silences(
+    wav_audio: AudioSpool, min_silence_seconds: float, padding_seconds: float
+) -> tuple[AudioSpool, list[TimeSpan]] | None:
+    """Cut the silences longer than `min_silence_seconds` out of a WAV.
+
+    Silences are detected with the same relative threshold as noise detection
+    (see _detect_silences). `padding_seconds` of each silence are kept on both
+    sides of a cut. The kept samples are copied as they are, so the trimmed
+    audio is the original with whole sample ranges removed.
+
+    Returns:
+        The trimmed WAV and the kept spans in original time, or None when no
+        silence is long enough to be removed.
+    """
+    pcm = wav_audio.pcm()
+    silences = _detect_silences(pcm, min_duration=min_silence_seconds)
+
+    padding = _seconds_to_samples(padding_seconds)
+    kept: list[tuple[int, int]] = []
+    kept_start = 0
+    for silence_start, silence_end in silences:
+        cut_start = _seconds_to_samples(silence_start) + padding
+        cut_end = min(_seconds_to_samples(silence_end), pcm.size) - padding
+        if cut_end <= cut_start:
+            continue
+        kept.append((kept_start, cut_start))
+        kept_start = cut_end
+    if not kept:
+        return None
+    kept.append((kept_start, pcm.size))
+
+    kept_samples = sum(end - start for start, end in kept)
+    trimmed_audio = AudioSpool(suffix=".wav")
+    try:
+        with open(trimmed_audio.path, "wb") as file:
+            file.write(
+                wav_header(kept_samples * audio_settings.BYTES_PER_SAMPLE, sample_rate)
+            )
+            file.writelines(memoryview(pcm[start:end]).cast("B") for start, end in kept)
+    except BaseException:
+        trimmed_audio.close()
+        raise
+
+    logger.info(
+        "Removed {} long silence(s): {:.1f}s of {:.1f}s kept",
+        len(kept) - 1,
+        kept_samples / sample_rate,
+        pcm.size / sample_rate,
     )
+    return trimmed_audio, [
+        TimeSpan(start / sample_rate, end / sample_rate) for start, end in kept
+    ]
 
 
 def _seconds_to_samples(seconds: float) -> int:
     """Convert a time position in seconds to a sample index."""
-    return int(seconds * audio_settings.SAMPLE_RATE)
+    return int(seconds * sample_rate)
 
 
 def compute_spectral_flatness_on_silences(
-    wav_bytes: BytesIO,
+    wav_audio: AudioSpool,
+    loudnorm_stats: dict[str, str] | None = None,
 ) -> float | None:
     """Calculate the average spectral flatness over silence segments."""
-    normalized_wav_bytes = two_pass_volume_normalization(wav_bytes)
-    silences = _detect_silences(normalized_wav_bytes)
-    samples = _read_audio_samples(normalized_wav_bytes)
-
-    flatness_values = []
-    for seg_start, seg_end in silences:
-        segment = samples[_seconds_to_samples(seg_start) : _seconds_to_samples(seg_end)]
-        if len(segment) < noise_detection_settings.FRAME_SIZE:
+    with two_pass_volume_normalization(wav_audio, loudnorm_stats) as normalized_audio:
+        normalized_pcm = normalized_audio.pcm()
+        silences = _detect_silences(normalized_pcm)
+        return spectral_flatness_on_segments(normalized_pcm, silences)
+
+
+def _frame_starts(
+    samples_count: int, segments: list[tuple[float, float]]
+) -> npt.NDArray[np.intp]:
+    """Start index of every FFT frame laid over the given segments.
+
+    Frames hop by HOP_SIZE from each segment start and must end strictly before
+    the segment end, matching the historical per-segment loop.
+    """
+    frame_size = noise_detection_settings.FRAME_SIZE
+    hop_size = noise_detection_settings.HOP_SIZE
+    starts = []
+    for seg_start, seg_end in segments:
+        first = _seconds_to_samples(seg_start)
+        last = min(_seconds_to_samples(seg_end), samples_count)
+        if last - first < frame_size:
             continue
-        for start in range(
-            0,
-            len(segment) - noise_detection_settings.FRAME_SIZE,
-            noise_detection_settings.HOP_SIZE,
-        ):
-            frame = segment[start : start + noise_detection_settings.FRAME_SIZE]
-            spectrum = np.abs(np.fft.rfft(frame)) ** 2 + 1e-12
-            geo_mean = np.exp(np.mean(np.log(spectrum)))
-            arith_mean = np.mean(spectrum)
-            flatness_values.append(geo_mean / arith_mean)
+        starts.append(np.arange(first, last - frame_size, hop_size, dtype=np.intp))
+    return np.concatenate(starts) if starts else np.empty(0, dtype=np.intp)
 
-    return float(np.mean(flatness_values)) if flatness_values else None
 
+def spectral_flatness_on_segments(
+    samples: npt.NDArray[np.float32] | npt.NDArray[np.int16],
+    segments: list[tuple[float, float]],
+) -> float | None:
+    """Average spectral flatness of the FFT frames covering the given segments.
 
-def is_audio_noisy(wav_bytes: BytesIO) -> bool:
+    Frames are gathered from a strided view of the samples and transformed in
+    batches of FLATNESS_BATCH_FRAMES, so memory stays bounded whatever the total
+    segment duration. int16 PCM is scaled to [-1, 1) one batch at a time.
+    """
+    frame_size = noise_detection_settings.FRAME_SIZE
+    starts = _frame_starts(len(samples), segments)
+    if starts.size == 0:
+        return None
+
+    frames = np.lib.stride_tricks.sliding_window_view(samples, frame_size)
+    batch_size = noise_detection_settings.FLATNESS_BATCH_FRAMES
+    flatness_sum = 0.0
+    for batch_start in range(0, starts.size, batch_size):
+        batch: npt.NDArray[np.float32] = frames[
+            starts[batch_start : batch_start + batch_size]
+        ].astype(np.float32, copy=False)
+        if samples.dtype == np.int16:
+            batch /= noise_detection_settings.INT16_MAX
+        spectrum = np.abs(np.fft.rfft(batch, axis=-1)) ** 2 + 1e-12
+        geo_mean = np.exp(np.mean(np.log(spectrum), axis=-1))
+        arith_mean = np.mean(spectrum, axis=-1)
+        flatness_sum += float(np.sum(geo_mean / arith_mean, dtype=np.float64))
+
+    return flatness_sum / starts.size
+
+
+def is_audio_noisy(
+    wav_audio: AudioSpool, loudnorm_stats: dict[str, str] | None = None
+) -> bool:
     """Determine whether audio is noisy based on spectral flatness in silence segments."""
-    flatness = compute_spectral_flatness_on_silences(wav_bytes)
+    flatness = compute_spectral_flatness_on_silences(wav_audio, loudnorm_stats)
     if flatness is None:
         logger.warning(
             "No silence segments detected, cannot compute spectral flatness. Assuming noisy audio."
         )
-    wav_bytes.seek(0)
     return (
         flatness is None or flatness > noise_detection_settings.NOISE_FLATNESS_THRESHOLD
     )
 
 
+def detect_speech(wav_audio: AudioSpool) -> list[TimeSpan]:
+    """Spans of the audio between its silences, found without diarization.
+
+    Silences are detected with the same relative threshold as noise detection
+    (see _detect_silences).
+    """
+    pcm = wav_audio.pcm()
+    speech: list[TimeSpan] = []
+    speech_start = 0.0
+    for silence_start, silence_end in _detect_silences(pcm):
+        if silence_start > speech_start:
+            speech.append(TimeSpan(speech_start, silence_start))
+        speech_start = silence_end
+    duration = pcm.size / sample_rate
+    if duration > speech_start:
+        speech.append(TimeSpan(speech_start, duration))
+    return speech
+
+
 def split_audio_on_timestamps(
-    audio_bytes: BytesIO,
+    wav_audio: AudioSpool,
     result_with_time: list[TimeSpan],
 ) -> list[TranscriptionInput]:
     """
-    Split mono audio bytes into chunks based on time spans.
+    Split mono WAV audio into chunks based on time spans.
+
+    Each chunk is a view of the memory-mapped int16 PCM: nothing is read or
+    copied until the chunk is encoded for transcription.
 
     Args:
-        audio_bytes (bytes): Full audio data (mono WAV/PCM encoded).
+        wav_audio (AudioSpool): Full audio (mono 16-bit PCM WAV).
         result_with_time (List[TimeSpan]): Spans with start/end times in seconds.
 
     Returns:
         List[TranscriptionInput]: List of audio chunks aligned with time spans.
     """
-    data, sample_rate = sf.read(audio_bytes)  # already mono
+    pcm = wav_audio.pcm()
     transcription_inputs: list[TranscriptionInput] = []
 
     for span in result_with_time:
         start_sample = int(span.start * sample_rate)
         end_sample = int(span.end * sample_rate)
-        chunk_data = data[start_sample:end_sample]
 
         transcription_inputs.append(
-            TranscriptionInput(
-                audio=chunk_data.astype("float32"),
-                span=span,
-            )
+            TranscriptionInput(audio=pcm[start_sample:end_sample], span=span)
         )
 
     logger.debug(
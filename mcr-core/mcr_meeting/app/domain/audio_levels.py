@@ -0,0 +1,78 @@
+"""In-process level analysis of 16-bit PCM, mirroring FFmpeg volumedetect/silencedetect.
+
+Once preprocessing holds 16 kHz mono PCM, measuring its mean volume or finding its
+silences does not need another FFmpeg process: both filters are simple reductions
+over the samples. The functions here reproduce their semantics on the int16 array
+(threshold rounding, strict comparisons, minimum duration, silence open at EOF),
+so callers get the same numbers without spawning a subprocess or scraping stderr.
+"""
+
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+# volumedetect reports this floor for digital silence instead of -inf.
+VOLUMEDETECT_MAX_DB = 91.0
+
+INT16_FULL_SCALE = 32768
+INT16_MAX = 32767
+
+# Samples processed at once, so memory stays bounded on memory-mapped PCM.
+_BLOCK_SAMPLES = 1 << 20
+
+
+def mean_volume_db(pcm: npt.NDArray[np.int16]) -> float:
+    """Mean volume in dBFS, as printed by volumedetect (0.1 dB resolution).
+
+    Returns -inf for empty input (volumedetect prints nothing) and -91.0 for
+    digital silence.
+    """
+    if pcm.size == 0:
+        return float("-inf")
+    power = 0
+    for offset in range(0, pcm.size, _BLOCK_SAMPLES):
+        block = pcm[offset : offset + _BLOCK_SAMPLES].astype(np.int64)
+        power += int(np.dot(block, block))
+    if power == 0:
+        return -VOLUMEDETECT_MAX_DB
+    mean_power = power / pcm.size / (INT16_FULL_SCALE * INT16_FULL_SCALE)
+    return round(10 * math.log10(mean_power), 1)
+
+
+def detect_silences(
+    pcm: npt.NDArray[np.int16],
+    noise_db: float,
+    min_duration: float,
+    sample_rate: int,
+) -> list[tuple[float, float]]:
+    """Silence intervals in seconds, as reported by silencedetect.
+
+    A sample is silent when its magnitude is strictly below the noise threshold,
+    converted to an int16 amplitude the way silencedetect does for s16 input.
+    A silence is reported once at least `min_duration` of consecutive silent
+    samples accumulate; a silence still open at the end of the audio is closed
+    at the end of the audio.
+    """
+    noise = int(10 ** (noise_db / 20) * INT16_MAX)
+    min_samples = max(round(min_duration * sample_rate), 1)
+
+    runs: list[tuple[int, int]] = []
+    open_start: int | None = None
+    for offset in range(0, pcm.size, _BLOCK_SAMPLES):
+        silent = np.abs(pcm[offset : offset + _BLOCK_SAMPLES].astype(np.int32)) < noise
+        edges = np.diff(silent.astype(np.int8), prepend=np.int8(open_start is not None))
+        starts = (np.flatnonzero(edges == 1) + offset).tolist()
+        ends = (np.flatnonzero(edges == -1) + offset).tolist()
+        if open_start is not None:
+            starts.insert(0, open_start)
+        runs.extend(zip(starts, ends, strict=False))
+        open_start = starts[-1] if len(starts) > len(ends) else None
+    if open_start is not None:
+        runs.append((open_start, pcm.size))
+
+    return [
+        (start / sample_rate, end / sample_rate)
+        for start, end in runs
+        if end - start >= min_samples
+    ]
@@ -0,0 +1,217 @@
+"""Parallel FFmpeg filtering of a WAV cut at its silences.
+
+An FFmpeg filter chain runs on one core, so denoising an hour-long meeting in a
+single process leaves the rest of the worker idle. Here the PCM is cut into
+segments of about FFMPEG_SEGMENT_SECONDS, each cut placed in the middle of a
+silence so that stateful filters (denoiser noise profile, compressor envelope)
+restart where there is nothing to hear. Every segment is streamed to its own
+FFmpeg process straight from the memory map, and the raw outputs are stitched
+back behind a new WAV header, each one trimmed or zero-padded to the length of
+its input so that timestamps stay sample-exact.
+
+Filters that must see the whole meeting (the loudnorm measurement) are not
+split: callers measure once, then pass the statistics to every segment.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import pairwise
+from typing import BinaryIO
+
+import ffmpeg
+import numpy as np
+import numpy.typing as npt
+from loguru import logger
+
+from mcr_meeting.app.configs.base import AudioSettings
+from mcr_meeting.app.domain.audio_spool import AudioSpool, wav_header
+
+audio_settings = AudioSettings()
+
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def plan_segments(
+    sample_count: int,
+    silences: list[tuple[float, float]],
+    segment_samples: int,
+    sample_rate: int,
+) -> list[tuple[int, int]]:
+    """Sample bounds of contiguous segments of about `segment_samples` each.
+
+    The audio is split evenly, then each cut is moved to the midpoint of the
+    silence closest to it, provided that silence lies within half a segment of
+    the even cut. Without such a silence the cut stays where it was.
+    """
+    segment_count = max(math.ceil(sample_count / max(segment_samples, 1)), 1)
+    if segment_count == 1:
+        return [(0, sample_count)]
+
+    spacing = sample_count / segment_count
+    midpoints = [round((start + end) / 2 * sample_rate) for start, end in silences]
+    cuts = []
+    for index in range(1, segment_count):
+        target = index * spacing
+        nearby = [point for point in midpoints if abs(point - target) < spacing / 2]
+        cuts.append(
+            min(nearby, key=lambda point: abs(point - target))
+            if nearby
+            else round(target)
+        )
+    edges = [0, *cuts, sample_count]
+    return list(pairwise(edges))
+
+
+def filter_segments(
+    wav_audio: AudioSpool,
+    segments: list[tuple[int, int]],
+    audio_filter: str,
+    sample_rate: int,
+) -> AudioSpool:
+    """Run an FFmpeg `-af` chain on each segment in parallel and stitch the results.
+
+    Args:
+        wav_audio (AudioSpool): Mono 16-bit PCM WAV.
+        segments (list[tuple[int, int]]): Contiguous sample bounds covering the
+            audio, as returned by plan_segments.
+        audio_filter (str): Filter chain applied to every segment.
+        sample_rate (int): Sample rate of the input, kept on output.
+    Returns:
+        AudioSpool: Filtered WAV with exactly as many samples as the input.
+    Raises:
+        ffmpeg.Error: When the chain fails on any segment.
+    """
+    pcm = wav_audio.pcm()
+    workers = min(
+        audio_settings.FFMPEG_SEGMENT_WORKERS or _available_cpus(), len(segments)
+    )
+    started = time.perf_counter()
+
+    outputs: list[AudioSpool] = []
+    try:
+        if workers <= 1:
+            for start, end in segments:
+                outputs.append(
+                    _filter_segment(pcm[start:end], audio_filter, sample_rate)
+                )
+        else:
+            outputs = _filter_segments_in_parallel(
+                pcm, segments, audio_filter, sample_rate, workers
+            )
+        stitched = _stitch(
+            outputs, [end - start for start, end in segments], sample_rate
+        )
+    finally:
+        for output in outputs:
+            output.close()
+
+    logger.info(
+        "Filtered {} segment(s) with {} FFmpeg process(es) in {:.1f}s",
+        len(segments),
+        workers,
+        time.perf_counter() - started,
+    )
+    return stitched
+
+
+def _available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _filter_segments_in_parallel(
+    pcm: npt.NDArray[np.int16],
+    segments: list[tuple[int, int]],
+    audio_filter: str,
+    sample_rate: int,
+    workers: int,
+) -> list[AudioSpool]:
+    # Threads are enough: each one only waits on its FFmpeg subprocess.
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ffmpeg-segment")
+    futures = [
+        pool.submit(_filter_segment, pcm[start:end], audio_filter, sample_rate)
+        for start, end in segments
+    ]
+    try:
+        return [future.result() for future in futures]
+    except BaseException:
+        pool.shutdown(cancel_futures=True)
+        for future in futures:
+            if not future.cancelled() and future.exception() is None:
+                future.result().close()
+        raise
+    finally:
+        pool.shutdown()
+
+
+def _filter_segment(
+    pcm: npt.NDArray[np.int16], audio_filter: str, sample_rate: int
+) -> AudioSpool:
+    """Filter one segment, fed to FFmpeg's stdin without copying the mapped samples."""
+    output = AudioSpool(suffix=".pcm")
+    try:
+        _, stderr_output = (
+            ffmpeg.input("pipe:", format="s16le", ar=sample_rate, ac=1)
+            .output(
+                output.path,
+                format="s16le",
+                af=audio_filter,
+                ar=sample_rate,
+                ac=1,
+            )
+            .overwrite_output()
+            .global_args("-hide_banner", "-nostats", "-loglevel", "warning")
+            .run(
+                input=memoryview(np.ascontiguousarray(pcm)).cast("B"),
+                capture_stderr=True,
+            )
+        )
+    except BaseException:
+        output.close()
+        raise
+    if stderr_output:
+        logger.warning(
+            "FFmpeg stderr (segment filtering): {}",
+            stderr_output.decode(errors="ignore"),
+        )
+    return output
+
+
+def _stitch(
+    outputs: list[AudioSpool], sample_counts: list[int], sample_rate: int
+) -> AudioSpool:
+    """Concatenate raw segment outputs into a WAV, each cut or padded to its input length."""
+    bytes_per_sample = audio_settings.BYTES_PER_SAMPLE
+    stitched = AudioSpool(suffix=".wav")
+    try:
+        with open(stitched.path, "wb") as file:
+            file.write(wav_header(sum(sample_counts) * bytes_per_sample, sample_rate))
+            for output, sample_count in zip(outputs, sample_counts, strict=True):
+                expected = sample_count * bytes_per_sample
+                with output.open() as source:
+                    copied = _copy_at_most(source, file, expected)
+                if copied != expected:
+                    logger.debug(
+                        "FFmpeg segment output is {} bytes, expected {}",
+                        output.size,
+                        expected,
+                    )
+                    file.write(bytes(expected - copied))
+    except BaseException:
+        stitched.close()
+        raise
+    return stitched
+
+
+def _copy_at_most(source: BinaryIO, destination: BinaryIO, limit: int) -> int:
+    copied = 0
+    while copied < limit:
+        block = source.read(min(_COPY_BUFFER_SIZE, limit - copied))
+        if not block:
+            break
+        destination.write(block)
+        copied += len(block)
+    return copied
@@ -0,0 +1,211 @@
+"""Disk-backed audio handle passed between the preprocessing steps.
+
+A meeting's audio is spooled to a temporary file instead of being held as bytes:
+FFmpeg reads and writes the files directly, uploads stream from them, and the
+16-bit PCM of a WAV is exposed as a read-only memory map. Worker memory therefore
+no longer grows with the length of the meeting.
+
+Slices of that map are wrapped back into WAV bytes by wav_bytes_from_pcm, which
+writes a header and copies the int16 frames as they are.
+"""
+
+import os
+import shutil
+import struct
+import tempfile
+import weakref
+from collections.abc import Iterable
+from io import BytesIO
+from types import TracebackType
+from typing import BinaryIO, Protocol, Self
+
+import numpy as np
+import numpy.typing as npt
+
+from mcr_meeting.app.configs.base import AudioSettings
+from mcr_meeting.app.exceptions.exceptions import InvalidAudioFileError
+
+audio_settings = AudioSettings()
+
+_COPY_BUFFER_SIZE = 1024 * 1024
+_RIFF_HEADER_SIZE = 12
+_CHUNK_HEADER = struct.Struct("<4sI")
+_FMT_CHUNK = struct.Struct("<HHIIHH")
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# Size FFmpeg writes for RIFF/data chunks when the output is not seekable.
+_UNKNOWN_CHUNK_SIZE = 0xFFFFFFFF
+# RIFF header, `fmt ` chunk (PCM) and `data` chunk header of a canonical WAV.
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+class ReadableStream(Protocol):
+    """A byte stream `append` copies from: a file, or an S3 object body."""
+
+    def read(self, size: int = ..., /) -> bytes: ...
+
+
+def _remove_file(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
+
+
+class AudioSpool:
+    """Audio stored in a temporary file, deleted on close().
+
+    Use it as a context manager. The file is also removed when the handle is
+    garbage collected, so an exception between two steps cannot leak it.
+    """
+
+    def __init__(self, suffix: str = "") -> None:
+        fd, self.path = tempfile.mkstemp(
+            prefix="mcr-audio-", suffix=suffix, dir=audio_settings.SPOOL_DIR
+        )
+        os.close(fd)
+        self._finalizer = weakref.finalize(self, _remove_file, self.path)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        spool = cls()
+        with open(spool.path, "wb") as file:
+            file.write(data)
+        return spool
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[bytes]) -> Self:
+        spool = cls()
+        with open(spool.path, "wb") as file:
+            file.writelines(chunks)
+        return spool
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._finalizer()
+
+    @property
+    def size(self) -> int:
+        return os.path.getsize(self.path)
+
+    def open(self) -> BinaryIO:
+        """Open the spooled audio for reading, from the start."""
+        return open(self.path, "rb")
+
+    def read_bytes(self) -> bytes:
+        """Load the whole file in memory. Meant for small files and tests."""
+        with self.open() as file:
+            return file.read()
+
+    def append(self, source: ReadableStream, offset: int | None = None) -> None:
+        """Copy a readable stream into the spool with a bounded buffer.
+
+        When `offset` is given the file is first truncated to it, so a download
+        retried after a partial read starts over cleanly.
+        """
+        with open(self.path, "r+b") as file:
+            if offset is not None:
+                file.truncate(offset)
+            file.seek(0, os.SEEK_END)
+            shutil.copyfileobj(source, file, _COPY_BUFFER_SIZE)
+
+    def pcm(self) -> npt.NDArray[np.int16]:
+        """Read-only memory map of the samples of a mono 16-bit PCM WAV."""
+        data_offset, data_size = self._locate_pcm_data()
+        sample_count = data_size // audio_settings.BYTES_PER_SAMPLE
+        if sample_count == 0:
+            return np.empty(0, dtype=np.int16)
+        return np.memmap(
+            self.path,
+            dtype="<i2",
+            mode="r",
+            offset=data_offset,
+            shape=(sample_count,),
+        )
+
+    def _locate_pcm_data(self) -> tuple[int, int]:
+        """Offset and size of the `data` chunk, after checking the `fmt ` chunk."""
+        file_size = self.size
+        with self.open() as file:
+            header = file.read(_RIFF_HEADER_SIZE)
+            if (
+                len(header) < _RIFF_HEADER_SIZE
+                or header[:4] != b"RIFF"
+                or header[8:] != b"WAVE"
+            ):
+                raise InvalidAudioFileError(f"Not a WAV file: {self.path}")
+
+            while header := file.read(_CHUNK_HEADER.size):
+                if len(header) < _CHUNK_HEADER.size:
+                    break
+                chunk_id, chunk_size = _CHUNK_HEADER.unpack(header)
+                if chunk_id == b"fmt ":
+                    self._check_format(file.read(_FMT_CHUNK.size))
+                    file.seek(chunk_size - _FMT_CHUNK.size + chunk_size % 2, 1)
+                elif chunk_id == b"data":
+                    data_offset = file.tell()
+                    available = file_size - data_offset
+                    if chunk_size == _UNKNOWN_CHUNK_SIZE or chunk_size > available:
+                        chunk_size = available
+                    return data_offset, chunk_size
+                else:
+                    file.seek(chunk_size + chunk_size % 2, 1)
+
+        raise InvalidAudioFileError(f"WAV file has no data chunk: {self.path}")
+
+    @staticmethod
+    def _check_format(fmt: bytes) -> None:
+        if len(fmt) < _FMT_CHUNK.size:
+            raise InvalidAudioFileError("Truncated WAV fmt chunk")
+        audio_format, channels, _, _, _, bits = _FMT_CHUNK.unpack(fmt)
+        if (
+            audio_format not in (_WAVE_FORMAT_PCM, _WAVE_FORMAT_EXTENSIBLE)
+            or channels != 1
+            or bits != 8 * audio_settings.BYTES_PER_SAMPLE
+        ):
+            raise InvalidAudioFileError(
+                f"Expected mono 16-bit PCM WAV, got format={audio_format} "
+                f"channels={channels} bits={bits}"
+            )
+
+
+def wav_bytes_from_pcm(pcm: npt.NDArray[np.int16], sample_rate: int) -> BytesIO:
+    """Mono 16-bit PCM WAV holding `pcm`, with no float round trip.
+
+    The samples are copied once, straight from `pcm` (typically a slice of
+    AudioSpool.pcm()) into the returned buffer, which is rewound to the start.
+    """
+    frames = np.ascontiguousarray(pcm, dtype="<i2")
+    buffer = BytesIO()
+    buffer.write(wav_header(frames.nbytes, sample_rate))
+    buffer.write(memoryview(frames).cast("B"))
+    buffer.seek(0)
+    return buffer
+
+
+def wav_header(data_size: int, sample_rate: int) -> bytes:
+    """Header of a canonical mono 16-bit PCM WAV whose samples take `data_size` bytes."""
+    bytes_per_sample = audio_settings.BYTES_PER_SAMPLE
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        _WAV_HEADER.size - 8 + data_size,
+        b"WAVE",
+        b"fmt ",
+        _FMT_CHUNK.size,
+        _WAVE_FORMAT_PCM,
+        1,
+        sample_rate,
+        sample_rate * bytes_per_sample,
+        bytes_per_sample,
+        8 * bytes_per_sample,
+        b"data",
+        data_size,
+    )
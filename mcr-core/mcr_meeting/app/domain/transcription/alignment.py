@@ -0,0 +1,55 @@
+"""Maximum-overlap lookup between two sets of time spans.
+
+Both sets are sorted by start once and walked together: a reference span joins
+the active set when a query could reach it and leaves it once queries start
+after its end, so each query only compares against the reference spans alive
+around it. With diarization turns, which rarely overlap more than a few at a
+time, the cost is linear after the two sorts, instead of comparing every
+transcription segment with every turn.
+"""
+
+from mcr_meeting.app.schemas.transcription_schema import TimeSpan
+
+
+def max_overlaps(
+    queries: list[TimeSpan], references: list[TimeSpan]
+) -> list[tuple[int | None, float]]:
+    """Reference span overlapping each query the most.
+
+    Args:
+        queries (list[TimeSpan]): Spans to match, in any order.
+        references (list[TimeSpan]): Spans to match against, in any order.
+    Returns:
+        list[tuple[int | None, float]]: For each query, in input order, the index
+            in `references` of the span with the largest overlap and that overlap
+            in seconds. Ties go to the lowest index; (None, 0.0) when no span
+            overlaps the query by more than zero.
+    """
+    by_start = sorted(range(len(references)), key=lambda i: references[i].start)
+    matches: list[tuple[int | None, float]] = [(None, 0.0)] * len(queries)
+    active: list[int] = []
+    next_reference = 0
+
+    for query_index in sorted(range(len(queries)), key=lambda i: queries[i].start):
+        query = queries[query_index]
+        while (
+            next_reference < len(by_start)
+            and references[by_start[next_reference]].start < query.end
+        ):
+            active.append(by_start[next_reference])
+            next_reference += 1
+        # Queries come by increasing start: a span ended before this one
+        # starts cannot overlap any later query either.
+        active = [i for i in active if references[i].end > query.start]
+
+        best: int | None = None
+        best_overlap = 0.0
+        for reference_index in active:
+            overlap = query.overlap(references[reference_index])
+            if overlap > best_overlap or (
+                overlap == best_overlap and best is not None and reference_index < best
+            ):
+                best, best_overlap = reference_index, overlap
+        matches[query_index] = (best, best_overlap)
+
+    return matches
@@ -0,0 +1,49 @@
+"""Fingerprints deciding whether a meeting's diarization artifacts can be reused.
+
+The diarize stage stores the preprocessed WAV and the diarization next to a
+manifest of the inputs that produced them: a hash of the source audio and a
+fingerprint of the configuration. A retried or requeued meeting whose inputs
+hash the same skips fetching, preprocessing and diarizing again.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable, Mapping
+
+from mcr_meeting.app.schemas.S3_types import S3Object
+from mcr_meeting.app.schemas.transcription_schema import ArtifactManifest
+
+# Bump when a code change alters the preprocessed audio or the diarization, so
+# artifacts produced by the previous code stop matching.
+ARTIFACTS_VERSION = 1
+
+
+def hash_audio_chunks(chunks: Iterable[S3Object]) -> str:
+    """Content hash of the source audio, from the object listing alone.
+
+    S3 ETags are content digests, so hashing each chunk's key, ETag and size in
+    key order identifies the concatenated audio without downloading it.
+    """
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(f"{chunk.object_name}\t{chunk.etag}\t{chunk.size}\n".encode())
+    return digest.hexdigest()
+
+
+def fingerprint_config(config: Mapping[str, object]) -> str:
+    """Stable hash of a JSON-serializable configuration, whatever its key order."""
+    payload = json.dumps(
+        {"version": ARTIFACTS_VERSION, "config": config},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def build_manifest(
+    chunks: Iterable[S3Object], config: Mapping[str, object]
+) -> ArtifactManifest:
+    return ArtifactManifest(
+        source_audio_hash=hash_audio_chunks(chunks),
+        config_fingerprint=fingerprint_config(config),
+    )
@@ -1,6 +1,10 @@
 """Compute large transcription chunks from diarization segments."""
 
+import heapq
+from bisect import bisect_left, bisect_right
 from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import pairwise
 
 from mcr_meeting.app.configs.base import WhisperTranscriptionSettings
 from mcr_meeting.app.schemas.transcription_schema import DiarizationSegment, TimeSpan
@@ -8,6 +12,7 @@ from mcr_meeting.app.schemas.transcription_schema import DiarizationSegment, Tim
 _settings = WhisperTranscriptionSettings()
 MAX_CHUNK_DURATION = _settings.MAX_CHUNK_DURATION
 SPLIT_SEARCH_WINDOW_RATIO = _settings.SPLIT_SEARCH_WINDOW_RATIO
+MIN_CHUNK_DURATION = _settings.MIN_CHUNK_DURATION
 
 
 def _merge_overlapping_intervals(
@@ -28,71 +33,183 @@ def _merge_overlapping_intervals(
     return merged
 
 
-def _find_split_boundary(
-    chunk_start: float,
-    chunk_intervals: list[TimeSpan],
-    next_interval: TimeSpan,
-    max_chunk_duration: float,
-    split_search_window_ratio: float = SPLIT_SEARCH_WINDOW_RATIO,
-) -> float:
-    window_start = chunk_start + (1 - split_search_window_ratio) * max_chunk_duration
-    window_end = chunk_start + max_chunk_duration
-
-    all_intervals = chunk_intervals + [next_interval]
-
-    best_gap: TimeSpan | None = None
-
-    for j in range(len(all_intervals) - 1):
-        gap = all_intervals[j].gap_to(all_intervals[j + 1])
-        if gap is None or gap.start < window_start:
-            continue
-        if gap.midpoint > window_end:
-            continue
-
-        if best_gap is None or gap.duration > best_gap.duration:
-            best_gap = gap
+class _Gaps:
+    """Silences between consecutive merged intervals, computed once.
+
+    Gap k lies between intervals k and k + 1. Intervals are sorted and apart,
+    so gap starts and midpoints both increase with k: the gaps of a split
+    window form one contiguous run, found by binary search.
+    """
+
+    def __init__(self, merged: list[TimeSpan]) -> None:
+        self.starts = [interval.end for interval in merged[:-1]]
+        ends = [interval.start for interval in merged[1:]]
+        self.durations = [end - start for start, end in zip(self.starts, ends)]
+        self.midpoints = [(start + end) / 2.0 for start, end in zip(self.starts, ends)]
+
+    def split_boundary(
+        self,
+        first_gap: int,
+        last_gap: int,
+        chunk_start: float,
+        max_chunk_duration: float,
+        split_search_window_ratio: float = SPLIT_SEARCH_WINDOW_RATIO,
+    ) -> float:
+        """Midpoint of the largest gap of `first_gap`..`last_gap` in the split window.
+
+        The window covers the last `split_search_window_ratio` of the chunk: a
+        gap qualifies when it starts inside it and its midpoint does not pass
+        the chunk's maximal end. Ties go to the earliest gap; with no gap in the
+        window the chunk is cut at its maximal end.
+        """
+        window_start = (
+            chunk_start + (1 - split_search_window_ratio) * max_chunk_duration
+        )
+        window_end = chunk_start + max_chunk_duration
 
-    if best_gap is not None:
-        return best_gap.midpoint
+        lo = bisect_left(self.starts, window_start, first_gap, last_gap + 1)
+        hi = bisect_right(self.midpoints, window_end, lo, last_gap + 1)
+        if lo == hi:
+            return window_end
 
-    return window_end
+        best = max(range(lo, hi), key=self.durations.__getitem__)
+        return self.midpoints[best]
 
 
 def compute_transcription_chunks(
     diarization: list[DiarizationSegment],
     max_chunk_duration: float = MAX_CHUNK_DURATION,
 ) -> list[TimeSpan]:
-    if not diarization:
-        return []
+    return compute_speech_chunks(
+        (TimeSpan(seg.start, seg.end) for seg in diarization), max_chunk_duration
+    )
 
-    spans = (TimeSpan(seg.start, seg.end) for seg in diarization)
-    merged = _merge_overlapping_intervals(spans)
+
+def compute_speech_chunks(
+    speech: Iterable[TimeSpan],
+    max_chunk_duration: float = MAX_CHUNK_DURATION,
+) -> list[TimeSpan]:
+    """Chunks covering the `speech` spans, cut in the gaps between them."""
+    merged = _merge_overlapping_intervals(speech)
 
     if not merged:
         return []
 
+    gaps = _Gaps(merged)
     chunks: list[TimeSpan] = []
     chunk_start = merged[0].start
-    chunk_intervals: list[TimeSpan] = [merged[0]]
+    # The chunk holds the intervals from `first_interval` on; the gap before
+    # it belongs to the previous chunk.
+    first_interval = 0
 
     for i in range(1, len(merged)):
-        interval = merged[i]
-        prospective_end = interval.end
-        prospective_duration = prospective_end - chunk_start
-
-        if prospective_duration <= max_chunk_duration:
-            chunk_intervals.append(interval)
+        if merged[i].end - chunk_start <= max_chunk_duration:
             continue
 
-        boundary = _find_split_boundary(
-            chunk_start, chunk_intervals, interval, max_chunk_duration
+        boundary = gaps.split_boundary(
+            first_interval, i - 1, chunk_start, max_chunk_duration
         )
 
         chunks.append(TimeSpan(chunk_start, boundary))
         chunk_start = boundary
-        chunk_intervals = [interval]
+        first_interval = i
 
-    last_end = chunk_intervals[-1].end
-    chunks.append(TimeSpan(chunk_start, last_end))
+    chunks.append(TimeSpan(chunk_start, merged[-1].end))
 
     return chunks
+
+
+@dataclass(frozen=True)
+class ChunkCostModel:
+    """Expected latency of chunk requests sent `concurrency` at a time.
+
+    A request costs a fixed overhead (upload, queueing, model start) plus
+    `real_time_factor` seconds per second of audio.
+    """
+
+    request_overhead: float
+    real_time_factor: float
+    concurrency: int
+
+    def wall_time(self, chunks: list[TimeSpan]) -> float:
+        """Time until the last chunk is transcribed, chunks sent in order.
+
+        Like the transcription thread pool, each slot takes the next chunk
+        as soon as it is free.
+        """
+        slots = [0.0] * max(1, self.concurrency)
+        for chunk in chunks:
+            free_at = heapq.heappop(slots)
+            heapq.heappush(
+                slots,
+                free_at
+                + self.request_overhead
+                + self.real_time_factor * chunk.duration,
+            )
+        return max(slots)
+
+
+def _balanced_chunks(
+    start: float, end: float, gaps: _Gaps, chunk_count: int
+) -> list[TimeSpan]:
+    """Cut start..end into about `chunk_count` equal chunks, at the nearest gaps.
+
+    Each cut goes to the gap midpoint closest to its ideal position, after the
+    previous cut; fewer chunks come out when the gaps run out.
+    """
+    boundaries: list[float] = []
+    next_gap = 0
+    for k in range(1, chunk_count):
+        if next_gap >= len(gaps.midpoints):
+            break
+        target = start + k * (end - start) / chunk_count
+        after = bisect_left(gaps.midpoints, target, next_gap)
+        nearest = min(
+            (i for i in (after - 1, after) if next_gap <= i < len(gaps.midpoints)),
+            key=lambda i: abs(gaps.midpoints[i] - target),
+        )
+        boundaries.append(gaps.midpoints[nearest])
+        next_gap = nearest + 1
+
+    edges = [start, *boundaries, end]
+    return [TimeSpan(a, b) for a, b in pairwise(edges)]
+
+
+def compute_makespan_chunks(
+    diarization: list[DiarizationSegment],
+    cost: ChunkCostModel,
+    max_chunk_duration: float = MAX_CHUNK_DURATION,
+    min_chunk_duration: float = MIN_CHUNK_DURATION,
+) -> list[TimeSpan]:
+    """Chunks that minimize the expected wall time of the transcription.
+
+    Starts from compute_transcription_chunks. When that plan leaves transcription
+    slots idle (short meetings), more and shorter chunks, cut at the diarization
+    gaps nearest to an even split, are tried up to one per slot, none shorter
+    on average than `min_chunk_duration`. The plan with the lowest expected
+    wall time under `cost` is kept: more chunks pay more request overheads but
+    run side by side.
+    """
+    chunks = compute_transcription_chunks(diarization, max_chunk_duration)
+    if not chunks or len(chunks) >= cost.concurrency:
+        return chunks
+
+    merged = _merge_overlapping_intervals(
+        TimeSpan(seg.start, seg.end) for seg in diarization
+    )
+    gaps = _Gaps(merged)
+    start, end = merged[0].start, merged[-1].end
+    longest_allowed = max(max_chunk_duration, max(c.duration for c in chunks))
+
+    best, best_wall_time = chunks, cost.wall_time(chunks)
+    for chunk_count in range(len(chunks) + 1, cost.concurrency + 1):
+        if (end - start) / chunk_count < min_chunk_duration:
+            break
+        candidate = _balanced_chunks(start, end, gaps, chunk_count)
+        if max(c.duration for c in candidate) > longest_allowed:
+            continue
+        wall_time = cost.wall_time(candidate)
+        if wall_time < best_wall_time:
+            best, best_wall_time = candidate, wall_time
+
+    return best
@@ -0,0 +1,234 @@
+"""Glossary acronyms a transcript chunk may have mistranscribed.
+
+A local pre-filter for the acronym correction: only the glossary entries that
+some words of a chunk could be a mistranscription of are worth sending to the
+LLM, and a chunk with none needs no call. The matcher looks for the error
+kinds the correction prompt lists:
+
+- the acronym read as a word and transcribed as French words that sound the
+  same (« opaque » for OPAC, « eau nue » for ONU), compared on a rough French
+  phonetic key;
+- the acronym in lower or mixed case (« Ants » for ANTS);
+- an initial A swallowed by the liaison after « la » / « le » (« la NTS »);
+- a doubled letter spoken as « deux X » (« AN2SI » for ANSSI);
+- an upper-case word one edit away from an acronym (« CMI » for CCMI).
+
+The sound-alike, case and doubled-letter forms are found in one pass per view
+of the text (normalized words, phonetic keys) by an Aho-Corasick automaton,
+and only kept when they start and end on word boundaries, so a pattern may span
+several words. The word after « la » / « le » is looked up among the acronyms
+without their initial A, and the upper-case words in an index of the acronyms
+with one character deleted. An acronym already written as in the glossary is
+not a candidate. Matching favours recall: a false candidate costs a few prompt lines,
+a missed one an uncorrected acronym.
+"""
+
+import itertools
+import re
+import unicodedata
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+# Shorter keys match common words too often to tell anything.
+_MIN_KEY_LENGTH = 3
+# Longest run of words a phonetic pattern may span (« eau nue »).
+_MAX_SPAN_WORDS = 3
+
+_ENTRY_ACRONYMS = re.compile(r"\*\*(.+?)\*\*")
+_WORDS = re.compile(r"\w+")
+
+# Rough French grapheme-to-sound rewrites, applied in order.
+_PHONETIC_REWRITES = [
+    (re.compile(r"eau|au"), "o"),
+    (re.compile(r"ph"), "f"),
+    (re.compile(r"qu|ck|q"), "k"),
+    (re.compile(r"c(?=[eiy])"), "s"),
+    (re.compile(r"c"), "k"),
+    (re.compile(r"g(?=[eiy])"), "j"),
+    (re.compile(r"gu(?=[eiy])"), "g"),
+    (re.compile(r"ai|ei"), "e"),
+    (re.compile(r"y"), "i"),
+    (re.compile(r"h"), ""),
+    (re.compile(r"(?<=.)(e|es|ent|s|t|x|d|z)$"), ""),
+    (re.compile(r"(.)\1+"), r"\1"),
+]
+
+
+@dataclass(frozen=True)
+class GlossaryEntry:
+    """One glossary line and the acronyms it defines."""
+
+    acronyms: tuple[str, ...]
+    text: str
+
+
+def parse_glossary(content: str) -> list[GlossaryEntry]:
+    """Entries of a glossary of `**ACRONYM** [ou **OTHER**] - meaning` paragraphs."""
+    entries = []
+    for paragraph in content.split("\n\n"):
+        paragraph = paragraph.strip()
+        head = paragraph.split(" - ", 1)[0]
+        acronyms = tuple(_ENTRY_ACRONYMS.findall(head))
+        if acronyms:
+            entries.append(GlossaryEntry(acronyms=acronyms, text=paragraph))
+    return entries
+
+
+def normalize(word: str) -> str:
+    """Lower case, without accents nor anything but letters and digits."""
+    decomposed = unicodedata.normalize("NFD", word.lower())
+    return "".join(c for c in decomposed if c.isalnum() and c.isascii())
+
+
+def phonetic_key(word: str) -> str:
+    """How a French reader would say `word`, roughly, as a comparable key."""
+    key = "".join(c for c in normalize(word) if c.isalpha())
+    for pattern, replacement in _PHONETIC_REWRITES:
+        key = pattern.sub(replacement, key)
+    return key
+
+
+class AhoCorasick:
+    """Every occurrence of a set of patterns in one pass over a text."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[list[str]] = [[]]
+        for pattern in set(patterns):
+            self._add(pattern)
+        self._link()
+
+    def _add(self, pattern: str) -> None:
+        state = 0
+        for char in pattern:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._outputs[state].append(pattern)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                if self._fail[child] == child:
+                    self._fail[child] = 0
+                self._outputs[child] += self._outputs[self._fail[child]]
+
+    def find(self, text: str) -> Iterable[tuple[int, str]]:
+        """(start, pattern) of each occurrence, overlapping ones included."""
+        state = 0
+        for end, char in enumerate(text, start=1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern in self._outputs[state]:
+                yield end - len(pattern), pattern
+
+
+def _deletions(word: str) -> set[str]:
+    return {word} | {word[:i] + word[i + 1 :] for i in range(len(word))}
+
+
+class GlossaryMatcher:
+    def __init__(self, entries: list[GlossaryEntry]) -> None:
+        self._entries = entries
+        written: dict[str, set[int]] = {}
+        normalized: dict[str, set[int]] = {}
+        phonetic: dict[str, set[int]] = {}
+        liaison: dict[str, set[int]] = {}
+        fuzzy: dict[str, set[int]] = {}
+        for index, entry in enumerate(entries):
+            for acronym in entry.acronyms:
+                written.setdefault(acronym, set()).add(index)
+                form = normalize(acronym)
+                if len(form) < _MIN_KEY_LENGTH:
+                    continue
+                if form.startswith("a"):
+                    liaison.setdefault(form[1:], set()).add(index)
+                forms = {form}
+                for letter in set(form):
+                    if letter + letter in form:
+                        forms.add(form.replace(letter + letter, "2" + letter, 1))
+                for key in forms:
+                    normalized.setdefault(key, set()).add(index)
+                key = phonetic_key(acronym)
+                if len(key) >= _MIN_KEY_LENGTH:
+                    phonetic.setdefault(key, set()).add(index)
+                for key in _deletions(acronym.upper()):
+                    fuzzy.setdefault(key, set()).add(index)
+        self._written = written
+        self._normalized = normalized
+        self._phonetic = phonetic
+        self._liaison = liaison
+        self._fuzzy = fuzzy
+        self._normalized_automaton = AhoCorasick(normalized)
+        self._phonetic_automaton = AhoCorasick(phonetic)
+
+    def candidates(self, text: str) -> list[GlossaryEntry]:
+        """Entries some words of `text` may be a mistranscription of.
+
+        In glossary order; empty when nothing in the text resembles an acronym.
+        """
+        words = _WORDS.findall(text)
+        found: set[int] = set()
+        found |= self._find_in_view(
+            words,
+            [normalize(word) for word in words],
+            self._normalized_automaton,
+            self._normalized,
+        )
+        found |= self._find_in_view(
+            words,
+            [phonetic_key(word) for word in words],
+            self._phonetic_automaton,
+            self._phonetic,
+        )
+        for article, word in itertools.pairwise(words):
+            if article.lower() in ("la", "le"):
+                found |= self._liaison.get(normalize(word), set())
+        for word in words:
+            if word.isupper() and len(word) > 1 and word not in self._written:
+                for key in _deletions(word):
+                    found |= self._fuzzy.get(key, set())
+        return [self._entries[index] for index in sorted(found)]
+
+    def _find_in_view(
+        self,
+        words: list[str],
+        keys: list[str],
+        automaton: AhoCorasick,
+        patterns: dict[str, set[int]],
+    ) -> set[int]:
+        # The keys are joined without separators, so that a pattern can span
+        # several words; only the occurrences aligned on words are kept.
+        starts: dict[int, int] = {}
+        ends: dict[int, int] = {}
+        offset = 0
+        for position, key in enumerate(keys):
+            if not key:
+                continue
+            starts[offset] = position
+            offset += len(key)
+            ends[offset] = position
+        found: set[int] = set()
+        for start, pattern in automaton.find("".join(keys)):
+            first = starts.get(start)
+            last = ends.get(start + len(pattern))
+            if first is None or last is None or last - first >= _MAX_SPAN_WORDS:
+                continue
+            for index in patterns[pattern]:
+                if first == last and words[first] in self._entries[index].acronyms:
+                    continue
+                found.add(index)
+        return found
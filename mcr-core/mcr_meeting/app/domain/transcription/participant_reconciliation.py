@@ -1,6 +1,8 @@
-"""Pure participant reconciliation: input formatting and name-loss detection."""
+"""Pure participant reconciliation: input formatting, name-loss detection and
+merging of the participants extracted chunk by chunk."""
 
 from dataclasses import dataclass
+from unicodedata import normalize
 
 from mcr_meeting.app.schemas.transcription_schema import (
     DiarizedTranscriptionSegment,
@@ -55,3 +57,167 @@ def detect_name_losses(
             )
 
     return losses
+
+
+# A candidate at or above this confidence was introduced explicitly (self- or
+# third-party introduction, see the extraction prompt), below it was deduced.
+_EXPLICIT_CONFIDENCE = 0.9
+# Between two deductions, the gap that settles which name a speaker gets.
+_DECISIVE_CONFIDENCE_GAP = 0.3
+
+
+@dataclass
+class ParticipantConflict:
+    speaker_ids: list[str]
+    names: list[str]
+    reason: str
+
+
+@dataclass
+class ParticipantMerge:
+    participants: list[Participant]
+    conflicts: list[ParticipantConflict]
+
+
+@dataclass
+class _NameGroup:
+    name: str
+    tokens: list[str]
+    members: list[Participant]
+
+    @property
+    def confidence(self) -> float:
+        return max(_confidence(p) for p in self.members)
+
+
+def merge_participant_candidates(
+    candidates_per_chunk: list[list[Participant]],
+) -> ParticipantMerge:
+    """Reconcile the participants extracted from each chunk on its own.
+
+    The names a speaker got in different chunks are kept together when one
+    extends the other (« Julie » and « Julie Martin » give « Julie Martin »).
+    When they differ, an explicit introduction beats deductions, and a
+    deduction beats one much less confident; otherwise the speaker stays
+    unnamed and the disagreement is reported as a conflict. The same goes
+    for one name given to several speakers. Participants are listed in the
+    order they first appear.
+    """
+    candidates_by_speaker: dict[str, list[Participant]] = {}
+    for candidates in candidates_per_chunk:
+        for candidate in candidates:
+            candidates_by_speaker.setdefault(candidate.speaker_id, []).append(candidate)
+
+    conflicts: list[ParticipantConflict] = []
+    participants: list[Participant] = []
+    for speaker_id, candidates in candidates_by_speaker.items():
+        groups = _group_names(candidates)
+        winner = _decisive(groups)
+        if groups and winner is None:
+            conflicts.append(
+                ParticipantConflict(
+                    speaker_ids=[speaker_id],
+                    names=[group.name for group in groups],
+                    reason="names_disagree",
+                )
+            )
+        participants.append(_merged_participant(speaker_id, candidates, winner))
+
+    conflicts += unshare_names(participants)
+    return ParticipantMerge(participants=participants, conflicts=conflicts)
+
+
+def unshare_names(participants: list[Participant]) -> list[ParticipantConflict]:
+    """Leave one speaker at most with each name, in place.
+
+    Of the speakers sharing a name, the one decisively more confident keeps
+    it; otherwise none does and the name is reported as a conflict.
+    """
+    by_name: dict[tuple[str, ...], list[Participant]] = {}
+    for participant in participants:
+        if participant.name:
+            by_name.setdefault(tuple(_name_tokens(participant.name)), []).append(
+                participant
+            )
+
+    conflicts: list[ParticipantConflict] = []
+    for sharing in by_name.values():
+        if len(sharing) < 2:
+            continue
+        groups = [
+            _NameGroup(name=p.name or "", tokens=[], members=[p]) for p in sharing
+        ]
+        winner = _decisive(groups)
+        for participant in sharing:
+            if winner is None or participant is not winner.members[0]:
+                participant.name = None
+                participant.confidence = None
+                participant.association_justification = None
+        if winner is None:
+            conflicts.append(
+                ParticipantConflict(
+                    speaker_ids=[p.speaker_id for p in sharing],
+                    names=[groups[0].name],
+                    reason="name_shared",
+                )
+            )
+    return conflicts
+
+
+def _confidence(participant: Participant) -> float:
+    return participant.confidence or 0.0
+
+
+def _name_tokens(name: str) -> list[str]:
+    return normalize("NFC", name).lower().split()
+
+
+def _group_names(candidates: list[Participant]) -> list[_NameGroup]:
+    groups: list[_NameGroup] = []
+    for candidate in candidates:
+        if not candidate.name or not candidate.name.strip():
+            continue
+        tokens = _name_tokens(candidate.name)
+        for group in groups:
+            shorter, longer = sorted((tokens, group.tokens), key=len)
+            if longer[: len(shorter)] == shorter:
+                group.members.append(candidate)
+                if len(tokens) > len(group.tokens):
+                    group.name, group.tokens = candidate.name.strip(), tokens
+                break
+        else:
+            groups.append(
+                _NameGroup(
+                    name=candidate.name.strip(), tokens=tokens, members=[candidate]
+                )
+            )
+    return groups
+
+
+def _decisive(groups: list[_NameGroup]) -> _NameGroup | None:
+    if not groups:
+        return None
+    ranked = sorted(groups, key=lambda group: group.confidence, reverse=True)
+    if len(ranked) == 1:
+        return ranked[0]
+    best, runner_up = ranked[0].confidence, ranked[1].confidence
+    if best >= _EXPLICIT_CONFIDENCE > runner_up:
+        return ranked[0]
+    if best - runner_up >= _DECISIVE_CONFIDENCE_GAP:
+        return ranked[0]
+    return None
+
+
+def _merged_participant(
+    speaker_id: str, candidates: list[Participant], winner: _NameGroup | None
+) -> Participant:
+    sources = winner.members if winner else candidates
+    best = max(sources, key=_confidence)
+    with_role = [p for p in sources if p.role] or [p for p in candidates if p.role]
+    return Participant(
+        speaker_id=speaker_id,
+        name=winner.name if winner else None,
+        role=max(with_role, key=_confidence).role if with_role else None,
+        confidence=best.confidence if winner else None,
+        association_justification=best.association_justification if winner else None,
+    )
@@ -0,0 +1,100 @@
+"""Conversion of timestamps between silence-trimmed audio and the original recording.
+
+Silence trimming keeps spans of the original recording and lays them end to end,
+so the mapping is piecewise: a trimmed time belongs to one kept span and is
+shifted by that span's offset. An original time inside a removed silence maps
+to the cut that replaced it.
+
+Diarization and transcription run on the trimmed audio; their results are mapped
+back to original time before being stored, so that every stored timestamp refers
+to the recording the user uploaded.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+from mcr_meeting.app.schemas.transcription_schema import (
+    DiarizationSegment,
+    TimeMap,
+    TranscriptionSegment,
+)
+
+
+class TimeRemapper:
+    """Maps times and segments both ways through a TimeMap."""
+
+    def __init__(self, time_map: TimeMap) -> None:
+        kept_spans = time_map.kept_spans
+        self._identity = not kept_spans
+        self._original_starts = [span.start for span in kept_spans or []]
+        self._durations = [span.duration for span in kept_spans or []]
+        self._trimmed_starts = list(accumulate(self._durations[:-1], initial=0.0))
+
+    def to_original(self, trimmed_time: float, is_end: bool = False) -> float:
+        """Original time of a trimmed time.
+
+        A time on a cut belongs to the span after it, or to the span before it
+        when it ends an interval (`is_end`), so that intervals never grow across
+        a removed silence they did not touch.
+        """
+        if self._identity:
+            return trimmed_time
+        find = bisect_left if is_end else bisect_right
+        index = max(find(self._trimmed_starts, trimmed_time) - 1, 0)
+        return self._original_starts[index] + trimmed_time - self._trimmed_starts[index]
+
+    def to_trimmed(self, original_time: float) -> float:
+        """Trimmed time of an original time, clamped to the cut inside removed silences."""
+        if self._identity:
+            return original_time
+        index = bisect_right(self._original_starts, original_time) - 1
+        if index < 0:
+            return 0.0
+        offset = min(
+            original_time - self._original_starts[index], self._durations[index]
+        )
+        return self._trimmed_starts[index] + offset
+
+    def diarization_to_original(
+        self, diarization: list[DiarizationSegment]
+    ) -> list[DiarizationSegment]:
+        if self._identity:
+            return diarization
+        return [
+            segment.model_copy(
+                update={
+                    "start": self.to_original(segment.start),
+                    "end": self.to_original(segment.end, is_end=True),
+                }
+            )
+            for segment in diarization
+        ]
+
+    def diarization_to_trimmed(
+        self, diarization: list[DiarizationSegment]
+    ) -> list[DiarizationSegment]:
+        """Diarization in trimmed time, without segments lying in a removed silence."""
+        if self._identity:
+            return diarization
+        trimmed = []
+        for segment in diarization:
+            start = self.to_trimmed(segment.start)
+            end = self.to_trimmed(segment.end)
+            if end > start:
+                trimmed.append(segment.model_copy(update={"start": start, "end": end}))
+        return trimmed
+
+    def transcription_to_original[T: TranscriptionSegment](
+        self, segments: list[T]
+    ) -> list[T]:
+        if self._identity:
+            return segments
+        return [
+            segment.model_copy(
+                update={
+                    "start": self.to_original(segment.start),
+                    "end": self.to_original(segment.end, is_end=True),
+                }
+            )
+            for segment in segments
+        ]
@@ -2,6 +2,7 @@
 
 from loguru import logger
 
+from mcr_meeting.app.domain.transcription.alignment import max_overlaps
 from mcr_meeting.app.schemas.transcription_schema import (
     DiarizationSegment,
     DiarizedTranscriptionSegment,
@@ -10,20 +11,6 @@ from mcr_meeting.app.schemas.transcription_schema import (
 )
 
 
-def find_best_matching_diarization(
-    transcription_span: TimeSpan,
-    diarization_spans: list[tuple[TimeSpan, DiarizationSegment]],
-) -> tuple[DiarizationSegment | None, float]:
-    best: DiarizationSegment | None = None
-    max_overlap_seconds = 0.0
-    for span, diarization_segment in diarization_spans:
-        overlap_seconds = transcription_span.overlap(span)
-        if overlap_seconds > max_overlap_seconds:
-            max_overlap_seconds = overlap_seconds
-            best = diarization_segment
-    return best, max_overlap_seconds
-
-
 def transcription_span_outside_diarization_range(
     transcription_span: TimeSpan, diarization_range: TimeSpan
 ) -> bool:
@@ -60,7 +47,7 @@ def diarize_vad_transcription_segments(
         ]
         return empty_speaker_transcription_segments
 
-    diarization_spans = [(TimeSpan(d.start, d.end), d) for d in diarization_result]
+    diarization_spans = [TimeSpan(d.start, d.end) for d in diarization_result]
     diarization_range = TimeSpan(
         diarization_result[0].start, diarization_result[-1].end
     )
@@ -71,21 +58,21 @@ def diarize_vad_transcription_segments(
         diarization_range.end,
     )
 
-    for transcription_segment in vad_transcription_segments:
-        transcription_span = TimeSpan(
-            transcription_segment.start, transcription_segment.end
-        )
+    transcription_spans = [
+        TimeSpan(segment.start, segment.end) for segment in vad_transcription_segments
+    ]
+    matches = max_overlaps(transcription_spans, diarization_spans)
 
+    for transcription_segment, transcription_span, (match_index, _) in zip(
+        vad_transcription_segments, transcription_spans, matches, strict=True
+    ):
         if transcription_span_outside_diarization_range(
             transcription_span, diarization_range
         ):
             continue
 
-        best_matching_diarization, max_overlap_seconds = find_best_matching_diarization(
-            transcription_span, diarization_spans
-        )
-
-        if best_matching_diarization and max_overlap_seconds > 0:
+        if match_index is not None:
+            best_matching_diarization = diarization_result[match_index]
             if best_matching_diarization.speaker:
                 speaker = best_matching_diarization.speaker
             else:
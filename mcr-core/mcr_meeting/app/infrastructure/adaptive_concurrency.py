@@ -0,0 +1,145 @@
+"""Adaptive (AIMD) limit on the calls in flight to a shared backend.
+
+The window of concurrent calls grows additively, by one after a full window of
+healthy calls (successful and within their latency budget), and is cut by a
+factor as soon as the backend shows overload (throttling, 5xx, timeouts). As in
+TCP congestion control, a congestion event is cut once: calls that started
+before the last cut report that same overload and leave the window alone.
+"""
+
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from loguru import logger
+
+
+@dataclass
+class LimiterSlot:
+    """One admitted call; the caller flags overload the limiter cannot see."""
+
+    started_at: float
+    overloaded: bool = False
+
+    def mark_overloaded(self) -> None:
+        self.overloaded = True
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        name: str,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        decrease_factor: float,
+        is_overload: Callable[[BaseException], bool],
+    ) -> None:
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError(
+                f"Concurrency bounds must satisfy 1 <= minimum <= initial <= maximum, "
+                f"got {minimum}, {initial}, {maximum}"
+            )
+        self._name = name
+        self._window = initial
+        self._healthy_calls = 0
+        self._minimum = minimum
+        self._maximum = maximum
+        self._decrease_factor = decrease_factor
+        self._is_overload = is_overload
+        self._in_flight = 0
+        self._last_decrease_at = -math.inf
+        self._condition = threading.Condition()
+
+    @property
+    def window(self) -> int:
+        """Calls currently allowed in flight."""
+        return self._window
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @contextmanager
+    def slot(self, latency_budget: float | None = None) -> Iterator[LimiterSlot]:
+        """Wait for room in the window, then run the call as one slot.
+
+        Args:
+            latency_budget (float | None): Seconds a healthy call may take; a
+                slower success holds the window rather than growing it.
+        Yields:
+            LimiterSlot: Lets the caller flag an overload it absorbed itself,
+                e.g. a throttled request its client retried successfully.
+        """
+        with self._condition:
+            while self._in_flight >= self.window:
+                self._condition.wait()
+            self._in_flight += 1
+        with self._admitted(latency_budget) as slot:
+            yield slot
+
+    @contextmanager
+    def try_slot(
+        self, latency_budget: float | None = None
+    ) -> Iterator[LimiterSlot | None]:
+        """Run the call as one slot if the window has room now, like `slot`.
+
+        Yields None instead of waiting when the window is full.
+        """
+        with self._condition:
+            admitted = self._in_flight < self.window
+            if admitted:
+                self._in_flight += 1
+        if not admitted:
+            yield None
+            return
+        with self._admitted(latency_budget) as slot:
+            yield slot
+
+    @contextmanager
+    def _admitted(self, latency_budget: float | None) -> Iterator[LimiterSlot]:
+        slot = LimiterSlot(started_at=time.monotonic())
+        try:
+            yield slot
+        except BaseException as e:
+            self._release(slot, overloaded=slot.overloaded or self._is_overload(e))
+            raise
+        latency = time.monotonic() - slot.started_at
+        self._release(
+            slot,
+            overloaded=slot.overloaded,
+            healthy=latency_budget is None or latency <= latency_budget,
+        )
+
+    def _release(
+        self, slot: LimiterSlot, overloaded: bool, healthy: bool = False
+    ) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            previous = self._window
+            if overloaded:
+                if slot.started_at >= self._last_decrease_at:
+                    self._window = max(
+                        self._minimum, int(self._window * self._decrease_factor)
+                    )
+                    self._healthy_calls = 0
+                    self._last_decrease_at = time.monotonic()
+            elif healthy:
+                self._healthy_calls += 1
+                if self._healthy_calls >= self._window:
+                    self._window = min(self._maximum, self._window + 1)
+                    self._healthy_calls = 0
+            current = self._window
+            self._condition.notify_all()
+
+        if current != previous:
+            logger.info(
+                "{} concurrency window {} -> {} ({} in flight)",
+                self._name,
+                previous,
+                current,
+                self._in_flight,
+            )
@@ -55,15 +55,31 @@ def enqueue_transcription_task(meeting_id: int, owner_keycloak_uuid: str) -> Non
         ) from e
 
 
-def enqueue_transcription_pipeline(meeting_id: int, owner_keycloak_uuid: str) -> None:
+def enqueue_transcription_pipeline(
+    meeting_id: int, owner_keycloak_uuid: str, fan_out_chunks: bool = False
+) -> None:
+    """Enqueue diarize → transcription → finalize_transcription for a meeting.
+
+    By default one transcribe_chunks task transcribes every chunk. With
+    `fan_out_chunks`, plan_transcription_chunks stores the chunk plan then
+    replaces itself with a chord: a group of one transcribe_chunk task per chunk,
+    which idle workers pick up side by side, and a merge_transcription_chunks
+    callback that assembles them in order before finalize_transcription runs.
+    The group is built in the worker because the plan needs the diarization.
+    """
     args = [meeting_id, owner_keycloak_uuid]
+    transcription_task = (
+        MCRTranscriptionTasks.PLAN_TRANSCRIPTION_CHUNKS
+        if fan_out_chunks
+        else MCRTranscriptionTasks.TRANSCRIBE_CHUNKS
+    )
     try:
         chain(
             celery_producer_app.signature(
                 MCRTranscriptionTasks.DIARIZE.value, args=args, immutable=True
             ),
             celery_producer_app.signature(
-                MCRTranscriptionTasks.TRANSCRIBE_CHUNKS.value, args=args, immutable=True
+                transcription_task.value, args=args, immutable=True
             ),
             celery_producer_app.signature(
                 MCRTranscriptionTasks.FINALIZE_TRANSCRIPTION.value,
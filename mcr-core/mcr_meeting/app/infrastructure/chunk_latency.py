@@ -0,0 +1,84 @@
+"""Online estimate of how long a chunk transcription request takes.
+
+The latency of a request is modelled as a fixed overhead plus a share of the
+chunk duration, fitted by weighted least squares over the process's calls, the
+older ones fading out. The configured estimates enter the fit as a few calls at
+the start, so it is defined from the first call on.
+"""
+
+import threading
+
+from loguru import logger
+
+# Weight kept by the previous calls at each new one (half-life ~35 calls).
+_DECAY = 0.98
+# Durations the configured estimates are anchored at, in seconds.
+_PRIOR_DURATIONS = (0.0, 600.0)
+# Below this spread of chunk durations (in seconds²), the fit cannot tell the
+# overhead from the per-second cost.
+_MIN_DURATION_VARIANCE = 1.0
+
+
+class ChunkLatencyModel:
+    def __init__(
+        self, request_overhead: float, real_time_factor: float, prior_weight: float
+    ) -> None:
+        self._prior = (request_overhead, real_time_factor)
+        self._sums = _Sums()
+        weight = prior_weight / len(_PRIOR_DURATIONS)
+        for duration in _PRIOR_DURATIONS:
+            self._sums.add(
+                duration, request_overhead + real_time_factor * duration, weight
+            )
+        self._lock = threading.Lock()
+
+    def record(self, duration: float, latency: float) -> None:
+        """Account for one request on `duration` seconds of audio."""
+        with self._lock:
+            self._sums.scale(_DECAY)
+            self._sums.add(duration, latency, 1.0)
+
+    def estimate(self) -> tuple[float, float]:
+        """Fitted (request overhead in seconds, seconds per second of audio)."""
+        with self._lock:
+            w, x, y = self._sums.w, self._sums.x, self._sums.y
+            xx, xy = self._sums.xx, self._sums.xy
+        mean_x, mean_y = x / w, y / w
+        variance = xx / w - mean_x * mean_x
+        if variance < _MIN_DURATION_VARIANCE:
+            # Every recent chunk had the same duration: scale the configured
+            # estimates to the latency observed at that duration.
+            prior_overhead, prior_real_time_factor = self._prior
+            scale = mean_y / (prior_overhead + prior_real_time_factor * mean_x)
+            request_overhead = prior_overhead * scale
+            real_time_factor = prior_real_time_factor * scale
+        else:
+            real_time_factor = max(0.0, (xy / w - mean_x * mean_y) / variance)
+            request_overhead = max(0.0, mean_y - real_time_factor * mean_x)
+        logger.debug(
+            "Chunk latency estimate: {:.2f}s + {:.3f}s per second of audio",
+            request_overhead,
+            real_time_factor,
+        )
+        return request_overhead, real_time_factor
+
+
+class _Sums:
+    """Weighted sums of a least-squares line fit."""
+
+    def __init__(self) -> None:
+        self.w = self.x = self.y = self.xx = self.xy = 0.0
+
+    def add(self, x: float, y: float, weight: float) -> None:
+        self.w += weight
+        self.x += weight * x
+        self.y += weight * y
+        self.xx += weight * x * x
+        self.xy += weight * x * y
+
+    def scale(self, factor: float) -> None:
+        self.w *= factor
+        self.x *= factor
+        self.y *= factor
+        self.xx *= factor
+        self.xy *= factor
@@ -1,6 +1,8 @@
 import re
 import time
-from io import BytesIO
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import BinaryIO
 
 import httpx
 from loguru import logger
@@ -23,6 +25,7 @@ from mcr_meeting.app.infrastructure.retry import retry_transient
 from mcr_meeting.app.infrastructure.sentry import span
 from mcr_meeting.app.schemas.transcription_schema import (
     DiarizationJobResponse,
+    DiarizationJobState,
     DiarizationJobStatus,
     DiarizationSegment,
 )
@@ -71,20 +74,50 @@ def next_poll_interval(phase_elapsed_s: float, queue_position: int | None) -> fl
     return api_settings.DIARIZATION_POLL_SLOW_INTERVAL_SECONDS
 
 
+def diarization_job_parameters() -> dict[str, str | float]:
+    """Form fields of a diarization job: everything but the audio that shapes the result."""
+    return {
+        "operation": "diarization",
+        "model": api_settings.DIARIZATION_API_MODEL,
+        "min_duration_off": diarization_params.min_duration_off,
+        "clustering_threshold": diarization_params.threshold,
+    }
+
+
 class _PollCadence:
-    def __init__(self, phase_started_at: float) -> None:
-        self._phase_started_at = phase_started_at
-        self._seen_processing = False
+    def __init__(
+        self,
+        phase_started_at: float,
+        seen_processing: bool = False,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        self.phase_started_at = phase_started_at
+        self.seen_processing = seen_processing
+        # In-process polling uses the monotonic clock; polls spread over several
+        # tasks (and workers) must share the wall clock instead.
+        self._clock = clock
+
+    def _now(self) -> float:
+        return self._clock() if self._clock is not None else time.monotonic()
 
     def next_interval(self, data: DiarizationJobResponse) -> float:
-        if data.status == DiarizationJobStatus.PROCESSING and not self._seen_processing:
-            self._seen_processing = True
-            self._phase_started_at = time.monotonic()
+        if data.status == DiarizationJobStatus.PROCESSING and not self.seen_processing:
+            self.seen_processing = True
+            self.phase_started_at = self._now()
 
-        phase_elapsed = time.monotonic() - self._phase_started_at
+        phase_elapsed = self._now() - self.phase_started_at
         return next_poll_interval(phase_elapsed, data.queue_position)
 
 
+@dataclass(frozen=True)
+class DiarizationJobPoll:
+    """Outcome of one status check: the segments once done, else when to look again."""
+
+    segments: list[DiarizationSegment] | None
+    job: DiarizationJobState
+    next_poll_in: float
+
+
 class DiarizationProcessor:
     def __init__(self) -> None:
         self._http_client: httpx.Client | None = None
@@ -102,25 +135,71 @@ class DiarizationProcessor:
 
     def diarize(
         self,
-        audio_bytes: BytesIO,
+        audio_bytes: BinaryIO,
     ) -> list[DiarizationSegment]:
-        """Perform speaker diarization on audio bytes
+        """Perform speaker diarization on a WAV stream
 
         Args:
-            audio_bytes (BytesIO): The input audio bytes.
+            audio_bytes (BinaryIO): The input audio, e.g. an open spool file.
 
         Returns:
             List[DiarizationSegment]: The diarization result with speaker segments.
         """
         return self._diarize_async_api(audio_bytes)
 
+    def submit_job(self, audio_bytes: BinaryIO) -> str:
+        """Submit a diarization job without waiting for it; returns the job id."""
+        return self._submit_diarization_job(audio_bytes)
+
+    def poll_job(self, job: DiarizationJobState) -> DiarizationJobPoll:
+        """Check a submitted job once, for callers that wait between polls themselves.
+
+        Follows the same cadence and overall deadline as the blocking poll loop,
+        measured on the wall clock from the persisted job state.
+
+        Raises:
+            DiarizationRetryableError: The server failed the job, but a new
+                submission may succeed.
+            DiarizationError: The job failed for good or exceeded the deadline.
+        """
+        if job.job_id is None:
+            raise ValueError("Cannot poll a diarization job that was not submitted")
+        deadline = celery_settings.REDIS_VISIBILITY_TIMEOUT
+        if time.time() - job.submitted_at >= deadline:
+            raise DiarizationError(
+                f"Diarization job {job.job_id} exceeded the {deadline}s deadline"
+            )
+
+        url = f"{api_settings.DIARIZATION_API_BASE_URL}/jobs/audio/{job.job_id}"
+        job_status = self._fetch_job_status(url, job.job_id)
+        segments = self._interpret_job_status(job_status, job.job_id)
+        if segments is not None:
+            return DiarizationJobPoll(segments=segments, job=job, next_poll_in=0.0)
+
+        cadence = _PollCadence(
+            phase_started_at=job.phase_started_at,
+            seen_processing=job.seen_processing,
+            clock=time.time,
+        )
+        next_poll_in = cadence.next_interval(job_status)
+        return DiarizationJobPoll(
+            segments=None,
+            job=job.model_copy(
+                update={
+                    "phase_started_at": cadence.phase_started_at,
+                    "seen_processing": cadence.seen_processing,
+                }
+            ),
+            next_poll_in=next_poll_in,
+        )
+
     @retry_transient(
         on=(DiarizationTransientError,),
         attempts=_retry_settings.DIARIZATION_RETRY_ATTEMPTS,
         initial_delay=_retry_settings.DIARIZATION_RETRY_INITIAL_DELAY,
         max_delay=_retry_settings.DIARIZATION_RETRY_MAX_DELAY,
     )
-    def _submit_diarization_job(self, audio_bytes: BytesIO) -> str:
+    def _submit_diarization_job(self, audio_bytes: BinaryIO) -> str:
         client = self._get_http_client()
 
         # Reset before (not only after) the POST so a local retry re-reads from
@@ -130,12 +209,7 @@ class DiarizationProcessor:
             response = client.post(
                 f"{api_settings.DIARIZATION_API_BASE_URL}/jobs/audio",
                 files={"file": ("audio.wav", audio_bytes, "audio/wav")},
-                data={
-                    "operation": "diarization",
-                    "model": api_settings.DIARIZATION_API_MODEL,
-                    "min_duration_off": diarization_params.min_duration_off,
-                    "clustering_threshold": diarization_params.threshold,
-                },
+                data=diarization_job_parameters(),
             )
             response.raise_for_status()
         except (httpx.ConnectError, httpx.ConnectTimeout) as e:
@@ -166,7 +240,7 @@ class DiarizationProcessor:
         logger.debug("Submitted async diarization job {}", job_id)
         return job_id
 
-    def _diarize_async_api(self, audio_bytes: BytesIO) -> list[DiarizationSegment]:
+    def _diarize_async_api(self, audio_bytes: BinaryIO) -> list[DiarizationSegment]:
         # The submit POST is auto-traced, but the poll loop waits minutes and
         # shows as a gap; one span makes the whole job a measurable span.
         with span("diarization.job", "diarize") as job_span:
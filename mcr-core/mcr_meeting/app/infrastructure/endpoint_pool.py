@@ -0,0 +1,237 @@
+"""Replicas of one backend, picked by least outstanding requests.
+
+Each call goes to the endpoint with the fewest requests in flight, ties to the
+one picked least recently. Every endpoint has a circuit breaker: after a run of
+consecutive failures it opens, and the endpoint gets no call until a cooldown
+has passed. The next call it is picked for is then its only one (half-open) and
+decides: a success closes the breaker, a failure opens it for another cooldown.
+A call that fails on an endpoint is sent to the next one it has not tried yet.
+When every breaker is open, the endpoint that opened first is tried anyway: the
+pool never refuses a call that a single endpoint would have taken.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class BreakerState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class EndpointHealth:
+    """Breaker state, requests in flight and counts so far of one endpoint."""
+
+    url: str
+    state: BreakerState
+    outstanding: int
+    requests: int
+    failures: int
+
+
+@dataclass
+class _Endpoint:
+    url: str
+    state: BreakerState = BreakerState.CLOSED
+    outstanding: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+    last_picked: int = 0
+
+
+class EndpointPool:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        cooldown_seconds: float,
+        is_failure: Callable[[BaseException], bool],
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError(
+                f"Breaker failure threshold must be at least 1, got {failure_threshold}"
+            )
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._cooldown_seconds = cooldown_seconds
+        self._is_failure = is_failure
+        self._endpoints: dict[str, _Endpoint] = {}
+        self._picks = 0
+        self._lock = threading.Lock()
+
+    def health(self) -> list[EndpointHealth]:
+        """Every endpoint called so far, in the order it was first called."""
+        with self._lock:
+            return [
+                EndpointHealth(
+                    url=endpoint.url,
+                    state=endpoint.state,
+                    outstanding=endpoint.outstanding,
+                    requests=endpoint.requests,
+                    failures=endpoint.failures,
+                )
+                for endpoint in self._endpoints.values()
+            ]
+
+    def call(self, urls: Sequence[str], request: Callable[[str], T]) -> T:
+        """Run `request` with the base URL of one of `urls`, failing over.
+
+        Only the errors `is_failure` accepts count against an endpoint and are
+        sent to the next one; any other error is raised as is. Once every
+        endpoint was tried, the last failure is raised.
+        """
+        if not urls:
+            raise ValueError(f"{self._name} has no endpoint to call")
+        tried: set[str] = set()
+        while True:
+            endpoint = self._acquire(urls, tried)
+            tried.add(endpoint.url)
+            try:
+                result = request(endpoint.url)
+            except BaseException as e:
+                failed = self._is_failure(e)
+                self._release(endpoint, failed=failed)
+                if not failed or len(tried) == len(set(urls)):
+                    raise
+                logger.warning(
+                    "{} endpoint {} failed ({}): trying another endpoint",
+                    self._name,
+                    endpoint.url,
+                    e,
+                )
+                continue
+            self._release(endpoint, failed=False)
+            return result
+
+    async def acall(
+        self, urls: Sequence[str], request: Callable[[str], Awaitable[T]]
+    ) -> T:
+        """`call` for a coroutine `request`.
+
+        A cancelled request frees its endpoint without counting for or against
+        it: the endpoint did not answer, but did not fail either.
+        """
+        if not urls:
+            raise ValueError(f"{self._name} has no endpoint to call")
+        tried: set[str] = set()
+        while True:
+            endpoint = self._acquire(urls, tried)
+            tried.add(endpoint.url)
+            try:
+                result = await request(endpoint.url)
+            except asyncio.CancelledError:
+                self._abandon(endpoint)
+                raise
+            except BaseException as e:
+                failed = self._is_failure(e)
+                self._release(endpoint, failed=failed)
+                if not failed or len(tried) == len(set(urls)):
+                    raise
+                logger.warning(
+                    "{} endpoint {} failed ({}): trying another endpoint",
+                    self._name,
+                    endpoint.url,
+                    e,
+                )
+                continue
+            self._release(endpoint, failed=False)
+            return result
+
+    def _acquire(self, urls: Sequence[str], tried: set[str]) -> _Endpoint:
+        with self._lock:
+            now = time.monotonic()
+            candidates = []
+            for url in urls:
+                endpoint = self._endpoints.setdefault(url, _Endpoint(url=url))
+                if url in tried:
+                    continue
+                if (
+                    endpoint.state == BreakerState.OPEN
+                    and now - endpoint.opened_at >= self._cooldown_seconds
+                ):
+                    endpoint.state = BreakerState.HALF_OPEN
+                    endpoint.probing = False
+                    logger.info(
+                        "{} endpoint {} breaker half-open: next call probes it",
+                        self._name,
+                        url,
+                    )
+                candidates.append(endpoint)
+
+            available = [
+                endpoint
+                for endpoint in candidates
+                if endpoint.state == BreakerState.CLOSED
+                or (endpoint.state == BreakerState.HALF_OPEN and not endpoint.probing)
+            ]
+            if available:
+                endpoint = min(available, key=lambda e: (e.outstanding, e.last_picked))
+                if endpoint.state == BreakerState.HALF_OPEN:
+                    endpoint.probing = True
+            else:
+                endpoint = min(candidates, key=lambda e: e.opened_at)
+                logger.warning(
+                    "{} has no endpoint with a closed breaker: trying {} anyway",
+                    self._name,
+                    endpoint.url,
+                )
+
+            self._picks += 1
+            endpoint.last_picked = self._picks
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def _abandon(self, endpoint: _Endpoint) -> None:
+        with self._lock:
+            endpoint.outstanding -= 1
+            # A cancelled probe proved nothing: the next call probes again.
+            endpoint.probing = False
+
+    def _release(self, endpoint: _Endpoint, failed: bool) -> None:
+        with self._lock:
+            endpoint.outstanding -= 1
+            if not failed:
+                endpoint.consecutive_failures = 0
+                if endpoint.state != BreakerState.CLOSED:
+                    endpoint.state = BreakerState.CLOSED
+                    endpoint.probing = False
+                    logger.info(
+                        "{} endpoint {} answered: breaker closed",
+                        self._name,
+                        endpoint.url,
+                    )
+                return
+
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if (
+                endpoint.state != BreakerState.CLOSED
+                or endpoint.consecutive_failures >= self._failure_threshold
+            ):
+                if endpoint.state != BreakerState.OPEN:
+                    logger.warning(
+                        "{} endpoint {} failed {} time(s) in a row: breaker open "
+                        "for {:.0f}s",
+                        self._name,
+                        endpoint.url,
+                        endpoint.consecutive_failures,
+                        self._cooldown_seconds,
+                    )
+                endpoint.state = BreakerState.OPEN
+                endpoint.opened_at = time.monotonic()
+                endpoint.probing = False
@@ -1,22 +1,23 @@
+from loguru import logger
+
 from mcr_meeting.app.infrastructure.llm.client import CorrectedText, complete
+from mcr_meeting.app.infrastructure.llm.glossary import glossary_for
 from mcr_meeting.app.infrastructure.llm.prompts.acronyms import (
     ACRONYM_PROMPT_TEMPLATE,
-    GLOSSARY_CONTENT,
-)
-
-_PROMPT_TEMPLATE = ACRONYM_PROMPT_TEMPLATE.format(
-    glossary=GLOSSARY_CONTENT,
-    text="{text}",
 )
 
 
 def correct_acronyms(text: str) -> str:
+    glossary = glossary_for(text)
+    if glossary is None:
+        logger.debug("No glossary acronym candidate, skipping acronym correction")
+        return text
     result = complete(
         response_model=CorrectedText,
         messages=[
             {
                 "role": "user",
-                "content": _PROMPT_TEMPLATE.format(text=text),
+                "content": ACRONYM_PROMPT_TEMPLATE.format(glossary=glossary, text=text),
             }
         ],
     )
@@ -1,13 +1,23 @@
+import threading
 from collections.abc import Iterable
 
 import instructor
 from instructor.exceptions import InstructorError
+from loguru import logger
 from openai import OpenAI
 from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from mcr_meeting.app.configs.base import LLMSettings
 from mcr_meeting.app.exceptions.exceptions import LLMCompletionError
+from mcr_meeting.app.infrastructure.llm.response_cache import (
+    DiskCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+    response_cache_key,
+)
+from mcr_meeting.app.infrastructure.redis import llm_response_cache_client
+from mcr_meeting.app.infrastructure.sentry import span
 
 
 class CorrectedText(BaseModel):
@@ -18,6 +28,35 @@ def complete[T: (BaseModel | Iterable[object])](
     response_model: type[T], messages: list[ChatCompletionMessageParam]
 ) -> T:
     settings = LLMSettings()
+    cache = _get_response_cache()
+    if cache is None:
+        return _create(settings, response_model, messages)
+
+    key = response_cache_key(
+        model=settings.LLM_MODEL_NAME,
+        temperature=settings.TEMPERATURE,
+        version=settings.LLM_RESPONSE_CACHE_VERSION,
+        response_model=response_model,
+        messages=messages,
+    )
+    with span("llm.complete", settings.LLM_MODEL_NAME) as llm_span:
+        cached = cache.get(key, response_model)
+        llm_span.set_data("llm.cache_backend", cache.backend_name)
+        llm_span.set_data("llm.cache_hit", cached is not None)
+        llm_span.set_data("llm.cache_hit_rate", cache.stats.hit_rate)
+        if cached is not None:
+            logger.debug("LLM response cache hit ({})", key[:12])
+            return cached
+        response = _create(settings, response_model, messages)
+        cache.set(key, response_model, response)
+        return response
+
+
+def _create[T: (BaseModel | Iterable[object])](
+    settings: LLMSettings,
+    response_model: type[T],
+    messages: list[ChatCompletionMessageParam],
+) -> T:
     try:
         return _get_llm_client().chat.completions.create(
             model=settings.LLM_MODEL_NAME,
@@ -44,10 +83,46 @@ def _build_llm_client() -> instructor.Instructor:
 
 
 _client: instructor.Instructor | None = None
+_client_lock = threading.Lock()
 
 
 def _get_llm_client() -> instructor.Instructor:
     global _client
-    if _client is None:
-        _client = _build_llm_client()
+    # Chunks are corrected from several threads: build the client only once.
+    with _client_lock:
+        if _client is None:
+            _client = _build_llm_client()
     return _client
+
+
+def _build_response_cache() -> ResponseCache | None:
+    settings = LLMSettings()
+    match settings.LLM_RESPONSE_CACHE_BACKEND:
+        case "none":
+            return None
+        case "disk":
+            backend: DiskCacheBackend | RedisCacheBackend = DiskCacheBackend(
+                settings.LLM_RESPONSE_CACHE_DIR
+            )
+        case "redis":
+            backend = RedisCacheBackend(llm_response_cache_client)
+    logger.info(
+        "LLM responses cached in {} for {}s",
+        backend.name,
+        settings.LLM_RESPONSE_CACHE_TTL_SECONDS,
+    )
+    return ResponseCache(backend, settings.LLM_RESPONSE_CACHE_TTL_SECONDS)
+
+
+_response_cache: ResponseCache | None = None
+_response_cache_built = False
+_response_cache_lock = threading.Lock()
+
+
+def _get_response_cache() -> ResponseCache | None:
+    global _response_cache, _response_cache_built
+    with _response_cache_lock:
+        if not _response_cache_built:
+            _response_cache = _build_response_cache()
+            _response_cache_built = True
+    return _response_cache
@@ -0,0 +1,33 @@
+from loguru import logger
+
+from mcr_meeting.app.domain.transcription.glossary_matcher import (
+    GlossaryMatcher,
+    parse_glossary,
+)
+from mcr_meeting.app.infrastructure.llm.prompts.acronyms import GLOSSARY_CONTENT
+from mcr_meeting.app.infrastructure.unleash import (
+    FeatureFlag,
+    get_feature_flag_client,
+)
+
+_glossary_entries = parse_glossary(GLOSSARY_CONTENT)
+_glossary_matcher = GlossaryMatcher(_glossary_entries)
+
+
+def glossary_for(text: str) -> str | None:
+    """Glossary to send along with `text` for the acronym correction.
+
+    The whole glossary, or with the acronym_glossary_prefilter flag only the
+    entries `text` may have mistranscribed, and None when there is none.
+    """
+    if not get_feature_flag_client().is_enabled(FeatureFlag.ACRONYM_GLOSSARY_PREFILTER):
+        return GLOSSARY_CONTENT
+    entries = _glossary_matcher.candidates(text)
+    logger.debug(
+        "{} of {} glossary entries are candidates in the chunk",
+        len(entries),
+        len(_glossary_entries),
+    )
+    if not entries:
+        return None
+    return "\n\n".join(entry.text for entry in entries)
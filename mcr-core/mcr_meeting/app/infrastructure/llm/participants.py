@@ -3,6 +3,7 @@ import json
 from mcr_meeting.app.infrastructure.llm.client import complete
 from mcr_meeting.app.infrastructure.llm.prompts.participants import (
     INITIAL_PROMPT_TEMPLATE,
+    MERGE_PROMPT_TEMPLATE,
     REFINE_PROMPT_TEMPLATE,
 )
 from mcr_meeting.app.schemas.transcription_schema import Participant
@@ -21,12 +22,16 @@ def extract_participants(chunk_text: str) -> list[Participant]:
     return result
 
 
+def _to_json(participants: list[Participant]) -> str:
+    return json.dumps(
+        [p.model_dump() for p in participants], ensure_ascii=False, indent=2
+    )
+
+
 def refine_participants(
     current: list[Participant], chunk_text: str
 ) -> list[Participant]:
-    current_json = json.dumps(
-        [p.model_dump() for p in current], ensure_ascii=False, indent=2
-    )
+    current_json = _to_json(current)
     result: list[Participant] = complete(
         response_model=list[Participant],
         messages=[
@@ -39,3 +44,25 @@ def refine_participants(
         ],
     )
     return result
+
+
+def resolve_participant_conflicts(
+    current: list[Participant], candidates: list[Participant]
+) -> list[Participant]:
+    """Settle the conflicts left by merging chunk-by-chunk extractions.
+
+    The LLM sees the candidates' justifications, not the transcript.
+    """
+    result: list[Participant] = complete(
+        response_model=list[Participant],
+        messages=[
+            {
+                "role": "user",
+                "content": MERGE_PROMPT_TEMPLATE.format(
+                    current_json=_to_json(current),
+                    candidates_json=_to_json(candidates),
+                ),
+            }
+        ],
+    )
+    return result
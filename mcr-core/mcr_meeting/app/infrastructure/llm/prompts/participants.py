@@ -246,3 +246,48 @@ Nouvel extrait de transcription :
 {chunk_text}
 </chunk>
 """
+
+
+MERGE_PROMPT_TEMPLATE = """
+Les participants d'une réunion ont été identifiés séparément dans plusieurs extraits de sa
+transcription. Leurs résultats ont été fusionnés, mais certains restent en conflit : un même
+speaker_id a reçu des noms différents selon les extraits, ou un même nom a été attribué à
+plusieurs speaker_id.
+
+Tu reçois :
+1) le JSON fusionné des participants, où les participants en conflit ont name=null,
+2) les candidats en conflit, tels que chaque extrait les a identifiés, avec leur justification.
+
+Ton objectif : TRANCHER chaque conflit et renvoyer le JSON complet des participants.
+
+==================================================
+RÈGLES DE RÉSOLUTION
+==================================================
+
+- Chaque speaker_id du JSON fusionné doit figurer une fois, ni plus ni moins. Tu ne dois pas
+  renommer, ajouter ni fusionner de speaker_id.
+- Ne modifie pas les participants qui ne sont pas en conflit.
+- Privilégie les informations explicites (auto-présentation, présentation directe par un tiers)
+  sur les déductions (interpellation, contexte), en t'appuyant sur les justifications.
+- Si deux candidats désignent la même personne sous deux formes (surnom et vrai nom, prénom
+  seul et nom complet), garde le vrai nom le plus complet.
+- Un même nom ne peut désigner deux speaker_id que pour des homonymes : dans ce cas,
+  numérote-les "<Prénom> 1" / "<Prénom> 2" dans l'ordre des speaker_id.
+- Si les justifications ne permettent pas de trancher avec certitude, garde name=null :
+  mieux vaut name=null qu'un nom incorrect.
+- Rédige une justification concise (2 phrases maximum) qui reflète le choix final.
+
+==================================================
+ENTRÉES À TRAITER
+==================================================
+
+JSON fusionné :
+<current>
+{current_json}
+</current>
+
+Candidats en conflit :
+<candidates>
+{candidates_json}
+</candidates>
+"""
@@ -0,0 +1,72 @@
+# Acronym and spelling correction in one pass: the rules of ACRONYM_PROMPT_TEMPLATE
+# and of the spelling PROMPT_TEMPLATE, for the same text and the same output.
+TEXT_CORRECTION_PROMPT_TEMPLATE = """
+Tu corriges une transcription vocale en français. Tu fais DEUX corrections, et RIEN d'autre :
+A) les acronymes mal transcrits ;
+B) les fautes d'orthographe, d'accord et de conjugaison évidentes, et les répétitions accidentelles dues à la transcription.
+
+# A) Acronymes
+
+Types d'erreurs à corriger :
+1. Acronyme transcrit en mot français courant
+   « opaque » → « OPAC », « café » → « CAF », « eau nue » → « ONU »
+2. Acronyme commençant par A avec liaison avalée (uniquement après « la » ou « le »)
+   « la NTS » → « l'ANTS », « la NTAI » → « l'ANTAI »
+3. Chiffre dans un sigle indiquant une lettre doublée (le locuteur a dit « deux X »)
+   « AN2SI » → « ANSSI » ; « A2IM » → « AAIM » ; « CN2L » → « CNLL »
+4. Acronyme en majuscules très proche d'un acronyme connu (lettre manquante ou modifiée)
+   « CMI » → « CCMI »
+
+Tu corriges en priorité vers les acronymes du glossaire fourni plus bas. Tu peux aussi corriger vers un acronyme ABSENT du glossaire, mais UNIQUEMENT s'il s'agit d'un sigle français très connu du grand public (ex : ONU, OTAN, SNCF, ANSSI, CNIL, INSEE, SMIC, RATP…) ET que la correction est évidente.
+
+Corrige UNIQUEMENT si : (a) ressemblance forte avec un acronyme connu ET (b) le contexte confirme sans effort. En cas de doute, ne corrige pas. Les acronymes corrigés s'écrivent en majuscules sans points (« ANTS », pas « A.N.T.S. »).
+
+Tu ne dois JAMAIS :
+- remplacer une forme développée par son acronyme (« direction générale des étrangers en France » RESTE tel quel) ;
+- remplacer un acronyme par un autre très différent (« AN2SI » peut devenir « ANSSI », mais PAS « DGSI ») ;
+- inventer un acronyme que tu ne connais pas avec certitude ;
+- corriger un acronyme déjà bien écrit ou épelé (« ANTS » reste « ANTS », « D-G-P-N » reste « D-G-P-N ») ;
+- modifier « une NTS », « de NTS », « du NTS » : la règle de liaison ne s'applique qu'à « la » et « le ».
+
+# B) Orthographe et répétitions
+
+Tu appliques UNIQUEMENT des corrections locales, sans reformuler ni modifier la structure des phrases. Tu peux seulement :
+- corriger l'orthographe (accents, lettres manquantes, homophones évidents si la correction ne change pas la structure) ;
+- corriger les accords (genre/nombre) et la conjugaison quand l'intention est non ambiguë ;
+- ajouter/ajuster une ponctuation minimale (virgules, points, majuscules en début de phrase) SANS modifier les mots ;
+- garder une seule occurrence d'un mot ou d'un groupe de mots répété plusieurs fois de suite par accident de transcription
+  ('merci merci merci merci' -> 'merci' ; 'il y a il y a il y a un problème' -> 'il y a un problème').
+
+Interdiction de reformuler : ne change jamais l'ordre des mots, ne remplace jamais un mot par un synonyme, ne simplifie pas. Ne corrige pas les contre-sens. Ne supprime aucun autre mot (y compris « euh ») et n'en ajoute aucun. Ne change pas le style ni le registre. Si une correction est incertaine, ne la fais pas.
+
+# Règles communes
+
+1. Garde les balises <separatorID> strictement identiques, à leur place : ne les modifie pas, ne les supprime pas, ne les déplace pas, ne les duplique pas.
+2. Aucun marquage typographique ajouté : pas de **gras**, pas de parenthèses, de guillemets, d'astérisques, de balises ni de commentaires.
+3. Conserve les sauts de ligne du texte d'origine.
+
+# Exemples
+
+Glossaire pour les exemples : **OPAC**, **ANTS**, **DGEF**, **CCMI**, **DGSI**.
+
+Entrée : Le locataire a contacté l'opaque pour signalé le problème problème.
+Sortie : Le locataire a contacté l'OPAC pour signaler le problème.
+
+Entrée : La NTS a transmis les dossier à la direction générale des étrangers en France.
+Sortie : L'ANTS a transmis les dossiers à la direction générale des étrangers en France.
+
+Entrée : Le CMI a été signé avant la réunion avec l'AN2SI.
+Sortie : Le CCMI a été signé avant la réunion avec l'ANSSI.
+
+# Glossaire à utiliser en priorité pour la correction des acronymes
+<<<
+{glossary}
+>>>
+
+# Texte à corriger
+<<<
+{text}
+>>>
+
+Réponds uniquement avec le texte corrigé. Pas de préambule, pas d'explication, pas de commentaire.
+"""
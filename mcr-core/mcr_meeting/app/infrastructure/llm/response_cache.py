@@ -0,0 +1,181 @@
+"""LLM responses kept by the content of their request.
+
+A response is stored under a digest of everything that decides it: the model
+and temperature, the exact messages, the JSON schema it is validated against
+and a cache version. The same request made again, by a retried task, a
+requeued meeting or an evaluation rerun, is answered from the cache without an
+LLM call; a request that differs in any of these is a miss. Bumping the version
+drops every cached response at once, e.g. when the model behind a name changes.
+
+The cache is best effort: a backend that fails is counted and logged, and the
+call goes to the LLM as if the cache were not there.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import redis
+from loguru import logger
+from openai.types.chat import ChatCompletionMessageParam
+from pydantic import TypeAdapter, ValidationError
+
+
+class CacheBackend(ABC):
+    """Where the serialized responses are kept."""
+
+    name: str
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """The value stored under `key`, or None if absent or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store `value` under `key` for `ttl_seconds`."""
+
+
+class DiskCacheBackend(CacheBackend):
+    """One file per response under a directory, shared by the local processes."""
+
+    name = "disk"
+
+    def __init__(self, directory: str | Path) -> None:
+        self._directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self._directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        if entry["expires_at"] <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        value: str = entry["value"]
+        return value
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"expires_at": time.time() + ttl_seconds, "value": value}
+        # Written aside then renamed: a concurrent reader sees the whole entry
+        # or none of it.
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                json.dump(entry, tmp, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+class RedisCacheBackend(CacheBackend):
+    """Responses in Redis, shared by every worker; Redis expires them."""
+
+    name = "redis"
+
+    def __init__(self, client: redis.Redis) -> None:
+        self._client = client
+
+    def get(self, key: str) -> str | None:
+        value: str | None = self._client.get(f"llm_response:{key}")  # type: ignore[assignment]
+        return value
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._client.set(f"llm_response:{key}", value, ex=ttl_seconds)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Lookups answered, lookups missed and backend errors, so far."""
+
+    hits: int
+    misses: int
+    errors: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    def __init__(self, backend: CacheBackend, ttl_seconds: int) -> None:
+        self._backend = backend
+        self._ttl_seconds = ttl_seconds
+        self._hits = self._misses = self._errors = 0
+        self._lock = threading.Lock()
+
+    @property
+    def backend_name(self) -> str:
+        return self._backend.name
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, errors=self._errors)
+
+    def get[T](self, key: str, response_model: type[T]) -> T | None:
+        """The cached response for `key`, validated as `response_model`."""
+        try:
+            value = self._backend.get(key)
+            response = (
+                None
+                if value is None
+                else TypeAdapter(response_model).validate_json(value)
+            )
+        except (redis.RedisError, OSError, ValueError, KeyError, ValidationError) as e:
+            logger.warning(
+                "LLM response cache ({}) read failed: {}", self.backend_name, e
+            )
+            self._count(errors=1, misses=1)
+            return None
+        self._count(hits=int(response is not None), misses=int(response is None))
+        return response
+
+    def set[T](self, key: str, response_model: type[T], response: T) -> None:
+        try:
+            value = TypeAdapter(response_model).dump_json(response).decode()
+            self._backend.set(key, value, self._ttl_seconds)
+        except (redis.RedisError, OSError, ValueError) as e:
+            logger.warning(
+                "LLM response cache ({}) write failed: {}", self.backend_name, e
+            )
+            self._count(errors=1)
+
+    def _count(self, hits: int = 0, misses: int = 0, errors: int = 0) -> None:
+        with self._lock:
+            self._hits += hits
+            self._misses += misses
+            self._errors += errors
+
+
+def response_cache_key(
+    model: str,
+    temperature: float,
+    version: str,
+    response_model: type[object],
+    messages: Iterable[ChatCompletionMessageParam],
+) -> str:
+    """Digest of everything that decides an LLM response."""
+    request = {
+        "model": model,
+        "temperature": temperature,
+        "version": version,
+        "schema": TypeAdapter(response_model).json_schema(),
+        "messages": list(messages),
+    }
+    encoded = json.dumps(request, sort_keys=True, ensure_ascii=False).encode()
+    return hashlib.sha256(encoded).hexdigest()
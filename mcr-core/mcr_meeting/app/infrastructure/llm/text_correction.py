@@ -0,0 +1,22 @@
+from mcr_meeting.app.infrastructure.llm.client import CorrectedText, complete
+from mcr_meeting.app.infrastructure.llm.glossary import glossary_for
+from mcr_meeting.app.infrastructure.llm.prompts.text_correction import (
+    TEXT_CORRECTION_PROMPT_TEMPLATE,
+)
+
+
+def correct_acronyms_and_spelling(text: str) -> str:
+    # Spelling still needs the call when no acronym is a candidate.
+    glossary = glossary_for(text) or ""
+    result = complete(
+        response_model=CorrectedText,
+        messages=[
+            {
+                "role": "user",
+                "content": TEXT_CORRECTION_PROMPT_TEMPLATE.format(
+                    glossary=glossary, text=text
+                ),
+            }
+        ],
+    )
+    return result.corrected_text
@@ -12,6 +12,13 @@ _client: redis.Redis = redis.Redis(
     decode_responses=True,
 )
 
+llm_response_cache_client: redis.Redis = redis.Redis(
+    host=_settings.REDIS_HOST,
+    port=_settings.REDIS_PORT,
+    db=_settings.REDIS_LLM_RESPONSE_CACHE_DB,
+    decode_responses=True,
+)
+
 
 def _key(user_sub: str) -> str:
     return f"drive_token:{user_sub}"
@@ -0,0 +1,194 @@
+"""Hedged requests: a duplicate for the calls that outlast most others.
+
+A call still running after a high percentile of the recently observed
+latencies is sent a second time, and whichever copy answers first wins. Calls
+of different sizes are compared through their expected latency: latencies are
+kept as multiples of it, and a call is hedged once it outlasts the percentile
+multiple of its own. The duplicates are paid from a budget that earns a
+fraction of a hedge per call, so a slow backend is never sent more than that
+fraction of extra load.
+
+Both copies run as tasks on the caller's event loop, so no thread is started,
+and the copy that loses is cancelled as soon as the other one answers: a
+cancelled HTTP request closes its connection instead of running on unseen.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from asyncio import FIRST_COMPLETED
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class HedgeRefused(Exception):
+    """Raised by a hedged request that cannot be sent now, e.g. for lack of a slot."""
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Calls, duplicates sent and duplicates that answered first, so far."""
+
+    calls: int
+    hedges: int
+    wins: int
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedges / self.calls if self.calls else 0.0
+
+
+class RequestHedger:
+    def __init__(
+        self,
+        name: str,
+        percentile: float,
+        min_samples: int,
+        window: int,
+        budget_ratio: float,
+        budget_burst: float,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError(f"Hedge percentile must be in (0, 100), got {percentile}")
+        self._name = name
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._budget_ratio = budget_ratio
+        self._budget_burst = budget_burst
+        self._budget = budget_burst
+        self._calls = self._hedges = self._wins = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(calls=self._calls, hedges=self._hedges, wins=self._wins)
+
+    def hedge_delay(self, expected_latency: float = 1.0) -> float | None:
+        """Seconds after which a call gets a duplicate; None until enough calls.
+
+        Args:
+            expected_latency (float): What the call is expected to take, in any
+                unit shared by the calls; the default compares raw seconds.
+        """
+        with self._lock:
+            if len(self._latencies) < self._min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        rank = math.ceil(self._percentile / 100 * len(latencies)) - 1
+        return latencies[rank] * expected_latency
+
+    async def call(
+        self,
+        request: Callable[[], Awaitable[T]],
+        hedge_request: Callable[[], Awaitable[T]] | None = None,
+        expected_latency: float = 1.0,
+    ) -> T:
+        """Await `request`, and a copy of it if it runs late and budget remains.
+
+        The copy is `hedge_request` when given, e.g. to hold its own concurrency
+        slot; if it raises HedgeRefused the hedge is not counted and its budget
+        is given back. The first copy to succeed wins and the other one is
+        cancelled. A failure only surfaces once both copies failed, the first
+        one's error then. `expected_latency` scales the call's delay and
+        latency sample, see hedge_delay.
+        """
+        if expected_latency <= 0:
+            raise ValueError(
+                f"Expected latency must be positive, got {expected_latency}"
+            )
+        with self._lock:
+            self._calls += 1
+            self._budget = min(self._budget_burst, self._budget + self._budget_ratio)
+
+        delay = self.hedge_delay(expected_latency)
+        if delay is None:
+            return await self._timed(request, expected_latency)
+
+        primary = asyncio.ensure_future(
+            self._timed(request, expected_latency, straggler=True)
+        )
+        done, _ = await asyncio.wait([primary], timeout=delay)
+        if done or not self._take_hedge():
+            return await primary
+
+        logger.info(
+            "{} call still running after {:.1f}s: sending a hedged request",
+            self._name,
+            delay,
+        )
+        hedge = asyncio.ensure_future(
+            self._timed(hedge_request or request, expected_latency)
+        )
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if task is hedge:
+                            with self._lock:
+                                self._wins += 1
+                        logger.info(
+                            "{} {} request answered first",
+                            self._name,
+                            "hedged" if task is hedge else "original",
+                        )
+                        return task.result()
+                    if task is hedge and isinstance(error, HedgeRefused):
+                        self._refund_hedge(error)
+            return primary.result()
+        finally:
+            # The loser is cancelled, and awaited so that what it holds (its
+            # connection, its concurrency slot) is released before returning.
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+
+    def _take_hedge(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                logger.debug("{} hedge budget exhausted", self._name)
+                return False
+            self._budget -= 1
+            self._hedges += 1
+            return True
+
+    def _refund_hedge(self, refusal: HedgeRefused) -> None:
+        logger.debug("{} hedged request not sent: {}", self._name, refusal)
+        with self._lock:
+            self._budget = min(self._budget_burst, self._budget + 1)
+            self._hedges -= 1
+
+    async def _timed(
+        self,
+        request: Callable[[], Awaitable[T]],
+        expected_latency: float,
+        straggler: bool = False,
+    ) -> T:
+        started_at = time.monotonic()
+        try:
+            result = await request()
+        except asyncio.CancelledError:
+            # An original cancelled once its hedge answered took at least this
+            # long: keeping it as a sample stops the percentile from forgetting
+            # the stragglers it hedges.
+            if straggler:
+                self._record((time.monotonic() - started_at) / expected_latency)
+            raise
+        self._record((time.monotonic() - started_at) / expected_latency)
+        return result
+
+    def _record(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
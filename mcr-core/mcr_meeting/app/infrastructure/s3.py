@@ -1,7 +1,11 @@
 import itertools
+import time
+from collections import deque
 from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from io import BytesIO
-from typing import cast
+from typing import BinaryIO, cast
 
 import boto3
 from botocore.config import Config
@@ -16,10 +20,11 @@ from botocore.exceptions import (
 from loguru import logger
 from mypy_boto3_s3 import S3Client
 from mypy_boto3_s3.type_defs import CompletedPartTypeDef
-from pydantic import TypeAdapter
+from pydantic import TypeAdapter, ValidationError
 from urllib3.exceptions import IncompleteRead, ProtocolError
 
 from mcr_meeting.app.configs.base import RetrySettings, S3Settings
+from mcr_meeting.app.domain.audio_spool import AudioSpool
 from mcr_meeting.app.domain.mime_types import DOCX_MIME_TYPE, guess_mime_type
 from mcr_meeting.app.exceptions.exceptions import (
     MeetingMultipartException,
@@ -27,6 +32,7 @@ from mcr_meeting.app.exceptions.exceptions import (
     S3TransientError,
 )
 from mcr_meeting.app.infrastructure.retry import retry_transient
+from mcr_meeting.app.infrastructure.sentry import span
 from mcr_meeting.app.models.deliverable_model import DeliverableType
 from mcr_meeting.app.schemas.S3_types import (
     MultipartAbortRequest,
@@ -42,9 +48,15 @@ from mcr_meeting.app.schemas.S3_types import (
     S3Object,
 )
 from mcr_meeting.app.schemas.transcription_schema import (
+    ArtifactManifest,
+    DiarizationJobState,
     DiarizationSegment,
     DiarizedTranscriptionSegment,
     FullTranscript,
+    SpeculativeTranscriptionWindows,
+    TimeMap,
+    TranscriptionChunkPlan,
+    TranscriptionSegment,
 )
 
 s3_settings = S3Settings()
@@ -107,6 +119,7 @@ _WAV_CONTENT_TYPE = "audio/wav"
 
 _DIARIZATION_LIST_SERIALIZER = TypeAdapter(list[DiarizationSegment])
 _TRANSCRIPTION_RAW_LIST_SERIALIZER = TypeAdapter(list[DiarizedTranscriptionSegment])
+_TRANSCRIPTION_CHUNK_SERIALIZER = TypeAdapter(list[TranscriptionSegment])
 
 
 def get_transcription_object_name(meeting_id: int, filename: str) -> str:
@@ -215,34 +228,51 @@ def abort_multipart_upload(
     )
 
 
-def fetch_audio_bytes(meeting_id: int) -> BytesIO:
-    logger.info("Fetching audio bytes for meeting ID: {}", meeting_id)
+def list_audio_chunks(meeting_id: int) -> list[S3Object]:
+    return get_objects_list_from_prefix(prefix=f"{meeting_id}/")
+
+
+def fetch_audio_spool(
+    meeting_id: int, chunks: list[S3Object] | None = None
+) -> AudioSpool:
+    """Download a meeting's audio; `chunks` reuses a listing already made."""
+    logger.info("Fetching audio for meeting ID: {}", meeting_id)
 
     try:
-        chunks = get_objects_list_from_prefix(prefix=f"{meeting_id}/")
-        return download_and_concatenate_s3_audio_chunks_into_bytes(chunks)
+        if chunks is None:
+            chunks = list_audio_chunks(meeting_id)
+        return download_and_concatenate_s3_audio_chunks_into_spool(chunks)
     except NoAudioFoundError as no_files_error:
         raise NoAudioFoundError(
             f"No audio files found for meeting {meeting_id}"
         ) from no_files_error
 
 
-def download_and_concatenate_s3_audio_chunks_into_bytes(
+def download_and_concatenate_s3_audio_chunks_into_spool(
     objects: Iterable[S3Object],
-) -> BytesIO:
-    audio_buffer = BytesIO()
-    chunk_count = 0
+) -> AudioSpool:
+    """Download every chunk, in key order, into one file on disk."""
+    audio_spool = AudioSpool()
+    stats = _ChunkFetchStats()
 
-    for obj_info in objects:
-        chunk_count += 1
-        audio_chunk_data = get_file_from_s3(object_name=obj_info.object_name)
-        audio_buffer.write(audio_chunk_data.read())
-
-    if chunk_count == 0:
+    try:
+        with (
+            span("s3.fetch_audio", "download_audio_chunks") as fetch_span,
+            open(audio_spool.path, "wb") as file,
+        ):
+            file.writelines(_prefetch_audio_chunks(objects, stats))
+            fetch_span.set_data("s3.chunk_count", stats.chunk_count)
+            fetch_span.set_data("s3.bytes", stats.byte_count)
+            fetch_span.set_data("s3.bytes_per_second", stats.bytes_per_second)
+    except BaseException:
+        audio_spool.close()
+        raise
+
+    if stats.chunk_count == 0:
+        audio_spool.close()
         raise NoAudioFoundError("No audio chunks found in iterator")
 
-    audio_buffer.seek(0)
-    return audio_buffer
+    return audio_spool
 
 
 def stream_meeting_audio(meeting_id: int) -> tuple[Iterator[bytes], str]:
@@ -270,9 +300,66 @@ def _object_name_for_deliverable(
 def _stream_audio_chunks(
     objects: Iterable[S3Object],
 ) -> Generator[bytes, None, None]:
-    for obj_info in objects:
-        audio_chunk_data = get_file_from_s3(object_name=obj_info.object_name)
-        yield audio_chunk_data.read()
+    yield from _prefetch_audio_chunks(objects, _ChunkFetchStats())
+
+
+@dataclass
+class _ChunkFetchStats:
+    """Throughput of one audio fetch, filled in by _prefetch_audio_chunks."""
+
+    chunk_count: int = 0
+    byte_count: int = 0
+    seconds: float = 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.byte_count / self.seconds if self.seconds > 0 else 0.0
+
+
+def _prefetch_audio_chunks(
+    objects: Iterable[S3Object], stats: _ChunkFetchStats
+) -> Iterator[bytes]:
+    """Yield the content of each object, in order, while downloading ahead.
+
+    A meeting is captured as many small objects, so a serial fetch spends most
+    of its time in round trips. Up to S3_AUDIO_DOWNLOAD_CONCURRENCY downloads
+    run at once, at most S3_AUDIO_PREFETCH_CHUNKS ahead of the consumer; each
+    one keeps the per-object retry of get_file_from_s3.
+    """
+    pending: deque[Future[BytesIO]] = deque()
+    remaining = iter(objects)
+    started = time.perf_counter()
+    pool = ThreadPoolExecutor(
+        max_workers=s3_settings.S3_AUDIO_DOWNLOAD_CONCURRENCY,
+        thread_name_prefix="s3-audio",
+    )
+
+    def submit_next() -> None:
+        obj_info = next(remaining, None)
+        if obj_info is not None:
+            pending.append(pool.submit(get_file_from_s3, obj_info.object_name))
+
+    try:
+        for _ in range(s3_settings.S3_AUDIO_PREFETCH_CHUNKS):
+            submit_next()
+        while pending:
+            chunk = pending.popleft().result().getvalue()
+            submit_next()
+            stats.chunk_count += 1
+            stats.byte_count += len(chunk)
+            yield chunk
+    finally:
+        # Also reached when the consumer stops early: drop what is still queued.
+        pool.shutdown(wait=True, cancel_futures=True)
+        stats.seconds = time.perf_counter() - started
+
+    logger.info(
+        "Fetched {} audio chunks ({} bytes) in {:.2f}s ({:.2f} MiB/s)",
+        stats.chunk_count,
+        stats.byte_count,
+        stats.seconds,
+        stats.bytes_per_second / (1024 * 1024),
+    )
 
 
 def get_artifact_object_name(meeting_id: int, filename: str) -> str:
@@ -291,17 +378,113 @@ def get_transcription_raw_object_name(meeting_id: int) -> str:
     return get_artifact_object_name(meeting_id, "transcription_raw.json")
 
 
-def write_preprocessed_audio(meeting_id: int, preprocessed_audio: BytesIO) -> None:
-    preprocessed_audio.seek(0)
+def get_transcription_chunk_object_name(meeting_id: int, checkpoint_key: str) -> str:
+    return get_artifact_object_name(
+        meeting_id, f"transcription_chunks/{checkpoint_key}.json"
+    )
+
+
+def get_transcription_chunk_audio_object_name(
+    meeting_id: int, checkpoint_key: str
+) -> str:
+    return get_artifact_object_name(
+        meeting_id, f"transcription_chunks/{checkpoint_key}.wav"
+    )
+
+
+def get_transcription_plan_object_name(meeting_id: int) -> str:
+    return get_artifact_object_name(meeting_id, "transcription_plan.json")
+
+
+def get_speculative_transcription_windows_object_name(meeting_id: int) -> str:
+    return get_artifact_object_name(
+        meeting_id, "speculative_transcription_windows.json"
+    )
+
+
+def get_artifact_manifest_object_name(meeting_id: int) -> str:
+    return get_artifact_object_name(meeting_id, "manifest.json")
+
+
+def get_time_map_object_name(meeting_id: int) -> str:
+    return get_artifact_object_name(meeting_id, "time_map.json")
+
+
+def get_diarization_job_object_name(meeting_id: int) -> str:
+    return get_artifact_object_name(meeting_id, "diarization_job.json")
+
+
+def write_preprocessed_audio(meeting_id: int, preprocessed_audio: AudioSpool) -> None:
+    with preprocessed_audio.open() as content:
+        put_file_to_s3(
+            content,
+            get_preprocessed_audio_object_name(meeting_id),
+            _WAV_CONTENT_TYPE,
+        )
+
+
+def read_preprocessed_audio(meeting_id: int) -> AudioSpool:
+    preprocessed_audio = AudioSpool(suffix=".wav")
+    try:
+        _download_file_from_s3_into(
+            get_preprocessed_audio_object_name(meeting_id), preprocessed_audio
+        )
+    except BaseException:
+        preprocessed_audio.close()
+        raise
+    return preprocessed_audio
+
+
+def write_artifact_manifest(meeting_id: int, manifest: ArtifactManifest) -> None:
     put_file_to_s3(
-        preprocessed_audio,
-        get_preprocessed_audio_object_name(meeting_id),
-        _WAV_CONTENT_TYPE,
+        BytesIO(manifest.model_dump_json().encode()),
+        get_artifact_manifest_object_name(meeting_id),
+        _JSON_CONTENT_TYPE,
+    )
+
+
+def read_artifact_manifest(meeting_id: int) -> ArtifactManifest | None:
+    content = get_file_from_s3_or_none(get_artifact_manifest_object_name(meeting_id))
+    if content is None:
+        return None
+    try:
+        return ArtifactManifest.model_validate_json(content.getvalue())
+    except ValidationError:
+        # Only a reuse hint: an unreadable manifest means "recompute".
+        logger.warning(
+            "Ignoring unreadable artifact manifest of meeting {}", meeting_id
+        )
+        return None
+
+
+def write_time_map(meeting_id: int, time_map: TimeMap) -> None:
+    put_file_to_s3(
+        BytesIO(time_map.model_dump_json().encode()),
+        get_time_map_object_name(meeting_id),
+        _JSON_CONTENT_TYPE,
+    )
+
+
+def read_time_map(meeting_id: int) -> TimeMap:
+    """Time map of the preprocessed audio; artifacts older than it were untrimmed."""
+    content = get_file_from_s3_or_none(get_time_map_object_name(meeting_id))
+    if content is None:
+        return TimeMap()
+    return TimeMap.model_validate_json(content.getvalue())
+
+
+def write_diarization_job(meeting_id: int, job: DiarizationJobState) -> None:
+    put_file_to_s3(
+        BytesIO(job.model_dump_json().encode()),
+        get_diarization_job_object_name(meeting_id),
+        _JSON_CONTENT_TYPE,
     )
 
 
-def read_preprocessed_audio(meeting_id: int) -> BytesIO:
-    return get_file_from_s3(get_preprocessed_audio_object_name(meeting_id))
+def read_diarization_job(meeting_id: int) -> DiarizationJobState:
+    return DiarizationJobState.model_validate_json(
+        get_file_from_s3(get_diarization_job_object_name(meeting_id)).getvalue()
+    )
 
 
 def write_diarization(meeting_id: int, diarization: list[DiarizationSegment]) -> None:
@@ -336,6 +519,94 @@ def read_transcription_raw(
     )
 
 
+def write_transcription_chunk(
+    meeting_id: int, checkpoint_key: str, segments: list[TranscriptionSegment]
+) -> None:
+    put_file_to_s3(
+        BytesIO(_TRANSCRIPTION_CHUNK_SERIALIZER.dump_json(segments)),
+        get_transcription_chunk_object_name(meeting_id, checkpoint_key),
+        _JSON_CONTENT_TYPE,
+    )
+
+
+def read_transcription_chunk(
+    meeting_id: int, checkpoint_key: str
+) -> list[TranscriptionSegment] | None:
+    """Checkpointed transcription of one chunk, None when it was not transcribed yet."""
+    content = get_file_from_s3_or_none(
+        get_transcription_chunk_object_name(meeting_id, checkpoint_key)
+    )
+    if content is None:
+        return None
+    try:
+        return _TRANSCRIPTION_CHUNK_SERIALIZER.validate_json(content.getvalue())
+    except ValidationError:
+        logger.warning(
+            "Ignoring unreadable transcription checkpoint {} of meeting {}",
+            checkpoint_key,
+            meeting_id,
+        )
+        return None
+
+
+def write_transcription_chunk_audio(
+    meeting_id: int, checkpoint_key: str, chunk_audio: BytesIO
+) -> None:
+    put_file_to_s3(
+        chunk_audio,
+        get_transcription_chunk_audio_object_name(meeting_id, checkpoint_key),
+        _WAV_CONTENT_TYPE,
+    )
+
+
+def read_transcription_chunk_audio(meeting_id: int, checkpoint_key: str) -> AudioSpool:
+    chunk_audio = AudioSpool(suffix=".wav")
+    try:
+        _download_file_from_s3_into(
+            get_transcription_chunk_audio_object_name(meeting_id, checkpoint_key),
+            chunk_audio,
+        )
+    except BaseException:
+        chunk_audio.close()
+        raise
+    return chunk_audio
+
+
+def write_transcription_plan(meeting_id: int, plan: TranscriptionChunkPlan) -> None:
+    put_file_to_s3(
+        BytesIO(plan.model_dump_json().encode()),
+        get_transcription_plan_object_name(meeting_id),
+        _JSON_CONTENT_TYPE,
+    )
+
+
+def read_transcription_plan(meeting_id: int) -> TranscriptionChunkPlan:
+    return TranscriptionChunkPlan.model_validate_json(
+        get_file_from_s3(get_transcription_plan_object_name(meeting_id)).getvalue()
+    )
+
+
+def write_speculative_transcription_windows(
+    meeting_id: int, windows: SpeculativeTranscriptionWindows
+) -> None:
+    put_file_to_s3(
+        BytesIO(windows.model_dump_json().encode()),
+        get_speculative_transcription_windows_object_name(meeting_id),
+        _JSON_CONTENT_TYPE,
+    )
+
+
+def read_speculative_transcription_windows(
+    meeting_id: int,
+) -> SpeculativeTranscriptionWindows | None:
+    content = get_file_from_s3_or_none(
+        get_speculative_transcription_windows_object_name(meeting_id)
+    )
+    if content is None:
+        return None
+    return SpeculativeTranscriptionWindows.model_validate_json(content.getvalue())
+
+
 def get_full_transcript_object_name(meeting_id: int) -> str:
     return get_transcription_object_name(meeting_id, "full_transcript.json")
 
@@ -363,6 +634,22 @@ def get_file_from_s3(object_name: str) -> BytesIO:
         raise S3TransientError(f"Transient error for s3 read: {object_name}") from e
 
 
+def _download_file_from_s3_into(object_name: str, audio_spool: AudioSpool) -> None:
+    """Append an object to the spool; a retried download restarts at the same offset."""
+    _append_file_from_s3(object_name, audio_spool, audio_spool.size)
+
+
+@_with_retry_transient
+def _append_file_from_s3(
+    object_name: str, audio_spool: AudioSpool, offset: int
+) -> None:
+    try:
+        response = s3_client.get_object(Bucket=s3_settings.S3_BUCKET, Key=object_name)
+        audio_spool.append(response["Body"], offset=offset)
+    except S3_TRANSIENT as e:
+        raise S3TransientError(f"Transient error for s3 read: {object_name}") from e
+
+
 def get_file_from_s3_or_none(object_name: str) -> BytesIO | None:
     try:
         return get_file_from_s3(object_name)
@@ -476,7 +763,7 @@ def validate_object_list(objects: Iterable[S3Object]) -> Iterator[S3Object]:
 
 @_with_retry_transient
 def put_file_to_s3(
-    content: BytesIO,
+    content: BinaryIO,
     object_name: str,
     content_type: str = "application/octet-stream",
 ) -> None:
@@ -1,79 +1,393 @@
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from io import BytesIO
+from typing import Protocol
 
 import numpy as np
-import soundfile as sf
 from loguru import logger
 from numpy.typing import NDArray
-from openai import APIConnectionError, APIStatusError, NotGiven, OpenAI
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    AsyncOpenAI,
+    NotGiven,
+    OpenAI,
+)
+from openai._legacy_response import LegacyAPIResponse
+from openai.types.audio import TranscriptionVerbose
+from sentry_sdk.tracing import Span
 
 from mcr_meeting.app.configs.base import (
+    AudioSettings,
     TranscriptionApiSettings,
     WhisperTranscriptionSettings,
 )
 from mcr_meeting.app.domain.audio import split_audio_on_timestamps
+from mcr_meeting.app.domain.audio_spool import AudioSpool, wav_bytes_from_pcm
+from mcr_meeting.app.domain.transcription.chunking import ChunkCostModel
 from mcr_meeting.app.exceptions.exceptions import (
     TranscriptionError,
     TranscriptionTransientError,
 )
+from mcr_meeting.app.infrastructure.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+    LimiterSlot,
+)
+from mcr_meeting.app.infrastructure.chunk_latency import ChunkLatencyModel
+from mcr_meeting.app.infrastructure.endpoint_pool import BreakerState, EndpointPool
+from mcr_meeting.app.infrastructure.request_hedging import (
+    HedgeRefused,
+    HedgeStats,
+    RequestHedger,
+)
 from mcr_meeting.app.infrastructure.sentry import span
+from mcr_meeting.app.infrastructure.unleash import (
+    FeatureFlag,
+    get_feature_flag_client,
+)
 from mcr_meeting.app.schemas.transcription_schema import (
     TimeSpan,
     TranscriptionInput,
     TranscriptionSegment,
 )
 
+audio_settings = AudioSettings()
 transcription_settings = WhisperTranscriptionSettings()
 api_settings = TranscriptionApiSettings()
 
+# Shared by every chunk call of the process, so that meetings transcribed side by
+# side back off together when the endpoint is saturated.
+chunk_concurrency = AdaptiveConcurrencyLimiter(
+    name="Transcription API",
+    initial=api_settings.INITIAL_CONCURRENT_CHUNKS,
+    minimum=api_settings.MIN_CONCURRENT_CHUNKS,
+    maximum=api_settings.MAX_CONCURRENT_CHUNKS,
+    decrease_factor=api_settings.CONCURRENCY_DECREASE_FACTOR,
+    is_overload=lambda e: isinstance(e, TranscriptionTransientError),
+)
+
+chunk_latency = ChunkLatencyModel(
+    request_overhead=api_settings.CHUNK_REQUEST_OVERHEAD_SECONDS,
+    real_time_factor=api_settings.CHUNK_REAL_TIME_FACTOR,
+    prior_weight=api_settings.CHUNK_LATENCY_PRIOR_WEIGHT,
+)
+
+chunk_hedger = RequestHedger(
+    name="Transcription API",
+    percentile=api_settings.HEDGE_LATENCY_PERCENTILE,
+    min_samples=api_settings.HEDGE_MIN_SAMPLES,
+    window=api_settings.HEDGE_LATENCY_WINDOW,
+    budget_ratio=api_settings.HEDGE_BUDGET_RATIO,
+    budget_burst=api_settings.HEDGE_BUDGET_BURST,
+)
+
+# Replicas are picked per request, so a hedged copy goes to another replica than
+# the original whenever one has fewer requests in flight.
+chunk_endpoints = EndpointPool(
+    name="Transcription API",
+    failure_threshold=api_settings.ENDPOINT_BREAKER_FAILURE_THRESHOLD,
+    cooldown_seconds=api_settings.ENDPOINT_BREAKER_COOLDOWN_SECONDS,
+    is_failure=lambda e: isinstance(e, TranscriptionTransientError),
+)
+
+
+# Floor of a chunk's expected latency, so that a degenerate latency fit cannot
+# zero the hedge delay.
+_MIN_EXPECTED_CHUNK_LATENCY = 0.01
+
+# Hedged chunk calls run on one event loop for the process, on a thread of its
+# own. The async clients belong to that loop, so their connections are reused
+# from one call, and one meeting, to the next, as the sync clients' are.
+_hedging_loop: asyncio.AbstractEventLoop | None = None
+_hedging_loop_lock = threading.Lock()
+_async_openai_clients: dict[str, AsyncOpenAI] = {}
+
+
+def _run_on_hedging_loop[T](coroutine: Coroutine[object, object, T]) -> T:
+    """Run `coroutine` on the process's hedging loop and wait for its result."""
+    global _hedging_loop
+    with _hedging_loop_lock:
+        if _hedging_loop is None:
+            _hedging_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_hedging_loop.run_forever,
+                name="transcription-hedging",
+                daemon=True,
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coroutine, _hedging_loop).result()
+
+
+def _get_async_openai_client(base_url: str) -> AsyncOpenAI:
+    # Only called on the hedging loop, which owns the clients: no lock needed.
+    if base_url not in _async_openai_clients:
+        _async_openai_clients[base_url] = AsyncOpenAI(
+            api_key=api_settings.TRANSCRIPTION_API_KEY,
+            base_url=base_url,
+            max_retries=_client_max_retries(),
+        )
+    return _async_openai_clients[base_url]
+
+
+def _expected_chunk_latency(duration: float) -> float:
+    """Latency the fitted model expects of a request on `duration` seconds."""
+    request_overhead, real_time_factor = chunk_latency.estimate()
+    return max(
+        request_overhead + real_time_factor * duration, _MIN_EXPECTED_CHUNK_LATENCY
+    )
+
+
+def _transcription_api_base_urls() -> list[str]:
+    return list(
+        dict.fromkeys(
+            [
+                api_settings.TRANSCRIPTION_API_BASE_URL,
+                *api_settings.TRANSCRIPTION_API_REPLICA_BASE_URLS,
+            ]
+        )
+    )
+
+
+def chunk_cost_model() -> ChunkCostModel:
+    """Cost of chunk requests as observed so far, at the current concurrency."""
+    request_overhead, real_time_factor = chunk_latency.estimate()
+    return ChunkCostModel(
+        request_overhead=request_overhead,
+        real_time_factor=real_time_factor,
+        concurrency=chunk_concurrency.window,
+    )
+
+
+# Bump when a code change alters what the API is asked for a given chunk.
+_CHUNK_CHECKPOINT_VERSION = 1
+
+
+class ChunkCheckpoints(Protocol):
+    """Where finished chunks are kept, so that a retry only redoes the others."""
+
+    def load(self, key: str) -> list[TranscriptionSegment] | None: ...
+
+    def save(self, key: str, segments: list[TranscriptionSegment]) -> None: ...
+
+
+def chunk_checkpoint_key(chunk: TranscriptionInput) -> str:
+    """Deterministic name of a chunk's checkpoint.
+
+    The chunk span, then a digest of its samples and of every setting that shapes
+    the API's answer: a checkpoint is only reused for the same audio, cut at the
+    same place, sent to the same model with the same language and prompt.
+    """
+    config = {
+        "version": _CHUNK_CHECKPOINT_VERSION,
+        "model": api_settings.TRANSCRIPTION_API_MODEL,
+        "language": api_settings.API_LANGUAGE,
+        "prompt": transcription_settings.INITIAL_PROMPT,
+        "sample_rate": audio_settings.SAMPLE_RATE,
+    }
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode())
+    digest.update(memoryview(np.ascontiguousarray(chunk.audio)).cast("B"))
+    return (
+        f"{round(chunk.span.start * 1000)}-{round(chunk.span.end * 1000)}-"
+        f"{digest.hexdigest()[:16]}"
+    )
+
+
+def _gather_in_chunk_order(
+    futures: list[Future[list[TranscriptionSegment]]],
+) -> list[list[TranscriptionSegment]]:
+    """Chunk results in submission order, once every chunk had its chance.
+
+    A transient failure lets the other chunks finish (and be checkpointed) before
+    it is raised, so that the retry only resends what failed. A permanent one
+    fails the meeting anyway: the chunks not started yet are cancelled.
+    """
+    for future in as_completed(futures):
+        error = future.exception()
+        if error is not None and not isinstance(error, TranscriptionTransientError):
+            for pending in futures:
+                pending.cancel()
+            raise error
+    return [future.result() for future in futures]
+
+
+def chunk_segments_in_audio_time(
+    idx: int, span: TimeSpan, chunk_segments: list[TranscriptionSegment]
+) -> list[TranscriptionSegment]:
+    """Segments of the chunk `idx`, moved from chunk time to audio time."""
+    if not chunk_segments:
+        logger.debug(
+            "No transcription for this chunk: start: {} - end: {}.",
+            span.start,
+            span.end,
+        )
+        return []
+
+    return [
+        TranscriptionSegment(
+            id=idx,
+            start=segment.start + span.start,
+            end=segment.end + span.start,
+            text=segment.text,
+        )
+        for segment in chunk_segments
+    ]
+
+
+def _record_hedges(transcription_span: Span, before: HedgeStats) -> None:
+    """Hedges sent and won since `before`, and the process-wide hedge rate."""
+    after = chunk_hedger.stats
+    transcription_span.set_data(
+        "transcription.hedged_requests", after.hedges - before.hedges
+    )
+    transcription_span.set_data("transcription.hedge_wins", after.wins - before.wins)
+    transcription_span.set_data("transcription.hedge_rate", after.hedge_rate)
+
+
+def _record_endpoint_health(transcription_span: Span) -> None:
+    health = chunk_endpoints.health()
+    transcription_span.set_data(
+        "transcription.open_endpoints",
+        sum(endpoint.state != BreakerState.CLOSED for endpoint in health),
+    )
+    transcription_span.set_data(
+        "transcription.endpoint_health",
+        {
+            endpoint.url: {
+                "state": endpoint.state.value,
+                "outstanding": endpoint.outstanding,
+                "requests": endpoint.requests,
+                "failures": endpoint.failures,
+            }
+            for endpoint in health
+        },
+    )
+
+
+def _client_max_retries() -> int:
+    # With replicas, a failing call moves on to the next one instead of
+    # waiting out the client's backoff on the same endpoint.
+    if len(_transcription_api_base_urls()) == 1:
+        return api_settings.MAX_RETRIES
+    return api_settings.REPLICA_MAX_RETRIES
+
+
+def _chunk_file(audio: NDArray[np.int16]) -> tuple[str, BytesIO, str]:
+    return (
+        "audio.wav",
+        wav_bytes_from_pcm(audio, audio_settings.SAMPLE_RATE),
+        "audio/wav",
+    )
+
+
+def _segments_from_response(
+    raw_response: LegacyAPIResponse[TranscriptionVerbose],
+    duration: float,
+    slot: LimiterSlot,
+    started_at: float,
+) -> list[TranscriptionSegment]:
+    if raw_response.retries_taken:
+        # The client absorbed throttling, 5xx or timeouts before this
+        # success: the endpoint is saturated even if the call is not.
+        slot.mark_overloaded()
+    else:
+        # Retried calls also measure the backoff, not the endpoint.
+        chunk_latency.record(duration, time.monotonic() - started_at)
+    response = raw_response.parse()
+
+    # Convert API response to TranscriptionSegment format
+    segments = []
+    if hasattr(response, "segments") and response.segments:
+        for idx, segment in enumerate(response.segments):
+            segments.append(
+                TranscriptionSegment(
+                    id=idx,
+                    start=segment.start,
+                    end=segment.end,
+                    text=segment.text,
+                )
+            )
+    return segments
+
+
+def _transcription_api_error(
+    e: APIStatusError | APIConnectionError,
+) -> TranscriptionError | TranscriptionTransientError:
+    if isinstance(e, APIConnectionError):
+        # Covers APITimeoutError. Connect blip / timeout on a stateless POST.
+        return TranscriptionTransientError(
+            f"Transient error calling transcription API: {e}"
+        )
+    # 5xx (backend down/cold) and 429 (overload) recover on a whole-op
+    # replay; a 4xx is a request the server rejects on replay → permanent.
+    if e.status_code == 429 or e.status_code >= 500:
+        return TranscriptionTransientError(
+            f"Transient transcription API error (HTTP {e.status_code})"
+        )
+    return TranscriptionError(
+        f"Transcription API rejected the request (HTTP {e.status_code})"
+    )
+
 
 class TranscriptionProcessor:
     def __init__(self) -> None:
-        self._openai_client: OpenAI | None = None
+        self._openai_clients: dict[str, OpenAI] = {}
 
-    def _get_openai_client(self) -> OpenAI:
-        if self._openai_client is None:
-            self._openai_client = OpenAI(
+    def _get_openai_client(self, base_url: str) -> OpenAI:
+        if base_url not in self._openai_clients:
+            self._openai_clients[base_url] = OpenAI(
                 api_key=api_settings.TRANSCRIPTION_API_KEY,
-                base_url=api_settings.TRANSCRIPTION_API_BASE_URL,
-                max_retries=api_settings.MAX_RETRIES,
+                base_url=base_url,
+                max_retries=_client_max_retries(),
             )
-        return self._openai_client
+        return self._openai_clients[base_url]
 
     def transcribe(
         self,
-        audio_bytes: BytesIO,
+        audio: AudioSpool,
         chunk_spans: list[TimeSpan],
+        checkpoints: ChunkCheckpoints | None = None,
     ) -> list[TranscriptionSegment]:
+        """Transcribe every chunk of `audio`, reusing the checkpointed ones.
+
+        With `checkpoints`, each chunk is saved as soon as it is transcribed, so
+        that when another chunk fails, the retry only sends the missing ones.
+        """
+        reused_chunks: list[int] = []
+
         def transcribe_one(
             indexed_chunk: tuple[int, TranscriptionInput],
         ) -> list[TranscriptionSegment]:
             idx, chunk = indexed_chunk
-            chunk_transcription_segments = self._transcribe_audio_chunk_api(chunk.audio)
-            if not chunk_transcription_segments:
-                logger.debug(
-                    "No transcription for this chunk: start: {} - end: {}.",
-                    chunk.span.start,
-                    chunk.span.end,
-                )
-                return []
-
-            return [
-                TranscriptionSegment(
-                    id=idx,
-                    start=segment.start + chunk.span.start,
-                    end=segment.end + chunk.span.start,
-                    text=segment.text,
+            if checkpoints is None:
+                chunk_transcription_segments = self._transcribe_audio_chunk_api(
+                    chunk.audio
                 )
-                for segment in chunk_transcription_segments
-            ]
+            else:
+                key = chunk_checkpoint_key(chunk)
+                checkpointed = checkpoints.load(key)
+                if checkpointed is None:
+                    chunk_transcription_segments = self._transcribe_audio_chunk_api(
+                        chunk.audio
+                    )
+                    checkpoints.save(key, chunk_transcription_segments)
+                else:
+                    reused_chunks.append(idx)
+                    chunk_transcription_segments = checkpointed
+            return chunk_segments_in_audio_time(
+                idx, chunk.span, chunk_transcription_segments
+            )
 
         # A parent span for the whole fan-out. The per-chunk API calls run in
         # worker threads whose spans don't nest here (Sentry's scope is
         # thread-local), but this still turns total transcription time into one
         # named span instead of scattered, orphaned child spans.
+        hedges_before = chunk_hedger.stats
         with span("transcription.transcribe", "transcribe") as transcribe_span:
-            transcription_inputs = split_audio_on_timestamps(audio_bytes, chunk_spans)
+            transcription_inputs = split_audio_on_timestamps(audio, chunk_spans)
             transcribe_span.set_data(
                 "transcription.chunk_count", len(transcription_inputs)
             )
@@ -83,69 +397,163 @@ class TranscriptionProcessor:
                 len(transcription_inputs),
             )
 
+            # The pool only bounds the threads; chunk_concurrency decides how
+            # many of them call the API at once.
             with ThreadPoolExecutor(
                 max_workers=api_settings.MAX_CONCURRENT_CHUNKS
             ) as pool:
-                results = pool.map(transcribe_one, enumerate(transcription_inputs))
+                results = _gather_in_chunk_order(
+                    [
+                        pool.submit(transcribe_one, indexed_chunk)
+                        for indexed_chunk in enumerate(transcription_inputs)
+                    ]
+                )
 
-                return [
+                segments = [
                     segment for chunk_segments in results for segment in chunk_segments
                 ]
+            transcribe_span.set_data(
+                "transcription.concurrency_window", chunk_concurrency.window
+            )
+            transcribe_span.set_data("transcription.reused_chunks", len(reused_chunks))
+            _record_hedges(transcribe_span, hedges_before)
+            _record_endpoint_health(transcribe_span)
+            if reused_chunks:
+                logger.info(
+                    "Reused {} of {} checkpointed chunk transcriptions",
+                    len(reused_chunks),
+                    len(transcription_inputs),
+                )
+            return segments
+
+    def transcribe_chunk(self, audio: NDArray[np.int16]) -> list[TranscriptionSegment]:
+        """Transcribe one chunk on its own, timestamps relative to the chunk."""
+        hedges_before = chunk_hedger.stats
+        with span("transcription.transcribe_chunk", "transcribe_chunk") as chunk_span:
+            segments = self._transcribe_audio_chunk_api(audio)
+            chunk_span.set_data(
+                "transcription.concurrency_window", chunk_concurrency.window
+            )
+            _record_hedges(chunk_span, hedges_before)
+            _record_endpoint_health(chunk_span)
+            return segments
 
     def _transcribe_audio_chunk_api(
         self,
-        audio: NDArray[np.float32],
+        audio: NDArray[np.int16],
     ) -> list[TranscriptionSegment]:
-        audio_bytes = BytesIO()
-        sf.write(audio_bytes, audio, 16000, format="WAV")
-        audio_bytes.seek(0)
+        duration = len(audio) / audio_settings.SAMPLE_RATE
+        latency_budget = (
+            api_settings.CHUNK_HEALTHY_LATENCY_BASE_SECONDS
+            + api_settings.CHUNK_HEALTHY_REAL_TIME_FACTOR * duration
+        )
 
-        try:
-            client = self._get_openai_client()
+        with chunk_concurrency.slot(latency_budget=latency_budget) as slot:
+            if get_feature_flag_client().is_enabled(
+                FeatureFlag.TRANSCRIPTION_HEDGED_REQUESTS
+            ):
+                segments = _run_on_hedging_loop(
+                    self._hedged_chunk_transcription(
+                        audio, duration, slot, latency_budget
+                    )
+                )
+            else:
+                segments = chunk_endpoints.call(
+                    _transcription_api_base_urls(),
+                    lambda base_url: self._request_chunk_transcription(
+                        audio, duration, slot, base_url
+                    ),
+                )
 
-            prompt = transcription_settings.INITIAL_PROMPT or NotGiven()
+        if not segments:
+            raise TranscriptionError("Transcription API returned no segments")
 
-            response = client.audio.transcriptions.create(
+        return segments
+
+    async def _hedged_chunk_transcription(
+        self,
+        audio: NDArray[np.int16],
+        duration: float,
+        slot: LimiterSlot,
+        latency_budget: float,
+    ) -> list[TranscriptionSegment]:
+        """The chunk request, hedged: both copies run on the hedging loop.
+
+        The original runs in the chunk's slot. Its copy is only sent if it can
+        hold a slot of its own, so the limiter counts every request in flight;
+        whichever copy loses is cancelled, which closes its connection. The
+        hedge delay is scaled to the latency expected for the chunk's duration:
+        a long chunk is not hedged for its length, nor a short one left late.
+        """
+
+        async def send(request_slot: LimiterSlot) -> list[TranscriptionSegment]:
+            return await chunk_endpoints.acall(
+                _transcription_api_base_urls(),
+                lambda base_url: self._arequest_chunk_transcription(
+                    audio, duration, request_slot, base_url
+                ),
+            )
+
+        async def send_hedge() -> list[TranscriptionSegment]:
+            with chunk_concurrency.try_slot(
+                latency_budget=latency_budget
+            ) as hedge_slot:
+                if hedge_slot is None:
+                    raise HedgeRefused("no free transcription slot")
+                return await send(hedge_slot)
+
+        return await chunk_hedger.call(
+            lambda: send(slot),
+            send_hedge,
+            expected_latency=_expected_chunk_latency(duration),
+        )
+
+    def _request_chunk_transcription(
+        self,
+        audio: NDArray[np.int16],
+        duration: float,
+        slot: LimiterSlot,
+        base_url: str,
+    ) -> list[TranscriptionSegment]:
+        """One request for the chunk."""
+        try:
+            client = self._get_openai_client(base_url)
+            started_at = time.monotonic()
+            raw_response = client.audio.transcriptions.with_raw_response.create(
                 model=api_settings.TRANSCRIPTION_API_MODEL,
-                file=("audio.wav", audio_bytes, "audio/wav"),
+                file=_chunk_file(audio),
                 language=api_settings.API_LANGUAGE,
                 response_format="verbose_json",
-                prompt=prompt,
+                prompt=transcription_settings.INITIAL_PROMPT or NotGiven(),
             )
-
-            # Convert API response to TranscriptionSegment format
-            segments = []
-            if hasattr(response, "segments") and response.segments:
-                for idx, segment in enumerate(response.segments):
-                    segments.append(
-                        TranscriptionSegment(
-                            id=idx,
-                            start=segment.start,
-                            end=segment.end,
-                            text=segment.text,
-                        )
-                    )
-
-        except APIStatusError as e:
-            # 5xx (backend down/cold) and 429 (overload) recover on a whole-op
-            # replay; a 4xx is a request the server rejects on replay → permanent.
-            if e.status_code == 429 or e.status_code >= 500:
-                raise TranscriptionTransientError(
-                    f"Transient transcription API error (HTTP {e.status_code})"
-                ) from e
-            raise TranscriptionError(
-                f"Transcription API rejected the request (HTTP {e.status_code})"
-            ) from e
-        except APIConnectionError as e:
-            # Covers APITimeoutError. Connect blip / timeout on a stateless POST.
-            raise TranscriptionTransientError(
-                f"Transient error calling transcription API: {e}"
-            ) from e
+            return _segments_from_response(raw_response, duration, slot, started_at)
+        except (APIStatusError, APIConnectionError) as e:
+            raise _transcription_api_error(e) from e
         except Exception as e:
             # Unknown fault → fail loud rather than retry-storm.
             raise TranscriptionError(f"Error calling transcription API: {e}") from e
 
-        if not segments:
-            raise TranscriptionError("Transcription API returned no segments")
-
-        return segments
+    async def _arequest_chunk_transcription(
+        self,
+        audio: NDArray[np.int16],
+        duration: float,
+        slot: LimiterSlot,
+        base_url: str,
+    ) -> list[TranscriptionSegment]:
+        """`_request_chunk_transcription` over the async client, to be cancellable."""
+        try:
+            client = _get_async_openai_client(base_url)
+            started_at = time.monotonic()
+            raw_response = await client.audio.transcriptions.with_raw_response.create(
+                model=api_settings.TRANSCRIPTION_API_MODEL,
+                file=_chunk_file(audio),
+                language=api_settings.API_LANGUAGE,
+                response_format="verbose_json",
+                prompt=transcription_settings.INITIAL_PROMPT or NotGiven(),
+            )
+            return _segments_from_response(raw_response, duration, slot, started_at)
+        except (APIStatusError, APIConnectionError) as e:
+            raise _transcription_api_error(e) from e
+        except Exception as e:
+            # Unknown fault → fail loud rather than retry-storm.
+            raise TranscriptionError(f"Error calling transcription API: {e}") from e
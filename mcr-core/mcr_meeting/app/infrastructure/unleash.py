@@ -18,10 +18,19 @@ from mcr_meeting.app.configs.base import Settings, UnleashSettings
 class FeatureFlag(StrEnum):
     """Centralized enum for all feature flag names in the application."""
 
+    ACRONYM_GLOSSARY_PREFILTER = "acronym_glossary_prefilter"
     AUDIO_NOISE_FILTERING = "audio_noise_filtering"
     AUDIO_PHASE_AWARE_DOWNMIX = "audio_phase_aware_downmix"
+    AUDIO_SILENCE_TRIMMING = "audio_silence_trimming"
+    DIARIZATION_DEFERRED_POLLING = "diarization_deferred_polling"
+    FUSED_TEXT_CORRECTION = "fused_text_correction"
+    PARTICIPANT_MAP_MERGE = "participant_map_merge"
     SPELLING_CORRECTION = "spelling_correction"
     STRUCTURAL_SPLIT_ENABLED = "structural_split_enabled"
+    TRANSCRIPTION_CHUNK_FAN_OUT = "transcription_chunk_fan_out"
+    TRANSCRIPTION_HEDGED_REQUESTS = "transcription_hedged_requests"
+    TRANSCRIPTION_MAKESPAN_CHUNKING = "transcription_makespan_chunking"
+    TRANSCRIPTION_SPECULATIVE_WINDOWS = "transcription_speculative_windows"
 
 
 class FeatureFlagClient(ABC):
@@ -16,6 +16,8 @@ class S3Object(BaseModel):
     bucket_name: str = s3_settings.S3_BUCKET
     object_name: str = Field(alias="Key")
     last_modified: datetime | None = Field(alias="LastModified")
+    etag: str | None = Field(default=None, alias="ETag")
+    size: int | None = Field(default=None, alias="Size")
 
     model_config = ConfigDict(extra="allow", populate_by_name=True)
 
@@ -15,7 +15,12 @@ class MCRTranscriptionTasks(MCRCeleryTask):
 
     TRANSCRIBE = f"{BASE_NAME}.transcribe"
     DIARIZE = f"{BASE_NAME}.diarize"
+    POLL_DIARIZATION = f"{BASE_NAME}.poll_diarization"
+    SPECULATIVE_TRANSCRIBE = f"{BASE_NAME}.speculative_transcribe"
     TRANSCRIBE_CHUNKS = f"{BASE_NAME}.transcribe_chunks"
+    PLAN_TRANSCRIPTION_CHUNKS = f"{BASE_NAME}.plan_transcription_chunks"
+    TRANSCRIBE_CHUNK = f"{BASE_NAME}.transcribe_chunk"
+    MERGE_TRANSCRIPTION_CHUNKS = f"{BASE_NAME}.merge_transcription_chunks"
     FINALIZE_TRANSCRIPTION = f"{BASE_NAME}.finalize_transcription"
     MARK_TRANSCRIPTION_FAILED = f"{BASE_NAME}.mark_transcription_failed"
     EVALUATE = f"{BASE_NAME}.evaluate"
@@ -51,7 +51,7 @@ class TimeSpan:
 class TranscriptionInput(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    audio: NDArray[np.float32]
+    audio: NDArray[np.int16]
     span: TimeSpan
 
 
@@ -140,6 +140,68 @@ class DiarizationSegment(BaseModel):
     speaker: str
 
 
+class ArtifactManifest(BaseModel):
+    """Inputs the stored preprocessed audio and diarization were produced from."""
+
+    source_audio_hash: str
+    config_fingerprint: str
+
+
+class TimeMap(BaseModel):
+    """Where the audio kept by silence trimming lies in the original recording.
+
+    The kept spans, in original time, are laid end to end in the trimmed audio.
+    None means nothing was trimmed: both time bases are the same.
+    """
+
+    kept_spans: list[TimeSpan] | None = None
+
+
+class DiarizationJobState(BaseModel):
+    """A submitted diarization job, persisted between two polls of its status.
+
+    Times are wall-clock (epoch seconds) since successive polls may run on
+    different workers. A None job_id asks the next poll to submit again, after
+    the server declared the previous job failed but worth retrying.
+    """
+
+    job_id: str | None
+    submitted_at: float
+    phase_started_at: float
+    seen_processing: bool = False
+    attempt: int = 1
+    manifest: ArtifactManifest
+
+
+class PlannedTranscriptionChunk(BaseModel):
+    """One chunk of a fanned-out transcription: its span and checkpoint name."""
+
+    span: TimeSpan
+    checkpoint_key: str
+
+
+class SpeculativeTranscriptionWindows(BaseModel):
+    """Windows of the preprocessed audio transcribed before its diarization.
+
+    Cut at the audio's own silences, in the time of the preprocessed audio.
+    `manifest` is the one the diarization will be stored with: the windows only
+    apply to the preprocessed audio of that same run.
+    """
+
+    manifest: ArtifactManifest
+    windows: list[TimeSpan]
+
+
+class TranscriptionChunkPlan(BaseModel):
+    """Chunks of a meeting transcribed by separate tasks, in audio order.
+
+    Spans are in the time of the preprocessed audio, trimmed or not. Each task
+    writes the checkpoint named in its entry; the merge reads them back in order.
+    """
+
+    chunks: list[PlannedTranscriptionChunk]
+
+
 class Participant(BaseModel):
     speaker_id: str = Field(
         description="Identifiant unique du locuteur dans la transcription ex: LOCUTEUR_03.",
@@ -8,12 +8,12 @@ from mcr_meeting.app.infrastructure.unleash import FeatureFlag, is_enabled
 
 
 def dispatch_transcription_task(meeting_id: int, owner_keycloak_uuid: str) -> None:
-    enqueue = (
-        enqueue_transcription_pipeline
-        if _structural_split_enabled()
-        else enqueue_transcription_task
+    if not _structural_split_enabled():
+        enqueue_transcription_task(meeting_id, owner_keycloak_uuid)
+        return
+    enqueue_transcription_pipeline(
+        meeting_id, owner_keycloak_uuid, fan_out_chunks=_chunk_fan_out_enabled()
     )
-    enqueue(meeting_id, owner_keycloak_uuid)
 
 
 def _structural_split_enabled() -> bool:
@@ -24,3 +24,14 @@ def _structural_split_enabled() -> bool:
             "Failed to read STRUCTURAL_SPLIT_ENABLED, enqueueing legacy task: {}", e
         )
         return False
+
+
+def _chunk_fan_out_enabled() -> bool:
+    try:
+        return is_enabled(FeatureFlag.TRANSCRIPTION_CHUNK_FAN_OUT)
+    except Exception as e:
+        logger.warning(
+            "Failed to read TRANSCRIPTION_CHUNK_FAN_OUT, transcribing in one task: {}",
+            e,
+        )
+        return False
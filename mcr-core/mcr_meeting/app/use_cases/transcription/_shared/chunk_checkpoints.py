@@ -0,0 +1,27 @@
+from loguru import logger
+
+from mcr_meeting.app.infrastructure import s3
+from mcr_meeting.app.schemas.transcription_schema import TranscriptionSegment
+
+
+class S3ChunkCheckpoints:
+    """Chunk checkpoints of one meeting, stored next to transcription_raw.json."""
+
+    def __init__(self, meeting_id: int) -> None:
+        self._meeting_id = meeting_id
+
+    def load(self, key: str) -> list[TranscriptionSegment] | None:
+        return s3.read_transcription_chunk(self._meeting_id, key)
+
+    def save(self, key: str, segments: list[TranscriptionSegment]) -> None:
+        # A lost checkpoint only costs a chunk transcription on retry: never fail
+        # a chunk that was transcribed because its checkpoint was not written.
+        try:
+            s3.write_transcription_chunk(self._meeting_id, key, segments)
+        except Exception as e:
+            logger.warning(
+                "Could not checkpoint chunk {} of meeting {}: {}",
+                key,
+                self._meeting_id,
+                e,
+            )
@@ -1,27 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+
 from langfuse import observe
 from loguru import logger
 
-from mcr_meeting.app.configs.base import ChunkingConfig
+from mcr_meeting.app.configs.base import ChunkingConfig, LLMSettings
 from mcr_meeting.app.domain.transcription.participant_reconciliation import (
+    ParticipantMerge,
     ParticipantNameLoss,
     detect_name_losses,
     format_segments_as_dialogue,
+    merge_participant_candidates,
+    unshare_names,
 )
 from mcr_meeting.app.domain.transcription.text_chunking import chunk_text
 from mcr_meeting.app.infrastructure.langfuse import (
     record_participant_name_lost_event,
 )
 from mcr_meeting.app.infrastructure.llm import participants as participants_llm
+from mcr_meeting.app.infrastructure.unleash import (
+    FeatureFlag,
+    get_feature_flag_client,
+)
 from mcr_meeting.app.schemas.transcription_schema import (
     DiarizedTranscriptionSegment,
     Participant,
 )
 
 
+class ParticipantExtractionMode(StrEnum):
+    """How the participants of the chunks of a transcript are put together."""
+
+    # Each chunk refines the list of the previous ones: one call after another.
+    REFINE = "refine"
+    # Every chunk on its own and side by side, then a local merge, and one more
+    # call only for the conflicts it leaves.
+    MAP_MERGE = "map_merge"
+
+
 @observe(name="participant_extraction")
 def extract_participants(
     segments: list[DiarizedTranscriptionSegment],
+    mode: ParticipantExtractionMode | None = None,
 ) -> list[Participant]:
+    """Name and role of each speaker of `segments`, as far as the LLM can tell.
+
+    `mode` defaults to the one the feature flags select; the participant naming
+    evaluation sets it to compare them on the same transcripts.
+    """
     text = format_segments_as_dialogue(segments)
     chunks = chunk_text(text, chunk_overlap=ChunkingConfig().CHUNK_OVERLAP)
 
@@ -29,6 +55,24 @@ def extract_participants(
         logger.warning("No chunks found")
         return []
 
+    if mode is None:
+        mode = _mode_from_flags()
+    logger.debug("Participant extraction: {} over {} chunk(s)", mode, len(chunks))
+
+    match mode:
+        case ParticipantExtractionMode.REFINE:
+            return _refine_chunk_by_chunk(chunks)
+        case ParticipantExtractionMode.MAP_MERGE:
+            return _map_then_merge(chunks)
+
+
+def _mode_from_flags() -> ParticipantExtractionMode:
+    if get_feature_flag_client().is_enabled(FeatureFlag.PARTICIPANT_MAP_MERGE):
+        return ParticipantExtractionMode.MAP_MERGE
+    return ParticipantExtractionMode.REFINE
+
+
+def _refine_chunk_by_chunk(chunks: list[str]) -> list[Participant]:
     participants = participants_llm.extract_participants(chunks[0])
 
     for step_index, chunk in enumerate(chunks[1:], start=1):
@@ -40,6 +84,70 @@ def extract_participants(
     return participants
 
 
+def _map_then_merge(chunks: list[str]) -> list[Participant]:
+    # No call waits for another: the extraction takes about as long as its
+    # slowest chunk instead of their sum. map() keeps the chunks in order, so
+    # the merge lists the speakers as they appear.
+    max_workers = min(
+        LLMSettings().LLM_MAX_CONCURRENT_PARTICIPANT_EXTRACTIONS, len(chunks)
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        candidates_per_chunk = list(
+            pool.map(participants_llm.extract_participants, chunks)
+        )
+
+    merge = merge_participant_candidates(candidates_per_chunk)
+    if not merge.conflicts:
+        return merge.participants
+    return _resolve_conflicts(merge, candidates_per_chunk)
+
+
+def _resolve_conflicts(
+    merge: ParticipantMerge, candidates_per_chunk: list[list[Participant]]
+) -> list[Participant]:
+    for conflict in merge.conflicts:
+        logger.warning(
+            "Participant conflict ({}): speakers {} named {}",
+            conflict.reason,
+            conflict.speaker_ids,
+            conflict.names,
+        )
+    conflicted = {
+        speaker_id
+        for conflict in merge.conflicts
+        for speaker_id in conflict.speaker_ids
+    }
+    candidates = [
+        candidate
+        for candidates in candidates_per_chunk
+        for candidate in candidates
+        if candidate.speaker_id in conflicted and candidate.name
+    ]
+    try:
+        resolved = participants_llm.resolve_participant_conflicts(
+            merge.participants, candidates
+        )
+    except Exception as e:
+        logger.warning("Participant conflict resolution failed, left unnamed: {}", e)
+        return merge.participants
+
+    # Only the conflicts are the LLM's to settle: the other speakers keep the
+    # local merge, whatever the answer says about them.
+    resolved_by_id = {p.speaker_id: p for p in resolved if p.speaker_id in conflicted}
+    participants = [
+        resolved_by_id.get(participant.speaker_id, participant)
+        for participant in merge.participants
+    ]
+    # The answer may give a settled speaker a name another one already has.
+    for conflict in unshare_names(participants):
+        logger.warning(
+            "Participant conflict resolution named speakers {} {}: left unnamed",
+            conflict.speaker_ids,
+            conflict.names,
+        )
+    return participants
+
+
 def _log_name_loss(loss: ParticipantNameLoss) -> None:
     if loss.reason == "disappeared":
         logger.warning(
@@ -1,7 +1,10 @@
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
 
 from loguru import logger
 
+from mcr_meeting.app.configs.base import LLMSettings
 from mcr_meeting.app.domain.transcription.post_process import (
     merge_consecutive_segments_per_speaker,
     remove_hallucinations,
@@ -13,6 +16,9 @@ from mcr_meeting.app.domain.transcription.text_chunking import (
 )
 from mcr_meeting.app.infrastructure.llm.acronyms import correct_acronyms
 from mcr_meeting.app.infrastructure.llm.spelling import correct_spelling
+from mcr_meeting.app.infrastructure.llm.text_correction import (
+    correct_acronyms_and_spelling,
+)
 from mcr_meeting.app.infrastructure.unleash import (
     FeatureFlag,
     get_feature_flag_client,
@@ -20,22 +26,55 @@ from mcr_meeting.app.infrastructure.unleash import (
 from mcr_meeting.app.schemas.transcription_schema import DiarizedTranscriptionSegment
 
 
+class TextCorrection(StrEnum):
+    """The LLM correction passes run over the transcript."""
+
+    NONE = "none"
+    ACRONYMS = "acronyms"
+    ACRONYMS_THEN_SPELLING = "acronyms_then_spelling"
+    # Both corrections in a single pass: one prompt, one call per chunk.
+    FUSED = "fused"
+
+
 def post_process_segments(
     segments: list[DiarizedTranscriptionSegment],
+    text_correction: TextCorrection | None = None,
 ) -> list[DiarizedTranscriptionSegment]:
+    """Merge turns, strip hallucinations and correct the text.
+
+    `text_correction` defaults to the passes the feature flags select; the
+    evaluation sets it to compare them on the same segments.
+    """
     merged_segments = merge_consecutive_segments_per_speaker(segments)
     cleaned_segments = remove_hallucinations(merged_segments)
 
-    logger.debug("Acronym correction: correcting segments")
-    cleaned_segments = _apply_text_correction(cleaned_segments, correct_acronyms)
+    if text_correction is None:
+        text_correction = _text_correction_from_flags()
+    logger.debug("Text correction: {}", text_correction)
+
+    match text_correction:
+        case TextCorrection.NONE:
+            return cleaned_segments
+        case TextCorrection.ACRONYMS:
+            return _apply_text_correction(cleaned_segments, correct_acronyms)
+        case TextCorrection.ACRONYMS_THEN_SPELLING:
+            cleaned_segments = _apply_text_correction(
+                cleaned_segments, correct_acronyms
+            )
+            return _apply_text_correction(cleaned_segments, correct_spelling)
+        case TextCorrection.FUSED:
+            return _apply_text_correction(
+                cleaned_segments, correct_acronyms_and_spelling
+            )
 
-    if get_feature_flag_client().is_enabled(FeatureFlag.SPELLING_CORRECTION):
-        logger.debug("Spelling correction enabled, correcting segments")
-        cleaned_segments = _apply_text_correction(cleaned_segments, correct_spelling)
-    else:
-        logger.debug("Spelling correction disabled, skipping correction")
 
-    return cleaned_segments
+def _text_correction_from_flags() -> TextCorrection:
+    flags = get_feature_flag_client()
+    if not flags.is_enabled(FeatureFlag.SPELLING_CORRECTION):
+        return TextCorrection.ACRONYMS
+    if flags.is_enabled(FeatureFlag.FUSED_TEXT_CORRECTION):
+        return TextCorrection.FUSED
+    return TextCorrection.ACRONYMS_THEN_SPELLING
 
 
 def _apply_text_correction(
@@ -46,9 +85,16 @@ def _apply_text_correction(
         return []
     text = format_segments_for_llm(segments)
     chunks = chunk_text(text, chunk_overlap=0)
-    corrected_chunks = [
-        _correct_chunk_best_effort(correct_chunk, chunk) for chunk in chunks
-    ]
+    # The chunks are corrected side by side: the pass takes about as long as its
+    # slowest LLM call instead of their sum. map() keeps them in text order.
+    max_workers = min(LLMSettings().LLM_MAX_CONCURRENT_CORRECTIONS, len(chunks))
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as pool:
+        corrected_chunks = list(
+            pool.map(
+                lambda chunk: _correct_chunk_best_effort(correct_chunk, chunk),
+                chunks,
+            )
+        )
     return reassemble_corrected_segments(corrected_chunks, segments)
 
 
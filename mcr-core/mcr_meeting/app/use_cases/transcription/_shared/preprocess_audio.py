@@ -1,21 +1,33 @@
-from io import BytesIO
-
 from loguru import logger
 
+from mcr_meeting.app.configs.base import (
+    AudioSettings,
+    NoiseDetectionSettings,
+    NormalizedAudioVolumeSettings,
+    Speech2TextSettings,
+)
 from mcr_meeting.app.domain.audio import (
-    audio_bytes_to_wav_bytes,
-    check_audio_is_not_silent,
-    filter_noise_from_audio_bytes,
+    analyze_audio,
+    check_silence_ratio,
+    filter_noise_from_audio,
     is_audio_noisy,
+    remove_long_silences,
 )
+from mcr_meeting.app.domain.audio_spool import AudioSpool
 from mcr_meeting.app.infrastructure.sentry import span
 from mcr_meeting.app.infrastructure.unleash import (
     FeatureFlag,
     get_feature_flag_client,
 )
+from mcr_meeting.app.schemas.transcription_schema import TimeMap
+
 
+def preprocess_audio(audio: AudioSpool) -> AudioSpool:
+    """Turn a raw recording into the normalized WAV sent to diarization/transcription.
 
-def preprocess_audio(audio_bytes: BytesIO) -> BytesIO:
+    Each step hands the next one an on-disk AudioSpool, never the audio bytes.
+    The caller owns `audio`; the returned spool is new and owned by the caller too.
+    """
     # ffmpeg runs as a subprocess and is invisible to auto-instrumentation, so
     # each step is spanned here — at the seam that owns the calls — to keep the
     # trace's ffmpeg time named rather than the domain layer aware of Sentry.
@@ -23,23 +35,86 @@ def preprocess_audio(audio_bytes: BytesIO) -> BytesIO:
     phase_aware_downmix = feature_flag_client.is_enabled(
         FeatureFlag.AUDIO_PHASE_AWARE_DOWNMIX
     )
-    with span("ffmpeg.transcode", "audio_bytes_to_wav_bytes"):
-        wav_audio_bytes = audio_bytes_to_wav_bytes(audio_bytes, phase_aware_downmix)
+    noise_filtering = feature_flag_client.is_enabled(FeatureFlag.AUDIO_NOISE_FILTERING)
 
-    with span("ffmpeg.silencedetect", "check_audio_is_not_silent"):
-        check_audio_is_not_silent(wav_audio_bytes)
+    # One decode feeds the WAV, the silence check and (when noise filtering is on)
+    # the loudnorm measurement that noise detection would otherwise redo.
+    with span("ffmpeg.analyze", "analyze_audio"):
+        analysis = analyze_audio(
+            audio,
+            phase_aware_downmix=phase_aware_downmix,
+            measure_loudness=noise_filtering,
+        )
+    wav_audio = analysis.audio
 
-    if not feature_flag_client.is_enabled(FeatureFlag.AUDIO_NOISE_FILTERING):
-        logger.debug("Noise filtering disabled, skipping filtering step")
-        return wav_audio_bytes
+    try:
+        check_silence_ratio(analysis.silence_ratio)
 
-    with span("ffmpeg.analyze", "is_audio_noisy"):
-        audio_is_noisy = is_audio_noisy(wav_audio_bytes)
+        if not noise_filtering:
+            logger.debug("Noise filtering disabled, skipping filtering step")
+            return wav_audio
+
+        with span("ffmpeg.analyze", "is_audio_noisy"):
+            audio_is_noisy = is_audio_noisy(wav_audio, analysis.loudnorm_stats)
+
+        if not audio_is_noisy:
+            logger.debug("Clean audio detected, not applying noise filtering")
+            return wav_audio
 
-    if audio_is_noisy:
         logger.debug("Noisy audio detected, applying noise filtering")
-        with span("ffmpeg.denoise", "filter_noise_from_audio_bytes"):
-            return filter_noise_from_audio_bytes(wav_audio_bytes)
+        with span("ffmpeg.denoise", "filter_noise_from_audio"):
+            filtered_audio = filter_noise_from_audio(wav_audio)
+    except BaseException:
+        wav_audio.close()
+        raise
+
+    wav_audio.close()
+    return filtered_audio
 
-    logger.debug("Clean audio detected, not applying noise filtering")
-    return wav_audio_bytes
+
+def trim_long_silences(audio: AudioSpool) -> tuple[AudioSpool, TimeMap]:
+    """Cut long silences out of preprocessed audio, when the flag enables it.
+
+    Diarization and transcription then process less audio; the returned TimeMap
+    converts their timestamps back to the time of `audio`. When nothing is
+    trimmed, `audio` itself is returned with an identity map, so closing both
+    spools is always safe.
+    """
+    if not get_feature_flag_client().is_enabled(FeatureFlag.AUDIO_SILENCE_TRIMMING):
+        return audio, TimeMap()
+
+    audio_settings = AudioSettings()
+    with span("audio.trim", "remove_long_silences"):
+        trimmed = remove_long_silences(
+            audio,
+            min_silence_seconds=audio_settings.SILENCE_TRIM_MIN_SECONDS,
+            padding_seconds=audio_settings.SILENCE_TRIM_PADDING_SECONDS,
+        )
+    if trimmed is None:
+        return audio, TimeMap()
+    trimmed_audio, kept_spans = trimmed
+    return trimmed_audio, TimeMap(kept_spans=kept_spans)
+
+
+def preprocessing_config() -> dict[str, object]:
+    """Everything that shapes the WAV preprocessing stores, for artifact reuse."""
+    feature_flag_client = get_feature_flag_client()
+    return {
+        "phase_aware_downmix": feature_flag_client.is_enabled(
+            FeatureFlag.AUDIO_PHASE_AWARE_DOWNMIX
+        ),
+        "noise_filtering": feature_flag_client.is_enabled(
+            FeatureFlag.AUDIO_NOISE_FILTERING
+        ),
+        "silence_trimming": feature_flag_client.is_enabled(
+            FeatureFlag.AUDIO_SILENCE_TRIMMING
+        ),
+        # Where the temporary files live and how many FFmpeg processes write
+        # them does not change their content.
+        "audio": AudioSettings().model_dump(
+            exclude={"SPOOL_DIR", "FFMPEG_SEGMENT_WORKERS"}
+        ),
+        "noise_detection": NoiseDetectionSettings().model_dump(),
+        "normalized_volume": NormalizedAudioVolumeSettings().model_dump(),
+        "noise_filters": Speech2TextSettings().NOISE_FILTERS,
+    }
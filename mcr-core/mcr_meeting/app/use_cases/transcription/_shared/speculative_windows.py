@@ -0,0 +1,53 @@
+"""Transcription windows cut before the diarization is known.
+
+The preprocessed audio is cut at its own silences into chunks of at most
+MAX_CHUNK_DURATION, so it can be transcribed while the diarization job waits.
+Once the diarization arrives, the transcription of these windows is assigned
+to its turns like that of the diarization chunks.
+"""
+
+from loguru import logger
+
+from mcr_meeting.app.domain.audio import detect_speech
+from mcr_meeting.app.domain.audio_spool import AudioSpool
+from mcr_meeting.app.domain.transcription.chunking import compute_speech_chunks
+from mcr_meeting.app.infrastructure import s3
+from mcr_meeting.app.infrastructure.unleash import (
+    FeatureFlag,
+    get_feature_flag_client,
+)
+from mcr_meeting.app.schemas.transcription_schema import TimeSpan
+
+
+def plan_speculative_windows(preprocessed_audio: AudioSpool) -> list[TimeSpan]:
+    """Windows of the preprocessed audio, cut in its silences."""
+    return compute_speech_chunks(detect_speech(preprocessed_audio))
+
+
+def speculative_chunk_spans(meeting_id: int) -> list[TimeSpan] | None:
+    """Windows transcribed ahead of the diarization, when they apply.
+
+    None when speculation is off, did not start, or ran on the preprocessed
+    audio of another run than the stored diarization.
+    """
+    if not get_feature_flag_client().is_enabled(
+        FeatureFlag.TRANSCRIPTION_SPECULATIVE_WINDOWS
+    ):
+        return None
+
+    speculative = s3.read_speculative_transcription_windows(meeting_id)
+    if speculative is None or not speculative.windows:
+        return None
+    if speculative.manifest != s3.read_artifact_manifest(meeting_id):
+        logger.info(
+            "Speculative windows of meeting {} belong to another run, ignored",
+            meeting_id,
+        )
+        return None
+
+    logger.info(
+        "Transcribing meeting {} in its {} speculative windows",
+        meeting_id,
+        len(speculative.windows),
+    )
+    return speculative.windows
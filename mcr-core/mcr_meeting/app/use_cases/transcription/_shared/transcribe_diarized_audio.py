@@ -1,31 +1,90 @@
-from io import BytesIO
-
 from loguru import logger
 
-from mcr_meeting.app.domain.transcription.chunking import compute_transcription_chunks
+from mcr_meeting.app.domain.audio_spool import AudioSpool
+from mcr_meeting.app.domain.transcription.chunking import (
+    compute_makespan_chunks,
+    compute_transcription_chunks,
+)
+from mcr_meeting.app.domain.transcription.time_map import TimeRemapper
 from mcr_meeting.app.domain.transcription.vad import diarize_vad_transcription_segments
 from mcr_meeting.app.exceptions.exceptions import InvalidAudioFileError
-from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
+from mcr_meeting.app.infrastructure.transcription import (
+    ChunkCheckpoints,
+    TranscriptionProcessor,
+    chunk_cost_model,
+)
+from mcr_meeting.app.infrastructure.unleash import (
+    FeatureFlag,
+    get_feature_flag_client,
+)
 from mcr_meeting.app.schemas.transcription_schema import (
     DiarizationSegment,
     DiarizedTranscriptionSegment,
+    TimeMap,
+    TimeSpan,
+    TranscriptionSegment,
 )
 
 
 def transcribe_diarized_audio(
-    preprocessed_audio: BytesIO,
+    preprocessed_audio: AudioSpool,
     diarization: list[DiarizationSegment],
     transcription_processor: TranscriptionProcessor,
+    time_map: TimeMap | None = None,
+    checkpoints: ChunkCheckpoints | None = None,
+    chunk_spans: list[TimeSpan] | None = None,
 ) -> list[DiarizedTranscriptionSegment]:
-    transcription_chunk_spans = compute_transcription_chunks(diarization)
+    """Transcribe the diarized speech and assign each segment its speaker.
 
+    `diarization` is in original time. When `preprocessed_audio` had its long
+    silences trimmed, `time_map` locates its chunks in it, and the transcription
+    is mapped back to original time before the speakers are assigned.
+    `checkpoints` keeps each transcribed chunk for a retry to reuse.
+    `chunk_spans`, in the time of `preprocessed_audio`, replaces the chunks
+    planned from the diarization.
+    """
+    if chunk_spans is None:
+        chunk_spans = plan_transcription_chunk_spans(diarization, time_map)
     transcription_segments = transcription_processor.transcribe(
-        audio_bytes=preprocessed_audio,
-        chunk_spans=transcription_chunk_spans,
+        audio=preprocessed_audio,
+        chunk_spans=chunk_spans,
+        checkpoints=checkpoints,
+    )
+
+    return assign_speakers(transcription_segments, diarization, time_map)
+
+
+def plan_transcription_chunk_spans(
+    diarization: list[DiarizationSegment], time_map: TimeMap | None = None
+) -> list[TimeSpan]:
+    """Chunks to transcribe, in the time of the (possibly trimmed) preprocessed audio."""
+    remapper = TimeRemapper(time_map or TimeMap())
+    trimmed_diarization = remapper.diarization_to_trimmed(diarization)
+    if not get_feature_flag_client().is_enabled(
+        FeatureFlag.TRANSCRIPTION_MAKESPAN_CHUNKING
+    ):
+        return compute_transcription_chunks(trimmed_diarization)
+
+    cost = chunk_cost_model()
+    chunk_spans = compute_makespan_chunks(trimmed_diarization, cost)
+    logger.info(
+        "Planned {} transcription chunks for an expected {:.0f}s ({})",
+        len(chunk_spans),
+        cost.wall_time(chunk_spans),
+        cost,
     )
+    return chunk_spans
 
+
+def assign_speakers(
+    transcription_segments: list[TranscriptionSegment],
+    diarization: list[DiarizationSegment],
+    time_map: TimeMap | None = None,
+) -> list[DiarizedTranscriptionSegment]:
+    """Map the transcription back to original time and give each segment its speaker."""
+    remapper = TimeRemapper(time_map or TimeMap())
     diarized_transcription_segments = diarize_vad_transcription_segments(
-        transcription_segments, diarization
+        remapper.transcription_to_original(transcription_segments), diarization
     )
 
     if not diarized_transcription_segments:
@@ -1,15 +1,217 @@
+import time
+
+from loguru import logger
+
+from mcr_meeting.app.configs.base import RetrySettings
+from mcr_meeting.app.domain.transcription.artifact_manifest import build_manifest
+from mcr_meeting.app.domain.transcription.time_map import TimeRemapper
+from mcr_meeting.app.exceptions.exceptions import (
+    DiarizationError,
+    DiarizationRetryableError,
+)
 from mcr_meeting.app.infrastructure import s3
-from mcr_meeting.app.infrastructure.diarization import DiarizationProcessor
+from mcr_meeting.app.infrastructure.diarization import (
+    DiarizationProcessor,
+    diarization_job_parameters,
+    next_poll_interval,
+)
+from mcr_meeting.app.infrastructure.unleash import (
+    FeatureFlag,
+    get_feature_flag_client,
+)
+from mcr_meeting.app.schemas.S3_types import S3Object
+from mcr_meeting.app.schemas.transcription_schema import (
+    ArtifactManifest,
+    DiarizationJobState,
+    DiarizationSegment,
+    TimeMap,
+)
 from mcr_meeting.app.use_cases.transcription._shared.preprocess_audio import (
     preprocess_audio,
+    preprocessing_config,
+    trim_long_silences,
 )
 
+_retry_settings = RetrySettings()
+
 
 def run_diarization(
     meeting_id: int, diarization_processor: DiarizationProcessor
 ) -> None:
-    audio_bytes = s3.fetch_audio_bytes(meeting_id)
-    preprocessed_audio = preprocess_audio(audio_bytes)
-    diarization = diarization_processor.diarize(audio_bytes=preprocessed_audio)
-    s3.write_preprocessed_audio(meeting_id, preprocessed_audio)
-    s3.write_diarization(meeting_id, diarization)
+    audio_chunks = s3.list_audio_chunks(meeting_id)
+    manifest = _build_diarization_manifest(audio_chunks)
+    if _artifacts_are_current(meeting_id, manifest):
+        return
+
+    with (
+        s3.fetch_audio_spool(meeting_id, audio_chunks) as audio,
+        preprocess_audio(audio) as preprocessed_audio,
+    ):
+        trimmed_audio, time_map = trim_long_silences(preprocessed_audio)
+        with trimmed_audio:
+            with trimmed_audio.open() as wav:
+                diarization = diarization_processor.diarize(audio_bytes=wav)
+            s3.write_preprocessed_audio(meeting_id, trimmed_audio)
+    s3.write_time_map(meeting_id, time_map)
+    _store_diarization(meeting_id, diarization, time_map, manifest)
+
+
+def start_diarization(
+    meeting_id: int, diarization_processor: DiarizationProcessor
+) -> float | None:
+    """Diarize the meeting, or only submit its job when polling is deferred.
+
+    With DIARIZATION_DEFERRED_POLLING on, the audio is preprocessed and the job
+    submitted, then the caller polls it through poll_diarization instead of
+    holding a worker while the diarization backend works. Speculative
+    transcription (TRANSCRIPTION_SPECULATIVE_WINDOWS) polls the same way, so
+    that the preprocessed audio can be transcribed while the job waits.
+
+    Returns:
+        float | None: Seconds to wait before the first poll, or None when the
+            diarization is already stored.
+    """
+    feature_flag_client = get_feature_flag_client()
+    if not (
+        feature_flag_client.is_enabled(FeatureFlag.DIARIZATION_DEFERRED_POLLING)
+        or feature_flag_client.is_enabled(FeatureFlag.TRANSCRIPTION_SPECULATIVE_WINDOWS)
+    ):
+        run_diarization(meeting_id, diarization_processor)
+        return None
+
+    audio_chunks = s3.list_audio_chunks(meeting_id)
+    manifest = _build_diarization_manifest(audio_chunks)
+    if _artifacts_are_current(meeting_id, manifest):
+        return None
+
+    with (
+        s3.fetch_audio_spool(meeting_id, audio_chunks) as audio,
+        preprocess_audio(audio) as preprocessed_audio,
+    ):
+        trimmed_audio, time_map = trim_long_silences(preprocessed_audio)
+        with trimmed_audio:
+            with trimmed_audio.open() as wav:
+                job_id = diarization_processor.submit_job(wav)
+            s3.write_preprocessed_audio(meeting_id, trimmed_audio)
+    s3.write_time_map(meeting_id, time_map)
+    submitted_at = time.time()
+    s3.write_diarization_job(
+        meeting_id,
+        DiarizationJobState(
+            job_id=job_id,
+            submitted_at=submitted_at,
+            phase_started_at=submitted_at,
+            manifest=manifest,
+        ),
+    )
+    logger.info("Submitted diarization job {} for meeting {}", job_id, meeting_id)
+    return next_poll_interval(0.0, None)
+
+
+def poll_diarization(
+    meeting_id: int, diarization_processor: DiarizationProcessor
+) -> float | None:
+    """Check the meeting's submitted diarization job once, storing it when done.
+
+    Returns:
+        float | None: Seconds to wait before the next poll, or None once the
+            diarization is stored.
+    Raises:
+        DiarizationRetryableError: The server failed the job but a new one may
+            succeed; the next poll submits it again, after the task backoff.
+    """
+    job = s3.read_diarization_job(meeting_id)
+    if job.job_id is None:
+        with (
+            s3.read_preprocessed_audio(meeting_id) as preprocessed_audio,
+            preprocessed_audio.open() as wav,
+        ):
+            job_id = diarization_processor.submit_job(wav)
+        submitted_at = time.time()
+        s3.write_diarization_job(
+            meeting_id,
+            job.model_copy(
+                update={
+                    "job_id": job_id,
+                    "submitted_at": submitted_at,
+                    "phase_started_at": submitted_at,
+                    "seen_processing": False,
+                }
+            ),
+        )
+        logger.info(
+            "Resubmitted diarization job {} for meeting {} (attempt {})",
+            job_id,
+            meeting_id,
+            job.attempt,
+        )
+        return next_poll_interval(0.0, None)
+
+    try:
+        poll = diarization_processor.poll_job(job)
+    except DiarizationRetryableError as e:
+        # Each resubmission replaces the polling task, which resets its Celery
+        # retry count: the attempt counter is what bounds them.
+        if job.attempt > _retry_settings.TASK_RETRY_MAX_RETRIES:
+            raise DiarizationError(
+                f"Diarization of meeting {meeting_id} failed after "
+                f"{job.attempt} jobs: {e}"
+            ) from e
+        s3.write_diarization_job(
+            meeting_id,
+            job.model_copy(update={"job_id": None, "attempt": job.attempt + 1}),
+        )
+        raise
+
+    if poll.segments is None:
+        if poll.job != job:
+            s3.write_diarization_job(meeting_id, poll.job)
+        return poll.next_poll_in
+
+    logger.info(
+        "Diarization job {} of meeting {} completed after {:.0f}s",
+        job.job_id,
+        meeting_id,
+        time.time() - job.submitted_at,
+    )
+    _store_diarization(
+        meeting_id, poll.segments, s3.read_time_map(meeting_id), job.manifest
+    )
+    return None
+
+
+def _build_diarization_manifest(audio_chunks: list[S3Object]) -> ArtifactManifest:
+    return build_manifest(
+        audio_chunks,
+        {
+            "preprocessing": preprocessing_config(),
+            "diarization": diarization_job_parameters(),
+        },
+    )
+
+
+def _artifacts_are_current(meeting_id: int, manifest: ArtifactManifest) -> bool:
+    # The manifest is written last, so a matching one proves both artifacts
+    # were stored from these very inputs by an earlier attempt.
+    if s3.read_artifact_manifest(meeting_id) != manifest:
+        return False
+    logger.info(
+        "Inputs of meeting {} unchanged, reusing its preprocessed audio and "
+        "diarization",
+        meeting_id,
+    )
+    return True
+
+
+def _store_diarization(
+    meeting_id: int,
+    diarization: list[DiarizationSegment],
+    time_map: TimeMap,
+    manifest: ArtifactManifest,
+) -> None:
+    # The stored audio is the trimmed one; the diarization is stored in original
+    # time, like every timestamp the later stages produce.
+    s3.write_diarization(
+        meeting_id, TimeRemapper(time_map).diarization_to_original(diarization)
+    )
+    s3.write_artifact_manifest(meeting_id, manifest)
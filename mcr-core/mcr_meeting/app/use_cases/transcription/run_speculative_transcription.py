@@ -0,0 +1,41 @@
+from loguru import logger
+
+from mcr_meeting.app.infrastructure import s3
+from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
+from mcr_meeting.app.schemas.transcription_schema import (
+    SpeculativeTranscriptionWindows,
+)
+from mcr_meeting.app.use_cases.transcription._shared.chunk_checkpoints import (
+    S3ChunkCheckpoints,
+)
+from mcr_meeting.app.use_cases.transcription._shared.speculative_windows import (
+    plan_speculative_windows,
+)
+
+
+def run_speculative_transcription(
+    meeting_id: int, transcription_processor: TranscriptionProcessor
+) -> None:
+    """Transcribe the preprocessed audio while its diarization job waits.
+
+    Each window is checkpointed like a diarization chunk: transcribe_chunks
+    reuses the finished ones and sends the others itself, so the meeting never
+    waits for this task.
+    """
+    job = s3.read_diarization_job(meeting_id)
+    with s3.read_preprocessed_audio(meeting_id) as preprocessed_audio:
+        windows = plan_speculative_windows(preprocessed_audio)
+        s3.write_speculative_transcription_windows(
+            meeting_id,
+            SpeculativeTranscriptionWindows(manifest=job.manifest, windows=windows),
+        )
+        logger.info(
+            "Speculatively transcribing meeting {} in {} windows",
+            meeting_id,
+            len(windows),
+        )
+        transcription_processor.transcribe(
+            audio=preprocessed_audio,
+            chunk_spans=windows,
+            checkpoints=S3ChunkCheckpoints(meeting_id),
+        )
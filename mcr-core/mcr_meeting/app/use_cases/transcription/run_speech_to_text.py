@@ -2,14 +2,18 @@ from io import BytesIO
 
 from loguru import logger
 
+from mcr_meeting.app.domain.audio_spool import AudioSpool
+from mcr_meeting.app.domain.transcription.time_map import TimeRemapper
 from mcr_meeting.app.infrastructure.diarization import DiarizationProcessor
 from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
 from mcr_meeting.app.schemas.transcription_schema import DiarizedTranscriptionSegment
 from mcr_meeting.app.use_cases.transcription._shared.post_process_segments import (
+    TextCorrection,
     post_process_segments,
 )
 from mcr_meeting.app.use_cases.transcription._shared.preprocess_audio import (
     preprocess_audio,
+    trim_long_silences,
 )
 from mcr_meeting.app.use_cases.transcription._shared.transcribe_diarized_audio import (
     transcribe_diarized_audio,
@@ -20,16 +24,24 @@ def run_speech_to_text(
     audio_bytes: BytesIO,
     diarization_processor: DiarizationProcessor,
     transcription_processor: TranscriptionProcessor,
+    text_correction: TextCorrection | None = None,
 ) -> list[DiarizedTranscriptionSegment]:
-    preprocessed_audio = preprocess_audio(audio_bytes)
+    with (
+        AudioSpool.from_bytes(audio_bytes.getvalue()) as audio,
+        preprocess_audio(audio) as preprocessed_audio,
+    ):
+        trimmed_audio, time_map = trim_long_silences(preprocessed_audio)
+        with trimmed_audio:
+            with trimmed_audio.open() as wav:
+                diarization = TimeRemapper(time_map).diarization_to_original(
+                    diarization_processor.diarize(audio_bytes=wav)
+                )
+            if not diarization:
+                logger.warning("No diarization result. Returning empty transcription.")
+                return []
 
-    diarization = diarization_processor.diarize(audio_bytes=preprocessed_audio)
-    if not diarization:
-        logger.warning("No diarization result. Returning empty transcription.")
-        return []
+            segments = transcribe_diarized_audio(
+                trimmed_audio, diarization, transcription_processor, time_map
+            )
 
-    segments = transcribe_diarized_audio(
-        preprocessed_audio, diarization, transcription_processor
-    )
-
-    return post_process_segments(segments)
+    return post_process_segments(segments, text_correction)
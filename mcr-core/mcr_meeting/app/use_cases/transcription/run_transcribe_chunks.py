@@ -2,6 +2,12 @@ from loguru import logger
 
 from mcr_meeting.app.infrastructure import s3
 from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
+from mcr_meeting.app.use_cases.transcription._shared.chunk_checkpoints import (
+    S3ChunkCheckpoints,
+)
+from mcr_meeting.app.use_cases.transcription._shared.speculative_windows import (
+    speculative_chunk_spans,
+)
 from mcr_meeting.app.use_cases.transcription._shared.transcribe_diarized_audio import (
     transcribe_diarized_audio,
 )
@@ -18,10 +24,14 @@ def run_transcribe_chunks(
         s3.write_transcription_raw(meeting_id, [])
         return
 
-    diarized_transcription_segments = transcribe_diarized_audio(
-        s3.read_preprocessed_audio(meeting_id),
-        diarization,
-        transcription_processor,
-    )
+    with s3.read_preprocessed_audio(meeting_id) as preprocessed_audio:
+        diarized_transcription_segments = transcribe_diarized_audio(
+            preprocessed_audio,
+            diarization,
+            transcription_processor,
+            s3.read_time_map(meeting_id),
+            S3ChunkCheckpoints(meeting_id),
+            speculative_chunk_spans(meeting_id),
+        )
 
     s3.write_transcription_raw(meeting_id, diarized_transcription_segments)
@@ -0,0 +1,124 @@
+"""Transcription of one meeting's chunks by separate tasks.
+
+The plan cuts the preprocessed audio into its chunks and uploads each one next
+to the checkpoint it will be transcribed into, so a chunk task downloads only
+its own audio. Chunk tasks write their checkpoint (the same one the single-task
+path reuses), and the merge reads them back in chunk order.
+"""
+
+from loguru import logger
+
+from mcr_meeting.app.configs.base import AudioSettings
+from mcr_meeting.app.domain.audio import split_audio_on_timestamps
+from mcr_meeting.app.domain.audio_spool import wav_bytes_from_pcm
+from mcr_meeting.app.exceptions.exceptions import TranscriptionError
+from mcr_meeting.app.infrastructure import s3
+from mcr_meeting.app.infrastructure.transcription import (
+    TranscriptionProcessor,
+    chunk_checkpoint_key,
+    chunk_segments_in_audio_time,
+)
+from mcr_meeting.app.schemas.transcription_schema import (
+    PlannedTranscriptionChunk,
+    TranscriptionChunkPlan,
+    TranscriptionSegment,
+)
+from mcr_meeting.app.use_cases.transcription._shared.speculative_windows import (
+    speculative_chunk_spans,
+)
+from mcr_meeting.app.use_cases.transcription._shared.transcribe_diarized_audio import (
+    assign_speakers,
+    plan_transcription_chunk_spans,
+)
+
+_audio_settings = AudioSettings()
+
+
+def run_plan_transcription_chunks(meeting_id: int) -> int:
+    """Store the chunk plan of the meeting and the audio of each chunk to transcribe.
+
+    Returns:
+        int: Number of chunk tasks to run. 0 when the diarization found no
+            speech, in which case the empty transcription is already written.
+    """
+    diarization = s3.read_diarization(meeting_id)
+
+    if not diarization:
+        logger.warning("No diarization result. Writing empty transcription.")
+        s3.write_transcription_raw(meeting_id, [])
+        return 0
+
+    chunk_spans = speculative_chunk_spans(meeting_id)
+    if chunk_spans is None:
+        chunk_spans = plan_transcription_chunk_spans(
+            diarization, s3.read_time_map(meeting_id)
+        )
+    planned_chunks: list[PlannedTranscriptionChunk] = []
+    with s3.read_preprocessed_audio(meeting_id) as preprocessed_audio:
+        for chunk in split_audio_on_timestamps(preprocessed_audio, chunk_spans):
+            key = chunk_checkpoint_key(chunk)
+            # A requeued meeting keeps its transcribed chunks: no need to upload
+            # the audio of those again.
+            if s3.read_transcription_chunk(meeting_id, key) is None:
+                s3.write_transcription_chunk_audio(
+                    meeting_id,
+                    key,
+                    wav_bytes_from_pcm(chunk.audio, _audio_settings.SAMPLE_RATE),
+                )
+            planned_chunks.append(
+                PlannedTranscriptionChunk(span=chunk.span, checkpoint_key=key)
+            )
+
+    s3.write_transcription_plan(
+        meeting_id, TranscriptionChunkPlan(chunks=planned_chunks)
+    )
+    logger.info(
+        "Planned {} transcription chunks for meeting {}",
+        len(planned_chunks),
+        meeting_id,
+    )
+    return len(planned_chunks)
+
+
+def run_transcribe_chunk(
+    meeting_id: int,
+    chunk_index: int,
+    transcription_processor: TranscriptionProcessor,
+) -> None:
+    planned_chunk = s3.read_transcription_plan(meeting_id).chunks[chunk_index]
+    key = planned_chunk.checkpoint_key
+    if s3.read_transcription_chunk(meeting_id, key) is not None:
+        logger.info("Chunk {} of meeting {} already transcribed", key, meeting_id)
+        return
+
+    with s3.read_transcription_chunk_audio(meeting_id, key) as chunk_audio:
+        segments = transcription_processor.transcribe_chunk(chunk_audio.pcm())
+    # Unlike the single-task checkpoints, this write is the chunk's result: a
+    # failure to store it must fail (and retry) the task.
+    s3.write_transcription_chunk(meeting_id, key, segments)
+
+
+def run_merge_transcription_chunks(meeting_id: int) -> None:
+    plan = s3.read_transcription_plan(meeting_id)
+    transcription_segments: list[TranscriptionSegment] = []
+    for idx, planned_chunk in enumerate(plan.chunks):
+        chunk_segments = s3.read_transcription_chunk(
+            meeting_id, planned_chunk.checkpoint_key
+        )
+        if chunk_segments is None:
+            raise TranscriptionError(
+                f"Chunk {planned_chunk.checkpoint_key} of meeting {meeting_id} "
+                "has no transcription"
+            )
+        transcription_segments.extend(
+            chunk_segments_in_audio_time(idx, planned_chunk.span, chunk_segments)
+        )
+
+    s3.write_transcription_raw(
+        meeting_id,
+        assign_speakers(
+            transcription_segments,
+            s3.read_diarization(meeting_id),
+            s3.read_time_map(meeting_id),
+        ),
+    )
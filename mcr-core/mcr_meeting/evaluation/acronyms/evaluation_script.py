@@ -75,6 +75,18 @@ def discover_audio_files(audio_dir: Path) -> list[Path]:
     return sorted(f for fmt in supported_formats for f in audio_dir.glob(f"*.{fmt}"))
 
 
+def load_evaluated_glossary() -> list[str]:
+    """Glossary acronyms plus the extra evaluated ones, minus the excluded ones."""
+    glossary = load_glossary(GLOSSARY_PATH)
+    if NOT_IN_GLOSSARY_PATH.exists():
+        not_in_glossary = load_glossary(NOT_IN_GLOSSARY_PATH)
+        glossary = glossary + not_in_glossary
+    if NOT_EVALUATED_PATH.exists():
+        not_evaluated = set(load_glossary(NOT_EVALUATED_PATH))
+        glossary = [a for a in glossary if a not in not_evaluated]
+    return glossary
+
+
 def process_single_audio(
     audio_path: Path,
     reference_dir: Path,
@@ -160,13 +172,7 @@ def main() -> None:
         logger.error("Reference directory does not exist: {}", REFERENCE_DIR)
         sys.exit(1)
 
-    glossary = load_glossary(GLOSSARY_PATH)
-    if NOT_IN_GLOSSARY_PATH.exists():
-        not_in_glossary = load_glossary(NOT_IN_GLOSSARY_PATH)
-        glossary = glossary + not_in_glossary
-    if NOT_EVALUATED_PATH.exists():
-        not_evaluated = set(load_glossary(NOT_EVALUATED_PATH))
-        glossary = [a for a in glossary if a not in not_evaluated]
+    glossary = load_evaluated_glossary()
     logger.info("Loaded glossary with {} acronyms.", len(glossary))
 
     audio_files = discover_audio_files(AUDIO_DIR)
@@ -0,0 +1,128 @@
+"""Compare the separate and fused LLM text corrections on the acronym dataset.
+
+The fused correction (``fused_text_correction`` flag) applies the acronym and
+spelling corrections in one LLM pass instead of two. For each audio of the
+`data/acronyms/audio/` dataset, this script:
+1. transcribes it once, without any text correction,
+2. corrects that same transcription with both passes one after another, then
+   with the fused pass,
+3. counts the glossary acronyms in each corrected text, as
+   ``evaluation_script.py`` does, and measures how close the two texts are.
+
+The result, ``{timestamp}_text_correction_comparison.json``, holds the acronym
+summary of each correction and the per-audio text agreement: the fused pass
+keeps the quality when its metrics match the separate passes' and its texts
+barely differ from theirs.
+
+Usage::
+
+    uv run mcr-core/mcr_meeting/evaluation/acronyms/text_correction_comparison.py
+"""
+
+import sys
+from datetime import datetime
+from io import BytesIO
+
+from loguru import logger
+
+from mcr_meeting.app.infrastructure.diarization import DiarizationProcessor
+from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
+from mcr_meeting.app.schemas.transcription_schema import DiarizedTranscriptionSegment
+from mcr_meeting.app.use_cases.transcription._shared.post_process_segments import (
+    TextCorrection,
+    post_process_segments,
+)
+from mcr_meeting.app.use_cases.transcription.run_speech_to_text import (
+    run_speech_to_text,
+)
+from mcr_meeting.evaluation.acronyms.evaluation_script import (
+    AUDIO_DIR,
+    OUTPUT_DIR,
+    REFERENCE_DIR,
+    discover_audio_files,
+    load_evaluated_glossary,
+)
+from mcr_meeting.evaluation.acronyms.loaders import load_audio_reference
+from mcr_meeting.evaluation.acronyms.utils import (
+    compare_text_corrections,
+    save_text_correction_comparison_json,
+)
+from mcr_meeting.evaluation.asr.types import TranscriptionOutput
+from mcr_meeting.evaluation.utils.text_normalization import french_text_normalizer
+
+
+def _normalized_text(segments: list[DiarizedTranscriptionSegment]) -> str:
+    return french_text_normalizer(
+        TranscriptionOutput(segments=segments).text, remove_repetitions=False
+    )
+
+
+def main() -> None:
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    logger.info("Starting text correction comparison. Timestamp: {}", timestamp)
+
+    if not AUDIO_DIR.exists() or not REFERENCE_DIR.exists():
+        logger.error("Acronym dataset not found under {}", AUDIO_DIR.parent)
+        sys.exit(1)
+
+    glossary = load_evaluated_glossary()
+    audio_files = discover_audio_files(AUDIO_DIR)
+    diarization_processor = DiarizationProcessor()
+    transcription_processor = TranscriptionProcessor()
+
+    per_audio_expected: dict[str, dict[str, int]] = {}
+    separate_texts: dict[str, str] = {}
+    fused_texts: dict[str, str] = {}
+    for audio_path in audio_files:
+        uid = audio_path.stem
+        reference_path = REFERENCE_DIR / f"{uid}.json"
+        if not reference_path.exists():
+            logger.warning("Missing reference for {}, skipping.", uid)
+            continue
+        try:
+            uncorrected = run_speech_to_text(
+                BytesIO(audio_path.read_bytes()),
+                diarization_processor=diarization_processor,
+                transcription_processor=transcription_processor,
+                text_correction=TextCorrection.NONE,
+            )
+            separate_texts[uid] = _normalized_text(
+                post_process_segments(
+                    uncorrected, TextCorrection.ACRONYMS_THEN_SPELLING
+                )
+            )
+            fused_texts[uid] = _normalized_text(
+                post_process_segments(uncorrected, TextCorrection.FUSED)
+            )
+            per_audio_expected[uid] = load_audio_reference(reference_path)
+        except Exception:
+            logger.exception("Error processing {}, skipping.", uid)
+
+    if not per_audio_expected:
+        logger.error("No audio files were successfully processed.")
+        sys.exit(1)
+
+    comparison = compare_text_corrections(
+        glossary, per_audio_expected, separate_texts, fused_texts
+    )
+    output_path = save_text_correction_comparison_json(
+        comparison, OUTPUT_DIR, timestamp
+    )
+    logger.info("Saved text correction comparison to: {}", output_path)
+
+    for name, summary in (
+        ("Separate", comparison.separate),
+        ("Fused", comparison.fused),
+    ):
+        logger.info(
+            "{} passes: precision={:.3f}, recall={:.3f}, accuracy={:.3f}",
+            name,
+            summary.global_metrics.precision,
+            summary.global_metrics.recall,
+            summary.global_metrics.accuracy,
+        )
+    logger.info("Mean text agreement: {:.3f}", comparison.mean_text_agreement)
+
+
+if __name__ == "__main__":
+    main()
@@ -38,3 +38,17 @@ class AcronymEvaluationSummary(BaseModel):
     global_metrics: AcronymMetrics
     aggregate_expected: dict[str, int]
     aggregate_predicted: dict[str, int]
+
+
+class TextCorrectionComparison(BaseModel):
+    """Separate acronym then spelling passes against the fused pass.
+
+    Both corrections ran on the same uncorrected transcriptions. The text
+    agreement of an audio is the word-level similarity of its two corrected
+    transcriptions (1.0 when identical).
+    """
+
+    separate: AcronymEvaluationSummary
+    fused: AcronymEvaluationSummary
+    text_agreement: dict[str, float]
+    mean_text_agreement: float
@@ -1,3 +1,7 @@
+from mcr_meeting.evaluation.acronyms.utils.comparison import (
+    compare_text_corrections,
+    text_agreement,
+)
 from mcr_meeting.evaluation.acronyms.utils.counting import (
     count_acronym_occurrences,
     evaluate_acronyms,
@@ -12,16 +16,20 @@ from mcr_meeting.evaluation.acronyms.utils.persistence import (
     build_summary,
     save_acronym_results_csv,
     save_acronym_summary_json,
+    save_text_correction_comparison_json,
 )
 
 __all__ = [
     "build_results_dataframe",
     "build_summary",
+    "compare_text_corrections",
     "compute_audio_metrics",
     "compute_global_metrics",
     "count_acronym_occurrences",
     "evaluate_acronyms",
     "save_acronym_results_csv",
     "save_acronym_summary_json",
+    "save_text_correction_comparison_json",
     "score_acronym",
+    "text_agreement",
 ]
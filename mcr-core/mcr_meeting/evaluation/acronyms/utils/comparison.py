@@ -0,0 +1,52 @@
+"""Compare the separate and fused text corrections on the same transcriptions."""
+
+from difflib import SequenceMatcher
+
+from mcr_meeting.evaluation.acronyms.types import TextCorrectionComparison
+from mcr_meeting.evaluation.acronyms.utils.counting import evaluate_acronyms
+from mcr_meeting.evaluation.acronyms.utils.persistence import build_summary
+
+
+def text_agreement(text: str, other: str) -> float:
+    """Word-level similarity of two normalized texts, 1.0 when identical."""
+    return SequenceMatcher(None, text.split(), other.split(), autojunk=False).ratio()
+
+
+def compare_text_corrections(
+    glossary: list[str],
+    per_audio_expected: dict[str, dict[str, int]],
+    separate_texts: dict[str, str],
+    fused_texts: dict[str, str],
+) -> TextCorrectionComparison:
+    """Acronym metrics of each correction and agreement of their texts.
+
+    ``separate_texts`` and ``fused_texts`` map each audio uid to its corrected
+    transcription, already normalized with ``french_text_normalizer``.
+    """
+    agreement = {
+        uid: text_agreement(separate_texts[uid], fused_texts[uid])
+        for uid in separate_texts
+        if uid in fused_texts
+    }
+    return TextCorrectionComparison(
+        separate=build_summary(
+            glossary,
+            per_audio_expected,
+            {
+                uid: evaluate_acronyms(text, glossary)
+                for uid, text in separate_texts.items()
+            },
+        ),
+        fused=build_summary(
+            glossary,
+            per_audio_expected,
+            {
+                uid: evaluate_acronyms(text, glossary)
+                for uid, text in fused_texts.items()
+            },
+        ),
+        text_agreement=agreement,
+        mean_text_agreement=(
+            sum(agreement.values()) / len(agreement) if agreement else 0.0
+        ),
+    )
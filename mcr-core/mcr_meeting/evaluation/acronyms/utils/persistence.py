@@ -8,6 +8,7 @@ import pandas as pd
 from mcr_meeting.evaluation.acronyms.types import (
     AcronymEvaluationSummary,
     AcronymPerAudioEntry,
+    TextCorrectionComparison,
 )
 from mcr_meeting.evaluation.acronyms.utils.metrics import (
     compute_audio_metrics,
@@ -101,3 +102,17 @@ def save_acronym_summary_json(
         json.dumps(summary.model_dump(), indent=2, ensure_ascii=False)
     )
     return output_path
+
+
+def save_text_correction_comparison_json(
+    comparison: TextCorrectionComparison,
+    output_dir: Path,
+    timestamp: str,
+) -> Path:
+    """Write ``{timestamp}_text_correction_comparison.json`` to ``output_dir``."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"{timestamp}_text_correction_comparison.json"
+    output_path.write_text(
+        json.dumps(comparison.model_dump(), indent=2, ensure_ascii=False)
+    )
+    return output_path
@@ -4,12 +4,16 @@ Evaluate the participant naming pipeline against ground-truth expected files.
 Usage from mcr root:
     docker compose --env-file .env --env-file .env.local.docker exec transcription_worker python -m mcr_meeting.evaluation.participant_naming
 
+Each extraction mode given with --mode (default: all of them) runs on every test
+file, and the report gives the accuracy and wall time of each, so that the
+map-then-merge extraction can be checked against the refine chain.
 """
 
 import argparse
 import json
 import re
 import sys
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from unicodedata import normalize
@@ -18,6 +22,7 @@ from loguru import logger
 
 from mcr_meeting.app.schemas.transcription_schema import DiarizedTranscriptionSegment
 from mcr_meeting.app.use_cases.transcription._shared.extract_participants import (
+    ParticipantExtractionMode,
     extract_participants,
 )
 from mcr_meeting.evaluation.utils.math_utils import safe_ratio
@@ -38,9 +43,11 @@ class SpeakerDetail:
 @dataclass
 class EvalResult:
     file: str
+    mode: ParticipantExtractionMode
     accuracy: float
     correct: int
     total: int
+    seconds: float
     details: list[SpeakerDetail] = field(default_factory=list)
 
 
@@ -72,12 +79,21 @@ def normalize_name(name: str | None) -> str | None:
     return normalize("NFC", name.strip().lower())
 
 
-def evaluate_file(txt_path: Path, expected_path: Path) -> EvalResult:
+def evaluate_file(
+    txt_path: Path, expected_path: Path, mode: ParticipantExtractionMode
+) -> EvalResult:
     segments = parse_txt_to_segments(txt_path)
     expected = load_expected(expected_path)
 
-    logger.info("Running extraction on {} ({} segments)", txt_path.name, len(segments))
-    participants = extract_participants(segments)
+    logger.info(
+        "Running {} extraction on {} ({} segments)",
+        mode,
+        txt_path.name,
+        len(segments),
+    )
+    started = time.perf_counter()
+    participants = extract_participants(segments, mode)
+    seconds = time.perf_counter() - started
 
     predicted = {p.speaker_id: p.name for p in participants}
 
@@ -107,25 +123,26 @@ def evaluate_file(txt_path: Path, expected_path: Path) -> EvalResult:
 
     return EvalResult(
         file=txt_path.name,
+        mode=mode,
         accuracy=safe_ratio(correct, total),
         correct=correct,
         total=total,
+        seconds=seconds,
         details=details,
     )
 
 
 def log_report(results: list[EvalResult]) -> None:
-    total_correct = 0
-    total_speakers = 0
-
     for res in results:
         logger.info("\n{}", "=" * 60)
         logger.info(
-            "  {}  —  {}/{} correct ({:.0%})",
+            "  {} [{}]  —  {}/{} correct ({:.0%}) in {:.1f}s",
             res.file,
+            res.mode,
             res.correct,
             res.total,
             res.accuracy,
+            res.seconds,
         )
         logger.info("{}", "=" * 60)
         for d in res.details:
@@ -137,12 +154,20 @@ def log_report(results: list[EvalResult]) -> None:
                 d.expected or "",
                 d.predicted or "",
             )
-        total_correct += res.correct
-        total_speakers += res.total
 
     logger.info("\n{}", "=" * 60)
-    overall = safe_ratio(total_correct, total_speakers)
-    logger.info("  OVERALL: {}/{} ({:.0%})", total_correct, total_speakers, overall)
+    for mode in dict.fromkeys(res.mode for res in results):
+        mode_results = [res for res in results if res.mode == mode]
+        total_correct = sum(res.correct for res in mode_results)
+        total_speakers = sum(res.total for res in mode_results)
+        logger.info(
+            "  OVERALL [{}]: {}/{} ({:.0%}) in {:.1f}s",
+            mode,
+            total_correct,
+            total_speakers,
+            safe_ratio(total_correct, total_speakers),
+            sum(res.seconds for res in mode_results),
+        )
     logger.info("{}\n", "=" * 60)
 
 
@@ -154,6 +179,14 @@ def main() -> None:
         default=DEFAULT_TEST_DIR,
         help="Directory containing .txt and .expected.json files (default: test_data/)",
     )
+    parser.add_argument(
+        "--mode",
+        type=ParticipantExtractionMode,
+        choices=list(ParticipantExtractionMode),
+        nargs="+",
+        default=list(ParticipantExtractionMode),
+        help="Extraction modes to evaluate (default: all of them)",
+    )
     args = parser.parse_args()
 
     txt_files = sorted(args.test_dir.glob("*.txt"))
@@ -178,9 +211,9 @@ def main() -> None:
     logger.info("Found {} test case(s).", len(pairs))
 
     results = []
-    for txt_path, expected_path in pairs:
-        result = evaluate_file(txt_path, expected_path)
-        results.append(result)
+    for mode in args.mode:
+        for txt_path, expected_path in pairs:
+            results.append(evaluate_file(txt_path, expected_path, mode))
 
     log_report(results)
 
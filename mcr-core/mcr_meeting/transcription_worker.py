@@ -3,6 +3,7 @@ from collections.abc import Callable
 from functools import partial
 from io import BytesIO
 
+from celery import chord
 from loguru import logger
 
 from mcr_meeting.app.infrastructure import s3
@@ -20,25 +21,41 @@ from mcr_meeting.app.infrastructure.sentry import (
     set_sentry_meeting_context,
 )
 from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
+from mcr_meeting.app.infrastructure.unleash import (
+    FeatureFlag,
+    get_feature_flag_client,
+)
 from mcr_meeting.app.schemas.celery_types import MCRTranscriptionTasks
 from mcr_meeting.app.schemas.transcription_schema import (
     DiarizedTranscriptionSegment,
     SpeakerTranscription,
 )
 from mcr_meeting.app.use_cases.run_evaluation_from_zip import run_evaluation_from_zip
-from mcr_meeting.app.use_cases.transcription.run_diarization import run_diarization
+from mcr_meeting.app.use_cases.transcription.run_diarization import (
+    poll_diarization,
+    run_diarization,
+    start_diarization,
+)
 from mcr_meeting.app.use_cases.transcription.run_finalize_transcription import (
     run_finalize_transcription,
 )
 from mcr_meeting.app.use_cases.transcription.run_mark_transcription_failed import (
     run_mark_transcription_failed,
 )
+from mcr_meeting.app.use_cases.transcription.run_speculative_transcription import (
+    run_speculative_transcription,
+)
 from mcr_meeting.app.use_cases.transcription.run_speech_to_text import (
     run_speech_to_text,
 )
 from mcr_meeting.app.use_cases.transcription.run_transcribe_chunks import (
     run_transcribe_chunks,
 )
+from mcr_meeting.app.use_cases.transcription.run_transcription_fan_out import (
+    run_merge_transcription_chunks,
+    run_plan_transcription_chunks,
+    run_transcribe_chunk,
+)
 
 init_sentry()
 init_langfuse()
@@ -103,15 +120,68 @@ def transcribe(meeting_id: int, owner_keycloak_uuid: str) -> None:
 
 
 @celery_worker.task(
+    bind=True,
     base=TranscriptionPipelineTask,
     name=MCRTranscriptionTasks.DIARIZE,
 )
-def diarize(meeting_id: int, owner_keycloak_uuid: str) -> None:
+def diarize(
+    self: TranscriptionPipelineTask, meeting_id: int, owner_keycloak_uuid: str
+) -> None:
     asyncio.run(MeetingApiClient(owner_keycloak_uuid).start_transcription(meeting_id))
-    run_diarization(meeting_id, DiarizationProcessor())
+    first_poll_in = start_diarization(meeting_id, DiarizationProcessor())
+    if first_poll_in is not None:
+        if get_feature_flag_client().is_enabled(
+            FeatureFlag.TRANSCRIPTION_SPECULATIVE_WINDOWS
+        ):
+            # Outside the chain: its failure only costs the head start.
+            speculative_transcribe.delay(meeting_id, owner_keycloak_uuid)
+        _poll_diarization_later(self, meeting_id, owner_keycloak_uuid, first_poll_in)
     logger.info("Diarization completed for meeting {}", meeting_id)
 
 
+@celery_worker.task(
+    base=RetryableInfraTask,
+    name=MCRTranscriptionTasks.SPECULATIVE_TRANSCRIBE,
+)
+def speculative_transcribe(meeting_id: int, owner_keycloak_uuid: str) -> None:
+    """Transcribe the meeting in silence-cut windows while it is diarized."""
+    run_speculative_transcription(meeting_id, TranscriptionProcessor())
+    logger.info("Speculative transcription completed for meeting {}", meeting_id)
+
+
+@celery_worker.task(
+    bind=True,
+    base=TranscriptionPipelineTask,
+    name=MCRTranscriptionTasks.POLL_DIARIZATION,
+)
+def poll_diarization_job(
+    self: TranscriptionPipelineTask, meeting_id: int, owner_keycloak_uuid: str
+) -> None:
+    next_poll_in = poll_diarization(meeting_id, DiarizationProcessor())
+    if next_poll_in is not None:
+        _poll_diarization_later(self, meeting_id, owner_keycloak_uuid, next_poll_in)
+    logger.info("Diarization completed for meeting {}", meeting_id)
+
+
+def _poll_diarization_later(
+    task: TranscriptionPipelineTask,
+    meeting_id: int,
+    owner_keycloak_uuid: str,
+    countdown: float,
+) -> None:
+    """Hand the rest of the chain to a poll task due in `countdown` seconds.
+
+    Celery's replace keeps the chain's remaining tasks and error callback on
+    the new task and raises Ignore, so this never returns inside a worker:
+    the worker slot is free for other meetings until the next poll.
+    """
+    task.replace(
+        poll_diarization_job.si(meeting_id, owner_keycloak_uuid).set(
+            countdown=countdown
+        )
+    )
+
+
 @celery_worker.task(
     base=TranscriptionPipelineTask,
     name=MCRTranscriptionTasks.TRANSCRIBE_CHUNKS,
@@ -121,6 +191,53 @@ def transcribe_chunks(meeting_id: int, owner_keycloak_uuid: str) -> None:
     logger.info("Chunk transcription completed for meeting {}", meeting_id)
 
 
+@celery_worker.task(
+    bind=True,
+    base=TranscriptionPipelineTask,
+    name=MCRTranscriptionTasks.PLAN_TRANSCRIPTION_CHUNKS,
+)
+def plan_transcription_chunks(
+    self: TranscriptionPipelineTask, meeting_id: int, owner_keycloak_uuid: str
+) -> None:
+    """Fan the meeting's chunks out to one task each, merged by a chord callback.
+
+    Like the diarization polls, replace hands the rest of the chain
+    (finalize_transcription) and its error callback over to the chord: they run
+    after the merge, and a chunk that fails for good fails the meeting.
+    """
+    chunk_count = run_plan_transcription_chunks(meeting_id)
+    if chunk_count == 0:
+        return
+    self.replace(
+        chord(
+            [
+                transcribe_chunk.si(meeting_id, owner_keycloak_uuid, chunk_index)
+                for chunk_index in range(chunk_count)
+            ],
+            merge_transcription_chunks.si(meeting_id, owner_keycloak_uuid),
+        )
+    )
+
+
+@celery_worker.task(
+    base=TranscriptionPipelineTask,
+    name=MCRTranscriptionTasks.TRANSCRIBE_CHUNK,
+)
+def transcribe_chunk(
+    meeting_id: int, owner_keycloak_uuid: str, chunk_index: int
+) -> None:
+    run_transcribe_chunk(meeting_id, chunk_index, TranscriptionProcessor())
+
+
+@celery_worker.task(
+    base=TranscriptionPipelineTask,
+    name=MCRTranscriptionTasks.MERGE_TRANSCRIPTION_CHUNKS,
+)
+def merge_transcription_chunks(meeting_id: int, owner_keycloak_uuid: str) -> None:
+    run_merge_transcription_chunks(meeting_id)
+    logger.info("Chunk transcription completed for meeting {}", meeting_id)
+
+
 @celery_worker.task(
     base=TranscriptionPipelineTask,
     name=MCRTranscriptionTasks.FINALIZE_TRANSCRIPTION,
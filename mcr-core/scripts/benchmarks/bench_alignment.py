@@ -0,0 +1,93 @@
+"""Benchmark: sweep-line speaker alignment vs the per-segment scan it replaced.
+
+Usage (from mcr-core/):
+    uv run python scripts/benchmarks/bench_alignment.py [--hours 10] [--turn-seconds 3]
+
+Synthesizes a meeting with a speaker turn every few seconds (with short overlaps
+between turns, as pyannote produces) and Whisper-like segments, then assigns a
+speaker to each segment twice: with the historical scan of every diarization
+turn per segment, and with max_overlaps. Both must agree on every segment.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+from loguru import logger
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from mcr_meeting.app.domain.transcription.alignment import max_overlaps  # noqa: E402
+from mcr_meeting.app.schemas.transcription_schema import TimeSpan  # noqa: E402
+
+
+def synthesize(
+    hours: float, turn_seconds: float, segment_seconds: float
+) -> tuple[list[TimeSpan], list[TimeSpan]]:
+    rng = random.Random(0)
+    duration = hours * 3600
+    turns = []
+    t = 0.0
+    while t < duration:
+        length = rng.uniform(0.3, 2 * turn_seconds)
+        turns.append(TimeSpan(t, t + length + rng.uniform(0, 0.4)))
+        t += length
+    segments = []
+    t = 0.0
+    while t < duration:
+        length = rng.uniform(1.0, 2 * segment_seconds)
+        segments.append(TimeSpan(t, t + length))
+        t += length + rng.uniform(0, 1.0)
+    return segments, turns
+
+
+def scan(
+    segments: list[TimeSpan], turns: list[TimeSpan]
+) -> list[tuple[int | None, float]]:
+    matches: list[tuple[int | None, float]] = []
+    for segment in segments:
+        best: int | None = None
+        best_overlap = 0.0
+        for index, turn in enumerate(turns):
+            overlap = segment.overlap(turn)
+            if overlap > best_overlap:
+                best, best_overlap = index, overlap
+        matches.append((best, best_overlap))
+    return matches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=10.0)
+    parser.add_argument("--turn-seconds", type=float, default=3.0)
+    parser.add_argument("--segment-seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    segments, turns = synthesize(args.hours, args.turn_seconds, args.segment_seconds)
+
+    t0 = time.perf_counter()
+    swept = max_overlaps(segments, turns)
+    sweep_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    scanned = scan(segments, turns)
+    scan_s = time.perf_counter() - t0
+
+    assert swept == scanned, "sweep-line and scan disagree"
+    logger.info(
+        "{} h meeting: {} transcription segments, {} diarization turns",
+        args.hours,
+        len(segments),
+        len(turns),
+    )
+    logger.info("scan:       {:.2f}s", scan_s)
+    logger.info("sweep-line: {:.3f}s", sweep_s)
+    logger.info("speedup:    {:.0f}x", scan_s / sweep_s)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark: transcription chunk planner vs the gap rescan it replaced.
+
+Usage (from mcr-core/):
+    uv run python scripts/benchmarks/bench_chunking.py [--turn-seconds 3] [--repeat 5]
+
+Synthesizes diarizations from 10 minutes to 12 hours, a speaker turn every few
+seconds with short pauses (and some overlaps) between them, and plans the
+transcription chunks twice: with the historical planner, which rescans every
+gap of the chunk at each split, and with compute_transcription_chunks. Both
+must produce the same plan.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections.abc import Callable
+
+from loguru import logger
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from mcr_meeting.app.domain.transcription.chunking import (  # noqa: E402
+    MAX_CHUNK_DURATION,
+    SPLIT_SEARCH_WINDOW_RATIO,
+    _merge_overlapping_intervals,
+    compute_transcription_chunks,
+)
+from mcr_meeting.app.schemas.transcription_schema import (  # noqa: E402
+    DiarizationSegment,
+    TimeSpan,
+)
+
+MEETING_HOURS = [1 / 6, 0.5, 1.0, 2.0, 4.0, 8.0, 12.0]
+
+
+def synthesize(hours: float, turn_seconds: float) -> list[DiarizationSegment]:
+    rng = random.Random(0)
+    duration = hours * 3600
+    segments = []
+    t = 0.0
+    while t < duration:
+        length = rng.uniform(0.3, 2 * turn_seconds)
+        segments.append(
+            DiarizationSegment(start=t, end=t + length, speaker=f"S{rng.randint(1, 6)}")
+        )
+        t += length + rng.uniform(-0.3, 1.5)
+    return segments
+
+
+def rescan(diarization: list[DiarizationSegment]) -> list[TimeSpan]:
+    merged = _merge_overlapping_intervals(
+        TimeSpan(seg.start, seg.end) for seg in diarization
+    )
+    chunks: list[TimeSpan] = []
+    chunk_start = merged[0].start
+    chunk_intervals = [merged[0]]
+    for interval in merged[1:]:
+        if interval.end - chunk_start <= MAX_CHUNK_DURATION:
+            chunk_intervals.append(interval)
+            continue
+        window_start = (
+            chunk_start + (1 - SPLIT_SEARCH_WINDOW_RATIO) * MAX_CHUNK_DURATION
+        )
+        window_end = chunk_start + MAX_CHUNK_DURATION
+        all_intervals = chunk_intervals + [interval]
+        best_gap: TimeSpan | None = None
+        for j in range(len(all_intervals) - 1):
+            gap = all_intervals[j].gap_to(all_intervals[j + 1])
+            if gap is None or gap.start < window_start or gap.midpoint > window_end:
+                continue
+            if best_gap is None or gap.duration > best_gap.duration:
+                best_gap = gap
+        boundary = best_gap.midpoint if best_gap is not None else window_end
+        chunks.append(TimeSpan(chunk_start, boundary))
+        chunk_start = boundary
+        chunk_intervals = [interval]
+    chunks.append(TimeSpan(chunk_start, chunk_intervals[-1].end))
+    return chunks
+
+
+def best_of(
+    planner: Callable[[list[DiarizationSegment]], list[TimeSpan]],
+    diarization: list[DiarizationSegment],
+    repeat: int,
+) -> tuple[float, list[TimeSpan]]:
+    best = float("inf")
+    plan: list[TimeSpan] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        plan = planner(diarization)
+        best = min(best, time.perf_counter() - t0)
+    return best, plan
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turn-seconds", type=float, default=3.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logger.info(
+        "{:>9} {:>9} {:>7} {:>11} {:>11}",
+        "meeting",
+        "turns",
+        "chunks",
+        "rescan",
+        "planner",
+    )
+    for hours in MEETING_HOURS:
+        diarization = synthesize(hours, args.turn_seconds)
+        rescan_s, expected = best_of(rescan, diarization, args.repeat)
+        planner_s, planned = best_of(
+            compute_transcription_chunks, diarization, args.repeat
+        )
+        assert planned == expected, f"plans differ for a {hours} h meeting"
+        logger.info(
+            "{:>5.0f} min {:>9} {:>7} {:>10.1f}ms {:>10.1f}ms",
+            hours * 60,
+            len(diarization),
+            len(planned),
+            rescan_s * 1000,
+            planner_s * 1000,
+        )
+
+
+if __name__ == "__main__":
+    main()
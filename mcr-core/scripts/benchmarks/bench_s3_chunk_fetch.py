@@ -0,0 +1,104 @@
+"""Benchmark: prefetched concurrent S3 chunk download vs the historical serial loop.
+
+Usage (from mcr-core/):
+    uv run python scripts/benchmarks/bench_s3_chunk_fetch.py [--chunks 2000]
+    uv run python scripts/benchmarks/bench_s3_chunk_fetch.py --live
+
+By default the chunks live in an in-process S3 stand-in that sleeps
+--latency-ms per GET, which is what dominates a real fetch of many small
+objects. With --live the chunks are uploaded to the S3 configured in the
+environment (e.g. the MinIO of docker-compose), fetched, then deleted.
+"""
+
+import argparse
+import os
+import sys
+import time
+from io import BytesIO
+from typing import Any
+
+from loguru import logger
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from mcr_meeting.app.infrastructure import s3  # noqa: E402
+from mcr_meeting.app.schemas.S3_types import S3Object  # noqa: E402
+
+BENCH_PREFIX = "benchmarks/s3_chunk_fetch"
+
+
+class LatencyS3:
+    """Minimal get_object stand-in answering after a fixed round-trip time."""
+
+    def __init__(self, latency: float) -> None:
+        self.objects: dict[str, bytes] = {}
+        self._latency = latency
+
+    def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        time.sleep(self._latency)
+        return {"Body": BytesIO(self.objects[Key])}
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes) -> None:
+        self.objects[Key] = Body
+
+    def delete_object(self, *, Bucket: str, Key: str) -> None:
+        self.objects.pop(Key, None)
+
+
+def serial_fetch(objects: list[S3Object]) -> list[bytes]:
+    """The one-object-at-a-time loop that _prefetch_audio_chunks replaced."""
+    return [s3.get_file_from_s3(obj.object_name).read() for obj in objects]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--chunk-kib", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--live", action="store_true")
+    args = parser.parse_args()
+
+    client: Any = s3.s3_client if args.live else LatencyS3(args.latency_ms / 1000)
+    s3.s3_client = client
+    bucket = s3.s3_settings.S3_BUCKET
+
+    keys = [f"{BENCH_PREFIX}/chunk_{idx:06d}.weba" for idx in range(args.chunks)]
+    payload = os.urandom(args.chunk_kib * 1024)
+    for key in keys:
+        client.put_object(Bucket=bucket, Key=key, Body=payload)
+    objects = [
+        S3Object.model_validate({"Key": key, "LastModified": None}) for key in keys
+    ]
+
+    try:
+        t0 = time.perf_counter()
+        serial = serial_fetch(objects)
+        serial_s = time.perf_counter() - t0
+
+        stats = s3._ChunkFetchStats()
+        t0 = time.perf_counter()
+        prefetched = list(s3._prefetch_audio_chunks(objects, stats))
+        prefetched_s = time.perf_counter() - t0
+    finally:
+        for key in keys:
+            client.delete_object(Bucket=bucket, Key=key)
+
+    assert prefetched == serial, "prefetched chunks differ from the serial fetch"
+    mib = stats.byte_count / (1024 * 1024)
+    logger.info(
+        "{} chunks of {} KiB against {} (concurrency={}, prefetch={})",
+        args.chunks,
+        args.chunk_kib,
+        "live S3" if args.live else f"stand-in S3, {args.latency_ms} ms/GET",
+        s3.s3_settings.S3_AUDIO_DOWNLOAD_CONCURRENCY,
+        s3.s3_settings.S3_AUDIO_PREFETCH_CHUNKS,
+    )
+    logger.info("serial:     {:.2f}s ({:.1f} MiB/s)", serial_s, mib / serial_s)
+    logger.info("prefetched: {:.2f}s ({:.1f} MiB/s)", prefetched_s, mib / prefetched_s)
+    logger.info("speedup:    {:.1f}x", serial_s / prefetched_s)
+
+
+if __name__ == "__main__":
+    main()
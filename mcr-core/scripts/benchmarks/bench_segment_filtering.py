@@ -0,0 +1,80 @@
+"""Benchmark: segment-parallel noise filtering vs one FFmpeg process.
+
+Usage (from mcr-core/):
+    uv run python scripts/benchmarks/bench_segment_filtering.py [--minutes 60]
+
+Synthesizes speech-like audio (noisy tone bursts separated by silences) and runs
+filter_noise_from_audio twice: once with FFMPEG_SEGMENT_SECONDS larger than the
+audio, which is the historical single-process run, and once with the configured
+segment length on every CPU available. The speedup is bounded by the CPU count.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from loguru import logger
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from mcr_meeting.app.domain import audio, audio_segments  # noqa: E402
+from mcr_meeting.app.domain.audio_spool import (  # noqa: E402
+    AudioSpool,
+    wav_bytes_from_pcm,
+)
+
+SAMPLE_RATE = 16000
+
+
+def synthesize(minutes: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    seconds = minutes * 60
+    t = np.arange(seconds * SAMPLE_RATE) / SAMPLE_RATE
+    speaking = (np.floor(t / 4) % 3 != 2).astype(np.float64)
+    tone = 6000 * np.sin(2 * np.pi * 220 * t) * speaking
+    noise = rng.normal(0, 400, t.size)
+    return (tone + noise).astype(np.int16)
+
+
+def timed_filter(wav_audio: AudioSpool) -> tuple[float, np.ndarray]:
+    t0 = time.perf_counter()
+    with audio.filter_noise_from_audio(wav_audio) as filtered:
+        elapsed = time.perf_counter() - t0
+        return elapsed, np.array(filtered.pcm())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=int, default=60)
+    args = parser.parse_args()
+
+    samples = synthesize(args.minutes)
+    segment_seconds = audio.audio_settings.FFMPEG_SEGMENT_SECONDS
+    with AudioSpool.from_bytes(
+        wav_bytes_from_pcm(samples, SAMPLE_RATE).getvalue()
+    ) as wav_audio:
+        audio.audio_settings.FFMPEG_SEGMENT_SECONDS = float(args.minutes * 60 + 1)
+        single_s, single = timed_filter(wav_audio)
+
+        audio.audio_settings.FFMPEG_SEGMENT_SECONDS = segment_seconds
+        segmented_s, segmented = timed_filter(wav_audio)
+
+    assert single.size == segmented.size == samples.size, "length changed"
+    logger.info(
+        "{} min of audio, {} s segments, {} CPU(s)",
+        args.minutes,
+        segment_seconds,
+        audio_segments.audio_settings.FFMPEG_SEGMENT_WORKERS
+        or audio_segments._available_cpus(),
+    )
+    logger.info("one process: {:.1f}s", single_s)
+    logger.info("segmented:   {:.1f}s", segmented_s)
+    logger.info("speedup:     {:.1f}x", single_s / segmented_s)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from mcr_meeting.app.domain.transcription.participant_reconciliation import (
     detect_name_losses,
     format_segments_as_dialogue,
+    merge_participant_candidates,
 )
 from mcr_meeting.app.schemas.transcription_schema import (
     DiarizedTranscriptionSegment,
@@ -8,12 +9,17 @@ from mcr_meeting.app.schemas.transcription_schema import (
 )
 
 
-def _participant(speaker_id: str, name: str | None) -> Participant:
+def _participant(
+    speaker_id: str,
+    name: str | None,
+    confidence: float | None = 0.9,
+    role: str | None = None,
+) -> Participant:
     return Participant(
         speaker_id=speaker_id,
         name=name,
-        role=None,
-        confidence=0.9,
+        role=role,
+        confidence=confidence,
         association_justification=None,
     )
 
@@ -118,3 +124,117 @@ class TestDetectNameLosses:
             "LOCUTEUR_02": "name_set_to_null",
             "LOCUTEUR_03": "disappeared",
         }
+
+
+class TestMergeParticipantCandidates:
+    def _names(self, participants: list[Participant]) -> dict[str, str | None]:
+        return {p.speaker_id: p.name for p in participants}
+
+    def test_lists_speakers_in_order_of_appearance(self) -> None:
+        merge = merge_participant_candidates(
+            [
+                [_participant("LOCUTEUR_02", None), _participant("LOCUTEUR_01", None)],
+                [_participant("LOCUTEUR_03", None), _participant("LOCUTEUR_01", None)],
+            ]
+        )
+
+        assert [p.speaker_id for p in merge.participants] == [
+            "LOCUTEUR_02",
+            "LOCUTEUR_01",
+            "LOCUTEUR_03",
+        ]
+        assert merge.conflicts == []
+
+    def test_name_from_one_chunk_survives_unnamed_chunks(self) -> None:
+        merge = merge_participant_candidates(
+            [
+                [_participant("LOCUTEUR_01", None, confidence=None)],
+                [_participant("LOCUTEUR_01", "Alice", role="PO")],
+                [_participant("LOCUTEUR_01", None, confidence=None)],
+            ]
+        )
+
+        assert merge.participants[0].name == "Alice"
+        assert merge.participants[0].role == "PO"
+        assert merge.conflicts == []
+
+    def test_first_name_and_full_name_are_the_same_person(self) -> None:
+        merge = merge_participant_candidates(
+            [
+                [_participant("LOCUTEUR_01", "Julie", confidence=0.7)],
+                [_participant("LOCUTEUR_01", "julie Martin", confidence=0.95)],
+            ]
+        )
+
+        assert merge.participants[0].name == "julie Martin"
+        assert merge.participants[0].confidence == 0.95
+        assert merge.conflicts == []
+
+    def test_explicit_introduction_beats_a_deduction(self) -> None:
+        merge = merge_participant_candidates(
+            [
+                [_participant("LOCUTEUR_01", "Marc", confidence=0.85)],
+                [_participant("LOCUTEUR_01", "Luc", confidence=0.95)],
+            ]
+        )
+
+        assert merge.participants[0].name == "Luc"
+        assert merge.conflicts == []
+
+    def test_close_deductions_leave_the_speaker_unnamed(self) -> None:
+        merge = merge_participant_candidates(
+            [
+                [_participant("LOCUTEUR_01", "Marc", confidence=0.7, role="PO")],
+                [_participant("LOCUTEUR_01", "Luc", confidence=0.6)],
+            ]
+        )
+
+        assert merge.participants[0].name is None
+        assert merge.participants[0].confidence is None
+        assert merge.participants[0].role == "PO"
+        assert len(merge.conflicts) == 1
+        assert merge.conflicts[0].reason == "names_disagree"
+        assert merge.conflicts[0].speaker_ids == ["LOCUTEUR_01"]
+        assert merge.conflicts[0].names == ["Marc", "Luc"]
+
+    def test_much_less_confident_deduction_is_dropped(self) -> None:
+        merge = merge_participant_candidates(
+            [
+                [_participant("LOCUTEUR_01", "Marc", confidence=0.8)],
+                [_participant("LOCUTEUR_01", "Luc", confidence=0.4)],
+            ]
+        )
+
+        assert merge.participants[0].name == "Marc"
+        assert merge.conflicts == []
+
+    def test_name_claimed_by_two_speakers_goes_to_the_explicit_one(self) -> None:
+        merge = merge_participant_candidates(
+            [
+                [_participant("LOCUTEUR_01", "Alice", confidence=0.95)],
+                [_participant("LOCUTEUR_02", "alice", confidence=0.6)],
+            ]
+        )
+
+        assert self._names(merge.participants) == {
+            "LOCUTEUR_01": "Alice",
+            "LOCUTEUR_02": None,
+        }
+        assert merge.conflicts == []
+
+    def test_name_claimed_by_two_speakers_alike_is_a_conflict(self) -> None:
+        merge = merge_participant_candidates(
+            [
+                [_participant("LOCUTEUR_01", "Alice", confidence=0.7)],
+                [_participant("LOCUTEUR_02", "Alice", confidence=0.7)],
+            ]
+        )
+
+        assert self._names(merge.participants) == {
+            "LOCUTEUR_01": None,
+            "LOCUTEUR_02": None,
+        }
+        assert len(merge.conflicts) == 1
+        assert merge.conflicts[0].reason == "name_shared"
+        assert merge.conflicts[0].speaker_ids == ["LOCUTEUR_01", "LOCUTEUR_02"]
+        assert merge.conflicts[0].names == ["Alice"]
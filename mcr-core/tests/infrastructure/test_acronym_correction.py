@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from mcr_meeting.app.infrastructure.llm import acronyms
+from mcr_meeting.app.infrastructure.llm.client import CorrectedText
+from mcr_meeting.app.infrastructure.unleash import FeatureFlag
+from tests.mocks.in_memory_feature_flags import InMemoryFeatureFlagClient
+
+
+@pytest.fixture
+def complete(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch.object(
+        acronyms,
+        "complete",
+        side_effect=lambda response_model, messages: CorrectedText(
+            corrected_text="corrigé"
+        ),
+    )
+
+
+def _prompt(complete: MagicMock) -> str:
+    return complete.call_args.kwargs["messages"][0]["content"]
+
+
+def test_whole_glossary_is_sent_without_the_prefilter(complete: MagicMock) -> None:
+    assert acronyms.correct_acronyms("Bonjour à tous.") == "corrigé"
+
+    assert "titres sécurisés" in _prompt(complete)
+    assert "Allocation pour adultes handicapés" in _prompt(complete)
+
+
+def test_chunk_without_candidate_skips_the_call(
+    complete: MagicMock, feature_flags: InMemoryFeatureFlagClient
+) -> None:
+    feature_flags.enable(FeatureFlag.ACRONYM_GLOSSARY_PREFILTER)
+
+    assert acronyms.correct_acronyms("Bonjour à tous.") == "Bonjour à tous."
+
+    complete.assert_not_called()
+
+
+def test_only_the_candidate_entries_are_sent(
+    complete: MagicMock, feature_flags: InMemoryFeatureFlagClient
+) -> None:
+    feature_flags.enable(FeatureFlag.ACRONYM_GLOSSARY_PREFILTER)
+
+    assert acronyms.correct_acronyms("La NTS a transmis le dossier.") == "corrigé"
+
+    assert "titres sécurisés" in _prompt(complete)
+    assert "Allocation pour adultes handicapés" not in _prompt(complete)
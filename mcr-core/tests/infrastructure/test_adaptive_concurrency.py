@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from mcr_meeting.app.infrastructure.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+)
+
+
+class _Overload(Exception):
+    pass
+
+
+def _limiter(
+    initial: int = 4, minimum: int = 1, maximum: int = 8
+) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter(
+        name="test",
+        initial=initial,
+        minimum=minimum,
+        maximum=maximum,
+        decrease_factor=0.5,
+        is_overload=lambda e: isinstance(e, _Overload),
+    )
+
+
+def _call(limiter: AdaptiveConcurrencyLimiter, **kwargs: float) -> None:
+    with limiter.slot(**kwargs):
+        pass
+
+
+def test_grows_by_one_per_window_of_healthy_calls() -> None:
+    limiter = _limiter(initial=4)
+
+    for _ in range(4):
+        _call(limiter)
+    assert limiter.window == 5
+
+    for _ in range(100):
+        _call(limiter)
+    assert limiter.window == 8
+
+
+def test_slow_calls_hold_the_window() -> None:
+    limiter = _limiter(initial=4)
+
+    for _ in range(10):
+        _call(limiter, latency_budget=-1.0)
+
+    assert limiter.window == 4
+
+
+def test_overload_cuts_the_window_down_to_the_floor() -> None:
+    limiter = _limiter(initial=8, minimum=3)
+
+    with pytest.raises(_Overload), limiter.slot():
+        raise _Overload
+    assert limiter.window == 4
+
+    with limiter.slot() as slot:
+        slot.mark_overloaded()
+    assert limiter.window == 3
+
+
+def test_other_errors_leave_the_window_alone() -> None:
+    limiter = _limiter(initial=4)
+
+    with pytest.raises(ValueError), limiter.slot():
+        raise ValueError
+
+    assert limiter.window == 4
+    assert limiter.in_flight == 0
+
+
+def test_one_congestion_event_is_cut_once() -> None:
+    limiter = _limiter(initial=8)
+    slots = [limiter.slot() for _ in range(4)]
+    for slot in slots:
+        slot.__enter__().mark_overloaded()
+
+    # All four calls were in flight before the first cut.
+    for slot in slots:
+        slot.__exit__(None, None, None)
+
+    assert limiter.window == 4
+
+
+def test_calls_beyond_the_window_wait() -> None:
+    limiter = _limiter(initial=2, maximum=2)
+    peak = 0
+    lock = threading.Lock()
+
+    def call() -> None:
+        nonlocal peak
+        with limiter.slot():
+            with lock:
+                peak = max(peak, limiter.in_flight)
+            time.sleep(0.02)
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+
+
+def test_try_slot_declines_instead_of_waiting_when_the_window_is_full() -> None:
+    limiter = _limiter(initial=1, maximum=1)
+
+    with limiter.slot():
+        with limiter.try_slot() as refused:
+            assert refused is None
+            assert limiter.in_flight == 1
+
+    with limiter.try_slot() as admitted:
+        assert admitted is not None
+        assert limiter.in_flight == 1
+    assert limiter.in_flight == 0
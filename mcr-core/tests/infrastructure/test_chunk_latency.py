@@ -0,0 +1,47 @@
+import pytest
+
+from mcr_meeting.app.infrastructure.chunk_latency import ChunkLatencyModel
+
+
+def _model() -> ChunkLatencyModel:
+    return ChunkLatencyModel(
+        request_overhead=3.0, real_time_factor=0.05, prior_weight=4
+    )
+
+
+def test_configured_estimates_before_any_call() -> None:
+    assert _model().estimate() == pytest.approx((3.0, 0.05))
+
+
+def test_converges_to_the_observed_latencies() -> None:
+    model = _model()
+    for i in range(300):
+        duration = 60.0 + (i % 10) * 50.0
+        model.record(duration, 1.0 + 0.02 * duration)
+
+    overhead, real_time_factor = model.estimate()
+
+    assert overhead == pytest.approx(1.0, abs=0.1)
+    assert real_time_factor == pytest.approx(0.02, abs=0.002)
+
+
+def test_same_duration_chunks_keep_the_fit_defined() -> None:
+    model = _model()
+    for _ in range(2000):
+        model.record(600.0, 12.0)
+
+    overhead, real_time_factor = model.estimate()
+
+    assert overhead + 600.0 * real_time_factor == pytest.approx(12.0)
+    assert overhead / real_time_factor == pytest.approx(3.0 / 0.05)
+
+
+def test_estimates_are_never_negative() -> None:
+    model = _model()
+    for duration in (10.0, 600.0) * 50:
+        model.record(duration, 0.0 if duration < 100 else 30.0)
+
+    overhead, real_time_factor = model.estimate()
+
+    assert overhead >= 0.0
+    assert real_time_factor > 0.0
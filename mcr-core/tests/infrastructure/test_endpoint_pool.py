@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mcr_meeting.app.infrastructure.endpoint_pool import BreakerState, EndpointPool
+
+URLS = ["http://a", "http://b"]
+
+
+class _Failure(Exception):
+    pass
+
+
+class _Rejected(Exception):
+    pass
+
+
+def _pool(failure_threshold: int = 2, cooldown_seconds: float = 60.0) -> EndpointPool:
+    return EndpointPool(
+        name="test",
+        failure_threshold=failure_threshold,
+        cooldown_seconds=cooldown_seconds,
+        is_failure=lambda e: isinstance(e, _Failure),
+    )
+
+
+def _failing_on(*down: str):
+    def request(url: str) -> str:
+        if url in down:
+            raise _Failure(url)
+        return url
+
+    return request
+
+
+def _states(pool: EndpointPool) -> dict[str, BreakerState]:
+    return {endpoint.url: endpoint.state for endpoint in pool.health()}
+
+
+def test_idle_endpoints_take_turns() -> None:
+    pool = _pool()
+
+    assert [pool.call(URLS, lambda url: url) for _ in range(4)] == URLS * 2
+
+
+def test_call_goes_to_the_endpoint_with_fewer_requests_in_flight() -> None:
+    pool = _pool()
+    started, release = threading.Event(), threading.Event()
+
+    def blocking(url: str) -> str:
+        started.set()
+        release.wait()
+        return url
+
+    first = threading.Thread(target=pool.call, args=(URLS, blocking))
+    first.start()
+    started.wait()
+    try:
+        busy = pool.health()[0].url
+        assert [pool.call(URLS, lambda url: url) for _ in range(2)] == [
+            url for url in URLS if url != busy
+        ] * 2
+    finally:
+        release.set()
+        first.join()
+
+
+def test_failed_call_moves_on_to_another_endpoint() -> None:
+    pool = _pool()
+
+    assert pool.call(URLS, _failing_on("http://a")) == "http://b"
+    assert [(e.requests, e.failures) for e in pool.health()] == [(1, 1), (1, 0)]
+
+
+def test_error_that_is_not_an_endpoint_failure_is_raised_at_once() -> None:
+    pool = _pool()
+
+    def rejected(url: str) -> str:
+        raise _Rejected(url)
+
+    with pytest.raises(_Rejected):
+        pool.call(URLS, rejected)
+    assert sum(endpoint.requests for endpoint in pool.health()) == 1
+
+
+def test_last_failure_is_raised_once_every_endpoint_failed() -> None:
+    pool = _pool()
+
+    with pytest.raises(_Failure, match="http://b"):
+        pool.call(URLS, _failing_on(*URLS))
+
+
+def test_consecutive_failures_open_the_breaker() -> None:
+    pool = _pool(failure_threshold=2)
+    request = _failing_on("http://a")
+
+    for _ in range(6):
+        assert pool.call(URLS, request) == "http://b"
+
+    health = {endpoint.url: endpoint for endpoint in pool.health()}
+    assert health["http://a"].state == BreakerState.OPEN
+    assert health["http://a"].requests == 2
+
+
+def test_half_open_probe_closes_the_breaker_on_success() -> None:
+    pool = _pool(failure_threshold=1, cooldown_seconds=0.05)
+    pool.call(URLS, _failing_on("http://a"))
+    assert _states(pool)["http://a"] == BreakerState.OPEN
+
+    time.sleep(0.1)
+    pool.call(URLS, lambda url: url)
+    pool.call(URLS, lambda url: url)
+
+    assert _states(pool)["http://a"] == BreakerState.CLOSED
+
+
+def test_failed_probe_opens_the_breaker_again() -> None:
+    pool = _pool(failure_threshold=1, cooldown_seconds=0.05)
+    request = _failing_on("http://a")
+    pool.call(URLS, request)
+
+    time.sleep(0.1)
+    for _ in range(4):
+        assert pool.call(URLS, request) == "http://b"
+
+    health = {endpoint.url: endpoint for endpoint in pool.health()}
+    assert health["http://a"].state == BreakerState.OPEN
+    assert health["http://a"].requests == 2
+
+
+def test_half_open_endpoint_takes_a_single_probe_at_a_time() -> None:
+    pool = _pool(failure_threshold=1, cooldown_seconds=0.05)
+    pool.call(URLS, _failing_on("http://a"))
+    time.sleep(0.1)
+    started, release = threading.Event(), threading.Event()
+
+    def probe_blocks(url: str) -> str:
+        if url == "http://a":
+            started.set()
+            release.wait()
+        return url
+
+    probe = threading.Thread(target=pool.call, args=(URLS, probe_blocks))
+    probe.start()
+    started.wait()
+    try:
+        assert [pool.call(URLS, lambda url: url) for _ in range(3)] == ["http://b"] * 3
+    finally:
+        release.set()
+        probe.join()
+
+
+def test_a_lone_endpoint_with_an_open_breaker_is_still_called() -> None:
+    pool = _pool(failure_threshold=1)
+    with pytest.raises(_Failure):
+        pool.call(["http://a"], _failing_on("http://a"))
+
+    assert pool.call(["http://a"], lambda url: url) == "http://a"
+    assert _states(pool)["http://a"] == BreakerState.CLOSED
+
+
+def test_cancelled_async_call_frees_its_endpoint_without_counting() -> None:
+    pool = _pool(failure_threshold=1)
+
+    async def never_answers(url: str) -> str:
+        await asyncio.sleep(10)
+        return url
+
+    async def cancel_after_start() -> None:
+        call = asyncio.ensure_future(pool.acall(["http://a"], never_answers))
+        await asyncio.sleep(0.01)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+    asyncio.run(cancel_after_start())
+
+    (health,) = pool.health()
+    assert (health.outstanding, health.failures) == (0, 0)
+    assert health.state == BreakerState.CLOSED
@@ -0,0 +1,192 @@
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+from pydantic import ValidationError
+from pytest_mock import MockerFixture
+
+from mcr_meeting.app.configs.base import LLMSettings
+from mcr_meeting.app.infrastructure.llm import client
+from mcr_meeting.app.infrastructure.llm.client import CorrectedText
+from mcr_meeting.app.infrastructure.llm.response_cache import (
+    CacheBackend,
+    DiskCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+    response_cache_key,
+)
+from mcr_meeting.app.schemas.transcription_schema import Participant
+from tests.mocks.in_memory_redis import InMemoryRedis
+
+MESSAGES = [{"role": "user", "content": "Corrige : la NTS"}]
+
+
+def _key(**overrides: object) -> str:
+    request: dict[str, object] = {
+        "model": "gptoss-120b",
+        "temperature": 0.0,
+        "version": "1",
+        "response_model": CorrectedText,
+        "messages": MESSAGES,
+    }
+    request.update(overrides)
+    return response_cache_key(**request)  # type: ignore[arg-type]
+
+
+class TestResponseCacheKey:
+    def test_same_request_same_key(self) -> None:
+        assert _key() == _key(messages=[dict(message) for message in MESSAGES])
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"model": "other-model"},
+            {"temperature": 0.5},
+            {"version": "2"},
+            {"response_model": list[Participant]},
+            {"messages": [{"role": "user", "content": "Corrige : la NTS."}]},
+        ],
+    )
+    def test_anything_that_decides_the_response_changes_the_key(
+        self, overrides: dict[str, object]
+    ) -> None:
+        assert _key(**overrides) != _key()
+
+
+class TestDiskCacheBackend:
+    def test_value_is_read_back(self, tmp_path: Path) -> None:
+        backend = DiskCacheBackend(tmp_path)
+
+        backend.set("abcdef", '{"corrected_text": "l\'ANTS"}', ttl_seconds=60)
+
+        assert backend.get("abcdef") == '{"corrected_text": "l\'ANTS"}'
+        assert DiskCacheBackend(tmp_path).get("abcdef") is not None
+
+    def test_missing_key(self, tmp_path: Path) -> None:
+        assert DiskCacheBackend(tmp_path).get("abcdef") is None
+
+    def test_expired_entry_is_dropped(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        backend = DiskCacheBackend(tmp_path)
+        backend.set("abcdef", "{}", ttl_seconds=60)
+        now = mocker.patch("time.time")
+        now.return_value = 10**12
+
+        assert backend.get("abcdef") is None
+        assert not list(tmp_path.rglob("*.json"))
+
+
+class TestResponseCache:
+    def test_list_responses_round_trip(self) -> None:
+        cache = ResponseCache(RedisCacheBackend(InMemoryRedis()), ttl_seconds=60)  # type: ignore[arg-type]
+        participants = [
+            Participant(
+                speaker_id="LOCUTEUR_01",
+                name="Julie",
+                role=None,
+                confidence=0.95,
+                association_justification="Se présente.",
+            )
+        ]
+
+        cache.set("k", list[Participant], participants)
+
+        assert cache.get("k", list[Participant]) == participants
+        assert cache.get("other", list[Participant]) is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_backend_failure_is_a_counted_miss(self) -> None:
+        backend = MagicMock(spec=CacheBackend)
+        backend.name = "redis"
+        backend.get.side_effect = redis.ConnectionError("down")
+        backend.set.side_effect = redis.ConnectionError("down")
+        cache = ResponseCache(backend, ttl_seconds=60)
+
+        assert cache.get("k", CorrectedText) is None
+        cache.set("k", CorrectedText, CorrectedText(corrected_text="x"))
+
+        assert cache.stats.misses == 1
+        assert cache.stats.errors == 2
+
+    def test_value_that_no_longer_validates_is_a_miss(self) -> None:
+        store = InMemoryRedis()
+        store.set("llm_response:k", '{"unexpected": 1}')
+        cache = ResponseCache(RedisCacheBackend(store), ttl_seconds=60)  # type: ignore[arg-type]
+
+        assert cache.get("k", CorrectedText) is None
+        assert cache.stats.errors == 1
+
+
+class TestComplete:
+    @pytest.fixture
+    def create(self, mocker: MockerFixture) -> MagicMock:
+        create = MagicMock(
+            side_effect=lambda **kwargs: CorrectedText(corrected_text="l'ANTS")
+        )
+        mocker.patch.object(
+            client,
+            "_get_llm_client",
+            return_value=SimpleNamespace(
+                chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+            ),
+        )
+        return create
+
+    def _use_cache(self, mocker: MockerFixture, cache: ResponseCache | None) -> None:
+        mocker.patch.object(client, "_response_cache", cache)
+        mocker.patch.object(client, "_response_cache_built", True)
+
+    def test_repeated_request_is_answered_from_the_cache(
+        self, create: MagicMock, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        cache = ResponseCache(DiskCacheBackend(tmp_path), ttl_seconds=60)
+        self._use_cache(mocker, cache)
+
+        first = client.complete(CorrectedText, MESSAGES)  # type: ignore[arg-type]
+        again = client.complete(CorrectedText, MESSAGES)  # type: ignore[arg-type]
+
+        assert first == again == CorrectedText(corrected_text="l'ANTS")
+        assert create.call_count == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_every_request_is_sent_without_a_cache(
+        self, create: MagicMock, mocker: MockerFixture
+    ) -> None:
+        self._use_cache(mocker, None)
+
+        client.complete(CorrectedText, MESSAGES)  # type: ignore[arg-type]
+        client.complete(CorrectedText, MESSAGES)  # type: ignore[arg-type]
+
+        assert create.call_count == 2
+
+    def test_redis_backend_is_selected_by_the_settings(
+        self, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        monkeypatch.setenv("LLM_RESPONSE_CACHE_BACKEND", "redis")
+        store = InMemoryRedis()
+        mocker.patch.object(client, "llm_response_cache_client", store)
+
+        cache = client._build_response_cache()
+        assert cache is not None
+        cache.set("k", CorrectedText, CorrectedText(corrected_text="x"))
+
+        assert cache.backend_name == "redis"
+        assert "llm_response:k" in store.store
+
+    def test_disk_backend_defaults_to_an_absolute_directory(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("LLM_RESPONSE_CACHE_BACKEND", "disk")
+        monkeypatch.delenv("LLM_RESPONSE_CACHE_DIR", raising=False)
+
+        assert Path(LLMSettings().LLM_RESPONSE_CACHE_DIR).is_absolute()
+
+        monkeypatch.setenv("LLM_RESPONSE_CACHE_DIR", ".cache/llm_responses")
+        with pytest.raises(ValidationError, match="must be absolute"):
+            LLMSettings()
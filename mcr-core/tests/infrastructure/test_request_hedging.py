@@ -0,0 +1,232 @@
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from mcr_meeting.app.infrastructure.request_hedging import (
+    HedgeRefused,
+    RequestHedger,
+)
+
+
+class _Failure(Exception):
+    pass
+
+
+def _hedger(
+    min_samples: int = 4, budget_ratio: float = 1.0, budget_burst: float = 1.0
+) -> RequestHedger:
+    return RequestHedger(
+        name="test",
+        percentile=90,
+        min_samples=min_samples,
+        window=10,
+        budget_ratio=budget_ratio,
+        budget_burst=budget_burst,
+    )
+
+
+def _call[T](
+    hedger: RequestHedger,
+    request: Callable[[], Awaitable[T]],
+    hedge_request: Callable[[], Awaitable[T]] | None = None,
+    expected_latency: float = 1.0,
+) -> T:
+    return asyncio.run(hedger.call(request, hedge_request, expected_latency))
+
+
+def _warm_up(
+    hedger: RequestHedger,
+    latency: float = 0.01,
+    calls: int = 4,
+    expected_latency: float = 1.0,
+) -> None:
+    for _ in range(calls):
+        _call(hedger, lambda: asyncio.sleep(latency), expected_latency=expected_latency)
+
+
+class _Requests:
+    """A request whose copies take the given times, in the order they start."""
+
+    def __init__(self, *latencies: float, failing: set[int] = frozenset()) -> None:
+        self._latencies = list(latencies)
+        self._failing = failing
+        self.sent = 0
+        self.cancelled: list[int] = []
+
+    async def __call__(self) -> int:
+        copy = self.sent
+        self.sent += 1
+        try:
+            await asyncio.sleep(self._latencies[copy])
+        except asyncio.CancelledError:
+            self.cancelled.append(copy)
+            raise
+        if copy in self._failing:
+            raise _Failure(copy)
+        return copy
+
+
+def test_no_hedge_before_enough_calls_are_observed() -> None:
+    hedger = _hedger(min_samples=4)
+    _warm_up(hedger, calls=3)
+    request = _Requests(0.2, 0.0)
+
+    assert _call(hedger, request) == 0
+    assert request.sent == 1
+    assert hedger.stats.hedges == 0
+
+
+def test_delay_is_the_percentile_of_recent_latencies() -> None:
+    hedger = _hedger()
+    for latency in (0.01, 0.02, 0.03, 0.04):
+        _call(hedger, lambda latency=latency: asyncio.sleep(latency))
+
+    delay = hedger.hedge_delay()
+
+    assert delay is not None
+    assert 0.04 <= delay < 0.1
+
+
+def test_delay_scales_with_the_expected_latency() -> None:
+    hedger = _hedger()
+    _warm_up(hedger, latency=0.01, expected_latency=0.01)
+
+    delay = hedger.hedge_delay()
+
+    assert delay is not None
+    assert hedger.hedge_delay(expected_latency=10.0) == pytest.approx(10 * delay)
+
+
+def test_call_within_its_expected_latency_is_not_hedged() -> None:
+    hedger = _hedger()
+    _warm_up(hedger, latency=0.01, expected_latency=0.01)
+    request = _Requests(0.15, 0.0)
+
+    assert _call(hedger, request, expected_latency=0.2) == 0
+    assert request.sent == 1
+    assert hedger.stats.hedges == 0
+
+
+def test_call_late_for_its_expected_latency_is_hedged() -> None:
+    hedger = _hedger()
+    _warm_up(hedger, latency=0.1, expected_latency=0.1)
+    request = _Requests(1.0, 0.0)
+
+    assert _call(hedger, request, expected_latency=0.01) == 1
+    assert hedger.stats.hedges == 1
+
+
+def test_expected_latency_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        _call(_hedger(), _Requests(0.0), expected_latency=0.0)
+
+
+def test_straggler_is_hedged_and_the_duplicate_wins() -> None:
+    hedger = _hedger()
+    _warm_up(hedger)
+    request = _Requests(1.0, 0.01)
+
+    started_at = time.monotonic()
+    assert _call(hedger, request) == 1
+    assert time.monotonic() - started_at < 0.5
+
+    assert hedger.stats.hedges == 1
+    assert hedger.stats.wins == 1
+
+
+def test_original_answering_first_still_wins() -> None:
+    hedger = _hedger()
+    _warm_up(hedger)
+    request = _Requests(0.2, 1.0)
+
+    assert _call(hedger, request) == 0
+
+    assert hedger.stats.hedges == 1
+    assert hedger.stats.wins == 0
+
+
+def test_loser_is_cancelled_once_the_winner_answers() -> None:
+    hedger = _hedger()
+    _warm_up(hedger)
+    request = _Requests(1.0, 0.01)
+
+    _call(hedger, request)
+
+    assert request.cancelled == [0]
+
+
+def test_cancelled_straggler_still_counts_as_a_latency() -> None:
+    hedger = _hedger()
+    _warm_up(hedger)
+    delay_before = hedger.hedge_delay()
+
+    _call(hedger, _Requests(1.0, 0.01))
+
+    assert delay_before is not None
+    assert hedger.hedge_delay() > delay_before  # type: ignore[operator]
+
+
+def test_no_thread_is_started() -> None:
+    hedger = _hedger()
+    _warm_up(hedger)
+    threads_before = threading.active_count()
+    running: list[int] = []
+
+    async def request() -> str:
+        running.append(threading.active_count())
+        await asyncio.sleep(0.2)
+        return "original"
+
+    async def hedge_request() -> str:
+        running.append(threading.active_count())
+        return "hedge"
+
+    assert _call(hedger, request, hedge_request) == "hedge"
+    assert running == [threads_before, threads_before]
+
+
+def test_a_failed_copy_leaves_the_answer_to_the_other() -> None:
+    hedger = _hedger()
+    _warm_up(hedger)
+    request = _Requests(0.2, 0.01, failing={1})
+
+    assert _call(hedger, request) == 0
+
+
+def test_the_first_error_surfaces_when_both_copies_fail() -> None:
+    hedger = _hedger()
+    _warm_up(hedger)
+    request = _Requests(0.2, 0.01, failing={0, 1})
+
+    with pytest.raises(_Failure, match="0"):
+        _call(hedger, request)
+
+
+def test_refused_hedge_gives_its_budget_back() -> None:
+    hedger = _hedger(budget_ratio=0.0, budget_burst=1.0)
+    _warm_up(hedger)
+
+    async def refused() -> int:
+        raise HedgeRefused("no slot")
+
+    assert _call(hedger, _Requests(0.2), refused) == 0
+    assert hedger.stats.hedges == 0
+
+    assert _call(hedger, _Requests(1.0, 0.0)) == 1
+    assert hedger.stats.hedges == 1
+
+
+def test_budget_caps_the_hedges() -> None:
+    hedger = _hedger(budget_ratio=0.0, budget_burst=1.0)
+    _warm_up(hedger)
+
+    _call(hedger, _Requests(0.2, 0.0))
+    second = _Requests(0.2, 0.0)
+    assert _call(hedger, second) == 0
+
+    assert second.sent == 1
+    assert hedger.stats.hedges == 1
+    assert hedger.stats.hedge_rate == pytest.approx(1 / 6)
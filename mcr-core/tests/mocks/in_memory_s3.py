@@ -1,3 +1,4 @@
+import hashlib
 from collections import Counter
 from collections.abc import Callable, Iterator
 from datetime import UTC, datetime
@@ -34,8 +35,14 @@ class _ListObjectsPaginator:
     ) -> Iterator[dict[str, Any]]:
         self._tick(S3Op.LIST)
         contents = [
-            {"Key": key, "LastModified": datetime(2026, 1, 1, tzinfo=UTC)}
-            for key in self._objects
+            {
+                "Key": key,
+                "LastModified": datetime(2026, 1, 1, tzinfo=UTC),
+                # Like S3 for non-multipart uploads: the quoted MD5 of the content.
+                "ETag": f'"{hashlib.md5(data).hexdigest()}"',
+                "Size": len(data),
+            }
+            for key, data in self._objects.items()
             if key.startswith(Prefix)
         ]
         # boto3 omits "Contents" entirely on empty pages
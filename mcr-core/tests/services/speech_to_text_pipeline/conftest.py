@@ -37,7 +37,7 @@ def mock_noise_detection_dependencies(feature_flags: InMemoryFeatureFlagClient):
             "mcr_meeting.app.use_cases.transcription._shared.preprocess_audio.is_audio_noisy"
         ) as mock_is_noisy,
         patch(
-            "mcr_meeting.app.use_cases.transcription._shared.preprocess_audio.filter_noise_from_audio_bytes"
+            "mcr_meeting.app.use_cases.transcription._shared.preprocess_audio.filter_noise_from_audio"
         ) as mock_filter_noise,
     ):
         yield SimpleNamespace(
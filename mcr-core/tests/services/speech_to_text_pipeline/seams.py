@@ -17,6 +17,7 @@ from unittest.mock import MagicMock
 
 from pytest_mock import MockerFixture
 
+from mcr_meeting.app.domain.audio_spool import AudioSpool
 from mcr_meeting.app.infrastructure import transcription as transcription_module
 from mcr_meeting.app.infrastructure.llm.client import CorrectedText
 from mcr_meeting.app.schemas.transcription_schema import (
@@ -39,7 +40,7 @@ _SEAM_TRANSCRIPTION_API = (
 _SEAM_LLM_FROM_OPENAI = (
     "mcr_meeting.app.infrastructure.llm.client.instructor.from_openai"
 )
-_SEAM_AUDIO_SOURCE = "mcr_meeting.app.infrastructure.s3.fetch_audio_bytes"
+_SEAM_AUDIO_SOURCE = "mcr_meeting.app.infrastructure.s3.fetch_audio_spool"
 
 
 class _FakeLLMCompletions:
@@ -122,7 +123,7 @@ class TranscriptionSeams:
         def create(**kwargs: object) -> SimpleNamespace:
             with lock:
                 segments = remaining.pop(0)
-            return SimpleNamespace(
+            response = SimpleNamespace(
                 segments=[
                     SimpleNamespace(
                         start=segment.start, end=segment.end, text=segment.text
@@ -130,9 +131,14 @@ class TranscriptionSeams:
                     for segment in segments
                 ]
             )
+            return SimpleNamespace(retries_taken=0, parse=lambda: response)
 
         client = SimpleNamespace(
-            audio=SimpleNamespace(transcriptions=SimpleNamespace(create=create))
+            audio=SimpleNamespace(
+                transcriptions=SimpleNamespace(
+                    with_raw_response=SimpleNamespace(create=create)
+                )
+            )
         )
         self._mocker.patch(_SEAM_TRANSCRIPTION_API, return_value=client)
 
@@ -159,7 +165,12 @@ class TranscriptionSeams:
         self._mocker.patch(_SEAM_LLM_FROM_OPENAI, return_value=fake_client)
 
     def install_audio_source(self, audio_bytes: BytesIO) -> None:
-        self._mocker.patch(_SEAM_AUDIO_SOURCE, return_value=audio_bytes)
+        self._mocker.patch(
+            _SEAM_AUDIO_SOURCE,
+            side_effect=lambda meeting_id, chunks=None: AudioSpool.from_bytes(
+                audio_bytes.getvalue()
+            ),
+        )
 
 
 def make_participant(speaker_id: str, name: str | None) -> Participant:
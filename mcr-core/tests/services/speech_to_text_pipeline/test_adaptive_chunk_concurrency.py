@@ -0,0 +1,182 @@
+"""Adaptive chunk concurrency against a local fake ASR endpoint.
+
+The fake server answers 429 whenever more requests are in flight than its
+capacity, like a saturated gateway. The real OpenAI client, with its own
+retries, talks to it over HTTP; only the chunk split is faked.
+"""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from mcr_meeting.app.infrastructure import transcription
+from mcr_meeting.app.infrastructure.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+)
+from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
+from mcr_meeting.app.schemas.transcription_schema import TimeSpan, TranscriptionInput
+
+_SEAM_SPLIT_AUDIO = (
+    "mcr_meeting.app.infrastructure.transcription.split_audio_on_timestamps"
+)
+
+_VERBOSE_JSON = json.dumps(
+    {
+        "text": "bonjour",
+        "language": "fr",
+        "duration": 1.0,
+        "segments": [
+            {
+                "id": 0,
+                "seek": 0,
+                "start": 0.0,
+                "end": 1.0,
+                "text": "bonjour",
+                "tokens": [],
+                "temperature": 0.0,
+                "avg_logprob": 0.0,
+                "compression_ratio": 1.0,
+                "no_speech_prob": 0.0,
+            }
+        ],
+    }
+).encode()
+
+
+class _FakeAsrServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(("127.0.0.1", 0), _FakeAsrHandler)
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.throttled = 0
+        self.served = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class _FakeAsrHandler(BaseHTTPRequestHandler):
+    server: _FakeAsrServer
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.in_flight += 1
+            throttle = self.server.in_flight > self.server.capacity
+            if throttle:
+                self.server.throttled += 1
+        try:
+            if throttle:
+                self._reply(429, b'{"error": {"message": "slow down"}}')
+            else:
+                time.sleep(0.02)
+                self._reply(200, _VERBOSE_JSON)
+                with self.server.lock:
+                    self.server.served += 1
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _reply(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        # Keeps the OpenAI client's retry backoff short.
+        self.send_header("retry-after-ms", "10")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _serve(capacity: int) -> Iterator[_FakeAsrServer]:
+    server = _FakeAsrServer(capacity)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def throttling_server() -> Iterator[_FakeAsrServer]:
+    yield from _serve(capacity=2)
+
+
+@pytest.fixture
+def idle_server() -> Iterator[_FakeAsrServer]:
+    yield from _serve(capacity=100)
+
+
+def _limiter(mocker: MockerFixture, initial: int) -> AdaptiveConcurrencyLimiter:
+    limiter = AdaptiveConcurrencyLimiter(
+        name="test",
+        initial=initial,
+        minimum=1,
+        maximum=8,
+        decrease_factor=0.5,
+        is_overload=transcription.chunk_concurrency._is_overload,
+    )
+    mocker.patch.object(transcription, "chunk_concurrency", limiter)
+    return limiter
+
+
+def _transcribe(
+    mocker: MockerFixture, server: _FakeAsrServer, chunk_count: int
+) -> list[object]:
+    mocker.patch.object(
+        transcription.api_settings, "TRANSCRIPTION_API_BASE_URL", server.url
+    )
+    mocker.patch.object(transcription.api_settings, "MAX_CONCURRENT_CHUNKS", 8)
+    # Until the window is cut, up to 8 calls race for 2 slots every 10ms: on a
+    # loaded machine a chunk can lose more than the default 6 retries in a row.
+    mocker.patch.object(transcription.api_settings, "MAX_RETRIES", 20)
+    mocker.patch(
+        _SEAM_SPLIT_AUDIO,
+        return_value=[
+            TranscriptionInput(
+                audio=np.zeros(1600, dtype=np.int16),
+                span=TimeSpan(start=idx * 10.0, end=(idx + 1) * 10.0),
+            )
+            for idx in range(chunk_count)
+        ],
+    )
+    return list(TranscriptionProcessor().transcribe(BytesIO(), []))
+
+
+def test_throttling_cuts_the_window_and_the_meeting_still_succeeds(
+    mocker: MockerFixture, throttling_server: _FakeAsrServer
+) -> None:
+    limiter = _limiter(mocker, initial=8)
+
+    segments = _transcribe(mocker, throttling_server, chunk_count=24)
+
+    assert len(segments) == 24
+    assert throttling_server.throttled > 0
+    assert limiter.window < 8
+
+
+def test_healthy_endpoint_grows_the_window(
+    mocker: MockerFixture, idle_server: _FakeAsrServer
+) -> None:
+    limiter = _limiter(mocker, initial=2)
+
+    segments = _transcribe(mocker, idle_server, chunk_count=24)
+
+    assert len(segments) == 24
+    assert idle_server.throttled == 0
+    assert limiter.window > 2
@@ -0,0 +1,155 @@
+"""Tests for the single-decode analysis graph in analyze_audio."""
+
+from collections.abc import Callable
+from io import BytesIO
+
+import ffmpeg
+import numpy as np
+import pytest
+import soundfile as sf
+from pytest_mock import MockerFixture
+
+from mcr_meeting.app.domain import audio
+from mcr_meeting.app.domain.audio import (
+    AudioAnalysis,
+    _measure_loudnorm_stats,
+    analyze_audio,
+    compute_spectral_flatness_on_silences,
+    split_audio_on_timestamps,
+)
+from mcr_meeting.app.domain.audio_levels import (
+    detect_silences,
+    mean_volume_db,
+)
+from mcr_meeting.app.domain.audio_spool import AudioSpool
+from mcr_meeting.app.exceptions.exceptions import InvalidAudioFileError
+from mcr_meeting.app.schemas.transcription_schema import TimeSpan
+
+
+def _analyze(buffer: BytesIO, measure_loudness: bool = False) -> AudioAnalysis:
+    with AudioSpool.from_bytes(buffer.getvalue()) as source:
+        return analyze_audio(source, measure_loudness=measure_loudness)
+
+
+class TestAnalyzeAudio:
+    @pytest.mark.parametrize("audio_format", ["wav", "mp3", "m4a"])
+    def test_pcm_view_matches_decoded_wav(
+        self, create_audio_buffer: Callable[[str], BytesIO], audio_format: str
+    ):
+        with _analyze(create_audio_buffer(audio_format)).audio as wav_audio:
+            samples, sample_rate = sf.read(wav_audio.path, dtype="int16")
+            assert sample_rate == 16000
+            assert samples.ndim == 1
+            np.testing.assert_array_equal(wav_audio.pcm(), samples)
+
+    def test_silent_audio_is_fully_silent(
+        self, create_silent_audio_buffer: Callable[[float], BytesIO]
+    ):
+        analysis = _analyze(create_silent_audio_buffer(5.0))
+        assert analysis.silence_ratio >= 0.95
+
+    def test_loudness_measured_only_on_request(
+        self, create_audio_buffer: Callable[[str], BytesIO]
+    ):
+        source = create_audio_buffer("wav")
+        assert _analyze(source).loudnorm_stats is None
+
+        analysis = _analyze(source, measure_loudness=True)
+        assert analysis.loudnorm_stats == _measure_loudnorm_stats(analysis.audio)
+
+    def test_reused_loudness_gives_same_flatness(
+        self, create_audio_buffer: Callable[[str], BytesIO]
+    ):
+        analysis = _analyze(create_audio_buffer("wav"), measure_loudness=True)
+        assert compute_spectral_flatness_on_silences(
+            analysis.audio, analysis.loudnorm_stats
+        ) == compute_spectral_flatness_on_silences(analysis.audio)
+
+    def test_invalid_input_raises(self):
+        with pytest.raises(InvalidAudioFileError):
+            _analyze(BytesIO(b"not audio"))
+
+    def test_failed_measurement_closes_the_wav(
+        self, create_audio_buffer: Callable[[str], BytesIO], mocker: MockerFixture
+    ):
+        mocker.patch.object(
+            audio,
+            "_parse_loudnorm_stats",
+            side_effect=RuntimeError("Could not parse loudnorm stats"),
+        )
+        close = mocker.spy(AudioSpool, "close")
+
+        with pytest.raises(InvalidAudioFileError, match="loudnorm"):
+            _analyze(create_audio_buffer("wav"), measure_loudness=True)
+
+        # The WAV being written, then the source.
+        assert close.call_count == 2
+
+
+class TestSplitAudioOnTimestamps:
+    def test_chunks_are_views_of_the_mapped_pcm(
+        self, create_audio_buffer: Callable[[str], BytesIO]
+    ):
+        spans = [TimeSpan(0.0, 0.5), TimeSpan(0.5, 1.25)]
+        with _analyze(create_audio_buffer("wav")).audio as wav_audio:
+            pcm = wav_audio.pcm()
+            chunks = split_audio_on_timestamps(wav_audio, spans)
+
+            assert [chunk.span for chunk in chunks] == spans
+            np.testing.assert_array_equal(chunks[0].audio, pcm[:8000])
+            np.testing.assert_array_equal(chunks[1].audio, pcm[8000:20000])
+            assert all(
+                isinstance(chunk.audio, np.memmap) and not chunk.audio.flags.owndata
+                for chunk in chunks
+            )
+
+
+class TestAudioAnalysisSilenceRatio:
+    def test_empty_audio_returns_one(self):
+        analysis = AudioAnalysis(AudioSpool(), 0.0, float("-inf"), [])
+        assert analysis.silence_ratio == 1.0
+
+    def test_ratio_is_capped_at_one(self):
+        analysis = AudioAnalysis(AudioSpool(), 2.0, -20.0, [(0.0, 1.5), (1.0, 2.5)])
+        assert analysis.silence_ratio == 1.0
+
+
+class TestInProcessLevelsMatchFfmpeg:
+    @pytest.mark.parametrize("noise_db", [-40.0, -25.0])
+    def test_same_mean_volume_and_silences(
+        self, create_audio_buffer: Callable[[str], BytesIO], noise_db: float
+    ):
+        wav_audio = _analyze(create_audio_buffer("wav")).audio
+        _, stderr = (
+            ffmpeg.input(wav_audio.path, format="wav")
+            .output(
+                "pipe:",
+                format="null",
+                af=f"volumedetect,silencedetect=noise={noise_db}dB:d=0.5",
+            )
+            .run(capture_stdout=True, capture_stderr=True)
+        )
+        stderr_text = stderr.decode()
+        (ffmpeg_mean_volume,) = [
+            float(line.split("mean_volume:")[1].split("dB")[0])
+            for line in stderr_text.splitlines()
+            if "mean_volume:" in line
+        ]
+        starts = [
+            float(line.split("silence_start:")[1])
+            for line in stderr_text.splitlines()
+            if "silence_start:" in line
+        ]
+        ends = [
+            float(line.split("silence_end:")[1].split("|")[0])
+            for line in stderr_text.splitlines()
+            if "silence_end:" in line
+        ]
+
+        pcm = wav_audio.pcm()
+        assert mean_volume_db(pcm) == ffmpeg_mean_volume
+        # ffmpeg prints timestamps with 6 significant digits.
+        assert detect_silences(pcm, noise_db, 0.5, 16000) == [
+            (pytest.approx(start, abs=1e-4), pytest.approx(end, abs=1e-4))
+            for start, end in zip(starts, ends, strict=True)
+        ]
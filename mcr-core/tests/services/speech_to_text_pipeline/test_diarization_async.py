@@ -8,6 +8,7 @@ import pytest
 
 from mcr_meeting.app.exceptions.exceptions import (
     DiarizationError,
+    DiarizationRetryableError,
     MCRException,
     TransientInfraError,
     UnknownDiarizationStatus,
@@ -17,7 +18,11 @@ from mcr_meeting.app.infrastructure.diarization import (
     DiarizationProcessor,
     next_poll_interval,
 )
-from mcr_meeting.app.schemas.transcription_schema import DiarizationJobResponse
+from mcr_meeting.app.schemas.transcription_schema import (
+    ArtifactManifest,
+    DiarizationJobResponse,
+    DiarizationJobState,
+)
 
 FAST = dp.api_settings.DIARIZATION_POLL_FAST_INTERVAL_SECONDS
 SLOW = dp.api_settings.DIARIZATION_POLL_SLOW_INTERVAL_SECONDS
@@ -329,6 +334,75 @@ class TestPollCadence:
         assert intervals == [SLOW, FAST, SLOW]
 
 
+def _job_state(submitted_at: float, **fields: object) -> DiarizationJobState:
+    return DiarizationJobState(
+        job_id="job-1",
+        submitted_at=submitted_at,
+        phase_started_at=submitted_at,
+        manifest=ArtifactManifest(source_audio_hash="a", config_fingerprint="b"),
+        **fields,
+    )
+
+
+class TestPollJobOnce:
+    def _poll(
+        self, client: MagicMock, job: DiarizationJobState, now: float
+    ) -> dp.DiarizationJobPoll:
+        processor = DiarizationProcessor()
+        with (
+            patch.object(processor, "_get_http_client", return_value=client),
+            patch.object(dp.time, "time", return_value=now),
+        ):
+            return processor.poll_job(job)
+
+    def test_pending_job_follows_the_wall_clock_cadence(self) -> None:
+        client = _client_returning({"status": "pending", "queue_position": 8})
+
+        early = self._poll(client, _job_state(1000.0), now=1000.0 + 1)
+        client = _client_returning({"status": "pending", "queue_position": 8})
+        late = self._poll(client, _job_state(1000.0), now=1000.0 + Y + 1)
+
+        assert (early.segments, early.next_poll_in) == (None, FAST)
+        assert late.next_poll_in == SLOW
+
+    def test_processing_transition_is_carried_in_the_job_state(self) -> None:
+        client = _client_returning({"status": "processing"})
+
+        poll = self._poll(client, _job_state(0.0), now=5000.0)
+
+        assert poll.next_poll_in == FAST
+        assert poll.job.seen_processing
+        assert poll.job.phase_started_at == 5000.0
+
+    def test_completed_job_returns_segments(self) -> None:
+        client = _client_returning(
+            {
+                "status": "completed",
+                "result": {
+                    "segments": [{"speaker": "SPEAKER_00", "start": 0.0, "end": 1.0}]
+                },
+            }
+        )
+
+        poll = self._poll(client, _job_state(0.0), now=10.0)
+
+        assert [s.speaker for s in poll.segments or []] == ["LOCUTEUR_00"]
+
+    def test_retryable_failure_is_raised(self) -> None:
+        client = _client_returning({"status": "failed", "error": "stale: pending"})
+
+        with pytest.raises(DiarizationRetryableError):
+            self._poll(client, _job_state(0.0), now=10.0)
+
+    def test_deadline_counts_from_submission(self) -> None:
+        client = _client_returning({"status": "pending"})
+        deadline = dp.celery_settings.REDIS_VISIBILITY_TIMEOUT
+
+        with pytest.raises(DiarizationError, match="deadline"):
+            self._poll(client, _job_state(0.0), now=deadline + 1.0)
+        client.get.assert_not_called()
+
+
 class TestDiarizeRouting:
     def test_diarize_always_uses_the_async_job_api(self) -> None:
         processor = DiarizationProcessor()
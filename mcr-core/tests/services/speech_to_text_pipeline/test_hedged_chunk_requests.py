@@ -0,0 +1,258 @@
+"""Hedged chunk requests against a local fake ASR endpoint.
+
+The fake server answers every request after a short delay, except the ones
+scripted as stragglers. The real OpenAI client talks to it over HTTP; only
+the chunk split is faked.
+"""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from mcr_meeting.app.infrastructure import transcription
+from mcr_meeting.app.infrastructure.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+)
+from mcr_meeting.app.infrastructure.request_hedging import RequestHedger
+from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
+from mcr_meeting.app.infrastructure.unleash import FeatureFlag
+from mcr_meeting.app.schemas.transcription_schema import TimeSpan, TranscriptionInput
+from tests.mocks.in_memory_feature_flags import InMemoryFeatureFlagClient
+
+_SEAM_SPLIT_AUDIO = (
+    "mcr_meeting.app.infrastructure.transcription.split_audio_on_timestamps"
+)
+
+_FAST_SECONDS = 0.02
+
+
+def _verbose_json(text: str) -> bytes:
+    return json.dumps(
+        {
+            "text": text,
+            "language": "fr",
+            "duration": 1.0,
+            "segments": [
+                {
+                    "id": 0,
+                    "seek": 0,
+                    "start": 0.0,
+                    "end": 1.0,
+                    "text": text,
+                    "tokens": [],
+                    "temperature": 0.0,
+                    "avg_logprob": 0.0,
+                    "compression_ratio": 1.0,
+                    "no_speech_prob": 0.0,
+                }
+            ],
+        }
+    ).encode()
+
+
+class _FakeAsrServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, stragglers: set[int], straggler_seconds: float) -> None:
+        super().__init__(("127.0.0.1", 0), _FakeAsrHandler)
+        self.stragglers = stragglers
+        self.straggler_seconds = straggler_seconds
+        self.lock = threading.Lock()
+        self.received = 0
+        self.client_ports: set[int] = set()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class _FakeAsrHandler(BaseHTTPRequestHandler):
+    server: _FakeAsrServer
+    # Keeps connections open, so that the test can tell whether they are reused.
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            request_index = self.server.received
+            self.server.received += 1
+            self.server.client_ports.add(self.client_address[1])
+        straggler = request_index in self.server.stragglers
+        time.sleep(self.server.straggler_seconds if straggler else _FAST_SECONDS)
+        body = _verbose_json("slow" if straggler else "fast")
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            # The client moved on with the hedged answer.
+            pass
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _serve(stragglers: set[int], straggler_seconds: float) -> Iterator[_FakeAsrServer]:
+    server = _FakeAsrServer(stragglers, straggler_seconds)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def server() -> Iterator[_FakeAsrServer]:
+    yield from _serve(stragglers=set(), straggler_seconds=0.0)
+
+
+# Chunks are sent one at a time: the 10th request is the 10th chunk.
+@pytest.fixture
+def server_with_a_straggler() -> Iterator[_FakeAsrServer]:
+    yield from _serve(stragglers={9}, straggler_seconds=1.0)
+
+
+@pytest.fixture
+def server_with_a_long_straggler() -> Iterator[_FakeAsrServer]:
+    yield from _serve(stragglers={9}, straggler_seconds=5.0)
+
+
+def _hedger(mocker: MockerFixture, budget_burst: float) -> RequestHedger:
+    hedger = RequestHedger(
+        name="test",
+        percentile=95,
+        # The chunks before the straggler are only observed: a fast one slowed
+        # down by a loaded machine cannot spend the budget first.
+        min_samples=9,
+        window=50,
+        budget_ratio=0.0,
+        budget_burst=budget_burst,
+    )
+    mocker.patch.object(transcription, "chunk_hedger", hedger)
+    return hedger
+
+
+def _limiter(mocker: MockerFixture, window: int) -> AdaptiveConcurrencyLimiter:
+    # The process-wide limiter may have been cut down by earlier tests.
+    limiter = AdaptiveConcurrencyLimiter(
+        name="test",
+        initial=window,
+        minimum=1,
+        maximum=window,
+        decrease_factor=0.5,
+        is_overload=lambda e: False,
+    )
+    mocker.patch.object(transcription, "chunk_concurrency", limiter)
+    return limiter
+
+
+def _transcribe(
+    mocker: MockerFixture, server: _FakeAsrServer, chunk_count: int
+) -> list[str]:
+    mocker.patch.object(
+        transcription.api_settings, "TRANSCRIPTION_API_BASE_URL", server.url
+    )
+    mocker.patch.object(transcription.api_settings, "MAX_CONCURRENT_CHUNKS", 1)
+    mocker.patch(
+        _SEAM_SPLIT_AUDIO,
+        return_value=[
+            TranscriptionInput(
+                audio=np.zeros(1600, dtype=np.int16),
+                span=TimeSpan(start=idx * 10.0, end=(idx + 1) * 10.0),
+            )
+            for idx in range(chunk_count)
+        ],
+    )
+    segments = TranscriptionProcessor().transcribe(BytesIO(), [])
+    return [segment.text for segment in segments]
+
+
+def test_straggler_chunk_is_answered_by_its_hedged_request(
+    mocker: MockerFixture,
+    feature_flags: InMemoryFeatureFlagClient,
+    server_with_a_long_straggler: _FakeAsrServer,
+) -> None:
+    feature_flags.enable(FeatureFlag.TRANSCRIPTION_HEDGED_REQUESTS)
+    hedger = _hedger(mocker, budget_burst=1)
+    limiter = _limiter(mocker, window=2)
+
+    started_at = time.monotonic()
+    texts = _transcribe(mocker, server_with_a_long_straggler, chunk_count=12)
+
+    assert (
+        time.monotonic() - started_at < server_with_a_long_straggler.straggler_seconds
+    )
+    assert texts == ["fast"] * 12
+    assert server_with_a_long_straggler.received == 13
+    assert (hedger.stats.hedges, hedger.stats.wins) == (1, 1)
+    assert limiter.in_flight == 0
+
+
+def test_hedged_chunk_calls_reuse_their_connection(
+    mocker: MockerFixture,
+    feature_flags: InMemoryFeatureFlagClient,
+    server: _FakeAsrServer,
+) -> None:
+    feature_flags.enable(FeatureFlag.TRANSCRIPTION_HEDGED_REQUESTS)
+    _hedger(mocker, budget_burst=0)
+
+    _transcribe(mocker, server, chunk_count=6)
+    _transcribe(mocker, server, chunk_count=6)
+
+    assert server.received == 12
+    assert len(server.client_ports) == 1
+
+
+def test_hedge_is_not_sent_without_a_free_slot(
+    mocker: MockerFixture,
+    feature_flags: InMemoryFeatureFlagClient,
+    server_with_a_straggler: _FakeAsrServer,
+) -> None:
+    feature_flags.enable(FeatureFlag.TRANSCRIPTION_HEDGED_REQUESTS)
+    hedger = _hedger(mocker, budget_burst=1)
+    limiter = _limiter(mocker, window=1)
+
+    texts = _transcribe(mocker, server_with_a_straggler, chunk_count=12)
+
+    assert texts[9] == "slow"
+    assert server_with_a_straggler.received == 12
+    assert hedger.stats.hedges == 0
+    assert limiter.in_flight == 0
+
+
+def test_exhausted_budget_waits_for_the_straggler(
+    mocker: MockerFixture,
+    feature_flags: InMemoryFeatureFlagClient,
+    server_with_a_straggler: _FakeAsrServer,
+) -> None:
+    feature_flags.enable(FeatureFlag.TRANSCRIPTION_HEDGED_REQUESTS)
+    hedger = _hedger(mocker, budget_burst=0)
+
+    texts = _transcribe(mocker, server_with_a_straggler, chunk_count=12)
+
+    assert texts[9] == "slow"
+    assert server_with_a_straggler.received == 12
+    assert hedger.stats.hedges == 0
+
+
+def test_flag_off_sends_each_chunk_once(
+    mocker: MockerFixture, server_with_a_straggler: _FakeAsrServer
+) -> None:
+    hedger = _hedger(mocker, budget_burst=1)
+
+    texts = _transcribe(mocker, server_with_a_straggler, chunk_count=12)
+
+    assert texts[9] == "slow"
+    assert server_with_a_straggler.received == 12
+    assert hedger.stats.calls == 0
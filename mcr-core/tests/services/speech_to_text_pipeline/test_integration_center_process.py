@@ -5,6 +5,7 @@ from io import BytesIO
 import pytest
 
 from mcr_meeting.app.configs.base import WhisperTranscriptionSettings
+from mcr_meeting.app.domain.audio_spool import AudioSpool
 from mcr_meeting.app.exceptions.exceptions import (
     DiarizationError,
     TranscriptionError,
@@ -35,11 +36,12 @@ def run_the_code_to_test(
     if not diarization_result:
         return []
 
-    return transcribe_diarized_audio(
-        pre_processed_audio_bytes,
-        diarization_result,
-        TranscriptionProcessor(),
-    )
+    with AudioSpool.from_bytes(pre_processed_audio_bytes.getvalue()) as audio:
+        return transcribe_diarized_audio(
+            audio,
+            diarization_result,
+            TranscriptionProcessor(),
+        )
 
 
 @pytest.mark.parametrize(
@@ -6,6 +6,7 @@ import pytest
 import soundfile as sf
 
 from mcr_meeting.app.configs.base import AudioSettings
+from mcr_meeting.app.domain.audio_spool import AudioSpool
 from mcr_meeting.app.exceptions.exceptions import SilentAudioError
 from mcr_meeting.app.infrastructure.unleash import FeatureFlag
 from mcr_meeting.app.use_cases.transcription._shared.preprocess_audio import (
@@ -14,6 +15,14 @@ from mcr_meeting.app.use_cases.transcription._shared.preprocess_audio import (
 from tests.mocks.in_memory_feature_flags import InMemoryFeatureFlagClient
 
 
+def _preprocess(audio_buffer: BytesIO) -> bytes:
+    with (
+        AudioSpool.from_bytes(audio_buffer.getvalue()) as audio,
+        preprocess_audio(audio) as preprocessed,
+    ):
+        return preprocessed.read_bytes()
+
+
 @pytest.mark.parametrize("feature_flag_enabled", [True, False])
 @pytest.mark.parametrize("audio_format", ["mp3", "mp4", "m4a", "wav", "mov"])
 def test_integration_pre_process(
@@ -26,13 +35,10 @@ def test_integration_pre_process(
         feature_flags.enable(FeatureFlag.AUDIO_NOISE_FILTERING)
     audio_buffer = create_audio_buffer(audio_format)
 
-    processed_bytes = preprocess_audio(audio_buffer)
+    result_data = _preprocess(audio_buffer)
 
     assert FeatureFlag.AUDIO_NOISE_FILTERING in feature_flags.calls
 
-    assert isinstance(processed_bytes, BytesIO)
-
-    result_data = processed_bytes.getvalue()
     assert len(result_data) > 0
 
     assert result_data[:4] == b"RIFF"
@@ -57,7 +63,7 @@ def test_pre_process_skips_filtering_when_audio_is_clean(
     mocks.mock_is_noisy.return_value = False
     audio_buffer = create_audio_buffer("wav")
 
-    preprocess_audio(audio_buffer)
+    _preprocess(audio_buffer)
 
     mocks.mock_is_noisy.assert_called_once()
 
@@ -68,10 +74,10 @@ def test_pre_process_applies_filtering_when_audio_is_noisy(
 ):
     mocks = mock_noise_detection_dependencies
     mocks.mock_is_noisy.return_value = True
-    mocks.mock_filter_noise.return_value = BytesIO(b"filtered")
+    mocks.mock_filter_noise.return_value = AudioSpool.from_bytes(b"filtered")
     audio_buffer = create_audio_buffer("wav")
 
-    preprocess_audio(audio_buffer)
+    _preprocess(audio_buffer)
 
     mocks.mock_is_noisy.assert_called_once()
     mocks.mock_filter_noise.assert_called_once()
@@ -83,7 +89,7 @@ def test_pre_process_recovers_phase_inverted_audio_when_downmix_enabled(
 ):
     feature_flags.enable(FeatureFlag.AUDIO_PHASE_AWARE_DOWNMIX)
 
-    preprocess_audio(create_phase_inverted_stereo_buffer(3.0))
+    _preprocess(create_phase_inverted_stereo_buffer(3.0))
 
 
 def test_pre_process_flags_phase_inverted_audio_when_downmix_disabled(
@@ -93,4 +99,4 @@ def test_pre_process_flags_phase_inverted_audio_when_downmix_disabled(
     feature_flags.disable(FeatureFlag.AUDIO_PHASE_AWARE_DOWNMIX)
 
     with pytest.raises(SilentAudioError):
-        preprocess_audio(create_phase_inverted_stereo_buffer(3.0))
+        _preprocess(create_phase_inverted_stereo_buffer(3.0))
@@ -33,7 +33,7 @@ def _make_transcription_inputs(chunk_count: int) -> list[TranscriptionInput]:
     # can recover which chunk it received regardless of call order
     return [
         TranscriptionInput(
-            audio=np.full(4, idx, dtype=np.float32),
+            audio=np.full(4, idx, dtype=np.int16),
             span=TimeSpan(start=idx * 10.0, end=(idx + 1) * 10.0),
         )
         for idx in range(chunk_count)
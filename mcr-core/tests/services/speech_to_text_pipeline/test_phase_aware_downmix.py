@@ -1,17 +1,20 @@
-"""Tests for the phase-aware mono downmix in audio_bytes_to_wav_bytes."""
+"""Tests for the phase-aware mono downmix in analyze_audio."""
 
 import tempfile
 from collections.abc import Callable
 from io import BytesIO
 
 import pytest
+from pydub import AudioSegment
 
+from mcr_meeting.app.domain import audio
 from mcr_meeting.app.domain.audio import (
     _is_phase_inverted_stereo,
-    audio_bytes_to_wav_bytes,
-    check_audio_is_not_silent,
-    compute_silence_ratio,
+    _stereo_mid_side_db,
+    analyze_audio,
+    check_silence_ratio,
 )
+from mcr_meeting.app.domain.audio_spool import AudioSpool
 from mcr_meeting.app.exceptions.exceptions import SilentAudioError
 
 
@@ -21,6 +24,13 @@ def _to_temp_file(buffer: BytesIO) -> str:
         return tmp.name
 
 
+def _silence_ratio(buffer: BytesIO, phase_aware_downmix: bool) -> float:
+    with AudioSpool.from_bytes(buffer.getvalue()) as source:
+        analysis = analyze_audio(source, phase_aware_downmix=phase_aware_downmix)
+    with analysis.audio:
+        return analysis.silence_ratio
+
+
 class TestIsPhaseInvertedStereo:
     def test_true_for_phase_inverted_stereo(
         self, create_phase_inverted_stereo_buffer: Callable[[float], BytesIO]
@@ -38,44 +48,85 @@ class TestIsPhaseInvertedStereo:
         path = _to_temp_file(create_audio_buffer("wav"))
         assert _is_phase_inverted_stereo(path) is False
 
+    def test_only_the_detection_window_is_decoded(
+        self,
+        create_phase_inverted_stereo_buffer: Callable[[float], BytesIO],
+        create_inphase_stereo_buffer: Callable[[float], BytesIO],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        # 1 s of inverted stereo followed by 5 s of normal stereo.
+        recording = AudioSegment.from_wav(
+            create_phase_inverted_stereo_buffer(1.0)
+        ) + AudioSegment.from_wav(create_inphase_stereo_buffer(5.0))
+        buffer = BytesIO()
+        recording.export(buffer, format="wav")
+        path = _to_temp_file(buffer)
+
+        assert _is_phase_inverted_stereo(path) is False
+
+        monkeypatch.setattr(
+            audio.noise_detection_settings, "PHASE_DETECTION_WINDOW_SECONDS", 1.0
+        )
+        assert _is_phase_inverted_stereo(path) is True
+
+
+class TestStereoMidSideDb:
+    def test_inverted_channels_cancel_the_mid(
+        self, create_phase_inverted_stereo_buffer: Callable[[float], BytesIO]
+    ):
+        mid_db, side_db = _stereo_mid_side_db(
+            _to_temp_file(create_phase_inverted_stereo_buffer(3.0))
+        )
+        assert side_db > 0
+        assert mid_db < side_db - 30
+
+    def test_identical_channels_have_no_side(
+        self, create_inphase_stereo_buffer: Callable[[float], BytesIO]
+    ):
+        mid_db, side_db = _stereo_mid_side_db(
+            _to_temp_file(create_inphase_stereo_buffer(3.0))
+        )
+        assert mid_db > 0
+        assert side_db == float("-inf")
+
 
 class TestPhaseAwareDownmix:
     def test_phase_inverted_stereo_is_cancelled_without_fix(
         self, create_phase_inverted_stereo_buffer: Callable[[float], BytesIO]
     ):
         """Reproduces the bug: plain averaging downmix silences the speech."""
-        wav = audio_bytes_to_wav_bytes(
+        ratio = _silence_ratio(
             create_phase_inverted_stereo_buffer(3.0), phase_aware_downmix=False
         )
-        assert compute_silence_ratio(wav) >= 0.95
+        assert ratio >= 0.95
 
     def test_phase_inverted_stereo_recovered_with_fix(
         self, create_phase_inverted_stereo_buffer: Callable[[float], BytesIO]
     ):
         """The fix uses the side signal, recovering the speech."""
-        wav = audio_bytes_to_wav_bytes(
+        ratio = _silence_ratio(
             create_phase_inverted_stereo_buffer(3.0), phase_aware_downmix=True
         )
-        assert compute_silence_ratio(wav) < 0.5
-        check_audio_is_not_silent(wav)  # Should not raise
+        assert ratio < 0.5
+        check_silence_ratio(ratio)  # Should not raise
 
     def test_inphase_stereo_unaffected_by_fix(
         self, create_inphase_stereo_buffer: Callable[[float], BytesIO]
     ):
         """Normal stereo keeps the averaging downmix and stays intelligible."""
-        wav = audio_bytes_to_wav_bytes(
+        ratio = _silence_ratio(
             create_inphase_stereo_buffer(3.0), phase_aware_downmix=True
         )
-        assert compute_silence_ratio(wav) < 0.5
-        check_audio_is_not_silent(wav)  # Should not raise
+        assert ratio < 0.5
+        check_silence_ratio(ratio)  # Should not raise
 
 
 class TestPhaseInvertedSilentAudioError:
     def test_pre_process_path_raises_without_fix(
         self, create_phase_inverted_stereo_buffer: Callable[[float], BytesIO]
     ):
-        wav = audio_bytes_to_wav_bytes(
+        ratio = _silence_ratio(
             create_phase_inverted_stereo_buffer(3.0), phase_aware_downmix=False
         )
         with pytest.raises(SilentAudioError):
-            check_audio_is_not_silent(wav)
+            check_silence_ratio(ratio)
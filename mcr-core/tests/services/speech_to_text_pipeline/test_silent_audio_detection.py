@@ -3,43 +3,41 @@ from io import BytesIO
 
 import pytest
 
-from mcr_meeting.app.domain.audio import (
-    check_audio_is_not_silent,
-    compute_silence_ratio,
-)
+from mcr_meeting.app.domain.audio import analyze_audio, check_silence_ratio
+from mcr_meeting.app.domain.audio_spool import AudioSpool
 from mcr_meeting.app.exceptions.exceptions import SilentAudioError
 
 
-class TestComputeSilenceRatio:
+def _silence_ratio(buffer: BytesIO) -> float:
+    with AudioSpool.from_bytes(buffer.getvalue()) as source:
+        analysis = analyze_audio(source)
+    with analysis.audio:
+        return analysis.silence_ratio
+
+
+class TestSilenceRatio:
     def test_silent_audio_has_ratio_near_one(
         self, create_silent_audio_buffer: Callable[[float], BytesIO]
     ):
-        wav = create_silent_audio_buffer(5.0)
-        ratio = compute_silence_ratio(wav)
+        ratio = _silence_ratio(create_silent_audio_buffer(5.0))
         assert ratio >= 0.95
 
     def test_non_silent_audio_has_low_ratio(
         self, create_audio_buffer: Callable[[str], BytesIO]
     ):
-        wav = create_audio_buffer("wav")
-        ratio = compute_silence_ratio(wav)
+        ratio = _silence_ratio(create_audio_buffer("wav"))
         assert ratio < 0.5
 
-    def test_empty_audio_returns_one(self):
-        wav = BytesIO(b"\x00" * 44)  # Header only, no PCM data
-        assert compute_silence_ratio(wav) == 1.0
-
 
-class TestCheckAudioIsNotSilent:
+class TestCheckSilenceRatio:
     def test_raises_on_silent_audio(
         self, create_silent_audio_buffer: Callable[[float], BytesIO]
     ):
-        wav = create_silent_audio_buffer(5.0)
+        ratio = _silence_ratio(create_silent_audio_buffer(5.0))
         with pytest.raises(SilentAudioError, match="Silent audio detected"):
-            check_audio_is_not_silent(wav)
+            check_silence_ratio(ratio)
 
     def test_passes_on_non_silent_audio(
         self, create_audio_buffer: Callable[[str], BytesIO]
     ):
-        wav = create_audio_buffer("wav")
-        check_audio_is_not_silent(wav)  # Should not raise
+        check_silence_ratio(_silence_ratio(create_audio_buffer("wav")))
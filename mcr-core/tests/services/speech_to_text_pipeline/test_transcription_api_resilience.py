@@ -43,8 +43,8 @@ def _timeout_error() -> Exception:
 def _run_chunk_with(exc: Exception) -> None:
     processor = TranscriptionProcessor()
     client = MagicMock()
-    client.audio.transcriptions.create.side_effect = exc
-    audio = np.zeros(16000, dtype=np.float32)
+    client.audio.transcriptions.with_raw_response.create.side_effect = exc
+    audio = np.zeros(16000, dtype=np.int16)
 
     with patch.object(processor, "_get_openai_client", return_value=client):
         processor._transcribe_audio_chunk_api(audio)
@@ -87,8 +87,10 @@ class TestDefinitiveFaultsFailLoud:
         client = MagicMock()
         response = MagicMock()
         response.segments = []
-        client.audio.transcriptions.create.return_value = response
-        audio = np.zeros(16000, dtype=np.float32)
+        raw_response = client.audio.transcriptions.with_raw_response.create.return_value
+        raw_response.retries_taken = 0
+        raw_response.parse.return_value = response
+        audio = np.zeros(16000, dtype=np.int16)
 
         with (
             patch.object(processor, "_get_openai_client", return_value=client),
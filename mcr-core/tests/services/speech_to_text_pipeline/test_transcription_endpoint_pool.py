@@ -0,0 +1,215 @@
+"""Chunk calls spread over several local fake ASR replicas.
+
+Each fake server answers after a short delay, or with a 503 while it is marked
+down. The real OpenAI client talks to them over HTTP; only the chunk split is
+faked.
+"""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from mcr_meeting.app.infrastructure import transcription
+from mcr_meeting.app.infrastructure.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+)
+from mcr_meeting.app.infrastructure.endpoint_pool import BreakerState, EndpointPool
+from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
+from mcr_meeting.app.schemas.transcription_schema import TimeSpan, TranscriptionInput
+
+_SEAM_SPLIT_AUDIO = (
+    "mcr_meeting.app.infrastructure.transcription.split_audio_on_timestamps"
+)
+
+_ANSWER_SECONDS = 0.05
+
+
+def _verbose_json(text: str) -> bytes:
+    return json.dumps(
+        {
+            "text": text,
+            "language": "fr",
+            "duration": 1.0,
+            "segments": [
+                {
+                    "id": 0,
+                    "seek": 0,
+                    "start": 0.0,
+                    "end": 1.0,
+                    "text": text,
+                    "tokens": [],
+                    "temperature": 0.0,
+                    "avg_logprob": 0.0,
+                    "compression_ratio": 1.0,
+                    "no_speech_prob": 0.0,
+                }
+            ],
+        }
+    ).encode()
+
+
+class _FakeAsrReplica(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, name: str) -> None:
+        super().__init__(("127.0.0.1", 0), _FakeAsrHandler)
+        self.name = name
+        self.down = False
+        self.lock = threading.Lock()
+        self.received = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class _FakeAsrHandler(BaseHTTPRequestHandler):
+    server: _FakeAsrReplica
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.received += 1
+        if self.server.down:
+            status, body = 503, b'{"error": {"message": "unavailable"}}'
+        else:
+            time.sleep(_ANSWER_SECONDS)
+            status, body = 200, _verbose_json(self.server.name)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def replicas() -> Iterator[list[_FakeAsrReplica]]:
+    servers = [_FakeAsrReplica(name) for name in ("a", "b", "c")]
+    for server in servers:
+        threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+    try:
+        yield servers
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+
+def _pool(mocker: MockerFixture, cooldown_seconds: float = 60.0) -> EndpointPool:
+    pool = EndpointPool(
+        name="test",
+        failure_threshold=2,
+        cooldown_seconds=cooldown_seconds,
+        is_failure=lambda e: isinstance(e, transcription.TranscriptionTransientError),
+    )
+    mocker.patch.object(transcription, "chunk_endpoints", pool)
+    return pool
+
+
+def _transcribe(
+    mocker: MockerFixture,
+    replicas: list[_FakeAsrReplica],
+    chunk_count: int,
+    concurrency: int,
+) -> list[str]:
+    settings = transcription.api_settings
+    mocker.patch.object(settings, "TRANSCRIPTION_API_BASE_URL", replicas[0].url)
+    mocker.patch.object(
+        settings,
+        "TRANSCRIPTION_API_REPLICA_BASE_URLS",
+        [replica.url for replica in replicas[1:]],
+    )
+    mocker.patch.object(settings, "REPLICA_MAX_RETRIES", 0)
+    mocker.patch.object(settings, "MAX_CONCURRENT_CHUNKS", concurrency)
+    mocker.patch.object(
+        transcription,
+        "chunk_concurrency",
+        AdaptiveConcurrencyLimiter(
+            name="test",
+            initial=concurrency,
+            minimum=1,
+            maximum=concurrency,
+            decrease_factor=0.5,
+            is_overload=transcription.chunk_concurrency._is_overload,
+        ),
+    )
+    mocker.patch(
+        _SEAM_SPLIT_AUDIO,
+        return_value=[
+            TranscriptionInput(
+                audio=np.zeros(1600, dtype=np.int16),
+                span=TimeSpan(start=idx * 10.0, end=(idx + 1) * 10.0),
+            )
+            for idx in range(chunk_count)
+        ],
+    )
+    segments = TranscriptionProcessor().transcribe(BytesIO(), [])
+    return [segment.text for segment in segments]
+
+
+def test_concurrent_chunks_are_spread_over_the_replicas(
+    mocker: MockerFixture, replicas: list[_FakeAsrReplica]
+) -> None:
+    _pool(mocker)
+
+    texts = _transcribe(mocker, replicas, chunk_count=12, concurrency=3)
+
+    assert len(texts) == 12
+    assert sum(replica.received for replica in replicas) == 12
+    assert all(replica.received >= 2 for replica in replicas)
+
+
+def test_down_replica_is_failed_over_then_left_out(
+    mocker: MockerFixture, replicas: list[_FakeAsrReplica]
+) -> None:
+    pool = _pool(mocker)
+    replicas[1].down = True
+
+    texts = _transcribe(mocker, replicas, chunk_count=12, concurrency=1)
+
+    assert len(texts) == 12
+    assert "b" not in texts
+    assert replicas[1].received == 2
+    states = {endpoint.url: endpoint.state for endpoint in pool.health()}
+    assert states[replicas[1].url] == BreakerState.OPEN
+
+
+def test_recovered_replica_is_probed_back_into_rotation(
+    mocker: MockerFixture, replicas: list[_FakeAsrReplica]
+) -> None:
+    pool = _pool(mocker, cooldown_seconds=0.2)
+    replicas[1].down = True
+    _transcribe(mocker, replicas, chunk_count=6, concurrency=1)
+
+    replicas[1].down = False
+    time.sleep(0.3)
+    texts = _transcribe(mocker, replicas, chunk_count=6, concurrency=1)
+
+    assert "b" in texts
+    states = {endpoint.url: endpoint.state for endpoint in pool.health()}
+    assert states[replicas[1].url] == BreakerState.CLOSED
+
+
+def test_every_replica_down_fails_the_chunk_as_transient(
+    mocker: MockerFixture, replicas: list[_FakeAsrReplica]
+) -> None:
+    _pool(mocker)
+    for replica in replicas:
+        replica.down = True
+
+    with pytest.raises(transcription.TranscriptionTransientError):
+        _transcribe(mocker, replicas, chunk_count=1, concurrency=1)
+
+    assert [replica.received for replica in replicas] == [1, 1, 1]
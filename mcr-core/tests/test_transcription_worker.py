@@ -10,6 +10,8 @@ from mcr_meeting.app.exceptions.exceptions import (
     InvalidAudioFileError,
     S3TransientError,
 )
+from mcr_meeting.app.infrastructure.unleash import FeatureFlag
+from tests.mocks.in_memory_feature_flags import InMemoryFeatureFlagClient
 
 MEETING_ID = 123
 OWNER = "owner-uuid"
@@ -26,13 +28,84 @@ class TestTaskDelegation:
         self, mocker: MockerFixture
     ) -> None:
         start = _patch_start_transcription(mocker)
-        run = mocker.patch.object(tw, "run_diarization")
+        run = mocker.patch.object(tw, "start_diarization", return_value=None)
+        replace = mocker.patch.object(tw.diarize, "replace")
 
         tw.diarize(MEETING_ID, OWNER)
 
         start.assert_called_once_with(MEETING_ID)
         run.assert_called_once()
         assert run.call_args.args[0] == MEETING_ID
+        replace.assert_not_called()
+
+    def test_diarize_hands_a_submitted_job_to_a_delayed_poll(
+        self, mocker: MockerFixture
+    ) -> None:
+        _patch_start_transcription(mocker)
+        mocker.patch.object(tw, "start_diarization", return_value=10.0)
+        replace = mocker.patch.object(tw.diarize, "replace", side_effect=Ignore())
+
+        with pytest.raises(Ignore):
+            tw.diarize(MEETING_ID, OWNER)
+
+        (signature,) = replace.call_args.args
+        assert signature.task == tw.MCRTranscriptionTasks.POLL_DIARIZATION
+        assert tuple(signature.args) == (MEETING_ID, OWNER)
+        assert signature.options["countdown"] == 10.0
+        assert signature.immutable
+
+    def test_diarize_starts_the_speculative_transcription_of_a_submitted_job(
+        self, mocker: MockerFixture, feature_flags: InMemoryFeatureFlagClient
+    ) -> None:
+        feature_flags.enable(FeatureFlag.TRANSCRIPTION_SPECULATIVE_WINDOWS)
+        _patch_start_transcription(mocker)
+        mocker.patch.object(tw, "start_diarization", return_value=10.0)
+        mocker.patch.object(tw.diarize, "replace", side_effect=Ignore())
+        speculate = mocker.patch.object(tw.speculative_transcribe, "delay")
+
+        with pytest.raises(Ignore):
+            tw.diarize(MEETING_ID, OWNER)
+
+        speculate.assert_called_once_with(MEETING_ID, OWNER)
+
+    def test_no_speculation_once_the_diarization_is_stored(
+        self, mocker: MockerFixture, feature_flags: InMemoryFeatureFlagClient
+    ) -> None:
+        feature_flags.enable(FeatureFlag.TRANSCRIPTION_SPECULATIVE_WINDOWS)
+        _patch_start_transcription(mocker)
+        mocker.patch.object(tw, "start_diarization", return_value=None)
+        speculate = mocker.patch.object(tw.speculative_transcribe, "delay")
+
+        tw.diarize(MEETING_ID, OWNER)
+
+        speculate.assert_not_called()
+
+    def test_speculative_transcription_delegates_outside_the_pipeline(
+        self, mocker: MockerFixture
+    ) -> None:
+        run = mocker.patch.object(tw, "run_speculative_transcription")
+
+        tw.speculative_transcribe(MEETING_ID, OWNER)
+
+        assert run.call_args.args[0] == MEETING_ID
+        # Its failure must not mark the meeting failed.
+        assert not isinstance(tw.speculative_transcribe, tw.TranscriptionPipelineTask)
+
+    def test_poll_reschedules_itself_until_the_job_is_done(
+        self, mocker: MockerFixture
+    ) -> None:
+        poll = mocker.patch.object(tw, "poll_diarization", side_effect=[90.0, None])
+        replace = mocker.patch.object(
+            tw.poll_diarization_job, "replace", side_effect=Ignore()
+        )
+
+        with pytest.raises(Ignore):
+            tw.poll_diarization_job(MEETING_ID, OWNER)
+        tw.poll_diarization_job(MEETING_ID, OWNER)
+
+        assert poll.call_count == 2
+        replace.assert_called_once()
+        assert replace.call_args.args[0].options["countdown"] == 90.0
 
     def test_transcribe_chunks_delegates(self, mocker: MockerFixture) -> None:
         run = mocker.patch.object(tw, "run_transcribe_chunks")
@@ -42,6 +115,42 @@ class TestTaskDelegation:
         run.assert_called_once()
         assert run.call_args.args[0] == MEETING_ID
 
+    def test_plan_fans_the_chunks_out_to_a_chord(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(tw, "run_plan_transcription_chunks", return_value=3)
+        replace = mocker.patch.object(
+            tw.plan_transcription_chunks, "replace", side_effect=Ignore()
+        )
+
+        with pytest.raises(Ignore):
+            tw.plan_transcription_chunks(MEETING_ID, OWNER)
+
+        (fan_out,) = replace.call_args.args
+        assert [(task.task, tuple(task.args)) for task in fan_out.tasks] == [
+            (tw.MCRTranscriptionTasks.TRANSCRIBE_CHUNK, (MEETING_ID, OWNER, index))
+            for index in range(3)
+        ]
+        assert fan_out.body.task == tw.MCRTranscriptionTasks.MERGE_TRANSCRIPTION_CHUNKS
+        assert tuple(fan_out.body.args) == (MEETING_ID, OWNER)
+        assert fan_out.body.immutable
+
+    def test_plan_without_chunks_moves_straight_on(self, mocker: MockerFixture) -> None:
+        mocker.patch.object(tw, "run_plan_transcription_chunks", return_value=0)
+        replace = mocker.patch.object(tw.plan_transcription_chunks, "replace")
+
+        tw.plan_transcription_chunks(MEETING_ID, OWNER)
+
+        replace.assert_not_called()
+
+    def test_chunk_and_merge_tasks_delegate(self, mocker: MockerFixture) -> None:
+        transcribe = mocker.patch.object(tw, "run_transcribe_chunk")
+        merge = mocker.patch.object(tw, "run_merge_transcription_chunks")
+
+        tw.transcribe_chunk(MEETING_ID, OWNER, 2)
+        tw.merge_transcription_chunks(MEETING_ID, OWNER)
+
+        assert transcribe.call_args.args[:2] == (MEETING_ID, 2)
+        merge.assert_called_once_with(MEETING_ID)
+
     def test_finalize_delegates_and_marks_success_without_payload(
         self, mocker: MockerFixture
     ) -> None:
@@ -94,7 +203,7 @@ class TestStateHandling:
         self, mocker: MockerFixture
     ) -> None:
         _patch_start_transcription(mocker)
-        mocker.patch.object(tw, "run_diarization", side_effect=RuntimeError("boom"))
+        mocker.patch.object(tw, "start_diarization", side_effect=RuntimeError("boom"))
         mark_failed = mocker.patch.object(tw, "run_mark_transcription_failed")
 
         with pytest.raises(RuntimeError):
@@ -142,7 +251,11 @@ class TestPipelineTaskBase:
         for task in (
             tw.transcribe,
             tw.diarize,
+            tw.poll_diarization_job,
             tw.transcribe_chunks,
+            tw.plan_transcription_chunks,
+            tw.transcribe_chunk,
+            tw.merge_transcription_chunks,
             tw.finalize_transcription,
         ):
             assert isinstance(task, tw.TranscriptionPipelineTask)
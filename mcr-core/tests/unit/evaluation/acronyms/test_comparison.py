@@ -0,0 +1,33 @@
+import pytest
+
+from mcr_meeting.evaluation.acronyms.utils.comparison import (
+    compare_text_corrections,
+    text_agreement,
+)
+
+GLOSSARY = ["ANTS", "DGSI"]
+
+
+class TestTextAgreement:
+    def test_identical_texts(self) -> None:
+        assert text_agreement("l ants a transmis", "l ants a transmis") == 1.0
+
+    def test_one_word_out_of_four_differs(self) -> None:
+        assert text_agreement("l ants a transmis", "l ants a transmit") == 0.75
+
+
+class TestCompareTextCorrections:
+    def test_metrics_of_each_correction_and_their_agreement(self) -> None:
+        expected = {"a1": {"ANTS": 1}, "a2": {"DGSI": 1}}
+        separate = {"a1": "l ants a transmis", "a2": "la dgsi enquete"}
+        fused = {"a1": "l ants a transmis", "a2": "la dg si enquete"}
+
+        comparison = compare_text_corrections(GLOSSARY, expected, separate, fused)
+
+        assert comparison.separate.global_metrics.recall == 1.0
+        assert comparison.fused.global_metrics.recall == 0.5
+        assert comparison.text_agreement["a1"] == 1.0
+        assert comparison.text_agreement["a2"] < 1.0
+        assert comparison.mean_text_agreement == pytest.approx(
+            (1.0 + comparison.text_agreement["a2"]) / 2
+        )
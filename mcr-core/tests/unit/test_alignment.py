@@ -0,0 +1,77 @@
+"""Unit tests for the sweep-line maximum-overlap lookup."""
+
+import random
+
+import pytest
+
+from mcr_meeting.app.domain.transcription.alignment import max_overlaps
+from mcr_meeting.app.schemas.transcription_schema import TimeSpan
+
+
+def _brute_force(
+    queries: list[TimeSpan], references: list[TimeSpan]
+) -> list[tuple[int | None, float]]:
+    """The historical scan: every query against every reference, first best wins."""
+    matches: list[tuple[int | None, float]] = []
+    for query in queries:
+        best: int | None = None
+        best_overlap = 0.0
+        for index, reference in enumerate(references):
+            overlap = query.overlap(reference)
+            if overlap > best_overlap:
+                best, best_overlap = index, overlap
+        matches.append((best, best_overlap))
+    return matches
+
+
+def _random_spans(
+    rng: random.Random, count: int, horizon: float, max_duration: float
+) -> list[TimeSpan]:
+    spans = []
+    for _ in range(count):
+        start = round(rng.uniform(0, horizon), 1)
+        spans.append(TimeSpan(start, round(start + rng.uniform(0, max_duration), 1)))
+    return spans
+
+
+def test_picks_the_largest_overlap():
+    references = [TimeSpan(0.0, 4.0), TimeSpan(3.0, 10.0)]
+
+    assert max_overlaps([TimeSpan(2.0, 6.0)], references) == [(1, 3.0)]
+
+
+def test_ties_go_to_the_first_reference():
+    references = [TimeSpan(5.0, 10.0), TimeSpan(0.0, 5.0)]
+
+    assert max_overlaps([TimeSpan(4.0, 6.0)], references) == [(0, 1.0)]
+
+
+def test_touching_spans_do_not_match():
+    references = [TimeSpan(0.0, 1.0), TimeSpan(3.0, 4.0)]
+
+    assert max_overlaps([TimeSpan(1.0, 3.0), TimeSpan(2.0, 2.0)], references) == [
+        (None, 0.0),
+        (None, 0.0),
+    ]
+
+
+def test_results_follow_the_query_order():
+    references = [TimeSpan(0.0, 5.0), TimeSpan(5.0, 10.0)]
+    queries = [TimeSpan(6.0, 7.0), TimeSpan(0.0, 9.0), TimeSpan(1.0, 2.0)]
+
+    assert max_overlaps(queries, references) == [(1, 1.0), (0, 5.0), (0, 1.0)]
+
+
+def test_no_reference():
+    assert max_overlaps([TimeSpan(0.0, 1.0)], []) == [(None, 0.0)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_the_brute_force_scan(seed: int):
+    rng = random.Random(seed)
+    # Rounded bounds produce ties and touching spans; long references overlap
+    # several turns at once, unsorted inputs exercise the index bookkeeping.
+    references = _random_spans(rng, rng.randint(0, 60), 300.0, 20.0)
+    queries = _random_spans(rng, rng.randint(0, 80), 320.0, 15.0)
+
+    assert max_overlaps(queries, references) == _brute_force(queries, references)
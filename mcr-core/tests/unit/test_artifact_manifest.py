@@ -0,0 +1,49 @@
+"""Unit tests for the diarization artifact manifest fingerprints."""
+
+from mcr_meeting.app.domain.transcription.artifact_manifest import (
+    build_manifest,
+    fingerprint_config,
+    hash_audio_chunks,
+)
+from mcr_meeting.app.schemas.S3_types import S3Object
+
+
+def _chunk(key: str, etag: str, size: int = 100) -> S3Object:
+    return S3Object.model_validate(
+        {"Key": key, "LastModified": None, "ETag": etag, "Size": size}
+    )
+
+
+class TestHashAudioChunks:
+    def test_same_listing_same_hash(self):
+        chunks = [_chunk("a", '"1"'), _chunk("b", '"2"')]
+        assert hash_audio_chunks(chunks) == hash_audio_chunks(list(chunks))
+
+    def test_changed_content_changes_hash(self):
+        before = [_chunk("a", '"1"'), _chunk("b", '"2"')]
+        after = [_chunk("a", '"1"'), _chunk("b", '"3"')]
+        assert hash_audio_chunks(before) != hash_audio_chunks(after)
+
+    def test_changed_size_changes_hash(self):
+        assert hash_audio_chunks([_chunk("a", '"1"', 100)]) != hash_audio_chunks(
+            [_chunk("a", '"1"', 101)]
+        )
+
+    def test_chunk_order_matters(self):
+        first, second = _chunk("a", '"1"'), _chunk("b", '"2"')
+        assert hash_audio_chunks([first, second]) != hash_audio_chunks([second, first])
+
+
+class TestFingerprintConfig:
+    def test_ignores_key_order(self):
+        assert fingerprint_config({"a": 1, "b": {"c": 2, "d": 3}}) == (
+            fingerprint_config({"b": {"d": 3, "c": 2}, "a": 1})
+        )
+
+    def test_changed_value_changes_fingerprint(self):
+        assert fingerprint_config({"a": 1}) != fingerprint_config({"a": 2})
+
+
+def test_build_manifest_compares_by_value():
+    chunks = [_chunk("a", '"1"')]
+    assert build_manifest(chunks, {"a": 1}) == build_manifest(chunks, {"a": 1})
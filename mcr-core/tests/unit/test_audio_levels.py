@@ -0,0 +1,75 @@
+"""Unit tests for the in-process volumedetect/silencedetect equivalents."""
+
+import numpy as np
+import pytest
+
+from mcr_meeting.app.domain import audio_levels
+from mcr_meeting.app.domain.audio_levels import (
+    detect_silences,
+    mean_volume_db,
+)
+
+SAMPLE_RATE = 16000
+
+
+def _tone(seconds: float, amplitude: int = 10000) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.cos(2 * np.pi * 440 * t)).astype(np.int16)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.int16)
+
+
+class TestMeanVolumeDb:
+    def test_full_scale_square_is_zero_db(self):
+        pcm = np.array([-32768, 32767] * 100, dtype=np.int16)
+        assert mean_volume_db(pcm) == 0.0
+
+    def test_rounded_to_tenth_of_db(self):
+        # RMS of a sine is amplitude / sqrt(2): 20*log10(10000/32768/sqrt(2)) = -13.3
+        assert mean_volume_db(_tone(1.0)) == -13.3
+
+    def test_digital_silence_reports_volumedetect_floor(self):
+        assert mean_volume_db(_silence(1.0)) == -91.0
+
+    def test_empty_is_unmeasurable(self):
+        assert mean_volume_db(np.empty(0, dtype=np.int16)) == float("-inf")
+
+
+class TestDetectSilences:
+    def test_interval_bounds(self):
+        pcm = np.concatenate([_tone(1.0), _silence(2.0), _tone(1.0)])
+        assert detect_silences(pcm, -40.0, 0.5, SAMPLE_RATE) == [(1.0, 3.0)]
+
+    def test_shorter_than_min_duration_is_ignored(self):
+        pcm = np.concatenate([_tone(1.0), _silence(0.4), _tone(1.0)])
+        assert detect_silences(pcm, -40.0, 0.5, SAMPLE_RATE) == []
+
+    def test_silence_open_at_end_is_closed_at_end(self):
+        pcm = np.concatenate([_tone(1.0), _silence(1.5)])
+        assert detect_silences(pcm, -40.0, 0.5, SAMPLE_RATE) == [(1.0, 2.5)]
+
+    def test_threshold_is_strict(self):
+        # -40 dB is an int16 amplitude of 327: |sample| must be strictly below it.
+        at_threshold = np.full(SAMPLE_RATE, 327, dtype=np.int16)
+        below = np.full(SAMPLE_RATE, -326, dtype=np.int16)
+        assert detect_silences(at_threshold, -40.0, 0.5, SAMPLE_RATE) == []
+        assert detect_silences(below, -40.0, 0.5, SAMPLE_RATE) == [(0.0, 1.0)]
+
+    def test_most_negative_sample_does_not_overflow(self):
+        pcm = np.full(SAMPLE_RATE, -32768, dtype=np.int16)
+        assert detect_silences(pcm, -40.0, 0.5, SAMPLE_RATE) == []
+
+    def test_blocks_do_not_change_the_result(self, monkeypatch: pytest.MonkeyPatch):
+        pcm = np.concatenate(
+            [_silence(0.7), _tone(1.0), _silence(2.0), _tone(0.3), _silence(1.1)]
+        )
+        expected = detect_silences(pcm, -40.0, 0.5, SAMPLE_RATE)
+        volume = mean_volume_db(pcm)
+
+        # Small odd-sized blocks so silences and tones straddle block edges.
+        monkeypatch.setattr(audio_levels, "_BLOCK_SAMPLES", 997)
+
+        assert detect_silences(pcm, -40.0, 0.5, SAMPLE_RATE) == expected
+        assert mean_volume_db(pcm) == volume
@@ -0,0 +1,193 @@
+"""Unit tests for the segment-parallel FFmpeg filtering."""
+
+import os
+from itertools import pairwise
+
+import ffmpeg
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from mcr_meeting.app.domain import audio, audio_segments
+from mcr_meeting.app.domain.audio_segments import filter_segments, plan_segments
+from mcr_meeting.app.domain.audio_spool import AudioSpool, wav_bytes_from_pcm
+
+SAMPLE_RATE = 16000
+
+
+def _speech_like(seconds: int, seed: int = 0) -> np.ndarray:
+    """One-second tone bursts separated by one second of silence."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    burst = 8000 * np.sin(2 * np.pi * 440 * t)
+    blocks = [
+        burst + rng.normal(0, 300, SAMPLE_RATE)
+        if second % 2 == 0
+        else np.zeros(SAMPLE_RATE)
+        for second in range(seconds)
+    ]
+    return np.concatenate(blocks).astype(np.int16)
+
+
+def _spool(samples: np.ndarray) -> AudioSpool:
+    return AudioSpool.from_bytes(wav_bytes_from_pcm(samples, SAMPLE_RATE).getvalue())
+
+
+class TestPlanSegments:
+    def test_short_audio_is_one_segment(self):
+        assert plan_segments(1000, [(0.01, 0.02)], 1000, SAMPLE_RATE) == [(0, 1000)]
+
+    def test_cuts_in_the_middle_of_the_nearest_silence(self):
+        silences = [(2.0, 3.0), (9.0, 10.0), (11.5, 12.5)]
+
+        segments = plan_segments(
+            20 * SAMPLE_RATE, silences, 10 * SAMPLE_RATE, SAMPLE_RATE
+        )
+
+        assert segments == [
+            (0, 9.5 * SAMPLE_RATE),
+            (9.5 * SAMPLE_RATE, 20 * SAMPLE_RATE),
+        ]
+
+    def test_cuts_evenly_without_a_nearby_silence(self):
+        segments = plan_segments(3000, [(0.0, 0.001)], 1000, 10_000)
+
+        assert segments == [(0, 1000), (1000, 2000), (2000, 3000)]
+
+    def test_segments_are_contiguous(self):
+        silences = [(float(start), start + 0.6) for start in range(1, 60, 3)]
+
+        segments = plan_segments(
+            60 * SAMPLE_RATE, silences, 7 * SAMPLE_RATE, SAMPLE_RATE
+        )
+
+        assert segments[0][0] == 0
+        assert segments[-1][1] == 60 * SAMPLE_RATE
+        assert all(
+            end == next_start for (_, end), (next_start, _) in pairwise(segments)
+        )
+        assert all(start < end for start, end in segments)
+
+
+class TestFilterSegments:
+    def test_stitched_output_matches_one_process(self):
+        samples = _speech_like(12)
+        segments = plan_segments(samples.size, [], 4 * SAMPLE_RATE, SAMPLE_RATE)
+        with (
+            _spool(samples) as wav_audio,
+            filter_segments(wav_audio, segments, "volume=0.5", SAMPLE_RATE) as split,
+            filter_segments(
+                wav_audio, [(0, samples.size)], "volume=0.5", SAMPLE_RATE
+            ) as whole,
+        ):
+            assert len(segments) == 3
+            np.testing.assert_array_equal(split.pcm(), whole.pcm())
+
+    def test_sequential_and_parallel_runs_agree(self, monkeypatch: pytest.MonkeyPatch):
+        samples = _speech_like(8)
+        segments = plan_segments(samples.size, [], 2 * SAMPLE_RATE, SAMPLE_RATE)
+        results = []
+        with _spool(samples) as wav_audio:
+            for workers in (1, 4):
+                monkeypatch.setattr(
+                    audio_segments.audio_settings, "FFMPEG_SEGMENT_WORKERS", workers
+                )
+                with filter_segments(
+                    wav_audio, segments, "highpass=f=80", SAMPLE_RATE
+                ) as filtered:
+                    results.append(np.array(filtered.pcm()))
+
+        np.testing.assert_array_equal(results[0], results[1])
+
+    def test_output_keeps_every_segment_length(self):
+        samples = _speech_like(6)
+        segments = [(0, 30_001), (30_001, samples.size)]
+        with (
+            _spool(samples) as wav_audio,
+            # atempo shortens each segment: the stitch pads it back.
+            filter_segments(wav_audio, segments, "atempo=1.25", SAMPLE_RATE) as fast,
+        ):
+            assert fast.pcm().size == samples.size
+            assert not fast.pcm()[30_001 - 100 : 30_001].any()
+
+    def test_failure_leaves_no_temporary_file(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: str
+    ):
+        samples = _speech_like(4)
+        with _spool(samples) as wav_audio:
+            monkeypatch.setattr(
+                audio_segments.audio_settings, "FFMPEG_SEGMENT_WORKERS", 2
+            )
+            monkeypatch.setattr(
+                "mcr_meeting.app.domain.audio_spool.audio_settings.SPOOL_DIR",
+                str(tmp_path),
+            )
+            with pytest.raises(ffmpeg.Error):
+                filter_segments(
+                    wav_audio,
+                    [(0, SAMPLE_RATE), (SAMPLE_RATE, samples.size)],
+                    "not_a_filter",
+                    SAMPLE_RATE,
+                )
+
+        assert os.listdir(tmp_path) == []
+
+
+class TestSegmentedFilters:
+    @pytest.fixture
+    def short_segments(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(audio.audio_settings, "FFMPEG_SEGMENT_SECONDS", 4.0)
+
+    def test_noise_filtering_normalizes_with_global_statistics(
+        self, short_segments: None, mocker: MockerFixture
+    ):
+        measure = mocker.spy(audio, "_measure_loudnorm_stats")
+        samples = _speech_like(12)
+        with (
+            _spool(samples) as wav_audio,
+            audio.filter_noise_from_audio(wav_audio) as out,
+        ):
+            assert out.pcm().size == samples.size
+
+        # The trailing loudnorm of NOISE_FILTERS is measured once, on the whole meeting.
+        measure.assert_called_once()
+        assert measure.call_args.args[1] == {"I": "-18", "LRA": "6", "TP": "-1.5"}
+
+    def test_one_or_several_segments_come_out_equally_loud(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        samples = _speech_like(12)
+        loudness = []
+        for segment_seconds in (300.0, 4.0):
+            monkeypatch.setattr(
+                audio.audio_settings, "FFMPEG_SEGMENT_SECONDS", segment_seconds
+            )
+            with (
+                _spool(samples) as wav_audio,
+                audio.filter_noise_from_audio(wav_audio) as out,
+            ):
+                loudness.append(float(audio._measure_loudnorm_stats(out)["input_i"]))
+
+        # A dynamic loudnorm on the single segment lands 0.1 LU off.
+        assert loudness[0] == pytest.approx(loudness[1], abs=0.03)
+
+    def test_volume_normalization_applies_one_gain(self, short_segments: None):
+        samples = _speech_like(12)
+        samples[: 4 * SAMPLE_RATE] //= 2
+        with _spool(samples) as wav_audio:
+            stats = audio._measure_loudnorm_stats(wav_audio)
+            with audio.two_pass_volume_normalization(wav_audio, stats) as normalized:
+                output = np.array(normalized.pcm())
+
+        assert output.size == samples.size
+        bursts = range(0, 12 * SAMPLE_RATE, 2 * SAMPLE_RATE)
+        gains = np.array(
+            [_rms(output, start) / _rms(samples, start) for start in bursts]
+        )
+        # A loudnorm per segment would have boosted the quiet first segment more.
+        assert gains.std() / gains.mean() < 0.02
+
+
+def _rms(samples: np.ndarray, start: int) -> float:
+    burst = samples[start + SAMPLE_RATE // 10 : start + SAMPLE_RATE * 9 // 10]
+    return float(np.sqrt(np.mean(burst.astype(np.float64) ** 2)))
@@ -0,0 +1,126 @@
+"""Unit tests for the disk-backed AudioSpool."""
+
+import os
+import struct
+from io import BytesIO
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from mcr_meeting.app.domain.audio_spool import AudioSpool, wav_bytes_from_pcm
+from mcr_meeting.app.exceptions.exceptions import InvalidAudioFileError
+
+SAMPLE_RATE = 16000
+
+
+def _wav_bytes(samples: np.ndarray, channels: int = 1) -> bytes:
+    buffer = BytesIO()
+    sf.write(
+        buffer,
+        np.repeat(samples[:, None], channels, axis=1),
+        SAMPLE_RATE,
+        format="WAV",
+        subtype="PCM_16",
+    )
+    return buffer.getvalue()
+
+
+def _with_unknown_sizes(wav: bytes) -> bytes:
+    """Rewrite the RIFF/data sizes the way FFmpeg does on a non-seekable output."""
+    data_offset = wav.index(b"data") + 4
+    unknown = struct.pack("<I", 0xFFFFFFFF)
+    return wav[:4] + unknown + wav[8:data_offset] + unknown + wav[data_offset + 4 :]
+
+
+class TestPcm:
+    def test_maps_the_samples(self):
+        samples = np.arange(-500, 500, dtype=np.int16)
+        with AudioSpool.from_bytes(_wav_bytes(samples)) as spool:
+            pcm = spool.pcm()
+            np.testing.assert_array_equal(pcm, samples)
+            assert not pcm.flags.writeable
+
+    def test_unknown_data_size_reads_to_end_of_file(self):
+        samples = np.arange(1000, dtype=np.int16)
+        wav = _with_unknown_sizes(_wav_bytes(samples))
+        with AudioSpool.from_bytes(wav) as spool:
+            np.testing.assert_array_equal(spool.pcm(), samples)
+
+    def test_empty_data_chunk(self):
+        with AudioSpool.from_bytes(_wav_bytes(np.empty(0, dtype=np.int16))) as spool:
+            assert spool.pcm().size == 0
+
+    def test_not_a_wav_raises(self):
+        with (
+            AudioSpool.from_bytes(b"not audio") as spool,
+            pytest.raises(InvalidAudioFileError, match="Not a WAV file"),
+        ):
+            spool.pcm()
+
+    def test_stereo_raises(self):
+        wav = _wav_bytes(np.zeros(100, dtype=np.int16), channels=2)
+        with (
+            AudioSpool.from_bytes(wav) as spool,
+            pytest.raises(InvalidAudioFileError, match="channels=2"),
+        ):
+            spool.pcm()
+
+
+class TestWavBytesFromPcm:
+    def test_matches_soundfile_encoding(self):
+        samples = np.arange(-1000, 1000, 7, dtype=np.int16)
+
+        wav = wav_bytes_from_pcm(samples, SAMPLE_RATE)
+
+        assert wav.tell() == 0
+        assert wav.getvalue() == _wav_bytes(samples)
+
+    def test_round_trips_a_memory_mapped_slice(self):
+        samples = np.arange(-500, 500, dtype=np.int16)
+        with AudioSpool.from_bytes(_wav_bytes(samples)) as spool:
+            wav = wav_bytes_from_pcm(spool.pcm()[100:300], SAMPLE_RATE)
+
+        decoded, sample_rate = sf.read(wav, dtype="int16")
+        assert sample_rate == SAMPLE_RATE
+        np.testing.assert_array_equal(decoded, samples[100:300])
+
+    def test_empty_chunk_is_a_valid_wav(self):
+        wav = wav_bytes_from_pcm(np.empty(0, dtype=np.int16), SAMPLE_RATE)
+        assert sf.info(wav).frames == 0
+
+
+class TestAppend:
+    def test_concatenates_streams(self):
+        with AudioSpool.from_chunks([b"one"]) as spool:
+            spool.append(BytesIO(b"-two"))
+            assert spool.read_bytes() == b"one-two"
+
+    def test_offset_drops_a_partial_previous_attempt(self):
+        with AudioSpool.from_bytes(b"one-tw") as spool:
+            spool.append(BytesIO(b"-two"), offset=3)
+            assert spool.read_bytes() == b"one-two"
+
+
+class TestLifecycle:
+    def test_close_removes_the_file(self):
+        spool = AudioSpool.from_bytes(b"data")
+        path = spool.path
+        assert os.path.exists(path)
+
+        spool.close()
+
+        assert not os.path.exists(path)
+
+    def test_close_is_idempotent(self):
+        spool = AudioSpool()
+        spool.close()
+        spool.close()
+
+    def test_garbage_collection_removes_the_file(self):
+        spool = AudioSpool.from_bytes(b"data")
+        path = spool.path
+
+        del spool
+
+        assert not os.path.exists(path)
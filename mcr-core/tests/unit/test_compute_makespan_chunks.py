@@ -0,0 +1,118 @@
+"""Unit tests for compute_makespan_chunks."""
+
+import random
+from itertools import pairwise
+
+import pytest
+
+from mcr_meeting.app.domain.transcription.chunking import (
+    ChunkCostModel,
+    compute_makespan_chunks,
+    compute_transcription_chunks,
+)
+from mcr_meeting.app.schemas.transcription_schema import DiarizationSegment, TimeSpan
+
+COST = ChunkCostModel(request_overhead=3.0, real_time_factor=0.05, concurrency=8)
+
+
+def _seg(start: float, end: float, speaker: str = "S1") -> DiarizationSegment:
+    return DiarizationSegment(start=start, end=end, speaker=speaker)
+
+
+def _turns(duration: float, turn: float = 9.0, pause: float = 1.0):
+    """Speaker turns of `turn` seconds separated by `pause` seconds of silence."""
+    segments = []
+    t = 0.0
+    while t + turn <= duration:
+        segments.append(_seg(t, t + turn))
+        t += turn + pause
+    return segments
+
+
+def _gap_midpoints(diarization: list[DiarizationSegment]) -> set[float]:
+    return {(a.end + b.start) / 2 for a, b in pairwise(diarization)}
+
+
+class TestChunkCostModel:
+    def test_chunks_run_side_by_side_up_to_the_concurrency(self):
+        cost = ChunkCostModel(request_overhead=1.0, real_time_factor=0.1, concurrency=2)
+        chunks = [TimeSpan(0, 100), TimeSpan(100, 200), TimeSpan(200, 300)]
+
+        # Two chunks at once (11s each), then the third one.
+        assert cost.wall_time(chunks) == pytest.approx(22.0)
+
+    def test_a_free_slot_takes_the_next_chunk(self):
+        cost = ChunkCostModel(request_overhead=0.0, real_time_factor=1.0, concurrency=2)
+        chunks = [TimeSpan(0, 10), TimeSpan(10, 12), TimeSpan(12, 14)]
+
+        assert cost.wall_time(chunks) == pytest.approx(10.0)
+
+
+class TestShortMeeting:
+    def test_splits_into_balanced_chunks_at_gap_midpoints(self):
+        diarization = _turns(400.0)
+
+        chunks = compute_makespan_chunks(diarization, COST)
+
+        assert compute_transcription_chunks(diarization) == [TimeSpan(0.0, 399.0)]
+        assert len(chunks) == COST.concurrency
+        assert chunks[0].start == 0.0 and chunks[-1].end == 399.0
+        assert all(a.end == b.start for a, b in pairwise(chunks))
+        assert {c.end for c in chunks[:-1]} <= _gap_midpoints(diarization)
+        durations = [c.duration for c in chunks]
+        assert max(durations) - min(durations) <= 10.0
+
+    def test_keeps_chunks_above_the_minimum_duration(self):
+        diarization = _turns(100.0)
+
+        chunks = compute_makespan_chunks(diarization, COST, min_chunk_duration=30.0)
+
+        assert len(chunks) == 3
+
+    def test_keeps_the_single_chunk_without_a_spare_slot(self):
+        # Split chunks would queue behind each other and pay one overhead each.
+        cost = ChunkCostModel(
+            request_overhead=3.0, real_time_factor=0.05, concurrency=1
+        )
+        diarization = _turns(400.0)
+
+        assert compute_makespan_chunks(diarization, cost) == [TimeSpan(0.0, 399.0)]
+
+    def test_unsplittable_speech_keeps_the_static_plan(self):
+        diarization = [_seg(0.0, 400.0)]
+
+        assert compute_makespan_chunks(diarization, COST) == [TimeSpan(0.0, 400.0)]
+
+
+class TestLongMeeting:
+    def test_plan_filling_every_slot_is_unchanged(self):
+        diarization = _turns(6 * 3600.0)
+
+        assert compute_makespan_chunks(diarization, COST) == (
+            compute_transcription_chunks(diarization)
+        )
+
+    def test_empty_diarization(self):
+        assert compute_makespan_chunks([], COST) == []
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_never_slower_than_the_static_plan(seed: int):
+    rng = random.Random(seed)
+    diarization = _turns(
+        rng.uniform(60.0, 3600.0), turn=rng.uniform(2.0, 20.0), pause=0.5
+    )
+    cost = ChunkCostModel(
+        request_overhead=rng.uniform(0.5, 20.0),
+        real_time_factor=rng.uniform(0.01, 0.2),
+        concurrency=rng.randint(1, 12),
+    )
+    static = compute_transcription_chunks(diarization)
+
+    chunks = compute_makespan_chunks(diarization, cost)
+
+    assert cost.wall_time(chunks) <= cost.wall_time(static)
+    assert (chunks[0].start, chunks[-1].end) == (static[0].start, static[-1].end)
+    assert max(c.duration for c in chunks) <= max(
+        600.0, max(c.duration for c in static)
+    )
@@ -1,7 +1,13 @@
 """Unit tests for compute_transcription_chunks."""
 
+import random
+
+import pytest
+
 from mcr_meeting.app.domain.transcription.chunking import (
     MAX_CHUNK_DURATION,
+    SPLIT_SEARCH_WINDOW_RATIO,
+    _merge_overlapping_intervals,
     compute_transcription_chunks,
 )
 from mcr_meeting.app.schemas.transcription_schema import DiarizationSegment, TimeSpan
@@ -154,3 +160,71 @@ class TestEdgeCases:
         # Chunks should be contiguous (no overlap or gap)
         for i in range(len(result) - 1):
             assert result[i].end == result[i + 1].start
+
+
+def _rescanning_planner(
+    diarization: list[DiarizationSegment], max_chunk_duration: float
+) -> list[TimeSpan]:
+    """The historical planner: every split rescans the gaps of its chunk."""
+    merged = _merge_overlapping_intervals(
+        TimeSpan(seg.start, seg.end) for seg in diarization
+    )
+    if not merged:
+        return []
+
+    chunks: list[TimeSpan] = []
+    chunk_start = merged[0].start
+    chunk_intervals = [merged[0]]
+    for interval in merged[1:]:
+        if interval.end - chunk_start <= max_chunk_duration:
+            chunk_intervals.append(interval)
+            continue
+
+        window_start = (
+            chunk_start + (1 - SPLIT_SEARCH_WINDOW_RATIO) * max_chunk_duration
+        )
+        window_end = chunk_start + max_chunk_duration
+        all_intervals = chunk_intervals + [interval]
+        best_gap: TimeSpan | None = None
+        for j in range(len(all_intervals) - 1):
+            gap = all_intervals[j].gap_to(all_intervals[j + 1])
+            if gap is None or gap.start < window_start or gap.midpoint > window_end:
+                continue
+            if best_gap is None or gap.duration > best_gap.duration:
+                best_gap = gap
+        boundary = best_gap.midpoint if best_gap is not None else window_end
+
+        chunks.append(TimeSpan(chunk_start, boundary))
+        chunk_start = boundary
+        chunk_intervals = [interval]
+
+    chunks.append(TimeSpan(chunk_start, chunk_intervals[-1].end))
+    return chunks
+
+
+def _random_diarization(rng: random.Random) -> list[DiarizationSegment]:
+    # Rounded times produce equal gaps (ties) and touching turns; occasional
+    # long turns exceed the chunk limit and force hard cuts.
+    segments = []
+    t = 0.0
+    for _ in range(rng.randint(0, 600)):
+        t += round(rng.choice([0.0, rng.uniform(0, 3), rng.uniform(0, 40)]), 1)
+        long_turn = rng.random() < 0.02
+        length = round(rng.uniform(50, 900) if long_turn else rng.uniform(0.2, 8), 1)
+        segments.append(_seg(t, t + length))
+        if rng.random() < 0.3:
+            t += length
+    rng.shuffle(segments)
+    return segments
+
+
+class TestMatchesTheRescanningPlanner:
+    @pytest.mark.parametrize("seed", range(50))
+    def test_same_plan_on_random_diarizations(self, seed: int):
+        rng = random.Random(seed)
+        diarization = _random_diarization(rng)
+        max_chunk_duration = rng.choice([30.0, 120.0, MAX_CHUNK_DURATION])
+
+        assert compute_transcription_chunks(
+            diarization, max_chunk_duration=max_chunk_duration
+        ) == _rescanning_planner(diarization, max_chunk_duration)
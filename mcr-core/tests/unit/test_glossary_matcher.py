@@ -0,0 +1,91 @@
+"""Unit tests for the glossary candidate pre-filter."""
+
+import pytest
+
+from mcr_meeting.app.domain.transcription.glossary_matcher import (
+    AhoCorasick,
+    GlossaryMatcher,
+    parse_glossary,
+    phonetic_key,
+)
+
+GLOSSARY = """**ANSSI** - Agence nationale de la sécurité des systèmes d'information - Autorité.
+
+**ANTS** - Agence nationale des titres sécurisés - Opérateur.
+
+**CAF** ou **CNAF** - Caisse d'allocations familiales - Organisme.
+
+**CCMI** - Contrat de construction de maison individuelle - Contrat.
+
+**ONU** - Organisation des Nations unies - Organisation.
+
+**OPAC** - Office public d'aménagement et de construction - Bailleur.
+"""
+
+
+@pytest.fixture(scope="module")
+def matcher() -> GlossaryMatcher:
+    return GlossaryMatcher(parse_glossary(GLOSSARY))
+
+
+def _acronyms(matcher: GlossaryMatcher, text: str) -> list[str]:
+    return [entry.acronyms[0] for entry in matcher.candidates(text)]
+
+
+def test_parse_glossary_keeps_every_acronym_of_an_entry():
+    entries = parse_glossary(GLOSSARY)
+
+    assert [entry.acronyms for entry in entries][2] == ("CAF", "CNAF")
+    assert entries[2].text.startswith("**CAF** ou **CNAF** - Caisse")
+
+
+def test_aho_corasick_finds_overlapping_occurrences():
+    automaton = AhoCorasick(["he", "she", "hers"])
+
+    assert sorted(automaton.find("ushers")) == [(1, "she"), (2, "he"), (2, "hers")]
+
+
+@pytest.mark.parametrize(
+    "word,sound_alike", [("OPAC", "opaque"), ("CAF", "café"), ("ONU", "eaunue")]
+)
+def test_phonetic_key_of_an_acronym_read_as_a_word(word: str, sound_alike: str):
+    assert phonetic_key(word) == phonetic_key(sound_alike)
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("Le locataire a contacté l'opaque hier.", ["OPAC"]),
+        ("Je suis ambassadeur à l'eau nue.", ["ONU"]),
+        ("Le dossier est parti à la caf.", ["CAF"]),
+        ("La NTS a transmis le dossier.", ["ANTS"]),
+        ("La réunion avec l'AN2SI est reportée.", ["ANSSI"]),
+        ("Le CMI a été signé.", ["CCMI"]),
+    ],
+)
+def test_mistranscribed_acronym_is_a_candidate(
+    matcher: GlossaryMatcher, text: str, expected: list[str]
+):
+    assert _acronyms(matcher, text) == expected
+
+
+def test_acronym_written_as_in_the_glossary_is_not_a_candidate(
+    matcher: GlossaryMatcher,
+):
+    assert _acronyms(matcher, "Le CCMI et l'ANSSI ont répondu à l'OPAC.") == []
+
+
+def test_text_without_anything_like_an_acronym_has_no_candidate(
+    matcher: GlossaryMatcher,
+):
+    text = "Bonjour à tous, nous allons parler du budget de l'année prochaine."
+
+    assert matcher.candidates(text) == []
+
+
+def test_candidates_come_in_glossary_order(matcher: GlossaryMatcher):
+    assert _acronyms(matcher, "L'eau nue, le CMI puis l'opaque.") == [
+        "CCMI",
+        "ONU",
+        "OPAC",
+    ]
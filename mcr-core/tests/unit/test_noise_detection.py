@@ -1,45 +1,42 @@
 """Unit tests for noise detection functions."""
 
-from io import BytesIO
 from unittest.mock import patch
 
+import numpy as np
+import numpy.typing as npt
 import pytest
 
+from mcr_meeting.app.configs.base import AudioSettings, NoiseDetectionSettings
+from mcr_meeting.app.domain import audio
 from mcr_meeting.app.domain.audio import (
     _parse_loudnorm_stats,
-    _parse_mean_volume,
-    _parse_silence_intervals,
     is_audio_noisy,
+    spectral_flatness_on_segments,
 )
-
-
-class TestParseMeanVolume:
-    def test_valid_output(self):
-        stderr = "[Parsed_volumedetect_0 @ 0x...] mean_volume: -20.5 dB\n"
-        assert _parse_mean_volume(stderr) == -20.5
-
-    def test_negative_integer(self):
-        stderr = "mean_volume: -30 dB\n"
-        assert _parse_mean_volume(stderr) == -30.0
-
-    def test_invalid_output_raises(self):
-        with pytest.raises(RuntimeError, match="Could not parse mean_volume"):
-            _parse_mean_volume("no volume info here")
-
-
-class TestParseSilenceIntervals:
-    def test_valid_output(self):
-        stderr = (
-            "[silencedetect @ 0x...] silence_start: 1.5\n"
-            "[silencedetect @ 0x...] silence_end: 3.2 | silence_duration: 1.7\n"
-            "[silencedetect @ 0x...] silence_start: 5.0\n"
-            "[silencedetect @ 0x...] silence_end: 7.8 | silence_duration: 2.8\n"
-        )
-        result = _parse_silence_intervals(stderr)
-        assert result == [(1.5, 3.2), (5.0, 7.8)]
-
-    def test_no_silence(self):
-        assert _parse_silence_intervals("no silence detected") == []
+from mcr_meeting.app.domain.audio_spool import AudioSpool
+
+SAMPLE_RATE = AudioSettings().SAMPLE_RATE
+FRAME_SIZE = NoiseDetectionSettings().FRAME_SIZE
+HOP_SIZE = NoiseDetectionSettings().HOP_SIZE
+
+
+def _per_frame_flatness(
+    samples: npt.NDArray[np.float32], segments: list[tuple[float, float]]
+) -> float | None:
+    """Reference: the per-frame loop the batched implementation replaced."""
+    flatness_values = []
+    for seg_start, seg_end in segments:
+        segment = samples[int(seg_start * SAMPLE_RATE) : int(seg_end * SAMPLE_RATE)]
+        if len(segment) < FRAME_SIZE:
+            continue
+        for start in range(0, len(segment) - FRAME_SIZE, HOP_SIZE):
+            spectrum = (
+                np.abs(np.fft.rfft(segment[start : start + FRAME_SIZE])) ** 2 + 1e-12
+            )
+            flatness_values.append(
+                np.exp(np.mean(np.log(spectrum))) / np.mean(spectrum)
+            )
+    return float(np.mean(flatness_values)) if flatness_values else None
 
 
 class TestParseLoudnormStats:
@@ -67,19 +64,59 @@ class TestIsAudioNoisy:
     @patch("mcr_meeting.app.domain.audio.compute_spectral_flatness_on_silences")
     def test_clean_audio(self, mock_flatness):
         mock_flatness.return_value = 0.01
-        wav_bytes = BytesIO(b"fake wav data")
-        assert is_audio_noisy(wav_bytes) is False
-        assert wav_bytes.tell() == 0  # cursor reset
+        with AudioSpool.from_bytes(b"fake wav data") as wav_audio:
+            assert is_audio_noisy(wav_audio) is False
 
     @patch("mcr_meeting.app.domain.audio.compute_spectral_flatness_on_silences")
     def test_noisy_audio(self, mock_flatness):
         mock_flatness.return_value = 0.1
-        wav_bytes = BytesIO(b"fake wav data")
-        assert is_audio_noisy(wav_bytes) is True
-        assert wav_bytes.tell() == 0
+        with AudioSpool.from_bytes(b"fake wav data") as wav_audio:
+            assert is_audio_noisy(wav_audio) is True
 
     @patch("mcr_meeting.app.domain.audio.compute_spectral_flatness_on_silences")
     def test_no_silence_segments(self, mock_flatness):
         mock_flatness.return_value = None
-        wav_bytes = BytesIO(b"fake wav data")
-        assert is_audio_noisy(wav_bytes) is True
+        with AudioSpool.from_bytes(b"fake wav data") as wav_audio:
+            assert is_audio_noisy(wav_audio) is True
+
+
+class TestSpectralFlatnessOnSegments:
+    @pytest.fixture
+    def samples(self) -> npt.NDArray[np.float32]:
+        rng = np.random.default_rng(42)
+        t = np.arange(10 * SAMPLE_RATE) / SAMPLE_RATE
+        tone = 0.3 * np.sin(2 * np.pi * 440 * t)
+        return (tone + 0.01 * rng.standard_normal(t.size)).astype(np.float32)
+
+    @pytest.mark.parametrize(
+        "segments",
+        [
+            [(0.0, 1.0), (2.5, 4.0), (6.0, 9.5)],
+            # Shorter than one frame, exactly one frame, and past the end of audio.
+            [(0.0, 0.1), (1.0, 1.0 + FRAME_SIZE / SAMPLE_RATE), (9.0, 12.0)],
+            [(0.0, 10.0)],
+        ],
+    )
+    def test_matches_per_frame_loop(
+        self, samples: npt.NDArray[np.float32], segments: list[tuple[float, float]]
+    ):
+        assert spectral_flatness_on_segments(samples, segments) == pytest.approx(
+            _per_frame_flatness(samples, segments), rel=1e-5
+        )
+
+    def test_independent_of_batch_size(
+        self, samples: npt.NDArray[np.float32], monkeypatch: pytest.MonkeyPatch
+    ):
+        segments = [(0.0, 4.0), (5.0, 9.0)]
+        monkeypatch.setattr(audio.noise_detection_settings, "FLATNESS_BATCH_FRAMES", 7)
+        small_batches = spectral_flatness_on_segments(samples, segments)
+        monkeypatch.setattr(
+            audio.noise_detection_settings, "FLATNESS_BATCH_FRAMES", 4096
+        )
+        assert spectral_flatness_on_segments(samples, segments) == pytest.approx(
+            small_batches, rel=1e-9
+        )
+
+    def test_no_frame_returns_none(self, samples: npt.NDArray[np.float32]):
+        assert spectral_flatness_on_segments(samples, [(0.0, 0.05)]) is None
+        assert spectral_flatness_on_segments(samples, []) is None
@@ -4,6 +4,10 @@ Runs against the in-memory S3 fake instead of patching the functions'
 collaborators, so the tests exercise the real listing/concatenation logic.
 """
 
+import threading
+import time
+from typing import Any
+
 import pytest
 
 from mcr_meeting.app.configs.base import S3Settings
@@ -11,9 +15,12 @@ from mcr_meeting.app.exceptions.exceptions import (
     NoAudioFoundError,
     S3TransientError,
 )
+from mcr_meeting.app.infrastructure import s3
 from mcr_meeting.app.infrastructure.s3 import (
-    download_and_concatenate_s3_audio_chunks_into_bytes,
-    fetch_audio_bytes,
+    _ChunkFetchStats,
+    _prefetch_audio_chunks,
+    download_and_concatenate_s3_audio_chunks_into_spool,
+    fetch_audio_spool,
 )
 from mcr_meeting.app.schemas.S3_types import S3Object
 from tests.mocks.in_memory_s3 import InMemoryS3, S3Op, transient_error
@@ -27,31 +34,73 @@ def _put_chunk(fake: InMemoryS3, meeting_id: int, name: str, data: bytes) -> Non
     fake.objects[f"{_AUDIO_FOLDER}/{meeting_id}/{name}"] = data
 
 
-class TestFetchAudioBytes:
+def _seed_chunks(fake: InMemoryS3, count: int) -> list[S3Object]:
+    objects = []
+    for idx in range(count):
+        key = f"{_AUDIO_FOLDER}/123/chunk_{idx:03d}.weba"
+        fake.objects[key] = f"<{idx}>".encode()
+        objects.append(S3Object.model_validate({"Key": key, "LastModified": None}))
+    return objects
+
+
+class _GetTracker:
+    """Wraps the fake's get_object to record ordering and concurrency."""
+
+    def __init__(self, fake: InMemoryS3, delay: float = 0.0) -> None:
+        self._get_object = fake.get_object
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started: list[str] = []
+        fake.get_object = self  # type: ignore[method-assign]
+
+    def __call__(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        with self._lock:
+            self.started.append(Key)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later chunks answer faster, so completion order is reversed.
+            time.sleep(self._delay / (1 + int(Key[-8:-5])))
+            return self._get_object(Bucket=Bucket, Key=Key)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestFetchAudioSpool:
     def test_raises_no_audio_found_when_meeting_has_no_chunks(
         self, in_memory_s3: InMemoryS3
     ) -> None:
         with pytest.raises(
             NoAudioFoundError, match="No audio files found for meeting 123"
         ):
-            fetch_audio_bytes(meeting_id=123)
+            fetch_audio_spool(meeting_id=123)
 
     def test_concatenates_chunks_in_key_order(self, in_memory_s3: InMemoryS3) -> None:
         _put_chunk(in_memory_s3, 123, "chunk_002.weba", b"-two")
         _put_chunk(in_memory_s3, 123, "chunk_001.weba", b"one")
 
-        result = fetch_audio_bytes(meeting_id=123)
-
-        # read() from the returned buffer proves it is rewound to the start
-        assert result.read() == b"one-two"
+        with fetch_audio_spool(meeting_id=123) as result:
+            assert result.read_bytes() == b"one-two"
 
     def test_ignores_chunks_of_other_meetings(self, in_memory_s3: InMemoryS3) -> None:
         _put_chunk(in_memory_s3, 123, "chunk_001.weba", b"mine")
         _put_chunk(in_memory_s3, 1234, "chunk_001.weba", b"not-mine")
 
-        result = fetch_audio_bytes(meeting_id=123)
+        with fetch_audio_spool(meeting_id=123) as result:
+            assert result.read_bytes() == b"mine"
+
+    def test_retried_chunk_download_is_not_duplicated(
+        self, in_memory_s3: InMemoryS3
+    ) -> None:
+        _put_chunk(in_memory_s3, 123, "chunk_001.weba", b"one")
+        _put_chunk(in_memory_s3, 123, "chunk_002.weba", b"-two")
+        in_memory_s3.fail(S3Op.GET, transient_error(), times=1)
 
-        assert result.read() == b"mine"
+        with fetch_audio_spool(meeting_id=123) as result:
+            assert result.read_bytes() == b"one-two"
 
     def test_transient_download_failure_surfaces_as_s3_transient(
         self, in_memory_s3: InMemoryS3
@@ -60,13 +109,13 @@ class TestFetchAudioBytes:
         in_memory_s3.fail(S3Op.GET, transient_error(), times=_PERSISTENT)
 
         with pytest.raises(S3TransientError):
-            fetch_audio_bytes(meeting_id=123)
+            fetch_audio_spool(meeting_id=123)
 
 
 class TestDownloadAndConcatenateS3AudioChunks:
     def test_raises_no_audio_found_on_empty_iterator(self) -> None:
         with pytest.raises(NoAudioFoundError, match="No audio chunks found"):
-            download_and_concatenate_s3_audio_chunks_into_bytes(iter([]))
+            download_and_concatenate_s3_audio_chunks_into_spool(iter([]))
 
     def test_transient_download_failure_surfaces_as_s3_transient(
         self, in_memory_s3: InMemoryS3
@@ -80,4 +129,50 @@ class TestDownloadAndConcatenateS3AudioChunks:
         )
 
         with pytest.raises(S3TransientError):
-            download_and_concatenate_s3_audio_chunks_into_bytes(objects)
+            download_and_concatenate_s3_audio_chunks_into_spool(objects)
+
+
+class TestPrefetchAudioChunks:
+    def test_keeps_key_order_when_downloads_complete_out_of_order(
+        self, in_memory_s3: InMemoryS3, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(s3.s3_settings, "S3_AUDIO_DOWNLOAD_CONCURRENCY", 4)
+        objects = _seed_chunks(in_memory_s3, 12)
+        tracker = _GetTracker(in_memory_s3, delay=0.02)
+
+        chunks = list(_prefetch_audio_chunks(objects, _ChunkFetchStats()))
+
+        assert chunks == [f"<{idx}>".encode() for idx in range(12)]
+        assert 1 < tracker.max_in_flight <= 4
+
+    def test_prefetch_window_bounds_downloads_ahead(
+        self, in_memory_s3: InMemoryS3, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(s3.s3_settings, "S3_AUDIO_PREFETCH_CHUNKS", 3)
+        objects = _seed_chunks(in_memory_s3, 10)
+        tracker = _GetTracker(in_memory_s3)
+
+        chunks = _prefetch_audio_chunks(objects, _ChunkFetchStats())
+        next(chunks)
+        chunks.close()
+
+        # The window of 3, plus the one refilled after the first chunk.
+        assert len(tracker.started) <= 4
+
+    def test_records_throughput(self, in_memory_s3: InMemoryS3) -> None:
+        objects = _seed_chunks(in_memory_s3, 5)
+        stats = _ChunkFetchStats()
+
+        list(_prefetch_audio_chunks(objects, stats))
+
+        assert stats.chunk_count == 5
+        assert stats.byte_count == sum(len(f"<{idx}>") for idx in range(5))
+        assert stats.seconds > 0
+        assert stats.bytes_per_second > 0
+
+    def test_failed_chunk_stops_the_fetch(self, in_memory_s3: InMemoryS3) -> None:
+        objects = _seed_chunks(in_memory_s3, 5)
+        in_memory_s3.fail(S3Op.GET, transient_error(), times=_PERSISTENT)
+
+        with pytest.raises(S3TransientError):
+            list(_prefetch_audio_chunks(objects, _ChunkFetchStats()))
@@ -0,0 +1,162 @@
+"""Unit tests for silence trimming, speech detection and the time map back to the original audio."""
+
+import numpy as np
+import pytest
+
+from mcr_meeting.app.domain.audio import detect_speech, remove_long_silences
+from mcr_meeting.app.domain.audio_spool import AudioSpool, wav_bytes_from_pcm
+from mcr_meeting.app.domain.transcription.time_map import TimeRemapper
+from mcr_meeting.app.schemas.transcription_schema import (
+    DiarizationSegment,
+    TimeMap,
+    TimeSpan,
+    TranscriptionSegment,
+)
+
+SAMPLE_RATE = 16000
+
+# 0-10 s kept, 10-30 s removed, 30-40 s kept: trimmed time 10 s is original 30 s.
+_TIME_MAP = TimeMap(kept_spans=[TimeSpan(0.0, 10.0), TimeSpan(30.0, 40.0)])
+
+
+def _tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.int16)
+
+
+def _spool(samples: np.ndarray) -> AudioSpool:
+    return AudioSpool.from_bytes(wav_bytes_from_pcm(samples, SAMPLE_RATE).getvalue())
+
+
+class TestTimeRemapper:
+    def test_identity_without_trimming(self):
+        remapper = TimeRemapper(TimeMap())
+        assert remapper.to_original(12.5) == 12.5
+        assert remapper.to_trimmed(12.5) == 12.5
+
+    @pytest.mark.parametrize(
+        ("trimmed", "original"), [(0.0, 0.0), (4.0, 4.0), (12.0, 32.0), (20.0, 40.0)]
+    )
+    def test_maps_trimmed_time_to_original(self, trimmed: float, original: float):
+        assert TimeRemapper(_TIME_MAP).to_original(trimmed) == original
+
+    def test_time_on_a_cut_depends_on_the_interval_side(self):
+        remapper = TimeRemapper(_TIME_MAP)
+        assert remapper.to_original(10.0) == 30.0
+        assert remapper.to_original(10.0, is_end=True) == 10.0
+
+    @pytest.mark.parametrize(
+        ("original", "trimmed"), [(5.0, 5.0), (15.0, 10.0), (29.0, 10.0), (35.0, 15.0)]
+    )
+    def test_maps_original_time_to_trimmed(self, original: float, trimmed: float):
+        assert TimeRemapper(_TIME_MAP).to_trimmed(original) == trimmed
+
+    def test_diarization_round_trips(self):
+        remapper = TimeRemapper(_TIME_MAP)
+        diarization = [
+            DiarizationSegment(start=1.0, end=10.0, speaker="A"),
+            DiarizationSegment(start=10.0, end=14.0, speaker="B"),
+        ]
+
+        original = remapper.diarization_to_original(diarization)
+
+        assert [(s.start, s.end) for s in original] == [(1.0, 10.0), (30.0, 34.0)]
+        assert remapper.diarization_to_trimmed(original) == diarization
+
+    def test_segments_inside_a_removed_silence_are_dropped(self):
+        diarization = [
+            DiarizationSegment(start=12.0, end=18.0, speaker="A"),
+            DiarizationSegment(start=8.0, end=32.0, speaker="B"),
+        ]
+
+        trimmed = TimeRemapper(_TIME_MAP).diarization_to_trimmed(diarization)
+
+        assert [(s.start, s.end, s.speaker) for s in trimmed] == [(8.0, 12.0, "B")]
+
+    def test_transcription_spanning_a_cut_keeps_both_ends(self):
+        segment = TranscriptionSegment(id=0, start=9.0, end=11.0, text="bonjour")
+
+        (original,) = TimeRemapper(_TIME_MAP).transcription_to_original([segment])
+
+        assert (original.start, original.end, original.text) == (9.0, 31.0, "bonjour")
+
+
+class TestRemoveLongSilences:
+    def test_cuts_long_silences_and_keeps_padding(self):
+        samples = np.concatenate(
+            [_tone(2), _silence(10), _tone(3), _silence(1), _tone(2)]
+        )
+
+        with _spool(samples) as wav_audio:
+            trimmed_audio, kept_spans = remove_long_silences(
+                wav_audio, min_silence_seconds=5.0, padding_seconds=0.5
+            )
+            with trimmed_audio:
+                trimmed = np.array(trimmed_audio.pcm())
+
+        # Only the 10 s silence is long enough; 0.5 s of it stays on each side.
+        # (The tone starts on a zero sample, which extends the silence by one.)
+        assert [(span.start, span.end) for span in kept_spans] == [
+            (0.0, 2.5),
+            (pytest.approx(11.5, abs=1e-3), 18.0),
+        ]
+        np.testing.assert_array_equal(
+            trimmed,
+            np.concatenate(
+                [
+                    samples[
+                        round(span.start * SAMPLE_RATE) : round(span.end * SAMPLE_RATE)
+                    ]
+                    for span in kept_spans
+                ]
+            ),
+        )
+
+    def test_trimmed_time_maps_back_to_the_same_sound(self):
+        samples = np.concatenate([_silence(8), _tone(2), _silence(8), _tone(2)])
+
+        with _spool(samples) as wav_audio:
+            trimmed_audio, kept_spans = remove_long_silences(
+                wav_audio, min_silence_seconds=5.0, padding_seconds=1.0
+            )
+            with trimmed_audio:
+                trimmed = np.array(trimmed_audio.pcm())
+        remapper = TimeRemapper(TimeMap(kept_spans=kept_spans))
+
+        for trimmed_second in (1.5, 2.5, 5.0, 6.0):
+            original_second = remapper.to_original(trimmed_second)
+            at_trimmed = int(trimmed_second * SAMPLE_RATE)
+            at_original = round(original_second * SAMPLE_RATE)
+            assert trimmed[at_trimmed] == samples[at_original]
+
+    def test_nothing_to_trim(self):
+        samples = np.concatenate([_tone(2), _silence(2), _tone(2)])
+
+        with _spool(samples) as wav_audio:
+            assert (
+                remove_long_silences(
+                    wav_audio, min_silence_seconds=5.0, padding_seconds=0.5
+                )
+                is None
+            )
+
+
+class TestDetectSpeech:
+    def test_speech_lies_between_the_silences(self):
+        samples = np.concatenate([_silence(1), _tone(2), _silence(2), _tone(3)])
+
+        with _spool(samples) as wav_audio:
+            speech = detect_speech(wav_audio)
+
+        assert [(span.start, span.end) for span in speech] == [
+            (pytest.approx(1.0, abs=1e-3), pytest.approx(3.0, abs=1e-3)),
+            (pytest.approx(5.0, abs=1e-3), 8.0),
+        ]
+
+    def test_audio_without_silence_is_one_span(self):
+        with _spool(_tone(3)) as wav_audio:
+            assert detect_speech(wav_audio) == [TimeSpan(0.0, 3.0)]
@@ -74,9 +74,7 @@ def test_transcription_error_event_leaks_no_transcript_text(
     sentry_capture: _CapturingTransport,
 ) -> None:
     inputs = [
-        TranscriptionInput(
-            audio=np.zeros(4, dtype=np.float32), span=TimeSpan(0.0, 10.0)
-        )
+        TranscriptionInput(audio=np.zeros(4, dtype=np.int16), span=TimeSpan(0.0, 10.0))
     ]
     mocker.patch(
         "mcr_meeting.app.infrastructure.transcription.split_audio_on_timestamps",
@@ -0,0 +1,182 @@
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+import mcr_meeting.app.use_cases.transcription._shared.extract_participants as ep
+from mcr_meeting.app.infrastructure.unleash import FeatureFlag
+from mcr_meeting.app.schemas.transcription_schema import (
+    DiarizedTranscriptionSegment,
+    Participant,
+)
+from tests.mocks.in_memory_feature_flags import InMemoryFeatureFlagClient
+
+CHUNK_COUNT = 4
+
+
+def _segments() -> list[DiarizedTranscriptionSegment]:
+    return [
+        DiarizedTranscriptionSegment(
+            id=i, speaker=f"LOCUTEUR_0{i}", text=f"mot {i}", start=i, end=i + 1
+        )
+        for i in range(CHUNK_COUNT)
+    ]
+
+
+def _participant(
+    speaker_id: str, name: str | None, confidence: float | None = 0.95
+) -> Participant:
+    return Participant(
+        speaker_id=speaker_id,
+        name=name,
+        role=None,
+        confidence=confidence,
+        association_justification=None,
+    )
+
+
+@pytest.fixture(autouse=True)
+def one_chunk_per_segment(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        ep, "chunk_text", side_effect=lambda text, chunk_overlap: text.split("\n")
+    )
+
+
+def _named_after_chunk(chunk: str) -> list[Participant]:
+    speaker_id, text = chunk.split(": ")
+    return [_participant(speaker_id, text.replace("mot", "Nom"))]
+
+
+class TestMapMerge:
+    @pytest.fixture(autouse=True)
+    def map_merge(self, feature_flags: InMemoryFeatureFlagClient) -> None:
+        feature_flags.enable(FeatureFlag.PARTICIPANT_MAP_MERGE)
+
+    def test_chunks_are_extracted_side_by_side_and_merged_in_order(
+        self, mocker: MockerFixture
+    ) -> None:
+        # Every chunk waits for all the others: only concurrent calls get through.
+        all_in_flight = threading.Barrier(CHUNK_COUNT, timeout=5)
+
+        def extract(chunk: str) -> list[Participant]:
+            all_in_flight.wait()
+            return _named_after_chunk(chunk)
+
+        mocker.patch.object(
+            ep.participants_llm, "extract_participants", side_effect=extract
+        )
+        refine = mocker.patch.object(ep.participants_llm, "refine_participants")
+        resolve = mocker.patch.object(
+            ep.participants_llm, "resolve_participant_conflicts"
+        )
+
+        participants = ep.extract_participants(_segments())
+
+        assert [(p.speaker_id, p.name) for p in participants] == [
+            (f"LOCUTEUR_0{i}", f"Nom {i}") for i in range(CHUNK_COUNT)
+        ]
+        refine.assert_not_called()
+        resolve.assert_not_called()
+
+    def test_llm_settles_only_the_conflicted_speakers(
+        self, mocker: MockerFixture
+    ) -> None:
+        def extract(chunk: str) -> list[Participant]:
+            # LOCUTEUR_00 gets a different, equally likely name in every chunk.
+            return [
+                _participant("LOCUTEUR_00", chunk, confidence=0.6),
+                _participant("LOCUTEUR_09", "Zoé"),
+            ]
+
+        mocker.patch.object(
+            ep.participants_llm, "extract_participants", side_effect=extract
+        )
+        resolve = mocker.patch.object(
+            ep.participants_llm,
+            "resolve_participant_conflicts",
+            return_value=[
+                _participant("LOCUTEUR_00", "Arbitré"),
+                _participant("LOCUTEUR_09", "Autre"),
+            ],
+        )
+
+        participants = ep.extract_participants(_segments())
+
+        assert [(p.speaker_id, p.name) for p in participants] == [
+            ("LOCUTEUR_00", "Arbitré"),
+            ("LOCUTEUR_09", "Zoé"),
+        ]
+        current, candidates = resolve.call_args.args
+        assert [p.name for p in current] == [None, "Zoé"]
+        assert {p.speaker_id for p in candidates} == {"LOCUTEUR_00"}
+        assert len(candidates) == CHUNK_COUNT
+
+    @pytest.mark.parametrize(
+        ("resolved_confidence", "expected"),
+        [
+            (0.6, [("LOCUTEUR_00", None), ("LOCUTEUR_09", "Zoé")]),
+            (0.95, [("LOCUTEUR_00", None), ("LOCUTEUR_09", None)]),
+        ],
+    )
+    def test_resolved_name_already_taken_is_not_shared(
+        self,
+        mocker: MockerFixture,
+        resolved_confidence: float,
+        expected: list[tuple[str, str | None]],
+    ) -> None:
+        mocker.patch.object(
+            ep.participants_llm,
+            "extract_participants",
+            side_effect=lambda chunk: [
+                _participant("LOCUTEUR_00", chunk, confidence=0.6),
+                _participant("LOCUTEUR_09", "Zoé"),
+            ],
+        )
+        mocker.patch.object(
+            ep.participants_llm,
+            "resolve_participant_conflicts",
+            return_value=[
+                _participant("LOCUTEUR_00", "Zoé", confidence=resolved_confidence)
+            ],
+        )
+
+        participants = ep.extract_participants(_segments())
+
+        assert [(p.speaker_id, p.name) for p in participants] == expected
+
+    def test_failed_resolution_leaves_the_conflict_unnamed(
+        self, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.object(
+            ep.participants_llm,
+            "extract_participants",
+            side_effect=lambda chunk: [_participant("LOCUTEUR_00", chunk, 0.6)],
+        )
+        mocker.patch.object(
+            ep.participants_llm,
+            "resolve_participant_conflicts",
+            side_effect=RuntimeError("LLM unavailable"),
+        )
+
+        participants = ep.extract_participants(_segments())
+
+        assert [(p.speaker_id, p.name) for p in participants] == [("LOCUTEUR_00", None)]
+
+
+def test_refine_chain_without_the_flag(mocker: MockerFixture) -> None:
+    extract = mocker.patch.object(
+        ep.participants_llm,
+        "extract_participants",
+        side_effect=_named_after_chunk,
+    )
+    refine = mocker.patch.object(
+        ep.participants_llm,
+        "refine_participants",
+        side_effect=lambda current, chunk: current + _named_after_chunk(chunk),
+    )
+
+    participants = ep.extract_participants(_segments())
+
+    assert extract.call_count == 1
+    assert refine.call_count == CHUNK_COUNT - 1
+    assert [p.name for p in participants] == [f"Nom {i}" for i in range(CHUNK_COUNT)]
@@ -212,6 +212,39 @@ def test_init_transcription_and_minutes_report_enqueues_chain_when_split_enabled
     mock_celery_producer_app.send_task.assert_not_called()
 
 
+def test_init_transcription_and_minutes_report_plans_a_chunk_fan_out_when_enabled(
+    mock_celery_producer_app: Mock,
+    feature_flags: InMemoryFeatureFlagClient,
+    mocker: MockerFixture,
+) -> None:
+    feature_flags.enable(FeatureFlag.STRUCTURAL_SPLIT_ENABLED)
+    feature_flags.enable(FeatureFlag.TRANSCRIPTION_CHUNK_FAN_OUT)
+    mocker.patch("mcr_meeting.app.infrastructure.celery.chain")
+    meeting = MeetingFactory.create(
+        status=MeetingStatus.CAPTURE_DONE,
+        name_platform=MeetingPlatforms.COMU,
+    )
+
+    init_transcription_and_minutes_report(meeting_id=meeting.id)
+
+    args = [meeting.id, str(meeting.owner.keycloak_uuid)]
+    mock_celery_producer_app.signature.assert_has_calls(
+        [
+            call(MCRTranscriptionTasks.DIARIZE, args=args, immutable=True),
+            call(
+                MCRTranscriptionTasks.PLAN_TRANSCRIPTION_CHUNKS,
+                args=args,
+                immutable=True,
+            ),
+            call(
+                MCRTranscriptionTasks.FINALIZE_TRANSCRIPTION,
+                args=args,
+                immutable=True,
+            ),
+        ]
+    )
+
+
 def test_init_transcription_and_minutes_report_falls_back_to_legacy_when_flag_unreadable(
     mock_celery_producer_app: Mock,
     feature_flags: InMemoryFeatureFlagClient,
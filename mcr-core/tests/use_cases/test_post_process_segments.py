@@ -0,0 +1,161 @@
+import re
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+import mcr_meeting.app.use_cases.transcription._shared.post_process_segments as pps
+from mcr_meeting.app.infrastructure.unleash import FeatureFlag
+from mcr_meeting.app.schemas.transcription_schema import DiarizedTranscriptionSegment
+from tests.mocks.in_memory_feature_flags import InMemoryFeatureFlagClient
+
+SEGMENT_COUNT = 6
+
+
+def _segments() -> list[DiarizedTranscriptionSegment]:
+    return [
+        DiarizedTranscriptionSegment(
+            id=i, speaker=f"S{i}", text=f"mot {i}", start=i, end=i + 1
+        )
+        for i in range(SEGMENT_COUNT)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def one_chunk_per_segment(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        pps,
+        "chunk_text",
+        side_effect=lambda text, chunk_overlap: re.split(r"(?<=>)", text),
+    )
+
+
+def _texts(segments: list[DiarizedTranscriptionSegment]) -> list[str]:
+    return [segment.text.strip() for segment in segments]
+
+
+def _correct(chunk: str) -> str:
+    return chunk.replace("mot", "MOT")
+
+
+def test_chunks_are_corrected_side_by_side_and_kept_in_order() -> None:
+    # Every chunk waits for all the others: only concurrent calls get through.
+    all_in_flight = threading.Barrier(SEGMENT_COUNT, timeout=5)
+
+    def correct(chunk: str) -> str:
+        all_in_flight.wait()
+        return _correct(chunk)
+
+    corrected = pps._apply_text_correction(_segments(), correct)
+
+    assert _texts(corrected) == [f"MOT {i}" for i in range(SEGMENT_COUNT)]
+
+
+def test_in_flight_corrections_are_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("LLM_MAX_CONCURRENT_CORRECTIONS", "2")
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def correct(chunk: str) -> str:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        threading.Event().wait(0.02)
+        with lock:
+            in_flight -= 1
+        return _correct(chunk)
+
+    corrected = pps._apply_text_correction(_segments(), correct)
+
+    assert peak == 2
+    assert _texts(corrected) == [f"MOT {i}" for i in range(SEGMENT_COUNT)]
+
+
+def test_failed_chunk_keeps_its_original_text() -> None:
+    def correct(chunk: str) -> str:
+        if "mot 2" in chunk:
+            raise RuntimeError("LLM unavailable")
+        return _correct(chunk)
+
+    corrected = pps._apply_text_correction(_segments(), correct)
+
+    assert _texts(corrected) == [
+        "MOT 0",
+        "MOT 1",
+        "mot 2",
+        "MOT 3",
+        "MOT 4",
+        "MOT 5",
+    ]
+
+
+class TestTextCorrectionFromFlags:
+    @pytest.fixture(autouse=True)
+    def correctors(self, mocker: MockerFixture) -> dict[str, list[str]]:
+        calls: dict[str, list[str]] = {"acronyms": [], "spelling": [], "fused": []}
+        for name, attribute in (
+            ("acronyms", "correct_acronyms"),
+            ("spelling", "correct_spelling"),
+            ("fused", "correct_acronyms_and_spelling"),
+        ):
+            mocker.patch.object(
+                pps,
+                attribute,
+                side_effect=lambda chunk, name=name: calls[name].append(chunk) or chunk,
+            )
+        return calls
+
+    def _call_counts(self, correctors: dict[str, list[str]]) -> dict[str, int]:
+        return {name: len(chunks) for name, chunks in correctors.items()}
+
+    def test_acronyms_only_without_spelling_correction(
+        self, correctors: dict[str, list[str]], feature_flags: InMemoryFeatureFlagClient
+    ) -> None:
+        feature_flags.enable(FeatureFlag.FUSED_TEXT_CORRECTION)
+
+        pps.post_process_segments(_segments())
+
+        assert self._call_counts(correctors) == {
+            "acronyms": SEGMENT_COUNT,
+            "spelling": 0,
+            "fused": 0,
+        }
+
+    def test_two_passes_with_spelling_correction(
+        self, correctors: dict[str, list[str]], feature_flags: InMemoryFeatureFlagClient
+    ) -> None:
+        feature_flags.enable(FeatureFlag.SPELLING_CORRECTION)
+
+        pps.post_process_segments(_segments())
+
+        assert self._call_counts(correctors) == {
+            "acronyms": SEGMENT_COUNT,
+            "spelling": SEGMENT_COUNT,
+            "fused": 0,
+        }
+
+    def test_fused_flag_makes_a_single_pass(
+        self, correctors: dict[str, list[str]], feature_flags: InMemoryFeatureFlagClient
+    ) -> None:
+        feature_flags.enable(FeatureFlag.SPELLING_CORRECTION)
+        feature_flags.enable(FeatureFlag.FUSED_TEXT_CORRECTION)
+
+        pps.post_process_segments(_segments())
+
+        assert self._call_counts(correctors) == {
+            "acronyms": 0,
+            "spelling": 0,
+            "fused": SEGMENT_COUNT,
+        }
+
+    def test_explicit_correction_overrides_the_flags(
+        self, correctors: dict[str, list[str]]
+    ) -> None:
+        pps.post_process_segments(_segments(), pps.TextCorrection.NONE)
+
+        assert self._call_counts(correctors) == {
+            "acronyms": 0,
+            "spelling": 0,
+            "fused": 0,
+        }
@@ -1,32 +1,57 @@
 import json
 import subprocess
-from io import BytesIO
+from typing import BinaryIO
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
+import soundfile as sf
 from pytest_mock import MockerFixture
 
 import mcr_meeting.app.use_cases.transcription._shared.preprocess_audio as pa
 import mcr_meeting.app.use_cases.transcription.run_diarization as rd
 from mcr_meeting.app.configs.base import S3Settings
-from mcr_meeting.app.schemas.transcription_schema import DiarizationSegment
-from tests.mocks.in_memory_s3 import InMemoryS3
+from mcr_meeting.app.domain.audio import AudioAnalysis
+from mcr_meeting.app.domain.audio_spool import AudioSpool, wav_bytes_from_pcm
+from mcr_meeting.app.exceptions.exceptions import (
+    DiarizationError,
+    DiarizationRetryableError,
+)
+from mcr_meeting.app.infrastructure.diarization import DiarizationJobPoll
+from mcr_meeting.app.infrastructure.unleash import FeatureFlag
+from mcr_meeting.app.schemas.transcription_schema import (
+    DiarizationJobState,
+    DiarizationSegment,
+)
+from tests.mocks.in_memory_feature_flags import InMemoryFeatureFlagClient
+from tests.mocks.in_memory_s3 import InMemoryS3, S3Op
 
 MEETING_ID = 123
 
 # Keys hardcode : They are an interface between the app and the S3
 PREPROCESSED_KEY = "artifacts/123/preprocessed_audio.wav"
 DIARIZATION_KEY = "artifacts/123/diarization.json"
+MANIFEST_KEY = "artifacts/123/manifest.json"
+DIARIZATION_JOB_KEY = "artifacts/123/diarization_job.json"
 
 _AUDIO_FOLDER = S3Settings().S3_AUDIO_FOLDER
 _DIARIZATION = [DiarizationSegment(start=0.0, end=1.0, speaker="A")]
 
 
-def _patch_preprocessing(mocker: MockerFixture, wav: BytesIO) -> None:
-    mocker.patch.object(rd.s3, "fetch_audio_bytes", return_value=BytesIO(b"raw"))
-    mocker.patch.object(pa, "audio_bytes_to_wav_bytes", return_value=wav)
-    mocker.patch.object(pa, "check_audio_has_minimum_duration")
-    mocker.patch.object(pa, "check_audio_is_not_silent")
+def _patch_preprocessing(mocker: MockerFixture, wav: bytes) -> None:
+    mocker.patch.object(
+        rd.s3, "fetch_audio_spool", return_value=AudioSpool.from_bytes(b"raw")
+    )
+    mocker.patch.object(
+        pa,
+        "analyze_audio",
+        return_value=AudioAnalysis(
+            audio=AudioSpool.from_bytes(wav),
+            duration_seconds=2.0,
+            mean_volume_db=-20.0,
+            silences=[],
+        ),
+    )
 
 
 @pytest.fixture
@@ -70,12 +95,17 @@ def test_writes_preprocessed_audio_and_diarization_to_s3(
     in_memory_s3: InMemoryS3, meeting_audio: bytes
 ) -> None:
     processor = Mock()
-    processor.diarize.return_value = _DIARIZATION
+    diarized: list[bytes] = []
+
+    def _diarize(audio_bytes: BinaryIO) -> list[DiarizationSegment]:
+        diarized.append(audio_bytes.read())
+        return _DIARIZATION
+
+    processor.diarize.side_effect = _diarize
 
     rd.run_diarization(MEETING_ID, processor)
 
-    diarized_audio = processor.diarize.call_args.kwargs["audio_bytes"].getvalue()
-    assert in_memory_s3.objects[PREPROCESSED_KEY] == diarized_audio
+    assert diarized == [in_memory_s3.objects[PREPROCESSED_KEY]]
     assert json.loads(in_memory_s3.objects[DIARIZATION_KEY]) == [
         {"start": 0.0, "end": 1.0, "speaker": "A"}
     ]
@@ -87,7 +117,7 @@ def test_uploads_full_audio_even_after_diarization_consumed_the_buffer(
     processor = Mock()
     consumed: list[int] = []
 
-    def _consume(audio_bytes: BytesIO) -> list[DiarizationSegment]:
+    def _consume(audio_bytes: BinaryIO) -> list[DiarizationSegment]:
         consumed.append(len(audio_bytes.read()))
         return _DIARIZATION
 
@@ -96,3 +126,247 @@ def test_uploads_full_audio_even_after_diarization_consumed_the_buffer(
     rd.run_diarization(MEETING_ID, processor)
 
     assert consumed == [len(in_memory_s3.objects[PREPROCESSED_KEY])]
+
+
+def _diarizing_processor() -> Mock:
+    processor = Mock()
+    processor.diarize.return_value = _DIARIZATION
+    return processor
+
+
+def test_writes_the_artifact_manifest(
+    in_memory_s3: InMemoryS3, meeting_audio: bytes
+) -> None:
+    rd.run_diarization(MEETING_ID, _diarizing_processor())
+
+    manifest = json.loads(in_memory_s3.objects[MANIFEST_KEY])
+    assert set(manifest) == {"source_audio_hash", "config_fingerprint"}
+
+
+def test_rerun_with_unchanged_inputs_reuses_the_artifacts(
+    in_memory_s3: InMemoryS3, meeting_audio: bytes
+) -> None:
+    rd.run_diarization(MEETING_ID, _diarizing_processor())
+    gets_before = in_memory_s3.calls[S3Op.GET]
+    processor = _diarizing_processor()
+
+    rd.run_diarization(MEETING_ID, processor)
+
+    processor.diarize.assert_not_called()
+    # Only the manifest is read: no audio chunk is downloaded again.
+    assert in_memory_s3.calls[S3Op.GET] == gets_before + 1
+
+
+def test_changed_audio_is_diarized_again(
+    in_memory_s3: InMemoryS3, meeting_audio: bytes
+) -> None:
+    rd.run_diarization(MEETING_ID, _diarizing_processor())
+    first_manifest = in_memory_s3.objects[MANIFEST_KEY]
+    # Same key, new content: only the listing's ETag and size tell them apart.
+    in_memory_s3.objects[f"{_AUDIO_FOLDER}/{MEETING_ID}/chunk_001.wav"] = meeting_audio[
+        :-3200
+    ]
+    processor = _diarizing_processor()
+
+    rd.run_diarization(MEETING_ID, processor)
+
+    processor.diarize.assert_called_once()
+    assert in_memory_s3.objects[MANIFEST_KEY] != first_manifest
+
+
+def test_changed_config_is_diarized_again(
+    in_memory_s3: InMemoryS3, meeting_audio: bytes, mocker: MockerFixture
+) -> None:
+    rd.run_diarization(MEETING_ID, _diarizing_processor())
+    first_manifest = in_memory_s3.objects[MANIFEST_KEY]
+    mocker.patch.object(
+        rd, "diarization_job_parameters", return_value={"model": "another-model"}
+    )
+    processor = _diarizing_processor()
+
+    rd.run_diarization(MEETING_ID, processor)
+
+    processor.diarize.assert_called_once()
+    assert in_memory_s3.objects[MANIFEST_KEY] != first_manifest
+
+
+def test_unreadable_manifest_is_ignored(
+    in_memory_s3: InMemoryS3, meeting_audio: bytes
+) -> None:
+    in_memory_s3.objects[MANIFEST_KEY] = b"not json"
+    processor = _diarizing_processor()
+
+    rd.run_diarization(MEETING_ID, processor)
+
+    processor.diarize.assert_called_once()
+
+
+def test_long_silences_are_trimmed_and_diarization_stored_in_original_time(
+    in_memory_s3: InMemoryS3, mocker: MockerFixture
+) -> None:
+    tone = np.sin(2 * np.pi * 440 * np.arange(2 * 16000) / 16000) * 8000
+    samples = np.concatenate([tone, np.zeros(10 * 16000), tone]).astype(np.int16)
+    in_memory_s3.objects[f"{_AUDIO_FOLDER}/{MEETING_ID}/chunk_001.wav"] = (
+        wav_bytes_from_pcm(samples, 16000).getvalue()
+    )
+    mocker.patch.object(
+        pa,
+        "get_feature_flag_client",
+        return_value=Mock(
+            is_enabled=lambda flag: flag == FeatureFlag.AUDIO_SILENCE_TRIMMING
+        ),
+    )
+    diarized_durations: list[float] = []
+
+    def diarize(audio_bytes: BinaryIO) -> list[DiarizationSegment]:
+        diarized_durations.append(sf.info(audio_bytes).duration)
+        return [DiarizationSegment(start=3.5, end=4.5, speaker="A")]
+
+    rd.run_diarization(MEETING_ID, Mock(diarize=diarize))
+
+    # 10 s of silence minus 1 s of padding on each side are cut out.
+    assert diarized_durations == [pytest.approx(6.0, abs=1e-3)]
+    (segment,) = json.loads(in_memory_s3.objects[DIARIZATION_KEY])
+    assert segment["start"] == pytest.approx(11.5, abs=1e-3)
+    assert segment["end"] == pytest.approx(12.5, abs=1e-3)
+    time_map = json.loads(in_memory_s3.objects["artifacts/123/time_map.json"])
+    assert len(time_map["kept_spans"]) == 2
+
+
+def test_untrimmed_audio_stores_an_identity_time_map(
+    in_memory_s3: InMemoryS3, meeting_audio: bytes
+) -> None:
+    rd.run_diarization(MEETING_ID, _diarizing_processor())
+
+    assert json.loads(in_memory_s3.objects["artifacts/123/time_map.json"]) == {
+        "kept_spans": None
+    }
+
+
+def _submitting_processor() -> Mock:
+    processor = Mock()
+    processor.submit_job.return_value = "job-1"
+    return processor
+
+
+def _stored_job(in_memory_s3: InMemoryS3) -> DiarizationJobState:
+    return DiarizationJobState.model_validate_json(
+        in_memory_s3.objects[DIARIZATION_JOB_KEY]
+    )
+
+
+class TestDeferredPolling:
+    @pytest.fixture(autouse=True)
+    def _deferred_polling(self, feature_flags: InMemoryFeatureFlagClient) -> None:
+        feature_flags.enable(FeatureFlag.DIARIZATION_DEFERRED_POLLING)
+
+    def test_submits_the_job_without_waiting_for_it(
+        self, in_memory_s3: InMemoryS3, meeting_audio: bytes
+    ) -> None:
+        processor = _submitting_processor()
+
+        first_poll_in = rd.start_diarization(MEETING_ID, processor)
+
+        assert first_poll_in == rd.next_poll_interval(0.0, None)
+        processor.diarize.assert_not_called()
+        assert _stored_job(in_memory_s3).job_id == "job-1"
+        assert PREPROCESSED_KEY in in_memory_s3.objects
+        assert DIARIZATION_KEY not in in_memory_s3.objects
+
+    def test_pending_job_is_polled_again_later(
+        self, in_memory_s3: InMemoryS3, meeting_audio: bytes
+    ) -> None:
+        processor = _submitting_processor()
+        rd.start_diarization(MEETING_ID, processor)
+        job = _stored_job(in_memory_s3)
+        processor.poll_job.return_value = DiarizationJobPoll(
+            segments=None,
+            job=job.model_copy(update={"seen_processing": True}),
+            next_poll_in=90.0,
+        )
+
+        assert rd.poll_diarization(MEETING_ID, processor) == 90.0
+        assert _stored_job(in_memory_s3).seen_processing
+
+    def test_completed_job_stores_the_diarization_and_manifest(
+        self, in_memory_s3: InMemoryS3, meeting_audio: bytes
+    ) -> None:
+        processor = _submitting_processor()
+        rd.start_diarization(MEETING_ID, processor)
+        processor.poll_job.return_value = DiarizationJobPoll(
+            segments=_DIARIZATION, job=_stored_job(in_memory_s3), next_poll_in=0.0
+        )
+
+        assert rd.poll_diarization(MEETING_ID, processor) is None
+
+        assert json.loads(in_memory_s3.objects[DIARIZATION_KEY]) == [
+            {"start": 0.0, "end": 1.0, "speaker": "A"}
+        ]
+        # Same manifest as a blocking run: a rerun reuses the artifacts.
+        assert rd.start_diarization(MEETING_ID, _submitting_processor()) is None
+
+    def test_retryable_failure_resubmits_the_stored_audio(
+        self, in_memory_s3: InMemoryS3, meeting_audio: bytes
+    ) -> None:
+        processor = _submitting_processor()
+        rd.start_diarization(MEETING_ID, processor)
+        processor.poll_job.side_effect = DiarizationRetryableError("stale")
+
+        with pytest.raises(DiarizationRetryableError):
+            rd.poll_diarization(MEETING_ID, processor)
+        assert _stored_job(in_memory_s3).job_id is None
+
+        submitted: list[bytes] = []
+        processor.submit_job.side_effect = lambda wav: (
+            submitted.append(wav.read()) or "job-2"
+        )
+        rd.poll_diarization(MEETING_ID, processor)
+
+        assert submitted == [in_memory_s3.objects[PREPROCESSED_KEY]]
+        job = _stored_job(in_memory_s3)
+        assert (job.job_id, job.attempt) == ("job-2", 2)
+
+    def test_resubmissions_are_bounded(
+        self, in_memory_s3: InMemoryS3, meeting_audio: bytes
+    ) -> None:
+        processor = _submitting_processor()
+        rd.start_diarization(MEETING_ID, processor)
+        job = _stored_job(in_memory_s3)
+        in_memory_s3.objects[DIARIZATION_JOB_KEY] = (
+            job.model_copy(
+                update={"attempt": rd._retry_settings.TASK_RETRY_MAX_RETRIES + 1}
+            )
+            .model_dump_json()
+            .encode()
+        )
+        processor.poll_job.side_effect = DiarizationRetryableError("stale")
+
+        with pytest.raises(DiarizationError, match="failed after"):
+            rd.poll_diarization(MEETING_ID, processor)
+
+
+def test_speculative_transcription_defers_the_polling_too(
+    in_memory_s3: InMemoryS3,
+    meeting_audio: bytes,
+    feature_flags: InMemoryFeatureFlagClient,
+) -> None:
+    feature_flags.enable(FeatureFlag.TRANSCRIPTION_SPECULATIVE_WINDOWS)
+    processor = _submitting_processor()
+
+    assert rd.start_diarization(MEETING_ID, processor) is not None
+
+    processor.diarize.assert_not_called()
+    assert _stored_job(in_memory_s3).job_id == "job-1"
+    assert PREPROCESSED_KEY in in_memory_s3.objects
+
+
+def test_start_diarization_waits_for_the_job_by_default(
+    in_memory_s3: InMemoryS3, meeting_audio: bytes
+) -> None:
+    processor = _diarizing_processor()
+
+    assert rd.start_diarization(MEETING_ID, processor) is None
+
+    processor.diarize.assert_called_once()
+    processor.submit_job.assert_not_called()
+    assert DIARIZATION_KEY in in_memory_s3.objects
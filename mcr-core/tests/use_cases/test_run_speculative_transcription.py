@@ -0,0 +1,172 @@
+import json
+from functools import partial
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+import mcr_meeting.app.use_cases.transcription._shared.speculative_windows as sw
+import mcr_meeting.app.use_cases.transcription.run_speculative_transcription as rst
+import mcr_meeting.app.use_cases.transcription.run_transcribe_chunks as rtc
+import mcr_meeting.app.use_cases.transcription.run_transcription_fan_out as fan_out
+from mcr_meeting.app.domain.audio_spool import wav_bytes_from_pcm
+from mcr_meeting.app.domain.transcription.chunking import compute_speech_chunks
+from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
+from mcr_meeting.app.infrastructure.unleash import FeatureFlag
+from mcr_meeting.app.schemas.transcription_schema import (
+    ArtifactManifest,
+    DiarizationJobState,
+    TranscriptionSegment,
+)
+from tests.mocks.in_memory_feature_flags import InMemoryFeatureFlagClient
+from tests.mocks.in_memory_s3 import InMemoryS3
+
+MEETING_ID = 123
+
+PREPROCESSED_KEY = "artifacts/123/preprocessed_audio.wav"
+DIARIZATION_KEY = "artifacts/123/diarization.json"
+DIARIZATION_JOB_KEY = "artifacts/123/diarization_job.json"
+MANIFEST_KEY = "artifacts/123/manifest.json"
+TRANSCRIPTION_RAW_KEY = "artifacts/123/transcription_raw.json"
+WINDOWS_KEY = "artifacts/123/speculative_transcription_windows.json"
+
+_MANIFEST = ArtifactManifest(source_audio_hash="audio", config_fingerprint="config")
+
+
+def _tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * 16000)) / 16000
+    return (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+
+
+@pytest.fixture(autouse=True)
+def speculation(feature_flags: InMemoryFeatureFlagClient) -> None:
+    feature_flags.enable(FeatureFlag.TRANSCRIPTION_SPECULATIVE_WINDOWS)
+
+
+@pytest.fixture
+def submitted_meeting(in_memory_s3: InMemoryS3, mocker: MockerFixture) -> None:
+    # Speech 0-3 s and 5-8 s, silent in between; windows of at most 4 s.
+    samples = np.concatenate([_tone(3), np.zeros(2 * 16000, np.int16), _tone(3)])
+    in_memory_s3.objects[PREPROCESSED_KEY] = wav_bytes_from_pcm(
+        samples, 16000
+    ).getvalue()
+    in_memory_s3.objects[DIARIZATION_JOB_KEY] = (
+        DiarizationJobState(
+            job_id="job-1", submitted_at=0.0, phase_started_at=0.0, manifest=_MANIFEST
+        )
+        .model_dump_json()
+        .encode()
+    )
+    mocker.patch.object(
+        sw,
+        "compute_speech_chunks",
+        partial(compute_speech_chunks, max_chunk_duration=4.0),
+    )
+
+
+def _diarization_completes(in_memory_s3: InMemoryS3) -> None:
+    in_memory_s3.objects[DIARIZATION_KEY] = (
+        b'[{"start": 0.0, "end": 3.0, "speaker": "A"},'
+        b' {"start": 5.0, "end": 8.0, "speaker": "B"}]'
+    )
+    in_memory_s3.objects[MANIFEST_KEY] = _MANIFEST.model_dump_json().encode()
+
+
+def _fake_api(mocker: MockerFixture) -> list[float]:
+    sent: list[float] = []
+
+    def transcribe_chunk(audio: np.ndarray) -> list[TranscriptionSegment]:
+        sent.append(len(audio) / 16000)
+        return [TranscriptionSegment(id=0, start=0.5, end=2.5, text="bonjour")]
+
+    mocker.patch.object(
+        TranscriptionProcessor,
+        "_transcribe_audio_chunk_api",
+        side_effect=transcribe_chunk,
+    )
+    return sent
+
+
+def test_windows_are_cut_in_the_silences_of_the_audio(
+    in_memory_s3: InMemoryS3, mocker: MockerFixture, submitted_meeting: None
+) -> None:
+    sent = _fake_api(mocker)
+
+    rst.run_speculative_transcription(MEETING_ID, TranscriptionProcessor())
+
+    windows = json.loads(in_memory_s3.objects[WINDOWS_KEY])
+    assert windows["manifest"] == _MANIFEST.model_dump()
+    assert [(w["start"], w["end"]) for w in windows["windows"]] == [
+        (0.0, pytest.approx(4.0, abs=0.1)),
+        (pytest.approx(4.0, abs=0.1), 8.0),
+    ]
+    assert len(sent) == 2
+
+
+def test_transcription_reuses_the_windows_and_assigns_the_turns(
+    in_memory_s3: InMemoryS3, mocker: MockerFixture, submitted_meeting: None
+) -> None:
+    _fake_api(mocker)
+    rst.run_speculative_transcription(MEETING_ID, TranscriptionProcessor())
+    _diarization_completes(in_memory_s3)
+
+    sent = _fake_api(mocker)
+    rtc.run_transcribe_chunks(MEETING_ID, TranscriptionProcessor())
+
+    assert sent == []
+    raw = json.loads(in_memory_s3.objects[TRANSCRIPTION_RAW_KEY])
+    assert [(s["speaker"], s["text"]) for s in raw] == [
+        ("A", "bonjour"),
+        ("B", "bonjour"),
+    ]
+
+
+def test_fan_out_plans_the_speculative_windows(
+    in_memory_s3: InMemoryS3, mocker: MockerFixture, submitted_meeting: None
+) -> None:
+    _fake_api(mocker)
+    rst.run_speculative_transcription(MEETING_ID, TranscriptionProcessor())
+    _diarization_completes(in_memory_s3)
+
+    assert fan_out.run_plan_transcription_chunks(MEETING_ID) == 2
+    sent = _fake_api(mocker)
+    for chunk_index in range(2):
+        fan_out.run_transcribe_chunk(MEETING_ID, chunk_index, TranscriptionProcessor())
+
+    assert sent == []
+
+
+def test_windows_of_another_run_are_ignored(
+    in_memory_s3: InMemoryS3, mocker: MockerFixture, submitted_meeting: None
+) -> None:
+    _fake_api(mocker)
+    rst.run_speculative_transcription(MEETING_ID, TranscriptionProcessor())
+    _diarization_completes(in_memory_s3)
+    in_memory_s3.objects[MANIFEST_KEY] = (
+        _MANIFEST.model_copy(update={"source_audio_hash": "new audio"})
+        .model_dump_json()
+        .encode()
+    )
+
+    sent = _fake_api(mocker)
+    rtc.run_transcribe_chunks(MEETING_ID, TranscriptionProcessor())
+
+    # One diarization chunk (the turns fit in MAX_CHUNK_DURATION), sent anew.
+    assert sent == [8.0]
+
+
+def test_flag_off_ignores_the_windows(
+    in_memory_s3: InMemoryS3,
+    mocker: MockerFixture,
+    feature_flags: InMemoryFeatureFlagClient,
+    submitted_meeting: None,
+) -> None:
+    _fake_api(mocker)
+    rst.run_speculative_transcription(MEETING_ID, TranscriptionProcessor())
+    _diarization_completes(in_memory_s3)
+    feature_flags.disable(FeatureFlag.TRANSCRIPTION_SPECULATIVE_WINDOWS)
+
+    sent = _fake_api(mocker)
+    rtc.run_transcribe_chunks(MEETING_ID, TranscriptionProcessor())
+
+    assert sent == [8.0]
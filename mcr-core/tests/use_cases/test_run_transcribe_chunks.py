@@ -1,13 +1,27 @@
 import json
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 from pytest_mock import MockerFixture
 
 import mcr_meeting.app.use_cases.transcription._shared.transcribe_diarized_audio as tda
 import mcr_meeting.app.use_cases.transcription.run_transcribe_chunks as rtc
-from mcr_meeting.app.exceptions.exceptions import InvalidAudioFileError
-from mcr_meeting.app.schemas.transcription_schema import DiarizedTranscriptionSegment
+from mcr_meeting.app.domain.audio_spool import wav_bytes_from_pcm
+from mcr_meeting.app.domain.transcription.chunking import ChunkCostModel
+from mcr_meeting.app.exceptions.exceptions import (
+    InvalidAudioFileError,
+    TranscriptionTransientError,
+)
+from mcr_meeting.app.infrastructure import transcription
+from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
+from mcr_meeting.app.infrastructure.unleash import FeatureFlag
+from mcr_meeting.app.schemas.transcription_schema import (
+    DiarizedTranscriptionSegment,
+    TimeSpan,
+    TranscriptionSegment,
+)
+from tests.mocks.in_memory_feature_flags import InMemoryFeatureFlagClient
 from tests.mocks.in_memory_s3 import InMemoryS3
 
 MEETING_ID = 123
@@ -17,6 +31,8 @@ MEETING_ID = 123
 PREPROCESSED_KEY = "artifacts/123/preprocessed_audio.wav"
 DIARIZATION_KEY = "artifacts/123/diarization.json"
 TRANSCRIPTION_RAW_KEY = "artifacts/123/transcription_raw.json"
+TIME_MAP_KEY = "artifacts/123/time_map.json"
+CHUNK_CHECKPOINT_PREFIX = "artifacts/123/transcription_chunks/"
 
 _RAW_SEGMENTS = [
     DiarizedTranscriptionSegment(id=0, start=0.0, end=1.0, text="hello", speaker="A")
@@ -35,14 +51,17 @@ def test_reads_diarization_artifacts_and_writes_raw_segments(
 ) -> None:
     _seed_diarization_artifacts(in_memory_s3)
     processor = Mock()
+    transcribed: list[bytes] = []
+    processor.transcribe.side_effect = lambda audio, chunk_spans, checkpoints: (
+        transcribed.append(audio.read_bytes())
+    )
     mocker.patch.object(
         tda, "diarize_vad_transcription_segments", return_value=_RAW_SEGMENTS
     )
 
     rtc.run_transcribe_chunks(MEETING_ID, processor)
 
-    audio_bytes = processor.transcribe.call_args.kwargs["audio_bytes"]
-    assert audio_bytes.getvalue() == b"wav-data"
+    assert transcribed == [b"wav-data"]
     assert json.loads(in_memory_s3.objects[TRANSCRIPTION_RAW_KEY]) == [
         {"id": 0, "start": 0.0, "end": 1.0, "text": "hello", "speaker": "A"}
     ]
@@ -70,3 +89,135 @@ def test_raises_and_writes_nothing_when_no_diarized_segments(
         rtc.run_transcribe_chunks(MEETING_ID, Mock())
 
     assert TRANSCRIPTION_RAW_KEY not in in_memory_s3.objects
+
+
+def test_trimmed_audio_is_transcribed_in_trimmed_time_and_stored_in_original(
+    in_memory_s3: InMemoryS3,
+) -> None:
+    _seed_diarization_artifacts(in_memory_s3)
+    # 0-10 s kept, 10-30 s trimmed, 30-40 s kept.
+    in_memory_s3.objects[TIME_MAP_KEY] = (
+        b'{"kept_spans": [{"start": 0.0, "end": 10.0}, {"start": 30.0, "end": 40.0}]}'
+    )
+    in_memory_s3.objects[DIARIZATION_KEY] = (
+        b'[{"start": 31.0, "end": 35.0, "speaker": "A"}]'
+    )
+    processor = Mock()
+    processor.transcribe.return_value = [
+        TranscriptionSegment(id=0, start=11.0, end=15.0, text="bonjour")
+    ]
+
+    rtc.run_transcribe_chunks(MEETING_ID, processor)
+
+    assert processor.transcribe.call_args.kwargs["chunk_spans"] == [
+        TimeSpan(11.0, 15.0)
+    ]
+    assert json.loads(in_memory_s3.objects[TRANSCRIPTION_RAW_KEY]) == [
+        {"id": 0, "start": 31.0, "end": 35.0, "text": "bonjour", "speaker": "A"}
+    ]
+
+
+def test_makespan_chunking_spreads_a_short_meeting_over_the_free_slots(
+    in_memory_s3: InMemoryS3,
+    mocker: MockerFixture,
+    feature_flags: InMemoryFeatureFlagClient,
+) -> None:
+    feature_flags.enable(FeatureFlag.TRANSCRIPTION_MAKESPAN_CHUNKING)
+    _seed_diarization_artifacts(in_memory_s3)
+    # Five minutes of 9 s turns separated by 1 s pauses.
+    in_memory_s3.objects[DIARIZATION_KEY] = json.dumps(
+        [{"start": t, "end": t + 9.0, "speaker": "A"} for t in range(0, 300, 10)]
+    ).encode()
+    mocker.patch.object(
+        tda,
+        "chunk_cost_model",
+        return_value=ChunkCostModel(
+            request_overhead=3.0, real_time_factor=0.05, concurrency=4
+        ),
+    )
+    processor = Mock()
+    processor.transcribe.return_value = [
+        TranscriptionSegment(id=0, start=0.0, end=9.0, text="bonjour")
+    ]
+
+    rtc.run_transcribe_chunks(MEETING_ID, processor)
+
+    assert processor.transcribe.call_args.kwargs["chunk_spans"] == [
+        TimeSpan(0.0, 79.5),
+        TimeSpan(79.5, 149.5),
+        TimeSpan(149.5, 219.5),
+        TimeSpan(219.5, 299.0),
+    ]
+
+
+class TestChunkCheckpoints:
+    @pytest.fixture
+    def three_chunks(self, in_memory_s3: InMemoryS3, mocker: MockerFixture) -> None:
+        # One second per chunk, each filled with its own number.
+        samples = np.repeat(np.arange(1, 4, dtype=np.int16), 16000)
+        in_memory_s3.objects[PREPROCESSED_KEY] = wav_bytes_from_pcm(
+            samples, 16000
+        ).getvalue()
+        in_memory_s3.objects[DIARIZATION_KEY] = (
+            b'[{"start": 0.0, "end": 3.0, "speaker": "A"}]'
+        )
+        mocker.patch.object(
+            tda,
+            "compute_transcription_chunks",
+            return_value=[TimeSpan(0.0, 1.0), TimeSpan(1.0, 2.0), TimeSpan(2.0, 3.0)],
+        )
+
+    def _fake_api(
+        self, mocker: MockerFixture, failing_chunk: int | None = None
+    ) -> list[int]:
+        sent: list[int] = []
+
+        def transcribe_chunk(audio: np.ndarray) -> list[TranscriptionSegment]:
+            chunk = int(audio[0])
+            sent.append(chunk)
+            if chunk == failing_chunk:
+                raise TranscriptionTransientError("HTTP 503")
+            return [TranscriptionSegment(id=0, start=0.1, end=0.9, text=f"c{chunk}")]
+
+        mocker.patch.object(
+            TranscriptionProcessor,
+            "_transcribe_audio_chunk_api",
+            side_effect=transcribe_chunk,
+        )
+        return sent
+
+    def test_retry_only_sends_the_chunks_that_failed(
+        self, in_memory_s3: InMemoryS3, mocker: MockerFixture, three_chunks: None
+    ) -> None:
+        self._fake_api(mocker, failing_chunk=2)
+        with pytest.raises(TranscriptionTransientError):
+            rtc.run_transcribe_chunks(MEETING_ID, TranscriptionProcessor())
+        checkpoints = [
+            key
+            for key in in_memory_s3.objects
+            if key.startswith(CHUNK_CHECKPOINT_PREFIX)
+        ]
+        assert len(checkpoints) == 2
+
+        sent = self._fake_api(mocker)
+        rtc.run_transcribe_chunks(MEETING_ID, TranscriptionProcessor())
+
+        assert sent == [2]
+        assert [
+            (s["start"], s["text"])
+            for s in json.loads(in_memory_s3.objects[TRANSCRIPTION_RAW_KEY])
+        ] == [(0.1, "c1"), (1.1, "c2"), (2.1, "c3")]
+
+    def test_checkpoints_of_another_model_are_not_reused(
+        self, in_memory_s3: InMemoryS3, mocker: MockerFixture, three_chunks: None
+    ) -> None:
+        self._fake_api(mocker)
+        rtc.run_transcribe_chunks(MEETING_ID, TranscriptionProcessor())
+        mocker.patch.object(
+            transcription.api_settings, "TRANSCRIPTION_API_MODEL", "another-model"
+        )
+
+        sent = self._fake_api(mocker)
+        rtc.run_transcribe_chunks(MEETING_ID, TranscriptionProcessor())
+
+        assert sorted(sent) == [1, 2, 3]
@@ -0,0 +1,160 @@
+import json
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+import mcr_meeting.app.use_cases.transcription._shared.transcribe_diarized_audio as tda
+import mcr_meeting.app.use_cases.transcription.run_transcribe_chunks as rtc
+import mcr_meeting.app.use_cases.transcription.run_transcription_fan_out as fan_out
+from mcr_meeting.app.domain.audio_spool import wav_bytes_from_pcm
+from mcr_meeting.app.exceptions.exceptions import TranscriptionError
+from mcr_meeting.app.infrastructure.transcription import TranscriptionProcessor
+from mcr_meeting.app.schemas.transcription_schema import (
+    TimeSpan,
+    TranscriptionSegment,
+)
+from tests.mocks.in_memory_s3 import InMemoryS3
+
+MEETING_ID = 123
+
+PREPROCESSED_KEY = "artifacts/123/preprocessed_audio.wav"
+DIARIZATION_KEY = "artifacts/123/diarization.json"
+TRANSCRIPTION_RAW_KEY = "artifacts/123/transcription_raw.json"
+TRANSCRIPTION_PLAN_KEY = "artifacts/123/transcription_plan.json"
+CHUNK_PREFIX = "artifacts/123/transcription_chunks/"
+
+
+@pytest.fixture
+def three_chunks(in_memory_s3: InMemoryS3, mocker: MockerFixture) -> None:
+    # One second per chunk, each filled with its own number.
+    samples = np.repeat(np.arange(1, 4, dtype=np.int16), 16000)
+    in_memory_s3.objects[PREPROCESSED_KEY] = wav_bytes_from_pcm(
+        samples, 16000
+    ).getvalue()
+    in_memory_s3.objects[DIARIZATION_KEY] = (
+        b'[{"start": 0.0, "end": 1.2, "speaker": "A"},'
+        b' {"start": 1.2, "end": 3.0, "speaker": "B"}]'
+    )
+    mocker.patch.object(
+        tda,
+        "compute_transcription_chunks",
+        return_value=[TimeSpan(0.0, 1.0), TimeSpan(1.0, 2.0), TimeSpan(2.0, 3.0)],
+    )
+
+
+def _fake_api(mocker: MockerFixture) -> list[int]:
+    sent: list[int] = []
+
+    def transcribe_chunk(audio: np.ndarray) -> list[TranscriptionSegment]:
+        chunk = int(audio[0])
+        sent.append(chunk)
+        return [TranscriptionSegment(id=0, start=0.1, end=0.9, text=f"c{chunk}")]
+
+    mocker.patch.object(
+        TranscriptionProcessor,
+        "_transcribe_audio_chunk_api",
+        side_effect=transcribe_chunk,
+    )
+    return sent
+
+
+def _chunk_objects(in_memory_s3: InMemoryS3, suffix: str) -> list[str]:
+    return [
+        key
+        for key in in_memory_s3.objects
+        if key.startswith(CHUNK_PREFIX) and key.endswith(suffix)
+    ]
+
+
+def _fan_out(chunk_order: list[int]) -> None:
+    chunk_count = fan_out.run_plan_transcription_chunks(MEETING_ID)
+    assert chunk_count == len(chunk_order)
+    for chunk_index in chunk_order:
+        fan_out.run_transcribe_chunk(MEETING_ID, chunk_index, TranscriptionProcessor())
+    fan_out.run_merge_transcription_chunks(MEETING_ID)
+
+
+def test_plan_stores_each_chunk_audio_once(
+    in_memory_s3: InMemoryS3, three_chunks: None
+) -> None:
+    assert fan_out.run_plan_transcription_chunks(MEETING_ID) == 3
+
+    plan = json.loads(in_memory_s3.objects[TRANSCRIPTION_PLAN_KEY])
+    assert [chunk["span"] for chunk in plan["chunks"]] == [
+        {"start": 0.0, "end": 1.0},
+        {"start": 1.0, "end": 2.0},
+        {"start": 2.0, "end": 3.0},
+    ]
+    assert sorted(_chunk_objects(in_memory_s3, ".wav")) == sorted(
+        f"{CHUNK_PREFIX}{chunk['checkpoint_key']}.wav" for chunk in plan["chunks"]
+    )
+
+
+def test_merge_matches_the_single_task_transcription(
+    in_memory_s3: InMemoryS3, mocker: MockerFixture, three_chunks: None
+) -> None:
+    _fake_api(mocker)
+    rtc.run_transcribe_chunks(MEETING_ID, TranscriptionProcessor())
+    single_task = in_memory_s3.objects.pop(TRANSCRIPTION_RAW_KEY)
+    for key in _chunk_objects(in_memory_s3, ".json"):
+        del in_memory_s3.objects[key]
+
+    # Chunk tasks finish in any order; the merge follows the plan.
+    _fan_out(chunk_order=[2, 0, 1])
+
+    assert json.loads(in_memory_s3.objects[TRANSCRIPTION_RAW_KEY]) == json.loads(
+        single_task
+    )
+    assert [(s["start"], s["text"], s["speaker"]) for s in json.loads(single_task)] == [
+        (0.1, "c1", "A"),
+        (1.1, "c2", "B"),
+        (2.1, "c3", "B"),
+    ]
+
+
+def test_retried_chunk_task_does_not_resend_its_chunk(
+    in_memory_s3: InMemoryS3, mocker: MockerFixture, three_chunks: None
+) -> None:
+    sent = _fake_api(mocker)
+    fan_out.run_plan_transcription_chunks(MEETING_ID)
+
+    fan_out.run_transcribe_chunk(MEETING_ID, 1, TranscriptionProcessor())
+    fan_out.run_transcribe_chunk(MEETING_ID, 1, TranscriptionProcessor())
+
+    assert sent == [2]
+
+
+def test_requeued_meeting_reuses_the_single_task_checkpoints(
+    in_memory_s3: InMemoryS3, mocker: MockerFixture, three_chunks: None
+) -> None:
+    _fake_api(mocker)
+    rtc.run_transcribe_chunks(MEETING_ID, TranscriptionProcessor())
+
+    sent = _fake_api(mocker)
+    _fan_out(chunk_order=[0, 1, 2])
+
+    assert sent == []
+    assert _chunk_objects(in_memory_s3, ".wav") == []
+
+
+def test_merge_fails_when_a_chunk_was_not_transcribed(
+    in_memory_s3: InMemoryS3, mocker: MockerFixture, three_chunks: None
+) -> None:
+    _fake_api(mocker)
+    fan_out.run_plan_transcription_chunks(MEETING_ID)
+    fan_out.run_transcribe_chunk(MEETING_ID, 0, TranscriptionProcessor())
+
+    with pytest.raises(TranscriptionError):
+        fan_out.run_merge_transcription_chunks(MEETING_ID)
+
+    assert TRANSCRIPTION_RAW_KEY not in in_memory_s3.objects
+
+
+def test_empty_diarization_plans_no_chunk(in_memory_s3: InMemoryS3) -> None:
+    in_memory_s3.objects[DIARIZATION_KEY] = b"[]"
+
+    assert fan_out.run_plan_transcription_chunks(MEETING_ID) == 0
+
+    assert json.loads(in_memory_s3.objects[TRANSCRIPTION_RAW_KEY]) == []
+    assert TRANSCRIPTION_PLAN_KEY not in in_memory_s3.objects